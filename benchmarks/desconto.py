@@ -0,0 +1,57 @@
+"""Mede o cálculo dos fatores de desconto de ``JurosConstante``.
+
+Uso:
+    python benchmarks/desconto.py --anos 40 --repeticoes 20
+
+Compara, em uma grade diária de tempos inteiros, o cálculo com uma potência por elemento (como era feito antes)
+com ``taxa_desconto``, que usa um produto acumulado em tempos consecutivos, e com ``vetor_desconto``, que
+reaproveita vetores já calculados. Também mede ``taxa_desconto`` em tempos não consecutivos, onde cada elemento é
+calculado com uma exponencial.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from tabatu import JurosConstante
+from tabatu.periodicidade import Periodicidade
+
+
+def medir(funcao, repeticoes: int) -> float:
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--anos", type=int, default=40)
+    parser.add_argument("--taxa", type=float, default=0.06)
+    parser.add_argument("--repeticoes", type=int, default=20)
+    args = parser.parse_args()
+
+    juros = JurosConstante(args.taxa).alterar_periodicidade(Periodicidade.DIARIA)
+    taxa = juros.taxa_juros([0])[0]
+    horizonte = 365 * args.anos
+    t = np.arange(horizonte, dtype=float)
+    t_nao_consecutivo = t[::-1].copy()
+
+    casos = {
+        "pow por elemento": lambda: np.power(1 + taxa, -t),
+        "taxa_desconto": lambda: juros.taxa_desconto(t),
+        "taxa_desconto (não consecutivo)": lambda: juros.taxa_desconto(t_nao_consecutivo),
+        "vetor_desconto": lambda: juros.vetor_desconto(horizonte),
+    }
+    print(f"tempos: {horizonte}")
+    base = None
+    for nome, funcao in casos.items():
+        segundos = medir(funcao, args.repeticoes)
+        base = segundos if base is None else base
+        print(f"{nome:<34} tempo={segundos * 1e6:10.1f}us  ganho={base / segundos:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Mede a escalabilidade de ``tabatu.paralelo.avaliar_carteira`` com a quantidade de threads.
+
+Uso:
+    python benchmarks/escalabilidade_threads.py --apolices 200000 --tempos 480 --threads 1 2 4 8 16
+
+Para cada quantidade de threads, imprime o melhor tempo entre as repetições e o ganho em relação a uma
+thread. Como os cálculos em C++ liberam o GIL, o ganho deve ser próximo de linear até o número de
+núcleos físicos da máquina.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu.paralelo import avaliar_carteira
+
+
+def criar_tabua() -> TabuaMDT:
+    idades = np.arange(116)
+    morte = np.minimum(0.0005 * np.exp(0.08 * idades), 1.0)
+    cancelamento = np.repeat(0.05, 116)
+    return TabuaMDT(Tabua(morte), Tabua(cancelamento))
+
+
+def medir(tabua, x, t, threads: int, repeticoes: int) -> float:
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        avaliar_carteira(tabua, "t_qx", x, t, max_threads=threads)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apolices", type=int, default=50_000)
+    parser.add_argument("--tempos", type=int, default=120)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    tabua = criar_tabua()
+    rng = np.random.default_rng(0)
+    x = np.column_stack([rng.integers(20, 70, args.apolices), np.zeros(args.apolices, dtype=np.int64)])
+    t = np.arange(args.tempos)
+
+    print(f"processadores disponíveis: {os.cpu_count()}")
+    print(f"apólices: {args.apolices}, tempos: {args.tempos}")
+    base = None
+    for threads in args.threads:
+        segundos = medir(tabua, x, t, threads, args.repeticoes)
+        base = segundos if base is None else base
+        print(f"threads={threads:>3}  tempo={segundos:8.3f}s  ganho={base / segundos:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Mede a memória ocupada por carteiras de tábuas compostas.
+
+Uso:
+    python benchmarks/memoria_tabuas.py --tabuas 10000 --idades 116
+
+Cria ``--tabuas`` tábuas de múltiplos decrementos e de múltiplas vidas a partir de uma tábua de morte e uma de
+cancelamento em periodicidade mensal, acessa as tábuas base de cada uma e imprime o aumento da memória residente por
+tábua composta. Quando as tábuas compostas são criadas a partir das mesmas tábuas de único decremento, as taxas, a
+sobrevivência acumulada e as visões de periodicidade são compartilhadas, e cada tábua composta ocupa apenas alguns
+objetos pequenos. Para comparação, também são criadas tábuas compostas com tábuas de único decremento próprias, que
+não compartilham memória. Cada caso é medido em um processo novo, e a memória residente é lida de
+``/proc/self/statm``, disponível apenas no Linux.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import multiprocessing
+import os
+
+import numpy as np
+
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu import TabuaMultiplasVidas
+from tabatu.periodicidade import Periodicidade
+
+COMPOSTAS = {"TabuaMDT": TabuaMDT, "TabuaMultiplasVidas": TabuaMultiplasVidas}
+
+
+def memoria_residente() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def criar_tabuas(idades: int) -> list[Tabua]:
+    idades = np.arange(idades)
+    qx_morte = np.minimum(0.0005 * np.exp(0.08 * idades), 1.0)
+    qx_cancelamento = np.repeat(0.05, len(idades))
+    return [Tabua(qx).alterar_periodicidade(Periodicidade.MENSAL) for qx in [qx_morte, qx_cancelamento]]
+
+
+def medir(composta: str, compartilhadas: bool, quantidade: int, idades: int) -> float:
+    tabuas = criar_tabuas(idades)
+    gc.collect()
+    inicio = memoria_residente()
+    carteira = []
+    for _ in range(quantidade):
+        tabua = COMPOSTAS[composta](*(tabuas if compartilhadas else criar_tabuas(idades)))
+        tabua.tabuas
+        carteira.append(tabua)
+    gc.collect()
+    return (memoria_residente() - inicio) / quantidade
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tabuas", type=int, default=10_000)
+    parser.add_argument("--idades", type=int, default=116)
+    args = parser.parse_args()
+
+    print(f"tábuas: {args.tabuas}, idades: {args.idades}")
+    contexto = multiprocessing.get_context("spawn")
+    for composta in COMPOSTAS:
+        for compartilhadas in [False, True]:
+            with contexto.Pool(1) as pool:
+                por_tabua = pool.apply(medir, (composta, compartilhadas, args.tabuas, args.idades))
+            nome = f"{composta} ({'compartilhadas' if compartilhadas else 'próprias'})"
+            total = por_tabua * args.tabuas / 2**20
+            print(f"{nome:<38} memória por tábua={por_tabua:10.0f} bytes  total={total:8.1f}MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Micro-benchmarks dos métodos principais das tábuas e dos juros.
+
+Uso:
+    python benchmarks/micro.py
+    python benchmarks/micro.py --filtro "TabuaMDT" --repeticoes 3
+    python benchmarks/micro.py --salvar benchmarks/referencia.json
+    python benchmarks/micro.py --comparar benchmarks/referencia.json --tolerancia 0.25
+
+Mede ``qx``, ``tpx`` e ``t_qx`` de ``Tabua``, ``TabuaMDT`` e ``TabuaMultiplasVidas``, ``qx_j`` e ``t_qx_j`` de
+``TabuaMDT``, as versões em lote de uma carteira de apólices, ``alterar_periodicidade_qx`` e
+``JurosConstante.taxa_desconto``. Os casos variam o tamanho e a periodicidade das tábuas (de 100 taxas anuais a
+43.800 taxas diárias), a quantidade de decrementos e de vidas, a quantidade de tempos e a quantidade de apólices.
+O nome de cada caso identifica o método e os parâmetros usados, e ``--filtro`` seleciona os casos cujo nome contém
+a expressão regular informada.
+
+O tempo de cada caso é o melhor tempo por chamada entre as repetições, e cada repetição executa o caso tantas vezes
+quanto necessário para durar pelo menos 0,2 segundo, como em :meth:`timeit.Timer.autorange`.
+
+Com ``--salvar``, os tempos são gravados em um arquivo JSON que serve de referência. Com ``--comparar``, os tempos
+são comparados com os de uma referência, e os casos mais lentos que a referência por mais de ``--tolerancia`` são
+listados como regressões; nesse caso, o script termina com código de saída 1. Os tempos dependem da máquina, então a
+comparação só faz sentido com uma referência gravada na mesma máquina. Para avaliar uma alteração, grave a referência
+antes da alteração, recompile a extensão e compare. O arquivo ``benchmarks/referencia.json`` contém a referência da
+versão atual.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import re
+import sys
+import timeit
+from typing import Callable
+
+import numpy as np
+
+from tabatu import JurosConstante
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu import TabuaMultiplasVidas
+from tabatu import alterar_periodicidade_qx
+from tabatu.periodicidade import Periodicidade
+
+# Periodicidade e quantidade de anos das tábuas, com 100, 1.440 e 43.800 taxas.
+TAMANHOS = [(Periodicidade.ANUAL, 100), (Periodicidade.MENSAL, 120), (Periodicidade.DIARIA, 120)]
+TEMPOS = [12, 1_200]
+APOLICES = 10_000
+
+
+def qx_anual(anos: int, fator: float = 1.0) -> np.ndarray:
+    return np.minimum(0.0005 * fator * np.exp(0.08 * np.arange(anos)), 1.0)
+
+
+def criar_tabua(periodicidade: Periodicidade, anos: int, fator: float = 1.0) -> Tabua:
+    qx = alterar_periodicidade_qx(qx_anual(anos, fator), Periodicidade.ANUAL, periodicidade)
+    return Tabua(qx, periodicidade)
+
+
+def criar_casos() -> dict[str, Callable[[], object]]:
+    casos = {}
+    rng = np.random.default_rng(0)
+    for periodicidade, anos in TAMANHOS:
+        tamanho = anos * periodicidade.quantidade_periodos_1_ano()
+        parametros = f"tamanho={tamanho},periodicidade={periodicidade.value}"
+        tabuas = [criar_tabua(periodicidade, anos, fator) for fator in [1.0, 0.5, 2.0]]
+        x = rng.integers(0, tamanho // 2, APOLICES)
+        compostas = {"Tabua": tabuas[0]}
+        for n in [2, 3]:
+            compostas[f"TabuaMDT,decrementos={n}"] = TabuaMDT(*tabuas[:n])
+            compostas[f"TabuaMultiplasVidas,vidas={n}"] = TabuaMultiplasVidas(*tabuas[:n])
+        for nome, tabua in compostas.items():
+            n = len(tabua.tabuas)
+            idades = [tamanho // 4] * n
+            for tempos in TEMPOS:
+                t = np.arange(tempos, dtype=float)
+                for metodo in ["qx", "tpx", "t_qx"]:
+                    casos[f"{nome}.{metodo}[{parametros},tempos={tempos}]"] = (
+                        lambda f=getattr(tabua, metodo), x=idades, t=t: f(x, t)
+                    )
+                if isinstance(tabua, TabuaMDT):
+                    for metodo in ["qx_j", "t_qx_j"]:
+                        casos[f"{nome}.{metodo}[{parametros},tempos={tempos}]"] = (
+                            lambda f=getattr(tabua, metodo), x=idades, t=t, j=list(range(n)): f(x, t, j)
+                        )
+            t = np.arange(TEMPOS[0], dtype=float)
+            x_lote = np.repeat(x[:, None], n, axis=1)
+            for metodo in ["tpx_lote", "t_qx_lote"]:
+                casos[f"{nome}.{metodo}[{parametros},tempos={TEMPOS[0]},apolices={APOLICES}]"] = (
+                    lambda f=getattr(tabua, metodo), x=x_lote, t=t: f(x, t)
+                )
+
+    for anos in [100, 120]:
+        qx = qx_anual(anos)
+        for periodicidade in [Periodicidade.MENSAL, Periodicidade.DIARIA]:
+            parametros = f"tamanho={anos},{Periodicidade.ANUAL.value}->{periodicidade.value}"
+            casos[f"alterar_periodicidade_qx[{parametros}]"] = (
+                lambda qx=qx, p=periodicidade: alterar_periodicidade_qx(qx, Periodicidade.ANUAL, p)
+            )
+        qx_mensal = alterar_periodicidade_qx(qx, Periodicidade.ANUAL, Periodicidade.MENSAL)
+        parametros = f"tamanho={len(qx_mensal)},{Periodicidade.MENSAL.value}->{Periodicidade.ANUAL.value}"
+        casos[f"alterar_periodicidade_qx[{parametros}]"] = (
+            lambda qx=qx_mensal: alterar_periodicidade_qx(qx, Periodicidade.MENSAL, Periodicidade.ANUAL)
+        )
+
+    for periodicidade, anos in TAMANHOS:
+        juros = JurosConstante(0.06).alterar_periodicidade(periodicidade)
+        t = np.arange(anos * periodicidade.quantidade_periodos_1_ano(), dtype=float)
+        parametros = f"periodicidade={periodicidade.value},tempos={len(t)}"
+        casos[f"JurosConstante.taxa_desconto[{parametros}]"] = lambda f=juros.taxa_desconto, t=t: f(t)
+        casos[f"JurosConstante.taxa_desconto[{parametros},nao_consecutivos]"] = (
+            lambda f=juros.taxa_desconto, t=t[::-1].copy(): f(t)
+        )
+    return casos
+
+
+def medir(funcao: Callable[[], object], repeticoes: int) -> float:
+    timer = timeit.Timer(funcao)
+    numero, _ = timer.autorange()
+    return min(timer.repeat(repeticoes, numero)) / numero
+
+
+def ambiente() -> dict[str, str]:
+    return {"python": platform.python_version(), "numpy": np.__version__, "maquina": platform.platform()}
+
+
+def comparar(atuais: dict[str, float], referencia: dict[str, float], tolerancia: float) -> list[str]:
+    regressoes = []
+    largura = max(map(len, atuais), default=0)
+    print(f"{'caso':<{largura}} {'referência':>12} {'atual':>12} {'razão':>7}")
+    for nome, segundos in atuais.items():
+        if nome not in referencia:
+            print(f"{nome:<{largura}} {'-':>12} {segundos * 1e6:10.1f}us {'novo':>7}")
+            continue
+        razao = segundos / referencia[nome]
+        marca = ""
+        if razao > 1 + tolerancia:
+            regressoes.append(nome)
+            marca = "  REGRESSÃO"
+        print(f"{nome:<{largura}} {referencia[nome] * 1e6:10.1f}us {segundos * 1e6:10.1f}us {razao:6.2f}x{marca}")
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filtro", default="")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--salvar", metavar="ARQUIVO")
+    parser.add_argument("--comparar", metavar="ARQUIVO")
+    parser.add_argument("--tolerancia", type=float, default=0.25)
+    args = parser.parse_args()
+
+    casos = {nome: funcao for nome, funcao in criar_casos().items() if re.search(args.filtro, nome)}
+    largura = max(map(len, casos), default=0)
+    atuais = {}
+    for nome, funcao in casos.items():
+        atuais[nome] = medir(funcao, args.repeticoes)
+        if args.comparar is None:
+            print(f"{nome:<{largura}} tempo={atuais[nome] * 1e6:10.1f}us")
+
+    if args.salvar is not None:
+        with open(args.salvar, "w") as f:
+            json.dump({"ambiente": ambiente(), "resultados": atuais}, f, indent=2)
+            f.write("\n")
+    if args.comparar is not None:
+        with open(args.comparar) as f:
+            referencia = json.load(f)
+        print(f"referência: {referencia['ambiente']}")
+        print(f"atual:      {ambiente()}")
+        regressoes = comparar(atuais, referencia["resultados"], args.tolerancia)
+        if regressoes:
+            print(f"\n{len(regressoes)} casos mais lentos que a referência por mais de {args.tolerancia:.0%}:")
+            for nome in regressoes:
+                print(f"  {nome}")
+            sys.exit(1)
+        print(f"\nNenhum caso mais lento que a referência por mais de {args.tolerancia:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
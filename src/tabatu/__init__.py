@@ -1,19 +1,29 @@
 from tabatu.multiplos_decrementos import TabuaMDT
 from tabatu.multiplas_vidas import TabuaMultiplasVidas, StatusVidasConjuntas
 from tabatu.unico_decremento import Tabua
+from tabatu.tabua_seletiva import TabuaSeletiva
+from tabatu.lote import TabuaLote
+from tabatu.hipotese_fracionaria import HipoteseFracionaria
 from tabatu.alterar_tabua import alterar_periodicidade_qx
 from tabatu.alterar_tabua import agravar_qx
 from tabatu.juros_constante import JurosConstante
+from tabatu.juros_curva import JurosCurva
+from tabatu.juros_estocastico import JurosEstocastico
 from tabatu.alterar_juros import alterar_periodicidade_juros
 
 
 __all__ = [
     "Tabua",
+    "TabuaSeletiva",
+    "TabuaLote",
     "TabuaMDT",
     "TabuaMultiplasVidas",
     "StatusVidasConjuntas",
+    "HipoteseFracionaria",
     "agravar_qx",
     "alterar_periodicidade_qx",
     "JurosConstante",
+    "JurosCurva",
+    "JurosEstocastico",
     "alterar_periodicidade_juros",
 ]
@@ -0,0 +1,221 @@
+"""Cache de tábuas derivadas, isto é, tábuas agravadas e com a periodicidade alterada.
+
+Carteiras costumam combinar poucas tábuas base com alguns percentuais de agravo e periodicidades, e cada execução
+refaz o agravo, a alteração de periodicidade e o cálculo da sobrevivência acumulada para todos os produtos. As tábuas
+derivadas são guardadas em um cache LRU, com a chave formada pelo conteúdo das taxas da tábua base, pelo agravo e pela
+periodicidade, de forma que cada combinação é calculada uma única vez por processo.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b
+from threading import Lock
+from typing import Callable, Hashable, Optional
+
+from numpy import ascontiguousarray
+from numpy import float64
+
+from tabatu.alterar_tabua import agravar_qx
+from tabatu.periodicidade import Periodicidade
+from tabatu.unico_decremento import Tabua
+
+TAMANHO_MAXIMO = 128
+"""Quantidade máxima default de tábuas mantidas no cache."""
+
+MEMORIA_MAXIMA = 256 * 2**20
+"""Memória máxima default, em bytes, ocupada pelas taxas e sobrevivências das tábuas do cache."""
+
+
+@dataclass(frozen=True)
+class EstatisticasCache:
+    """Estatísticas de uso de um :class:`CacheTabuas`.
+
+    Args:
+        acertos (int): Quantidade de consultas que encontraram a tábua no cache.
+        falhas (int): Quantidade de consultas que precisaram calcular a tábua.
+        descartes (int): Quantidade de tábuas removidas para respeitar os limites do cache.
+        entradas (int): Quantidade de tábuas no cache.
+        memoria (int): Memória, em bytes, ocupada pelas tábuas do cache.
+    """
+    acertos: int
+    falhas: int
+    descartes: int
+    entradas: int
+    memoria: int
+
+
+class CacheTabuas:
+    """Cache LRU de tábuas, limitado pela quantidade de tábuas e pela memória ocupada.
+
+    Quando um dos limites é ultrapassado, as tábuas usadas há mais tempo são descartadas. Tábuas maiores que a memória
+    máxima são calculadas normalmente, mas não são guardadas. O cache pode ser compartilhado entre threads.
+
+    Args:
+        tamanho_maximo (int): Quantidade máxima de tábuas.
+        memoria_maxima (int): Memória máxima, em bytes.
+
+    Examples:
+
+        >>> from tabatu import Tabua
+        >>> cache = CacheTabuas(tamanho_maximo=2)
+        >>> tabua = Tabua([0.1, 0.2, 0.4, 0.8, 1.0])
+        >>> derivar_tabua(tabua, 150, cache=cache) is derivar_tabua(tabua, 150, cache=cache)
+        True
+        >>> cache.estatisticas()
+        EstatisticasCache(acertos=1, falhas=1, descartes=0, entradas=1, memoria=88)
+    """
+    __slots__ = (
+        "_tamanho_maximo", "_memoria_maxima", "_entradas", "_memoria", "_acertos", "_falhas", "_descartes", "_trava"
+    )
+
+    def __init__(self, tamanho_maximo: int = TAMANHO_MAXIMO, memoria_maxima: int = MEMORIA_MAXIMA) -> None:
+        self._entradas: OrderedDict[Hashable, tuple[Tabua, int]] = OrderedDict()
+        self._memoria = 0
+        self._acertos = 0
+        self._falhas = 0
+        self._descartes = 0
+        self._trava = Lock()
+        self.configurar(tamanho_maximo, memoria_maxima)
+
+    @property
+    def tamanho_maximo(self) -> int:
+        """Quantidade máxima de tábuas."""
+        return self._tamanho_maximo
+
+    @property
+    def memoria_maxima(self) -> int:
+        """Memória máxima, em bytes."""
+        return self._memoria_maxima
+
+    def configurar(self, tamanho_maximo: Optional[int] = None, memoria_maxima: Optional[int] = None) -> None:
+        """Altera os limites do cache, descartando as tábuas usadas há mais tempo se necessário.
+
+        Args:
+            tamanho_maximo (int, optional): Quantidade máxima de tábuas. Por default, é mantida.
+            memoria_maxima (int, optional): Memória máxima, em bytes. Por default, é mantida.
+        """
+        if tamanho_maximo is not None and tamanho_maximo < 0:
+            raise ValueError("tamanho_maximo deve ser maior ou igual a zero.")
+        if memoria_maxima is not None and memoria_maxima < 0:
+            raise ValueError("memoria_maxima deve ser maior ou igual a zero.")
+        with self._trava:
+            if tamanho_maximo is not None:
+                self._tamanho_maximo = tamanho_maximo
+            if memoria_maxima is not None:
+                self._memoria_maxima = memoria_maxima
+            self._descartar()
+
+    def obter(self, chave: Hashable, criar: Callable[[], tuple[Tabua, int]]) -> Tabua:
+        """Retorna a tábua da chave, criando-a com ``criar`` se ela não estiver no cache.
+
+        Args:
+            chave (Hashable): Chave da tábua.
+            criar (Callable[[], tuple[Tabua, int]]): Função que cria a tábua e retorna a tábua e a sua memória, em
+                bytes.
+
+        Returns:
+            Tabua: Tábua da chave.
+        """
+        with self._trava:
+            entrada = self._entradas.get(chave)
+            if entrada is not None:
+                self._entradas.move_to_end(chave)
+                self._acertos += 1
+                return entrada[0]
+            self._falhas += 1
+        # A tábua é criada fora da trava, para que outras threads possam consultar o cache enquanto isso.
+        tabua, memoria = criar()
+        with self._trava:
+            if chave not in self._entradas and memoria <= self._memoria_maxima and self._tamanho_maximo > 0:
+                self._entradas[chave] = (tabua, memoria)
+                self._memoria += memoria
+                self._descartar()
+        return tabua
+
+    def _descartar(self) -> None:
+        while self._entradas and (
+            len(self._entradas) > self._tamanho_maximo or self._memoria > self._memoria_maxima
+        ):
+            _, (_, memoria) = self._entradas.popitem(last=False)
+            self._memoria -= memoria
+            self._descartes += 1
+
+    def estatisticas(self) -> EstatisticasCache:
+        """Estatísticas de uso do cache."""
+        with self._trava:
+            return EstatisticasCache(self._acertos, self._falhas, self._descartes, len(self._entradas), self._memoria)
+
+    def limpar(self) -> None:
+        """Remove todas as tábuas do cache e zera as estatísticas."""
+        with self._trava:
+            self._entradas.clear()
+            self._memoria = 0
+            self._acertos = 0
+            self._falhas = 0
+            self._descartes = 0
+
+
+CACHE_TABUAS = CacheTabuas()
+"""Cache usado por default em :func:`derivar_tabua`."""
+
+
+def derivar_tabua(
+    tabua: Tabua,
+    agravo: float = 100,
+    periodicidade: Optional[Periodicidade] = None,
+    cache: Optional[CacheTabuas] = None,
+) -> Tabua:
+    """Tábua com as taxas agravadas e a periodicidade alterada, reaproveitando as tábuas já calculadas.
+
+    As taxas da tábua são agravadas com :func:`~tabatu.agravar_qx` na periodicidade da tábua, e só então a
+    periodicidade é alterada. A chave do cache é formada pelo conteúdo das taxas, pela periodicidade e pela hipótese
+    fracionária da tábua, pelo agravo e pela nova periodicidade. Assim, tábuas iguais criadas separadamente
+    compartilham a mesma tábua derivada. A tábua retornada é compartilhada entre as consultas com a mesma chave.
+
+    Args:
+        tabua (Tabua): Tábua de único decremento.
+        agravo (float): Percentual de agravo das taxas. Por default, 100, isto é, as taxas não são alteradas.
+        periodicidade (Periodicidade, optional): Nova periodicidade. Por default, é mantida a periodicidade da tábua.
+        cache (CacheTabuas, optional): Cache a ser usado. Por default, usa :data:`CACHE_TABUAS`.
+
+    Returns:
+        Tabua: Tábua derivada.
+
+    Note:
+        Para tábuas de múltiplos decrementos ou de múltiplas vidas, derive cada tábua de único decremento e combine
+        as tábuas derivadas.
+
+    Examples:
+
+        >>> from tabatu import Tabua
+        >>> from tabatu.periodicidade import Periodicidade
+        >>> tabua = Tabua([0.1, 0.2, 0.4, 0.8, 1.0])
+        >>> derivar_tabua(tabua, 150, Periodicidade.MENSAL).tpx([0], [12, 24])
+        array([0.85 , 0.595])
+    """
+    if tabua.numero_decrementos != 1 or tabua.numero_vidas != 1:
+        raise ValueError("Apenas tábuas de único decremento podem ser derivadas.")
+    tabua_base, = tabua.tabuas
+    if tabua_base.pega_periodo_selecao() > 0:
+        raise ValueError("Tábuas seletivas não podem ser derivadas.")
+    cache = CACHE_TABUAS if cache is None else cache
+    qx = ascontiguousarray(tabua_base.pega_qx(), dtype=float64)
+    periodicidade = tabua.periodicidade if periodicidade is None else Periodicidade(periodicidade)
+    hipotese = tabua.hipotese_fracionaria
+    chave = (
+        blake2b(qx.tobytes(), digest_size=16).digest(),
+        tabua.periodicidade,
+        hipotese,
+        float(agravo),
+        periodicidade,
+    )
+
+    def criar() -> tuple[Tabua, int]:
+        qx_agravado = agravar_qx(qx, agravo)
+        derivada = Tabua(qx_agravado, tabua.periodicidade, hipotese).alterar_periodicidade(periodicidade)
+        # Taxas e sobrevivência acumulada armazenadas, mais a taxa e a sobrevivência por idade das visões.
+        vetores = 4 if derivada.tabuas[0].pega_razao_periodicidade() > 1 else 2
+        return derivada, vetores * qx_agravado.nbytes + qx_agravado.itemsize
+
+    return cache.obter(chave, criar)
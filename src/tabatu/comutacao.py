@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from numpy import arange
+from numpy import asarray
+from numpy import atleast_1d
+from numpy import divide
+from numpy import float64
+from numpy import int64
+from numpy import isinf
+from numpy import minimum
+from numpy import zeros
+from numpy import zeros_like
+from numpy.typing import ArrayLike
+from numpy.typing import NDArray
+
+import tabatu.core as core
+from tabatu.typing import JurosInterface
+from tabatu.typing import TabuaInterface
+
+_DX, _NX, _SX, _CX, _MX, _RX = range(6)
+
+
+def _validar_inteiro_positivo(valor: ArrayLike, nome: str) -> NDArray[int64]:
+    valor = atleast_1d(asarray(valor, dtype=int64))
+    if (valor < 0).any():
+        raise ValueError(f"{nome} deve ser maior ou igual a zero.")
+    return valor
+
+
+class Comutacao:
+    """Colunas de comutação de uma tábua e de um juros.
+
+    As colunas são calculadas uma única vez, para todas as idades da tábua, e os fatores atuariais usuais são obtidos
+    por consulta às colunas, com custo constante para qualquer idade e prazo. Idades e prazos devem estar na mesma
+    periodicidade da tábua e do juros.
+
+    Para tábuas com mais de um decremento ou mais de uma vida, as colunas consideram que todos os componentes possuem a
+    mesma idade. Em tábuas de múltiplos decrementos com causa principal, as colunas Cx, Mx e Rx consideram apenas a
+    causa principal.
+
+    As colunas descontam os fluxos pela idade, o que só é equivalente ao desconto pelo tempo decorrido quando o
+    juros é constante. Para juros variáveis no tempo, como :class:`~tabatu.JurosCurva`, use as funções de
+    :mod:`tabatu.valor_presente`.
+
+    Args:
+        tabua (TabuaInterface): Tábua biométrica. Não pode possuir fechamento de tipo platô.
+        juros (JurosInterface): Juros constante utilizado no desconto.
+
+    Examples:
+
+        >>> from tabatu import JurosConstante, Tabua
+        >>> comutacao = Comutacao(Tabua([0.1, 0.2, 0.4, 0.8, 1.0]), JurosConstante(0.05))
+        >>> comutacao.Dx
+        array([1.        , 0.85714286, 0.65306122, 0.37317784, 0.07108149,
+               0.        ])
+        >>> comutacao.anuidade([0, 2], 2)
+        array([1.85714286, 1.57142857])
+    """
+    __slots__ = "_colunas", "_tamanho"
+
+    def __init__(self, tabua: TabuaInterface, juros: JurosInterface) -> None:
+        if not isinstance(juros, core.JurosConstante):
+            raise ValueError("As colunas de comutação só podem ser calculadas com juros constante.")
+        x = zeros(tabua.numero_decrementos * tabua.numero_vidas, dtype=int64)
+        tempo_futuro_maximo = tabua.tempo_futuro_maximo(x)
+        if isinf(tempo_futuro_maximo):
+            raise ValueError("Tabua nao pode ser plato")
+        self._tamanho = int(tempo_futuro_maximo)
+        idades = arange(self._tamanho, dtype=float64)
+        self._colunas = core.comutacao(
+            tabua.tpx(x, idades),
+            tabua.t_qx(x, idades),
+            juros.taxa_desconto(arange(self._tamanho + 1, dtype=float64)),
+        )
+        self._colunas.flags.writeable = False
+
+    def _consultar(self, coluna: int, idade: NDArray[int64]) -> NDArray[float64]:
+        return self._colunas[coluna, minimum(idade, self._tamanho)]
+
+    def _prazo(self, n: Optional[ArrayLike]) -> NDArray[int64]:
+        if n is None:
+            return atleast_1d(self._tamanho)
+        return _validar_inteiro_positivo(n, "n")
+
+    def _dividir_por_dx(self, valor: NDArray[float64], x: NDArray[int64]) -> NDArray[float64]:
+        """Divide por Dx, retornando zero para idades sem sobreviventes."""
+        dx = self._consultar(_DX, x)
+        return divide(valor, dx, out=zeros_like(valor, dtype=float64), where=dx > 0)
+
+    @property
+    def Dx(self) -> NDArray[float64]:
+        """Coluna Dx, o valor presente dos sobreviventes em cada idade."""
+        return self._colunas[_DX]
+
+    @property
+    def Nx(self) -> NDArray[float64]:
+        """Coluna Nx, a soma de Dx a partir de cada idade."""
+        return self._colunas[_NX]
+
+    @property
+    def Sx(self) -> NDArray[float64]:
+        """Coluna Sx, a soma de Nx a partir de cada idade."""
+        return self._colunas[_SX]
+
+    @property
+    def Cx(self) -> NDArray[float64]:
+        """Coluna Cx, o valor presente das falhas em cada idade, descontadas para o fim do período."""
+        return self._colunas[_CX]
+
+    @property
+    def Mx(self) -> NDArray[float64]:
+        """Coluna Mx, a soma de Cx a partir de cada idade."""
+        return self._colunas[_MX]
+
+    @property
+    def Rx(self) -> NDArray[float64]:
+        """Coluna Rx, a soma de Mx a partir de cada idade."""
+        return self._colunas[_RX]
+
+    def dotal_puro(self, x: ArrayLike, n: ArrayLike) -> NDArray[float64]:
+        """Valor presente de um pagamento unitário em n períodos, caso o indivíduo sobreviva.
+
+        Args:
+            x (ArrayLike): Idades.
+            n (ArrayLike): Prazos.
+
+        Returns:
+            NDArray[float64]: Fatores de dotal puro.
+        """
+        x = _validar_inteiro_positivo(x, "x")
+        n = _validar_inteiro_positivo(n, "n")
+        return self._dividir_por_dx(self._consultar(_DX, x + n), x)
+
+    def anuidade(
+        self, x: ArrayLike, n: Optional[ArrayLike] = None, antecipada: bool = True
+    ) -> NDArray[float64]:
+        """Valor presente de uma renda unitária paga enquanto o indivíduo sobreviver, limitada a n pagamentos.
+
+        Args:
+            x (ArrayLike): Idades.
+            n (ArrayLike, optional): Prazos. Se não for informado, a renda é vitalícia.
+            antecipada (bool): Se True, os pagamentos ocorrem no início de cada período, caso contrário, no fim.
+
+        Returns:
+            NDArray[float64]: Fatores de anuidade.
+        """
+        x = _validar_inteiro_positivo(x, "x")
+        n = self._prazo(n)
+        inicio = x if antecipada else x + 1
+        return self._dividir_por_dx(self._consultar(_NX, inicio) - self._consultar(_NX, inicio + n), x)
+
+    def seguro(self, x: ArrayLike, n: Optional[ArrayLike] = None) -> NDArray[float64]:
+        """Valor presente de um pagamento unitário no fim do período de falha, caso ela ocorra em até n períodos.
+
+        Args:
+            x (ArrayLike): Idades.
+            n (ArrayLike, optional): Prazos. Se não for informado, o seguro é vitalício.
+
+        Returns:
+            NDArray[float64]: Fatores de seguro.
+        """
+        x = _validar_inteiro_positivo(x, "x")
+        n = self._prazo(n)
+        return self._dividir_por_dx(self._consultar(_MX, x) - self._consultar(_MX, x + n), x)
+
+    def dotal(self, x: ArrayLike, n: ArrayLike) -> NDArray[float64]:
+        """Valor presente de um seguro temporário por n períodos somado ao dotal puro de n períodos.
+
+        Args:
+            x (ArrayLike): Idades.
+            n (ArrayLike): Prazos.
+
+        Returns:
+            NDArray[float64]: Fatores de dotal misto.
+        """
+        return self.seguro(x, n) + self.dotal_puro(x, n)
+
+    def anuidade_crescente(self, x: ArrayLike, n: Optional[ArrayLike] = None) -> NDArray[float64]:
+        """Valor presente de uma renda antecipada que paga k no k-ésimo período, limitada a n pagamentos.
+
+        Args:
+            x (ArrayLike): Idades.
+            n (ArrayLike, optional): Prazos. Se não for informado, a renda é vitalícia.
+
+        Returns:
+            NDArray[float64]: Fatores de anuidade crescente.
+        """
+        x = _validar_inteiro_positivo(x, "x")
+        n = self._prazo(n)
+        valor = self._consultar(_SX, x) - self._consultar(_SX, x + n) - n * self._consultar(_NX, x + n)
+        return self._dividir_por_dx(valor, x)
+
+    def seguro_crescente(self, x: ArrayLike, n: Optional[ArrayLike] = None) -> NDArray[float64]:
+        """Valor presente de um seguro que paga k caso a falha ocorra no k-ésimo período, limitado a n períodos.
+
+        Args:
+            x (ArrayLike): Idades.
+            n (ArrayLike, optional): Prazos. Se não for informado, o seguro é vitalício.
+
+        Returns:
+            NDArray[float64]: Fatores de seguro crescente.
+        """
+        x = _validar_inteiro_positivo(x, "x")
+        n = self._prazo(n)
+        valor = self._consultar(_RX, x) - self._consultar(_RX, x + n) - n * self._consultar(_MX, x + n)
+        return self._dividir_por_dx(valor, x)
@@ -1,9 +1,16 @@
 #include "JurosConstanteCpp.h"
+#include <algorithm>
+#include <cmath>
+
+// Quantidade máxima de multiplicações sucessivas antes de recalcular o desconto com exp, limitando o
+// acúmulo de erro de arredondamento do produto.
+const int PASSOS_RESSINCRONIZACAO = 64;
 
 JurosConstanteCpp::JurosConstanteCpp() {
 }
 
-JurosConstanteCpp::JurosConstanteCpp(double juros) : m_taxa_juros(juros) {
+JurosConstanteCpp::JurosConstanteCpp(double juros)
+    : m_taxa_juros(juros), m_desconto(1.0 / (1.0 + juros)), m_log_desconto(-std::log1p(juros)) {
 }
 
 double JurosConstanteCpp::taxa_juros(double t) const {
@@ -14,14 +21,26 @@ double JurosConstanteCpp::mapear_t(double t) const {
     return t;
 }
 
-std::vector<double> JurosConstanteCpp::taxa_juros(std::vector<double> t) const {
-    return JurosInterfaceCpp::taxa_juros(t);
+void JurosConstanteCpp::taxa_juros(const double* t, int n, double* ret) const {
+    std::fill(ret, ret + n, m_taxa_juros);
 }
 
 double JurosConstanteCpp::taxa_desconto(double t) const {
-    return JurosInterfaceCpp::taxa_desconto(t);
+    return std::exp(t * m_log_desconto);
 }
 
-std::vector<double> JurosConstanteCpp::taxa_desconto(std::vector<double> t) const {
-    return JurosInterfaceCpp::taxa_desconto(t);
+// Em trechos de tempos consecutivos (t[i] = t[i - 1] + 1), o desconto é obtido pelo produto com o desconto de
+// um período, sem nenhuma chamada a pow ou exp. Os demais tempos usam exp(t * log(v)).
+void JurosConstanteCpp::taxa_desconto(const double* t, int n, double* ret) const {
+    int passos = 0;
+    for (int i = 0; i < n; i++) {
+        if (i > 0 && t[i] == t[i - 1] + 1.0 && passos < PASSOS_RESSINCRONIZACAO) {
+            ret[i] = ret[i - 1] * m_desconto;
+            passos++;
+        }
+        else {
+            ret[i] = taxa_desconto(t[i]);
+            passos = 0;
+        }
+    }
 }
\ No newline at end of file
@@ -7,12 +7,14 @@ class JurosConstanteCpp final : public JurosInterfaceCpp
 private:
     double mapear_t(double t) const override;
     double m_taxa_juros;
+    double m_desconto;
+    double m_log_desconto;
 
 public:
     JurosConstanteCpp();
     JurosConstanteCpp(double taxa_juros);
     double taxa_juros(double t) const override;
-    std::vector<double> taxa_juros(std::vector<double> t) const;
+    void taxa_juros(const double* t, int n, double* ret) const;
     double taxa_desconto(double t) const;
-    std::vector<double> taxa_desconto(std::vector<double> t) const;
+    void taxa_desconto(const double* t, int n, double* ret) const;
 };
@@ -4,7 +4,7 @@ from JurosInterfaceCpp cimport JurosInterfaceCpp
 cdef extern from "JurosConstanteCpp.cpp":
     pass
 
-cdef extern from "JurosConstanteCpp.h":
+cdef extern from "JurosConstanteCpp.h" nogil:
     cdef cppclass JurosConstanteCpp(JurosInterfaceCpp):
         JurosConstanteCpp() except +
         JurosConstanteCpp(double juros)
@@ -0,0 +1,70 @@
+#include "JurosCurvaCpp.h"
+#include <cmath>
+#include <stdexcept>
+
+JurosCurvaCpp::JurosCurvaCpp() {
+}
+
+// taxas_juros[k] é a taxa a termo do período [k, k + 1). O desconto acumulado até cada período é calculado
+// uma única vez, de forma que o desconto em tempos inteiros é apenas uma consulta.
+JurosCurvaCpp::JurosCurvaCpp(const double* taxas_juros, int n) : m_taxas_juros(taxas_juros, taxas_juros + n) {
+    if (n == 0) {
+        throw std::invalid_argument("A curva de juros deve possuir pelo menos uma taxa.");
+    }
+    m_desconto_acumulado.resize(n + 1);
+    m_desconto_acumulado[0] = 1.0;
+    for (int k = 0; k < n; k++) {
+        if (!(taxas_juros[k] > -1.0)) {
+            throw std::invalid_argument("As taxas de juros devem ser maiores que -1.");
+        }
+        m_desconto_acumulado[k + 1] = m_desconto_acumulado[k] / (1.0 + taxas_juros[k]);
+    }
+}
+
+double JurosCurvaCpp::mapear_t(double t) const {
+    return t;
+}
+
+int JurosCurvaCpp::indice(double t) const {
+    if (t < 0) {
+        throw std::invalid_argument("t deve ser maior ou igual a zero.");
+    }
+    int n = m_taxas_juros.size();
+    return t >= n ? n : (int) t;
+}
+
+double JurosCurvaCpp::taxa_juros(double t) const {
+    int k = indice(t);
+    return m_taxas_juros[k == (int) m_taxas_juros.size() ? k - 1 : k];
+}
+
+void JurosCurvaCpp::taxa_juros(const double* t, int n, double* ret) const {
+    for (int i = 0; i < n; i++) {
+        ret[i] = taxa_juros(t[i]);
+    }
+}
+
+// Após o fim da curva, a última taxa a termo é mantida constante. Dentro de cada período,
+// o desconto é interpolado geometricamente com a taxa a termo do período.
+double JurosCurvaCpp::taxa_desconto(double t) const {
+    int k = indice(t);
+    double restante = t - k;
+    if (restante == 0.0) {
+        return m_desconto_acumulado[k];
+    }
+    return m_desconto_acumulado[k] * std::pow(1.0 + taxa_juros(t), -restante);
+}
+
+void JurosCurvaCpp::taxa_desconto(const double* t, int n, double* ret) const {
+    for (int i = 0; i < n; i++) {
+        ret[i] = taxa_desconto(t[i]);
+    }
+}
+
+int JurosCurvaCpp::tamanho() const {
+    return m_taxas_juros.size();
+}
+
+const double* JurosCurvaCpp::dados_taxas_juros() const {
+    return m_taxas_juros.data();
+}
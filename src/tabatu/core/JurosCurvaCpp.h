@@ -0,0 +1,23 @@
+#pragma once
+#include <vector>
+#include "JurosInterfaceCpp.h"
+
+
+class JurosCurvaCpp final : public JurosInterfaceCpp
+{
+private:
+    double mapear_t(double t) const override;
+    std::vector<double> m_taxas_juros;
+    std::vector<double> m_desconto_acumulado;
+    int indice(double t) const;
+
+public:
+    JurosCurvaCpp();
+    JurosCurvaCpp(const double* taxas_juros, int n);
+    double taxa_juros(double t) const override;
+    void taxa_juros(const double* t, int n, double* ret) const;
+    double taxa_desconto(double t) const;
+    void taxa_desconto(const double* t, int n, double* ret) const;
+    int tamanho() const;
+    const double* dados_taxas_juros() const;
+};
@@ -0,0 +1,11 @@
+from JurosInterfaceCpp cimport JurosInterfaceCpp
+
+cdef extern from "JurosCurvaCpp.cpp":
+    pass
+
+cdef extern from "JurosCurvaCpp.h" nogil:
+    cdef cppclass JurosCurvaCpp(JurosInterfaceCpp):
+        JurosCurvaCpp() except +
+        JurosCurvaCpp(const double* taxas_juros, int n) except +
+        int tamanho()
+        const double* dados_taxas_juros()
@@ -8,18 +8,14 @@ double JurosInterfaceCpp::taxa_desconto(double t) const {
     return std::pow(1.0 + taxa_juros(t), -mapear_t(t));
 }
 
-std::vector<double> JurosInterfaceCpp::taxa_desconto(std::vector<double> t) const {
-    std::vector<double> taxa(t.size());
-    for (int i = 0; i < t.size(); i++) {
-        taxa[i] = taxa_desconto(t[i]);
+void JurosInterfaceCpp::taxa_desconto(const double* t, int n, double* ret) const {
+    for (int i = 0; i < n; i++) {
+        ret[i] = taxa_desconto(t[i]);
     }
-    return taxa;
 }
 
-std::vector<double> JurosInterfaceCpp::taxa_juros(std::vector<double> t) const {
-    std::vector<double> taxa(t.size());
-    for (int i = 0; i < t.size(); i++) {
-        taxa[i] = taxa_juros(t[i]);
+void JurosInterfaceCpp::taxa_juros(const double* t, int n, double* ret) const {
+    for (int i = 0; i < n; i++) {
+        ret[i] = taxa_juros(t[i]);
     }
-    return taxa;
 }
\ No newline at end of file
@@ -9,8 +9,8 @@ private:
 public:
     JurosInterfaceCpp();
     virtual double taxa_juros(double t) const = 0;
-    std::vector<double> taxa_juros(std::vector<double> t) const;
+    void taxa_juros(const double* t, int n, double* ret) const;
     double taxa_desconto(double t) const;
-    std::vector<double> taxa_desconto(std::vector<double> t) const;
+    void taxa_desconto(const double* t, int n, double* ret) const;
 
 };
\ No newline at end of file
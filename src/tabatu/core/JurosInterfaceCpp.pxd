@@ -4,8 +4,8 @@ from libcpp.vector cimport vector
 cdef extern from "JurosInterfaceCpp.cpp":
     pass
 
-cdef extern from "JurosInterfaceCpp.h":
+cdef extern from "JurosInterfaceCpp.h" nogil:
     cdef cppclass JurosInterfaceCpp:
         JurosInterfaceCpp() except +
-        vector[double] taxa_juros(vector[double] t) const
-        vector[double] taxa_desconto(vector[double] t) const
+        void taxa_juros(const double* t, int n, double* ret) except +
+        void taxa_desconto(const double* t, int n, double* ret) except +
@@ -1,71 +1,336 @@
 #include "TabuaBaseCpp.h"
-#include <math.h>
+#include "alterar_tabua.h"
+#include <algorithm>
+#include <cmath>
 #include <limits>
 #include <stdexcept>
 
+// Aloca um vetor próprio de n valores, cuja memória pertence ao dono.
+static double* alocar(DonoCpp& dono, size_t n, double valor) {
+    auto dados = std::make_shared<std::vector<double>>(n, valor);
+    dono = dados;
+    return dados->data();
+}
+
 TabuaBaseCpp::TabuaBaseCpp() {
+    calcular_log_lx();
 }
 
 TabuaBaseCpp::TabuaBaseCpp(std::vector<double> qx) :
-    m_qx(qx)
+    TabuaBaseCpp(qx.data(), (int)qx.size())
+{
+}
+
+TabuaBaseCpp::TabuaBaseCpp(const double* qx, int n)
+{
+    double* qx_proprio = alocar(m_dono_qx, n, 0.0);
+    std::copy(qx, qx + n, qx_proprio);
+    m_qx = qx_proprio;
+    m_tamanho_armazenado = m_qx_size = n;
+    calcular_log_lx();
+}
+
+TabuaBaseCpp::TabuaBaseCpp(const double* qx, const double* log_lx, int n)
+{
+    // Usado quando a sobrevivência acumulada já foi calculada por outra tábua, por exemplo,
+    // em outro processo. Apenas o tempo futuro máximo e o último qx precisam ser recuperados.
+    double* qx_proprio = alocar(m_dono_qx, n, 0.0);
+    double* log_lx_proprio = alocar(m_dono_log_lx, n + 1, 0.0);
+    std::copy(qx, qx + n, qx_proprio);
+    std::copy(log_lx, log_lx + n + 1, log_lx_proprio);
+    m_qx = qx_proprio;
+    m_log_lx = log_lx_proprio;
+    m_tamanho_armazenado = m_qx_size = n;
+    calcular_limites();
+}
+
+TabuaBaseCpp::TabuaBaseCpp(const double* qx, const double* log_lx, int n, DonoCpp dono) :
+    m_dono_qx(dono), m_qx(qx)
+{
+    // As taxas, e o log da sobrevivência acumulada se informado, são usados diretamente da memória do dono,
+    // sem cópias. O dono deve manter a memória válida e inalterada enquanto existir alguma cópia da tábua.
+    m_tamanho_armazenado = m_qx_size = n;
+    if (log_lx == nullptr) {
+        calcular_log_lx();
+        return;
+    }
+    m_dono_log_lx = dono;
+    m_log_lx = log_lx;
+    calcular_limites();
+}
+
+TabuaBaseCpp::TabuaBaseCpp(const double* qx_selecao, int idades, int periodo_selecao) :
+    m_idades_selecao(idades), m_periodo_selecao(periodo_selecao)
+{
+    validar_selecao();
+    int colunas = m_periodo_selecao + 1;
+    size_t tamanho = (size_t)idades * colunas;
+    double* qx_proprio = alocar(m_dono_selecao, 2 * tamanho, -std::numeric_limits<double>::infinity());
+    double* log_lx_proprio = qx_proprio + tamanho;
+    std::copy(qx_selecao, qx_selecao + tamanho, qx_proprio);
+    m_qx_selecao = qx_proprio;
+    m_log_lx_selecao = log_lx_proprio;
+    // Sobrevivência acumulada de cada idade de entrada ao longo do período de seleção.
+    for (int linha = 0; linha < idades; linha++)
+    {
+        const double* qx = &qx_proprio[(size_t)linha * colunas];
+        double* log_lx = &log_lx_proprio[(size_t)linha * colunas];
+        log_lx[0] = 0.0;
+        for (int d = 0; d < m_periodo_selecao && qx[d] < 1.0; d++)
+        {
+            log_lx[d + 1] = log_lx[d] + std::log1p(-qx[d]);
+        }
+    }
+    inicializar_tabua_final();
+}
+
+TabuaBaseCpp::TabuaBaseCpp(const double* qx_selecao, const double* log_lx_selecao, int idades, int periodo_selecao) :
+    m_idades_selecao(idades), m_periodo_selecao(periodo_selecao)
 {
-    m_qx_size = (int)m_qx.size();
-    m_lx = std::vector<double>(m_qx_size + 1);
+    validar_selecao();
+    size_t tamanho = (size_t)idades * (periodo_selecao + 1);
+    double* qx_proprio = alocar(m_dono_selecao, 2 * tamanho, 0.0);
+    std::copy(qx_selecao, qx_selecao + tamanho, qx_proprio);
+    std::copy(log_lx_selecao, log_lx_selecao + tamanho, qx_proprio + tamanho);
+    m_qx_selecao = qx_proprio;
+    m_log_lx_selecao = qx_proprio + tamanho;
+    inicializar_tabua_final();
+}
+
+void TabuaBaseCpp::validar_selecao() const {
+    if (m_idades_selecao <= 0) {
+        throw std::invalid_argument("A tábua seletiva deve possuir pelo menos uma idade de entrada.");
+    }
+    if (m_periodo_selecao <= 0) {
+        throw std::invalid_argument("O período de seleção deve ser maior que zero.");
+    }
+}
+
+void TabuaBaseCpp::inicializar_tabua_final() {
+    // A tábua final é indexada pela idade atingida: a taxa da idade x + s é a última coluna da linha x.
+    // Idades atingidas menores que o período de seleção só ocorrem durante a seleção, e repetem a
+    // primeira taxa final.
+    int s = m_periodo_selecao;
+    m_tamanho_armazenado = m_qx_size = m_idades_selecao + s;
+    double* qx = alocar(m_dono_qx, m_qx_size, 0.0);
+    for (int y = 0; y < m_qx_size; y++)
+    {
+        qx[y] = m_qx_selecao[(size_t)std::max(y - s, 0) * (s + 1) + s];
+    }
+    m_qx = qx;
+    calcular_log_lx();
+}
 
-    calcular_lx(10000.0);
+void TabuaBaseCpp::calcular_log_lx() {
+    double* log_lx = alocar(m_dono_log_lx, m_qx_size + 1, 0.0);
+    preencher_log_lx(m_qx, m_qx_size, log_lx);
+    m_log_lx = log_lx;
+    calcular_limites();
 }
 
-void TabuaBaseCpp::calcular_lx(double raiz) {
-    m_lx[0] = raiz;
-    for (int i = 1; i < m_qx_size + 1; i++)
+void TabuaBaseCpp::preencher_log_lx(const double* qx, int n, double* log_lx) {
+    // A sobrevivência acumulada é guardada em escala log, evitando o underflow de lx em tábuas longas
+    // (mensais ou diárias). Somente um qx igual a 1 zera a sobrevivência e define o tempo futuro máximo.
+    log_lx[0] = 0.0;
+    int i = 1;
+    for (; i < n + 1 && qx[i - 1] < 1.0; i++)
     {
-        m_lx[i] = m_lx[i - 1] * (1 - m_qx[i - 1]);
-        if (m_lx[i] == 0) {
-            m_w = (double)(i - 1);
+        log_lx[i] = log_lx[i - 1] + std::log1p(-qx[i - 1]);
+    }
+    std::fill(log_lx + i, log_lx + n + 1, -std::numeric_limits<double>::infinity());
+}
+
+void TabuaBaseCpp::calcular_limites() {
+    for (int i = 0; i < m_qx_size; i++)
+    {
+        if (m_qx[i] >= 1.0) {
+            m_w = (double)i;
             break;
         }
     }
+    if (m_qx_size > 0 && m_qx[m_qx_size - 1] < 1.0) {
+        m_log_px_ultimo = std::log1p(-m_qx[m_qx_size - 1]);
+    }
+}
+
+double TabuaBaseCpp::tempo_futuro_maximo_final(int x) const {
+    return std::max(m_w - x + 1.0, 0.0);
 }
 
 double TabuaBaseCpp::tempo_futuro_maximo(int x) const {
     if (x < 0) {
         throw std::invalid_argument("x deve ser maior ou igual a 0");
     }
-    return std::max(m_w - x + 1.0, 0.0);
+    if (m_periodo_selecao > 0) {
+        const double* qx = &m_qx_selecao[(size_t)std::min(x, m_idades_selecao - 1) * (m_periodo_selecao + 1)];
+        for (int d = 0; d < m_periodo_selecao; d++)
+        {
+            if (qx[d] >= 1.0) {
+                return d + 1.0;
+            }
+        }
+        return m_periodo_selecao + tempo_futuro_maximo_final(x + m_periodo_selecao);
+    }
+    return tempo_futuro_maximo_final(x);
 }
 
 bool TabuaBaseCpp::possui_fechamento_plato() const {
-    return isinf(m_w);
+    return std::isinf(m_w);
 }
 
 std::vector<double> TabuaBaseCpp::pega_qx() const
+{
+    if (m_razao == 1) {
+        return std::vector<double>(m_qx, m_qx + m_qx_size);
+    }
+    std::vector<double> qx(m_qx_size);
+    for (int i = 0; i < m_qx_size; i++)
+    {
+        qx[i] = qx_indice(i);
+    }
+    return qx;
+}
+
+const double* TabuaBaseCpp::dados_qx() const
 {
     return m_qx;
 }
 
-double TabuaBaseCpp::lx(double x) const {
-    double limite_superior_x = std::min(tempo_futuro_maximo(0), (double)(m_qx_size));
-    int x_trunc = (int)std::min(x, limite_superior_x);
-    double lx_ret = m_lx[x_trunc];
-    if (possui_fechamento_plato() && (x > x_trunc)) {
-        int extras = (int)x - x_trunc;
-        double qx_last = m_qx.back();
-        for (int i = 0; i < extras; i++)
+const double* TabuaBaseCpp::dados_log_lx() const
+{
+    return m_log_lx;
+}
+
+int TabuaBaseCpp::tamanho_qx() const
+{
+    return m_qx_size;
+}
+
+int TabuaBaseCpp::periodo_selecao() const
+{
+    return m_periodo_selecao;
+}
+
+int TabuaBaseCpp::idades_selecao() const
+{
+    return m_idades_selecao;
+}
+
+const double* TabuaBaseCpp::dados_qx_selecao() const
+{
+    return m_qx_selecao;
+}
+
+const double* TabuaBaseCpp::dados_log_lx_selecao() const
+{
+    return m_log_lx_selecao;
+}
+
+HipoteseFracionariaCpp TabuaBaseCpp::pega_hipotese_fracionaria() const
+{
+    return m_hipotese_fracionaria;
+}
+
+void TabuaBaseCpp::definir_hipotese_fracionaria(HipoteseFracionariaCpp hipotese_fracionaria)
+{
+    m_hipotese_fracionaria = hipotese_fracionaria;
+}
+
+int TabuaBaseCpp::razao_periodicidade() const
+{
+    return m_razao;
+}
+
+// Cria uma visão com razao períodos em cada período das taxas armazenadas. As taxas armazenadas são mantidas,
+// e apenas a taxa convertida e o log da sobrevivência em um período são calculados, uma vez por idade.
+TabuaBaseCpp TabuaBaseCpp::visao_periodicidade(int razao) const
+{
+    if (razao < 1) {
+        throw std::invalid_argument("A razão entre as periodicidades deve ser maior que zero.");
+    }
+    if (m_periodo_selecao > 0) {
+        throw std::invalid_argument("A periodicidade de tábuas seletivas não pode ser alterada.");
+    }
+    TabuaBaseCpp visao(*this);
+    int n = m_tamanho_armazenado;
+    visao.m_razao = razao;
+    visao.m_qx_size = n * razao;
+    visao.m_w = std::isinf(m_w) ? m_w : (m_w / m_razao) * razao;
+    visao.m_dono_periodo.reset();
+    visao.m_qx_periodo = visao.m_log_px_periodo = nullptr;
+    if (razao > 1) {
+        // As cópias da visão compartilham as taxas convertidas, calculadas uma única vez.
+        double* qx_periodo = alocar(visao.m_dono_periodo, 2 * (size_t)n, 0.0);
+        double* log_px_periodo = qx_periodo + n;
+        for (int i = 0; i < n; i++)
         {
-            lx_ret = lx_ret * (1 - qx_last);
+            qx_periodo[i] = reduzir_periodicidade(m_qx[i], razao);
+            log_px_periodo[i] = std::log1p(-qx_periodo[i]);
         }
+        visao.m_qx_periodo = qx_periodo;
+        visao.m_log_px_periodo = log_px_periodo;
+    }
+    if (n > 0 && m_qx[n - 1] < 1.0) {
+        visao.m_log_px_ultimo = razao > 1 ? visao.m_log_px_periodo[n - 1] : std::log1p(-m_qx[n - 1]);
+    }
+    return visao;
+}
+
+// Copia as taxas e o log da sobrevivência acumulada de cada período, com tamanhos tamanho_qx() e tamanho_qx() + 1.
+void TabuaBaseCpp::materializar(double* qx, double* log_lx) const
+{
+    for (int i = 0; i < m_qx_size; i++)
+    {
+        qx[i] = qx_indice(i);
+        log_lx[i] = log_lx_indice(i);
     }
-    return lx_ret;
+    log_lx[m_qx_size] = log_lx_indice(m_qx_size);
 }
 
-std::vector<double> TabuaBaseCpp::qx(int x, std::vector<double> t) const {
-    std::vector<double> ret(t.size());
-    int n = (int)t.size();
+double TabuaBaseCpp::qx_indice(int i) const {
+    if (m_razao == 1) {
+        return m_qx[i];
+    }
+    return m_qx_periodo[i / m_razao];
+}
+
+double TabuaBaseCpp::log_lx_indice(int i) const {
+    if (m_razao == 1) {
+        return m_log_lx[i];
+    }
+    int idade = i / m_razao;
+    int resto = i % m_razao;
+    if (resto == 0) {
+        return m_log_lx[idade];
+    }
+    return m_log_lx[idade] + resto * m_log_px_periodo[idade];
+}
+
+double TabuaBaseCpp::log_lx(double x) const {
+    double limite_superior_x = std::min(tempo_futuro_maximo_final(0), (double)(m_qx_size));
+    int x_trunc = (int)std::min(x, limite_superior_x);
+    double log_lx_ret = log_lx_indice(x_trunc);
+    if (possui_fechamento_plato() && (x > x_trunc)) {
+        // Após o fim da tábua, o último qx se repete indefinidamente: a sobrevivência é obtida em O(1).
+        double extras = std::floor(x) - x_trunc;
+        log_lx_ret += extras * m_log_px_ultimo;
+    }
+    return log_lx_ret;
+}
+
+void TabuaBaseCpp::qx(int x, const double* t, int n, double* ret) const {
     for (int i = 0; i < n; i++)
     {
         ret[i] = qx(x, t[i]);
     }
-    return ret;
+}
+
+double TabuaBaseCpp::qx_final(int x, double t) const {
+    int limite_superior_x = (int)std::min(tempo_futuro_maximo_final(0), (double)(m_qx_size - 1));
+    x = std::min(x, limite_superior_x);
+    double limite_superior_t = std::min(tempo_futuro_maximo_final(x), (double)(m_qx_size - x - 1));
+    t = std::min(t, limite_superior_t);
+    return qx_indice(x + (int)t);
 }
 
 double TabuaBaseCpp::qx(int x, double t) const {
@@ -75,11 +340,26 @@ double TabuaBaseCpp::qx(int x, double t) const {
     if (t < 0) {
         throw std::invalid_argument("t deve ser maior ou igual a 0");
     }
-    int limite_superior_x = (int)std::min(tempo_futuro_maximo(0), (double)(m_qx_size - 1));
-    x = std::min(x, limite_superior_x);
-    double limite_superior_t = std::min(tempo_futuro_maximo(x), (double)(m_qx_size - x - 1));
-    t = std::min(t, limite_superior_t);
-    return m_qx[x + (int)t];
+    double inteiro = std::floor(t);
+    if (m_hipotese_fracionaria == HipoteseFracionariaCpp::NENHUMA || t == inteiro) {
+        return qx_inteiro(x, t);
+    }
+    // Em tempos fracionados, qx é a probabilidade de falha no período [t, t + 1), que abrange duas idades.
+    double sobrevivencia = tpx(x, t);
+    if (sobrevivencia == 0) {
+        return qx_inteiro(x, inteiro);
+    }
+    return 1 - tpx(x, t + 1) / sobrevivencia;
+}
+
+double TabuaBaseCpp::qx_inteiro(int x, double t) const {
+    if (t < m_periodo_selecao) {
+        // Durante a seleção, x é a idade de entrada e t é a duração. Idades de entrada acima da
+        // última linha usam as taxas seletivas da última linha.
+        int linha = std::min(x, m_idades_selecao - 1);
+        return m_qx_selecao[(size_t)linha * (m_periodo_selecao + 1) + (int)t];
+    }
+    return qx_final(x, t);
 }
 
 double TabuaBaseCpp::tpx(int x, double t) const {
@@ -92,35 +372,76 @@ double TabuaBaseCpp::tpx(int x, double t) const {
     if (t == 0) {
         return 1;
     }
-    double _lx = lx(x);
-    double _lxt = lx(x + t);
-    if (_lx == 0) {
+    double ret = tpx_inteiro(x, t);
+    double fracao = t - std::floor(t);
+    if (m_hipotese_fracionaria == HipoteseFracionariaCpp::NENHUMA || fracao == 0 || ret == 0) {
+        return ret;
+    }
+    return ret * sobrevivencia_fracionaria(qx_inteiro(x, std::floor(t)), fracao);
+}
+
+// Probabilidade de sobreviver a uma fração do período, dada a probabilidade de falha no período inteiro.
+double TabuaBaseCpp::sobrevivencia_fracionaria(double qx, double fracao) const {
+    switch (m_hipotese_fracionaria)
+    {
+    case HipoteseFracionariaCpp::UDD:
+        return 1 - fracao * qx;
+    case HipoteseFracionariaCpp::FORCA_CONSTANTE:
+        return qx >= 1 ? 0 : std::exp(fracao * std::log1p(-qx));
+    case HipoteseFracionariaCpp::BALDUCCI:
+        return (1 - qx) / (1 - (1 - fracao) * qx);
+    default:
+        return 1;
+    }
+}
+
+// Sobrevivência até o tempo inteiro floor(t).
+double TabuaBaseCpp::tpx_inteiro(int x, double t) const {
+    if (m_periodo_selecao > 0) {
+        return tpx_selecao(x, t);
+    }
+    double _log_lx = log_lx(x);
+    if (std::isinf(_log_lx)) {
+        return 0;
+    }
+    return std::exp(log_lx(x + t) - _log_lx);
+}
+
+// A sobrevivência de uma vida que entrou com idade x é a sobrevivência ao longo da seleção, seguida pela
+// sobrevivência da tábua final a partir da idade atingida x + s.
+double TabuaBaseCpp::tpx_selecao(int x, double t) const {
+    int s = m_periodo_selecao;
+    double duracao = std::floor(t);
+    int linha = std::min(x, m_idades_selecao - 1);
+    double log_tpx = m_log_lx_selecao[(size_t)linha * (s + 1) + (int)std::min(duracao, (double)s)];
+    if (std::isinf(log_tpx)) {
+        return 0;
+    }
+    if (duracao <= s) {
+        return std::exp(log_tpx);
+    }
+    double log_lx_fim_selecao = log_lx(x + s);
+    if (std::isinf(log_lx_fim_selecao)) {
         return 0;
     }
-    return _lxt / _lx;
+    return std::exp(log_tpx + log_lx(x + t) - log_lx_fim_selecao);
 }
 
-std::vector<double> TabuaBaseCpp::tpx(int x, std::vector<double> t) const {
-    std::vector<double> ret(t.size());
-    int n = (int)t.size();
+void TabuaBaseCpp::tpx(int x, const double* t, int n, double* ret) const {
     for (int i = 0; i < n; i++)
     {
         ret[i] = tpx(x, t[i]);
     }
-    return ret;
 }
 
 double TabuaBaseCpp::t_qx(int x, double t) const {
-    return qx(x, t) * tpx(x, (int)t);
+    return qx(x, t) * tpx(x, t);
 }
 
-std::vector<double> TabuaBaseCpp::t_qx(int x, std::vector<double> t) const {
-    std::vector<double> ret(t.size());
-    int n = (int)t.size();
+void TabuaBaseCpp::t_qx(int x, const double* t, int n, double* ret) const {
     for (int i = 0; i < n; i++)
     {
         ret[i] = t_qx(x, t[i]);
     }
-    return ret;
 }
 
@@ -1,30 +1,87 @@
 #pragma once
 #include <vector>
 #include <limits>
+#include <memory>
 
+// Dono da memória das taxas de uma tábua: um vetor da própria tábua ou um buffer externo.
+using DonoCpp = std::shared_ptr<const void>;
+
+// Hipótese para a sobrevivência entre idades inteiras. NENHUMA trunca o tempo para inteiro.
+enum class HipoteseFracionariaCpp { NENHUMA, UDD, FORCA_CONSTANTE, BALDUCCI };
 
 class TabuaBaseCpp final
 {
 private:
-    std::vector<double> m_qx;
-    std::vector<double> m_lx;
+    // Taxas e log da sobrevivência acumulada armazenados. A tábua é imutável após a criação, e a memória é
+    // compartilhada entre as suas cópias, ou pertence a um buffer externo mantido pelos donos.
+    DonoCpp m_dono_qx;
+    DonoCpp m_dono_log_lx;
+    const double* m_qx = nullptr;
+    const double* m_log_lx = nullptr;
+    int m_tamanho_armazenado = 0;
+    double m_log_px_ultimo = 0.0;
     double m_w = std::numeric_limits<double>::infinity();
-    int m_qx_size;
+    int m_qx_size = 0;
+    // Tábuas seletivas: matrizes (idades de entrada) x (período de seleção + 1), contíguas por linha, na mesma
+    // memória compartilhada.
+    DonoCpp m_dono_selecao;
+    const double* m_qx_selecao = nullptr;
+    const double* m_log_lx_selecao = nullptr;
+    int m_idades_selecao = 0;
+    int m_periodo_selecao = 0;
+    HipoteseFracionariaCpp m_hipotese_fracionaria = HipoteseFracionariaCpp::NENHUMA;
+    // Visões de periodicidade: cada período da tábua é uma fração 1 / m_razao de um período das taxas
+    // armazenadas. A taxa convertida e o log da sobrevivência em um período são guardados por idade armazenada,
+    // na mesma memória compartilhada.
+    int m_razao = 1;
+    DonoCpp m_dono_periodo;
+    const double* m_qx_periodo = nullptr;
+    const double* m_log_px_periodo = nullptr;
 
 public:
     TabuaBaseCpp();
     TabuaBaseCpp(std::vector<double> qx);
+    TabuaBaseCpp(const double* qx, int n);
+    TabuaBaseCpp(const double* qx, const double* log_lx, int n);
+    TabuaBaseCpp(const double* qx, const double* log_lx, int n, DonoCpp dono);
+    TabuaBaseCpp(const double* qx_selecao, int idades, int periodo_selecao);
+    TabuaBaseCpp(const double* qx_selecao, const double* log_lx_selecao, int idades, int periodo_selecao);
     double qx(int x, double t) const;
     double tpx(int x, double t) const;
     double t_qx(int x, double t) const;
-    std::vector<double> qx(int x, std::vector<double> t) const;
-    std::vector<double> tpx(int x, std::vector<double> t) const;
-    std::vector<double> t_qx(int x, std::vector<double> t) const;
+    void qx(int x, const double* t, int n, double* ret) const;
+    void tpx(int x, const double* t, int n, double* ret) const;
+    void t_qx(int x, const double* t, int n, double* ret) const;
     double tempo_futuro_maximo(int x) const;
     bool possui_fechamento_plato() const;
     std::vector<double> pega_qx() const;
+    const double* dados_qx() const;
+    const double* dados_log_lx() const;
+    int tamanho_qx() const;
+    int periodo_selecao() const;
+    int idades_selecao() const;
+    const double* dados_qx_selecao() const;
+    const double* dados_log_lx_selecao() const;
+    HipoteseFracionariaCpp pega_hipotese_fracionaria() const;
+    void definir_hipotese_fracionaria(HipoteseFracionariaCpp hipotese_fracionaria);
+    int razao_periodicidade() const;
+    TabuaBaseCpp visao_periodicidade(int razao) const;
+    void materializar(double* qx, double* log_lx) const;
+    // Calcula o log da sobrevivência acumulada, com n + 1 elementos, a partir de n taxas.
+    static void preencher_log_lx(const double* qx, int n, double* log_lx);
 
 private:
-    double lx(double x) const;
-    void calcular_lx(double raiz);
+    double log_lx(double x) const;
+    double qx_indice(int i) const;
+    double log_lx_indice(int i) const;
+    void calcular_log_lx();
+    void calcular_limites();
+    void validar_selecao() const;
+    void inicializar_tabua_final();
+    double tempo_futuro_maximo_final(int x) const;
+    double qx_final(int x, double t) const;
+    double qx_inteiro(int x, double t) const;
+    double tpx_inteiro(int x, double t) const;
+    double tpx_selecao(int x, double t) const;
+    double sobrevivencia_fracionaria(double qx, double fracao) const;
 };
\ No newline at end of file
@@ -4,16 +4,39 @@ from libcpp cimport bool
 cdef extern from "TabuaBaseCpp.cpp":
     pass
 
-cdef extern from "TabuaBaseCpp.h":
+cdef extern from "TabuaBaseCpp.h" nogil:
+    cdef cppclass HipoteseFracionariaCpp:
+        pass
+
+    cdef cppclass DonoCpp:
+        pass
+
     cdef cppclass TabuaBaseCpp:
         TabuaBaseCpp() except +
         TabuaBaseCpp(vector[double] qx)
+        TabuaBaseCpp(const double* qx, int n)
+        TabuaBaseCpp(const double* qx, const double* log_lx, int n)
+        TabuaBaseCpp(const double* qx, const double* log_lx, int n, DonoCpp dono)
+        TabuaBaseCpp(const double* qx_selecao, int idades, int periodo_selecao) except +
+        TabuaBaseCpp(const double* qx_selecao, const double* log_lx_selecao, int idades, int periodo_selecao) except +
         double qx(int x, double t) const
         double tpx(int x, double t) const
         double t_qx(int x, double t) const
-        vector[double] qx(int x, vector[double] t) except +
-        vector[double] tpx(int x, vector[double] t) except +
-        vector[double] t_qx(int x, vector[double] t) except +
+        void qx(int x, const double* t, int n, double* ret) except +
+        void tpx(int x, const double* t, int n, double* ret) except +
+        void t_qx(int x, const double* t, int n, double* ret) except +
         double tempo_futuro_maximo(int x) except +
         bool possui_fechamento_plato() const
         vector[double] pega_qx() const
+        const double* dados_qx() const
+        const double* dados_log_lx() const
+        int tamanho_qx() const
+        int periodo_selecao() const
+        int idades_selecao() const
+        const double* dados_qx_selecao() const
+        const double* dados_log_lx_selecao() const
+        HipoteseFracionariaCpp pega_hipotese_fracionaria() const
+        void definir_hipotese_fracionaria(HipoteseFracionariaCpp hipotese_fracionaria)
+        int razao_periodicidade() const
+        TabuaBaseCpp visao_periodicidade(int razao) except +
+        void materializar(double* qx, double* log_lx) const
@@ -2,10 +2,10 @@
 #include "TabuaBaseCpp.h"
 #include <stdexcept>
 
-std::vector<TabuaBaseCpp> extrairTabuasBase(std::vector<TabuaCpp> tabuas) {
+std::vector<TabuaBaseCpp> extrairTabuasBase(const std::vector<TabuaCpp>& tabuas) {
     std::vector<TabuaBaseCpp> tabuasBase;
     tabuasBase.reserve(tabuas.size());
-    for (TabuaCpp tabua : tabuas) {
+    for (const TabuaCpp& tabua : tabuas) {
         tabuasBase.push_back(tabua.pega_tabuas()[0]);
     }
     return tabuasBase;
@@ -14,58 +14,56 @@ std::vector<TabuaBaseCpp> extrairTabuasBase(std::vector<TabuaCpp> tabuas) {
 TabuaCpp::TabuaCpp() : TabuaInterfaceCpp() {
 }
 
-TabuaCpp::TabuaCpp(std::vector<double> qx) : TabuaInterfaceCpp(1, 1, { TabuaBaseCpp(qx) })
+TabuaCpp::TabuaCpp(std::vector<double> qx) : TabuaCpp(TabuaBaseCpp(qx))
+{
+}
+
+TabuaCpp::TabuaCpp(const double* qx, int n) : TabuaCpp(TabuaBaseCpp(qx, n))
 {
-    m_tabuas = { TabuaBaseCpp(qx) };
 }
 
 TabuaCpp::TabuaCpp(TabuaBaseCpp tabua) : TabuaInterfaceCpp(1, 1, { tabua })
 {
-    m_tabuas = { tabua };
 }
 
-double TabuaCpp::qx(std::vector<int> x, double t) const {
-    return m_tabuas[0].qx(x[0], t);
+double TabuaCpp::qx(const std::vector<int>& x, double t) const {
+    return tabua(0).qx(x[0], t);
 }
 
-double TabuaCpp::tpx(std::vector<int> x, double t) const {
-    return m_tabuas[0].tpx(x[0], t);
+double TabuaCpp::tpx(const std::vector<int>& x, double t) const {
+    return tabua(0).tpx(x[0], t);
 }
 
-std::vector<double> TabuaCpp::qx(std::vector<int> x, std::vector<double> t) const {
-    if (x.size() > 1) {
+void TabuaCpp::qx(const std::vector<int>& x, const double* t, int n, double* ret) const {
+    if (x.size() != 1) {
         throw std::invalid_argument("x deve ter tamanho 1");
     }
-    return m_tabuas[0].qx(x[0], t);
+    tabua(0).qx(x[0], t, n, ret);
 }
 
-std::vector<double> TabuaCpp::tpx(std::vector<int> x, std::vector<double> t) const {
-    if (x.size() > 1) {
+void TabuaCpp::tpx(const std::vector<int>& x, const double* t, int n, double* ret) const {
+    if (x.size() != 1) {
         throw std::invalid_argument("x deve ter tamanho 1");
     }
-    return m_tabuas[0].tpx(x[0], t);
+    tabua(0).tpx(x[0], t, n, ret);
 }
 
-std::vector<double> TabuaCpp::t_qx(std::vector<int> x, std::vector<double> t) const {
+void TabuaCpp::t_qx(const std::vector<int>& x, const double* t, int n, double* ret) const {
     if (x.size() != m_numero_decrementos * m_numero_vidas) {
         throw std::invalid_argument("x deve ter o mesmo tamanho que a quantidade de vidas ou decrementos");
     }
-    std::vector<double> ret(t.size());
-    int n = (int)t.size();
     for (int i = 0; i < n; i++)
     {
         ret[i] = TabuaInterfaceCpp::t_qx(x, t[i]);
     }
-    return ret;
 }
 
-double TabuaCpp::tempo_futuro_maximo(std::vector<int> x) const {
-    if (x.size() > 1) {
+double TabuaCpp::tempo_futuro_maximo(const std::vector<int>& x) const {
+    if (x.size() != 1) {
         throw std::invalid_argument("x deve ter tamanho 1");
     }
-    return m_tabuas[0].tempo_futuro_maximo(x[0]);
+    return tabua(0).tempo_futuro_maximo(x[0]);
 }
 
 
 
-
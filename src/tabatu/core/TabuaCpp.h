@@ -5,21 +5,17 @@
 
 class TabuaCpp final : public TabuaInterfaceCpp
 {
-private:
-    std::vector<TabuaBaseCpp> m_tabuas;
-    int m_numero_vidas = 1;
-    int m_numero_decrementos = 1;
-
 public:
     TabuaCpp();
     TabuaCpp(std::vector<double> qx);
+    TabuaCpp(const double* qx, int n);
     TabuaCpp(TabuaBaseCpp tabua);
-    double qx(std::vector<int> x, double t) const;
-    double tpx(std::vector<int> x, double t) const;
-    std::vector<double> qx(std::vector<int> x, std::vector<double> t) const;
-    std::vector<double> tpx(std::vector<int> x, std::vector<double> t) const;
-    std::vector<double> t_qx(std::vector<int> x, std::vector<double> t) const;
-    double tempo_futuro_maximo(std::vector<int> x) const;
+    double qx(const std::vector<int>& x, double t) const override;
+    double tpx(const std::vector<int>& x, double t) const override;
+    void qx(const std::vector<int>& x, const double* t, int n, double* ret) const override;
+    void tpx(const std::vector<int>& x, const double* t, int n, double* ret) const override;
+    void t_qx(const std::vector<int>& x, const double* t, int n, double* ret) const override;
+    double tempo_futuro_maximo(const std::vector<int>& x) const override;
 };
 
-std::vector<TabuaBaseCpp> extrairTabuasBase(std::vector<TabuaCpp> tabuas);
\ No newline at end of file
+std::vector<TabuaBaseCpp> extrairTabuasBase(const std::vector<TabuaCpp>& tabuas);
\ No newline at end of file
@@ -1,14 +1,17 @@
 from libcpp.vector cimport vector
 from TabuaInterfaceCpp cimport TabuaInterfaceCpp
+from TabuaBaseCpp cimport TabuaBaseCpp
 
 cdef extern from "TabuaCpp.cpp":
     pass
 
-cdef extern from "TabuaCpp.h":
+cdef extern from "TabuaCpp.h" nogil:
     cdef cppclass TabuaCpp(TabuaInterfaceCpp):
         TabuaCpp() except +
         TabuaCpp(vector[double] qx)
-        vector[double] qx(vector[int] x, vector[double] t) except +
-        vector[double] tpx(vector[int] x, vector[double] t) except +
-        vector[double] t_qx(vector[int] x, vector[double] t) except +
-        double tempo_futuro_maximo(vector[int] x) except +
+        TabuaCpp(const double* qx, int n)
+        TabuaCpp(TabuaBaseCpp tabua)
+        void qx(const vector[int]& x, const double* t, int n, double* ret) except +
+        void tpx(const vector[int]& x, const double* t, int n, double* ret) except +
+        void t_qx(const vector[int]& x, const double* t, int n, double* ret) except +
+        double tempo_futuro_maximo(const vector[int]& x) except +
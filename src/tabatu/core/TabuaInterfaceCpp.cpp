@@ -8,7 +8,8 @@ TabuaInterfaceCpp::TabuaInterfaceCpp()
 }
 
 TabuaInterfaceCpp::TabuaInterfaceCpp(int numero_decrementos, int numero_vidas, std::vector<TabuaBaseCpp> tabuas) :
-    m_numero_decrementos(numero_decrementos), m_numero_vidas(numero_vidas), m_tabuas(tabuas)
+    m_numero_decrementos(numero_decrementos), m_numero_vidas(numero_vidas),
+    m_tabuas(std::make_shared<const std::vector<TabuaBaseCpp>>(std::move(tabuas)))
 {
 
 }
@@ -19,8 +20,48 @@ bool TabuaInterfaceCpp::possui_fechamento_plato() const {
 }
 
 
-double TabuaInterfaceCpp::t_qx(std::vector<int> x, double t) const {
-    return qx(x, t) * tpx(x, (int)t);
+double TabuaInterfaceCpp::t_qx(const std::vector<int>& x, double t) const {
+    return qx(x, t) * tpx(x, t);
+}
+
+template <typename Metodo>
+void TabuaInterfaceCpp::avaliar_lote(const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret, Metodo metodo) const {
+    int k = m_numero_vidas * m_numero_decrementos;
+    std::vector<int> x_i(k);
+    for (int i = 0; i < n; i++)
+    {
+        for (int j = 0; j < k; j++)
+        {
+            x_i[j] = (int)x[(size_t)i * k + j];
+        }
+        const double* t_i = t_por_linha ? t + (size_t)i * n_t : t;
+        metodo(x_i, t_i, n_t, ret + (size_t)i * n_t);
+    }
+}
+
+void TabuaInterfaceCpp::qx_lote(const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) const {
+    avaliar_lote(x, n, t, n_t, t_por_linha, ret, [this](const std::vector<int>& x_i, const double* t_i, int n_t, double* ret_i) { qx(x_i, t_i, n_t, ret_i); });
+}
+
+void TabuaInterfaceCpp::tpx_lote(const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) const {
+    avaliar_lote(x, n, t, n_t, t_por_linha, ret, [this](const std::vector<int>& x_i, const double* t_i, int n_t, double* ret_i) { tpx(x_i, t_i, n_t, ret_i); });
+}
+
+void TabuaInterfaceCpp::t_qx_lote(const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) const {
+    avaliar_lote(x, n, t, n_t, t_por_linha, ret, [this](const std::vector<int>& x_i, const double* t_i, int n_t, double* ret_i) { t_qx(x_i, t_i, n_t, ret_i); });
+}
+
+void TabuaInterfaceCpp::tempo_futuro_maximo_lote(const int64_t* x, int n, double* ret) const {
+    int k = m_numero_vidas * m_numero_decrementos;
+    std::vector<int> x_i(k);
+    for (int i = 0; i < n; i++)
+    {
+        for (int j = 0; j < k; j++)
+        {
+            x_i[j] = (int)x[(size_t)i * k + j];
+        }
+        ret[i] = tempo_futuro_maximo(x_i);
+    }
 }
 
 
@@ -32,6 +73,7 @@ int TabuaInterfaceCpp::pega_numero_decrementos() const {
     return m_numero_decrementos;
 }
 
-std::vector<TabuaBaseCpp> TabuaInterfaceCpp::pega_tabuas() const {
-    return m_tabuas;
+const std::vector<TabuaBaseCpp>& TabuaInterfaceCpp::pega_tabuas() const {
+    static const std::vector<TabuaBaseCpp> vazio;
+    return m_tabuas ? *m_tabuas : vazio;
 }
\ No newline at end of file
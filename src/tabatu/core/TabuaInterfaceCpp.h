@@ -1,23 +1,39 @@
 #pragma once
 #include <vector>
+#include <cstdint>
+#include <memory>
 #include "TabuaBaseCpp.h"
 
 class TabuaInterfaceCpp
 {
+protected:
+    int m_numero_decrementos = 1;
+    int m_numero_vidas = 1;
+    // As tábuas base são imutáveis, e o vetor é compartilhado entre as cópias da tábua, ao invés de copiado.
+    std::shared_ptr<const std::vector<TabuaBaseCpp>> m_tabuas;
+
+    const TabuaBaseCpp& tabua(size_t i) const { return (*m_tabuas)[i]; }
+
 private:
-    int m_numero_decrementos;
-    int m_numero_vidas;
-    std::vector<TabuaBaseCpp> m_tabuas;
+    template <typename Metodo>
+    void avaliar_lote(const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret, Metodo metodo) const;
 
 public:
     TabuaInterfaceCpp();
     TabuaInterfaceCpp(int numero_decrementos, int numero_vidas, std::vector<TabuaBaseCpp> tabuas);
-    virtual double qx(std::vector<int> x, double t) const = 0;
-    virtual double tpx(std::vector<int> x, double t) const = 0;
-    virtual double tempo_futuro_maximo(std::vector<int> x) const = 0;
+    virtual double qx(const std::vector<int>& x, double t) const = 0;
+    virtual double tpx(const std::vector<int>& x, double t) const = 0;
+    virtual double tempo_futuro_maximo(const std::vector<int>& x) const = 0;
+    virtual void qx(const std::vector<int>& x, const double* t, int n, double* ret) const = 0;
+    virtual void tpx(const std::vector<int>& x, const double* t, int n, double* ret) const = 0;
+    virtual void t_qx(const std::vector<int>& x, const double* t, int n, double* ret) const = 0;
     bool possui_fechamento_plato() const;
-    virtual double t_qx(std::vector<int> x, double t) const;
+    virtual double t_qx(const std::vector<int>& x, double t) const;
+    void qx_lote(const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) const;
+    void tpx_lote(const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) const;
+    void t_qx_lote(const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) const;
+    void tempo_futuro_maximo_lote(const int64_t* x, int n, double* ret) const;
     int pega_numero_vidas() const;
     int pega_numero_decrementos() const;
-    std::vector<TabuaBaseCpp> pega_tabuas() const;
+    const std::vector<TabuaBaseCpp>& pega_tabuas() const;
 };
\ No newline at end of file
@@ -1,15 +1,20 @@
 from libcpp.vector cimport vector
 from libcpp cimport bool
+from libc.stdint cimport int64_t
 from TabuaBaseCpp cimport TabuaBaseCpp
 
 cdef extern from "TabuaInterfaceCpp.cpp":
     pass
 
-cdef extern from "TabuaInterfaceCpp.h":
+cdef extern from "TabuaInterfaceCpp.h" nogil:
     cdef cppclass TabuaInterfaceCpp:
         TabuaInterfaceCpp() except +
         TabuaInterfaceCpp(int numero_decrementos, int numero_vidas, vector[TabuaBaseCpp] tabuas)
         bool possui_fechamento_plato() const
         int pega_numero_vidas() const
         int pega_numero_decrementos() const
-        vector[TabuaBaseCpp] pega_tabuas() const
\ No newline at end of file
+        void qx_lote(const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) except +
+        void tpx_lote(const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) except +
+        void t_qx_lote(const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) except +
+        void tempo_futuro_maximo_lote(const int64_t* x, int n, double* ret) except +
+        const vector[TabuaBaseCpp]& pega_tabuas() const
\ No newline at end of file
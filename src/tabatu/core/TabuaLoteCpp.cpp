@@ -0,0 +1,108 @@
+#include "TabuaLoteCpp.h"
+#include <algorithm>
+#include <limits>
+#include <stdexcept>
+
+TabuaLoteCpp::TabuaLoteCpp()
+{
+}
+
+TabuaLoteCpp::TabuaLoteCpp(const double* qx, const int64_t* inicios, int quantidade)
+{
+    if (inicios[0] != 0) {
+        throw std::invalid_argument("O início da primeira tábua deve ser zero.");
+    }
+    for (int i = 0; i < quantidade; i++)
+    {
+        if (inicios[i + 1] < inicios[i] || inicios[i + 1] - inicios[i] > std::numeric_limits<int>::max()) {
+            throw std::invalid_argument("Os inícios das tábuas devem ser crescentes.");
+        }
+    }
+    // Uma única alocação guarda as taxas de todas as tábuas, seguidas do log da sobrevivência acumulada.
+    m_tamanho = inicios[quantidade];
+    size_t total = (size_t)m_tamanho;
+    auto dados = std::make_shared<std::vector<double>>(2 * total + quantidade);
+    double* qx_lote = dados->data();
+    double* log_lx_lote = qx_lote + total;
+    std::copy(qx, qx + total, qx_lote);
+    m_dono = dados;
+    m_qx = qx_lote;
+    m_tabuas.reserve(quantidade);
+    for (int i = 0; i < quantidade; i++)
+    {
+        int n = (int)(inicios[i + 1] - inicios[i]);
+        const double* qx_tabua = qx_lote + inicios[i];
+        double* log_lx_tabua = log_lx_lote + inicios[i] + i;
+        TabuaBaseCpp::preencher_log_lx(qx_tabua, n, log_lx_tabua);
+        m_tabuas.emplace_back(qx_tabua, log_lx_tabua, n, m_dono);
+    }
+}
+
+int TabuaLoteCpp::quantidade() const
+{
+    return (int)m_tabuas.size();
+}
+
+const TabuaBaseCpp& TabuaLoteCpp::tabua(int i) const
+{
+    return m_tabuas.at(i);
+}
+
+int64_t TabuaLoteCpp::tamanho() const
+{
+    return m_tamanho;
+}
+
+const double* TabuaLoteCpp::dados_qx() const
+{
+    return m_qx;
+}
+
+void TabuaLoteCpp::definir_hipotese_fracionaria(HipoteseFracionariaCpp hipotese_fracionaria)
+{
+    for (TabuaBaseCpp& tabua : m_tabuas)
+    {
+        tabua.definir_hipotese_fracionaria(hipotese_fracionaria);
+    }
+}
+
+const TabuaBaseCpp& TabuaLoteCpp::tabua_apolice(const int64_t* tabuas, int i) const
+{
+    if (tabuas[i] < 0 || tabuas[i] >= (int64_t)m_tabuas.size()) {
+        throw std::out_of_range("O índice da tábua deve estar entre 0 e a quantidade de tábuas do lote.");
+    }
+    return m_tabuas[tabuas[i]];
+}
+
+template <typename Metodo>
+void TabuaLoteCpp::avaliar(const int64_t* tabuas, const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret, Metodo metodo) const
+{
+    for (int i = 0; i < n; i++)
+    {
+        const double* t_i = t_por_linha ? t + (size_t)i * n_t : t;
+        metodo(tabua_apolice(tabuas, i), (int)x[i], t_i, n_t, ret + (size_t)i * n_t);
+    }
+}
+
+void TabuaLoteCpp::qx(const int64_t* tabuas, const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) const
+{
+    avaliar(tabuas, x, n, t, n_t, t_por_linha, ret, [](const TabuaBaseCpp& tabua, int x_i, const double* t_i, int n_t, double* ret_i) { tabua.qx(x_i, t_i, n_t, ret_i); });
+}
+
+void TabuaLoteCpp::tpx(const int64_t* tabuas, const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) const
+{
+    avaliar(tabuas, x, n, t, n_t, t_por_linha, ret, [](const TabuaBaseCpp& tabua, int x_i, const double* t_i, int n_t, double* ret_i) { tabua.tpx(x_i, t_i, n_t, ret_i); });
+}
+
+void TabuaLoteCpp::t_qx(const int64_t* tabuas, const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) const
+{
+    avaliar(tabuas, x, n, t, n_t, t_por_linha, ret, [](const TabuaBaseCpp& tabua, int x_i, const double* t_i, int n_t, double* ret_i) { tabua.t_qx(x_i, t_i, n_t, ret_i); });
+}
+
+void TabuaLoteCpp::tempo_futuro_maximo(const int64_t* tabuas, const int64_t* x, int n, double* ret) const
+{
+    for (int i = 0; i < n; i++)
+    {
+        ret[i] = tabua_apolice(tabuas, i).tempo_futuro_maximo((int)x[i]);
+    }
+}
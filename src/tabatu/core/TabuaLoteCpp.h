@@ -0,0 +1,36 @@
+#pragma once
+#include <vector>
+#include <cstdint>
+#include "TabuaBaseCpp.h"
+
+// Coleção de tábuas de único decremento criadas em uma única chamada. As taxas das tábuas são guardadas em um único
+// vetor, em sequência, e a tábua i ocupa as posições [inicios[i], inicios[i + 1]). O log da sobrevivência acumulada
+// é guardado da mesma forma, com um elemento a mais por tábua. A memória é compartilhada pelas tábuas da coleção e
+// pelas suas cópias.
+class TabuaLoteCpp final
+{
+private:
+    DonoCpp m_dono;
+    const double* m_qx = nullptr;
+    int64_t m_tamanho = 0;
+    std::vector<TabuaBaseCpp> m_tabuas;
+
+    const TabuaBaseCpp& tabua_apolice(const int64_t* tabuas, int i) const;
+    template <typename Metodo>
+    void avaliar(const int64_t* tabuas, const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret, Metodo metodo) const;
+
+public:
+    TabuaLoteCpp();
+    TabuaLoteCpp(const double* qx, const int64_t* inicios, int quantidade);
+    int quantidade() const;
+    const TabuaBaseCpp& tabua(int i) const;
+    int64_t tamanho() const;
+    const double* dados_qx() const;
+    void definir_hipotese_fracionaria(HipoteseFracionariaCpp hipotese_fracionaria);
+    // Avaliam a apólice i, com a tábua tabuas[i] e a idade x[i], nos tempos t, comuns a todas as apólices, ou
+    // t + i * n_t, quando t_por_linha. O resultado da apólice i é escrito em ret + i * n_t.
+    void qx(const int64_t* tabuas, const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) const;
+    void tpx(const int64_t* tabuas, const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) const;
+    void t_qx(const int64_t* tabuas, const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) const;
+    void tempo_futuro_maximo(const int64_t* tabuas, const int64_t* x, int n, double* ret) const;
+};
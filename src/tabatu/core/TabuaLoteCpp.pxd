@@ -0,0 +1,21 @@
+from libc.stdint cimport int64_t
+from libcpp cimport bool
+from TabuaBaseCpp cimport TabuaBaseCpp
+from TabuaBaseCpp cimport HipoteseFracionariaCpp
+
+cdef extern from "TabuaLoteCpp.cpp":
+    pass
+
+cdef extern from "TabuaLoteCpp.h" nogil:
+    cdef cppclass TabuaLoteCpp:
+        TabuaLoteCpp() except +
+        TabuaLoteCpp(const double* qx, const int64_t* inicios, int quantidade) except +
+        int quantidade() const
+        const TabuaBaseCpp& tabua(int i) except +
+        int64_t tamanho() const
+        const double* dados_qx() const
+        void definir_hipotese_fracionaria(HipoteseFracionariaCpp hipotese_fracionaria)
+        void qx(const int64_t* tabuas, const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) except +
+        void tpx(const int64_t* tabuas, const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) except +
+        void t_qx(const int64_t* tabuas, const int64_t* x, int n, const double* t, int n_t, bool t_por_linha, double* ret) except +
+        void tempo_futuro_maximo(const int64_t* tabuas, const int64_t* x, int n, double* ret) except +
@@ -9,185 +9,292 @@ double qx2qxj(double qx1, double qx2, double qx3)
 	return qx1 * (1 - 0.5 * (qx2 + qx3) + 1.0 / 3.0 * (qx2 * qx3));
 }
 
-std::vector<double> qx2qxj(std::vector<double> qx1, std::vector<double> qx2, std::vector<double> qx3)
+// Nós e pesos da quadratura de Gauss-Legendre com m pontos, no intervalo [0, 1].
+void gauss_legendre(int m, std::vector<double>& nos, std::vector<double>& pesos)
 {
-	std::vector<double> qxj;
-	qxj.reserve(qx1.size());
-	for (int i = 0; i < qx1.size(); i++)
-	{
-		qxj.push_back(qx2qxj(qx1[i], qx2[i], qx3[i]));
+	const double pi = 3.14159265358979323846;
+	nos.resize(m);
+	pesos.resize(m);
+	for (int i = 0; i < m; i++) {
+		double z = std::cos(pi * (i + 0.75) / (m + 0.5));
+		double derivada = 1.0;
+		for (int iteracao = 0; iteracao < 100; iteracao++) {
+			double p0 = 1.0;
+			double p1 = 0.0;
+			for (int j = 1; j <= m; j++) {
+				double p2 = p1;
+				p1 = p0;
+				p0 = ((2.0 * j - 1.0) * z * p1 - (j - 1.0) * p2) / j;
+			}
+			derivada = m * (z * p0 - p1) / (z * z - 1.0);
+			double anterior = z;
+			z = anterior - p0 / derivada;
+			if (std::abs(z - anterior) <= 1e-15) {
+				break;
+			}
+		}
+		nos[i] = 0.5 * (1.0 - z);
+		pesos[i] = 1.0 / ((1.0 - z * z) * derivada * derivada);
+	}
+}
+
+// Quantidade máxima de nós da quadratura usada na conversão de mais de 3 causas.
+const int MAXIMO_NOS_MDT = 16;
+
+// Quantidade de nós da quadratura para k causas: ceil(k / 2), que integra exatamente o polinômio de grau k - 1,
+// limitada a MAXIMO_NOS_MDT.
+int quantidade_nos_mdt(int k)
+{
+	return std::min((k + 1) / 2, MAXIMO_NOS_MDT);
+}
+
+// Converte as taxas de decremento único das k causas em taxas de múltiplos decrementos, supondo que as falhas
+// de cada causa são uniformes ao longo do período: qxj = qx_j * integral_0^1 prod_{i != j} (1 - s * qx_i) ds.
+// Até 3 causas, a integral é calculada pela sua expansão. Acima disso, o integrando, um polinômio de grau k - 1, é
+// integrado pela quadratura de Gauss-Legendre com quantidade_nos_mdt(k) nós. Em cada nó, o produto das outras
+// causas é obtido com um produto de prefixo e um de sufixo, com custo O(k) para todas as causas. Como a quantidade
+// de nós é limitada, a conversão custa O(k) por tempo. Até 2 * MAXIMO_NOS_MDT causas a integral é exata; acima
+// disso, o erro é da ordem de 1e-7 mesmo com metade das causas iguais a 1.
+// auxiliar deve ter pelo menos k + 1 posições.
+void converter_mdt(const double* qx, int k, const std::vector<double>& nos, const std::vector<double>& pesos, double* auxiliar, double* qxj)
+{
+	if (k <= 3) {
+		double q[3] = {0.0, 0.0, 0.0};
+		std::copy(qx, qx + k, q);
+		for (int j = 0; j < k; j++) {
+			qxj[j] = qx2qxj(q[j], q[(j + 1) % 3], q[(j + 2) % 3]);
+		}
+		return;
+	}
+	double* sufixo = auxiliar;
+	std::fill(qxj, qxj + k, 0.0);
+	for (size_t n = 0; n < nos.size(); n++) {
+		sufixo[k] = 1.0;
+		for (int i = k - 1; i >= 0; i--) {
+			sufixo[i] = sufixo[i + 1] * (1.0 - nos[n] * qx[i]);
+		}
+		double prefixo = 1.0;
+		for (int j = 0; j < k; j++) {
+			qxj[j] += pesos[n] * prefixo * sufixo[j + 1];
+			prefixo *= 1.0 - nos[n] * qx[j];
+		}
+	}
+	for (int j = 0; j < k; j++) {
+		qxj[j] *= qx[j];
 	}
-	return qxj;
 }
 
 std::vector<double> converter_mdt(std::vector<double> qx) {
-	std::vector<double> qxj(3);
-	int tamanho = 3 - (int)qx.size();
-	double zeros = 0.0;
-	if (tamanho < 0) {
-		throw std::invalid_argument("O número de tábuas não pode ser maior que 3");
-	}
-	for (int i = 0; i < tamanho; i++) {
-		qx.push_back(zeros);
-	}
-	qxj[0] = qx2qxj(qx[0], qx[1], qx[2]);
-	qxj[1] = qx2qxj(qx[1], qx[2], qx[0]);
-	qxj[2] = qx2qxj(qx[2], qx[0], qx[1]);
+	int k = (int)qx.size();
+	std::vector<double> nos, pesos;
+	gauss_legendre(quantidade_nos_mdt(k), nos, pesos);
+	std::vector<double> auxiliar(k + 1);
+	std::vector<double> qxj(k);
+	converter_mdt(qx.data(), k, nos, pesos, auxiliar.data(), qxj.data());
 	return qxj;
 }
 
 std::vector<std::vector<double>> converter_mdt(std::vector<std::vector<double>> qx) {
-	std::vector<std::vector<double>> qxj(3);
-	int tamanho = 3 - (int)qx.size();
-	std::vector<double> zeros(qx[0].size(), 0.0);
-	if (tamanho < 0) {
-		throw std::invalid_argument("O número de tábuas não pode ser maior que 3");
-	}
-	for (int i = 0; i < tamanho; i++) {
-		qx.push_back(zeros);
-	}
-	qxj[0] = qx2qxj(qx[0], qx[1], qx[2]);
-	qxj[1] = qx2qxj(qx[1], qx[2], qx[0]);
-	qxj[2] = qx2qxj(qx[2], qx[0], qx[1]);
+	int k = (int)qx.size();
+	std::vector<std::vector<double>> qxj(k, std::vector<double>(k == 0 ? 0 : qx[0].size()));
+	std::vector<double> nos, pesos;
+	gauss_legendre(quantidade_nos_mdt(k), nos, pesos);
+	std::vector<double> qx_t(k), qxj_t(k), auxiliar(k + 1);
+	for (size_t i = 0; k > 0 && i < qx[0].size(); i++) {
+		for (int j = 0; j < k; j++) {
+			qx_t[j] = qx[j][i];
+		}
+		converter_mdt(qx_t.data(), k, nos, pesos, auxiliar.data(), qxj_t.data());
+		for (int j = 0; j < k; j++) {
+			qxj[j][i] = qxj_t[j];
+		}
+	}
 	return qxj;
 }
 
 TabuaMDTCpp::TabuaMDTCpp() : TabuaInterfaceCpp() {
 }
 
-TabuaMDTCpp::TabuaMDTCpp(std::vector<TabuaCpp> tabuas, int causa_principal) : TabuaInterfaceCpp((int)tabuas.size(), 1, extrairTabuasBase(tabuas))
+TabuaMDTCpp::TabuaMDTCpp(const std::vector<TabuaCpp>& tabuas, int causa_principal) : TabuaInterfaceCpp((int)tabuas.size(), 1, extrairTabuasBase(tabuas))
 {
-	m_numero_decrementos = (int)tabuas.size();
-	m_tabuas = extrairTabuasBase(tabuas);
 	m_causa_principal = causa_principal;
+	if (m_numero_decrementos > 3) {
+		gauss_legendre(quantidade_nos_mdt(m_numero_decrementos), m_nos, m_pesos);
+	}
 }
 
-// comeco
-double TabuaMDTCpp::qx_j(std::vector<int> x, double t, int j) const {
+void TabuaMDTCpp::validar_x(const std::vector<int>& x) const {
 	if (x.size() != m_numero_decrementos) {
 		throw std::invalid_argument("x deve ser um vetor com tamanho igual ao numero de decrementos.");
 	}
-	if (j > m_numero_decrementos) {
-		throw std::out_of_range("");
+}
+
+void TabuaMDTCpp::validar_j(const std::vector<int>& j) const {
+	for (size_t k = 0; k < j.size(); k++)
+	{
+		if (j[k] < 0 || j[k] >= m_numero_decrementos) {
+			throw std::out_of_range("");
+		}
 	}
-	std::vector<double> qx;
-	qx.reserve(m_tabuas.size());
-	for (size_t i = 0; i < m_numero_decrementos; i++) {
-		qx.push_back(m_tabuas[i].qx(x[i], t));
+}
+
+// auxiliar deve ter pelo menos 2k + 1 posições: as k primeiras recebem o qx de cada tábua.
+void TabuaMDTCpp::qx_todas_causas(const std::vector<int>& x, double t, double* auxiliar, double* qxj) const {
+	for (int i = 0; i < m_numero_decrementos; i++) {
+		auxiliar[i] = tabua(i).qx(x[i], t);
+	}
+	converter_mdt(auxiliar, m_numero_decrementos, m_nos, m_pesos, auxiliar + m_numero_decrementos, qxj);
+}
+
+double TabuaMDTCpp::qx_j(const std::vector<int>& x, double t, int j) const {
+	validar_x(x);
+	if (j < 0 || j >= m_numero_decrementos) {
+		throw std::out_of_range("");
 	}
-	return converter_mdt(qx)[j];
+	std::vector<double> auxiliar(2 * m_numero_decrementos + 1), qxj(m_numero_decrementos);
+	qx_todas_causas(x, t, auxiliar.data(), qxj.data());
+	return qxj[j];
 }
 
-double TabuaMDTCpp::t_qx(std::vector<int> x, double t) const {
+double TabuaMDTCpp::t_qx(const std::vector<int>& x, double t) const {
 	if (m_causa_principal != -1) {
 		return tpx(x, t) * qx_j(x, t, m_causa_principal);
 	}
 	return tpx(x, t) * qx(x, t);
 }
 
-std::vector<double> TabuaMDTCpp::t_qx(std::vector<int> x, std::vector<double> t) const {
-    if (x.size() != m_numero_decrementos * m_numero_vidas) {
-        throw std::invalid_argument("x deve ter o mesmo tamanho que a quantidade de vidas ou decrementos");
-    }
-    std::vector<double> ret(t.size());
-    int n = (int)t.size();
-    for (int i = 0; i < n; i++)
-    {
-        ret[i] = t_qx(x, t[i]);
-    }
-    return ret;
-}
-
-std::vector<double> TabuaMDTCpp::qx_j(std::vector<int> x, std::vector<double> t, int j) const {
-    std::vector<double> ret(t.size());
-    int n = (int)t.size();
-    for (int i = 0; i < n; i++)
-    {
-        ret[i] = qx_j(x, t[i], j);
-    }
-    return ret;
-}
-
-std::vector<std::vector<double>> TabuaMDTCpp::qx_j(std::vector<int> x, std::vector<double> t, std::vector<int> j) const {
-    std::vector<std::vector<double>> ret(j.size());
-    int n = (int)j.size();
-    for (int i = 0; i < n; i++)
-    {
-        ret[i] = qx_j(x, t, j[i]);
-    }
-    return ret;
-}
-
-std::vector<double> TabuaMDTCpp::t_qx_j(std::vector<int> x, std::vector<double> t, int j) const {
-    std::vector<double> ret(t.size());
-    int n = (int)t.size();
-    for (int i = 0; i < n; i++)
-    {
-        ret[i] = tpx(x, t[i]) * qx_j(x, t[i], j);
-    }
-    return ret;
-}
-
-std::vector<std::vector<double>> TabuaMDTCpp::t_qx_j(std::vector<int> x, std::vector<double> t, std::vector<int> j) const {
-    std::vector<std::vector<double>> ret(j.size());
-    int n = (int)j.size();
-    for (int i = 0; i < n; i++)
-    {
-        ret[i] = t_qx_j(x, t, j[i]);
-    }
-    return ret;
-}
-
-double TabuaMDTCpp::qx(std::vector<int> x, double t) const {
+void TabuaMDTCpp::t_qx(const std::vector<int>& x, const double* t, int n, double* ret) const {
+	if (x.size() != m_numero_decrementos * m_numero_vidas) {
+		throw std::invalid_argument("x deve ter o mesmo tamanho que a quantidade de vidas ou decrementos");
+	}
+	std::vector<double> auxiliar(2 * m_numero_decrementos + 1), qxj(m_numero_decrementos);
+	for (int i = 0; i < n; i++)
+	{
+		qx_todas_causas(x, t[i], auxiliar.data(), qxj.data());
+		double _qx = 0.0;
+		if (m_causa_principal != -1) {
+			_qx = qxj[m_causa_principal];
+		} else {
+			for (int j = 0; j < m_numero_decrementos; j++) {
+				_qx += qxj[j];
+			}
+		}
+		ret[i] = tpx(x, t[i]) * _qx;
+	}
+}
+
+void TabuaMDTCpp::qx_j(const std::vector<int>& x, const double* t, int n, const std::vector<int>& j, double* ret) const {
+	validar_x(x);
+	validar_j(j);
+	int n_j = (int)j.size();
+	std::vector<double> auxiliar(2 * m_numero_decrementos + 1), qxj(m_numero_decrementos);
+	for (int i = 0; i < n; i++)
+	{
+		qx_todas_causas(x, t[i], auxiliar.data(), qxj.data());
+		for (int k = 0; k < n_j; k++)
+		{
+			ret[(size_t)k * n + i] = qxj[j[k]];
+		}
+	}
+}
+
+void TabuaMDTCpp::t_qx_j(const std::vector<int>& x, const double* t, int n, const std::vector<int>& j, double* ret) const {
+	validar_x(x);
+	validar_j(j);
+	int n_j = (int)j.size();
+	std::vector<double> auxiliar(2 * m_numero_decrementos + 1), qxj(m_numero_decrementos);
+	for (int i = 0; i < n; i++)
+	{
+		qx_todas_causas(x, t[i], auxiliar.data(), qxj.data());
+		double _tpx = tpx(x, t[i]);
+		for (int k = 0; k < n_j; k++)
+		{
+			ret[(size_t)k * n + i] = _tpx * qxj[j[k]];
+		}
+	}
+}
+
+void TabuaMDTCpp::probabilidades(const std::vector<int>& x, const double* t, int n, double* ret) const {
+	validar_x(x);
+	int k = m_numero_decrementos;
+	std::vector<double> auxiliar(2 * k + 1), qxj(k);
+	for (int i = 0; i < n; i++)
+	{
+		qx_todas_causas(x, t[i], auxiliar.data(), qxj.data());
+		double _qx = 0.0;
+		for (int j = 0; j < k; j++)
+		{
+			ret[(size_t)j * n + i] = qxj[j];
+			_qx += qxj[j];
+		}
+		double _tpx = tpx(x, t[i]);
+		ret[(size_t)k * n + i] = _qx;
+		ret[(size_t)(k + 1) * n + i] = _tpx;
+		for (int j = 0; j < k; j++)
+		{
+			ret[(size_t)(k + 2 + j) * n + i] = _tpx * qxj[j];
+		}
+	}
+}
+
+double TabuaMDTCpp::qx(const std::vector<int>& x, double t) const {
+	validar_x(x);
+	std::vector<double> auxiliar(2 * m_numero_decrementos + 1), qxj(m_numero_decrementos);
+	qx_todas_causas(x, t, auxiliar.data(), qxj.data());
 	double ret = 0.0;
 	for (int i = 0; i < m_numero_decrementos; i++)
 	{
-		ret += qx_j(x, t, i);
+		ret += qxj[i];
 	}
 	return ret;
 }
 
-double TabuaMDTCpp::tpx(std::vector<int> x, double t) const {
+double TabuaMDTCpp::tpx(const std::vector<int>& x, double t) const {
 	if (x.size() != m_numero_decrementos) {
 		throw std::invalid_argument("x deve ser um vetor com tamanho igual ao numero de decrementos.");
 	}
 	double ret = 1.0;
 	for (size_t i = 0; i < m_numero_decrementos; i++)
 	{
-		ret = ret * m_tabuas[i].tpx(x[i], t);
+		ret = ret * tabua(i).tpx(x[i], t);
 	}
 	return ret;
 }
 
-std::vector<double> TabuaMDTCpp::qx(std::vector<int> x, std::vector<double> t) const {
-	std::vector<double> ret(t.size());
-    int n = (int)t.size();
-    for (int i = 0; i < n; i++)
-    {
-        ret[i] = qx(x, t[i]);
-    }
-    return ret;
+void TabuaMDTCpp::qx(const std::vector<int>& x, const double* t, int n, double* ret) const {
+	validar_x(x);
+	std::vector<double> auxiliar(2 * m_numero_decrementos + 1), qxj(m_numero_decrementos);
+	for (int i = 0; i < n; i++)
+	{
+		qx_todas_causas(x, t[i], auxiliar.data(), qxj.data());
+		ret[i] = 0.0;
+		for (int j = 0; j < m_numero_decrementos; j++)
+		{
+			ret[i] += qxj[j];
+		}
+	}
 }
 
-std::vector<double> TabuaMDTCpp::tpx(std::vector<int> x, std::vector<double> t) const {
-	std::vector<double> ret(t.size());
-    int n = (int)t.size();
-    for (int i = 0; i < n; i++)
-    {
-        ret[i] = tpx(x, t[i]);
-    }
-    return ret;
+void TabuaMDTCpp::tpx(const std::vector<int>& x, const double* t, int n, double* ret) const {
+	for (int i = 0; i < n; i++)
+	{
+		ret[i] = tpx(x, t[i]);
+	}
 }
 
-double TabuaMDTCpp::tempo_futuro_maximo(std::vector<int> x) const {
+double TabuaMDTCpp::tempo_futuro_maximo(const std::vector<int>& x) const {
 	if (x.size() != m_numero_decrementos) {
 		throw std::invalid_argument("x deve ser um vetor com tamanho igual ao numero de decrementos.");
 	}
 	std::vector<double> ret(m_numero_decrementos);
 	for (size_t i = 0; i < m_numero_decrementos; i++)
 	{
-		ret[i] = m_tabuas[i].tempo_futuro_maximo(x[i]);
+		ret[i] = tabua(i).tempo_futuro_maximo(x[i]);
 	}
 	return *std::min_element(ret.begin(), ret.end());
 }
 
+int TabuaMDTCpp::pega_causa_principal() const
+{
+	return m_causa_principal;
+}
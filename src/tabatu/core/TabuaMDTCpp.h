@@ -7,23 +7,25 @@
 class TabuaMDTCpp final : public TabuaInterfaceCpp
 {
 private:
-    int m_numero_decrementos;
-    int m_numero_vidas = 1;
     int m_causa_principal = -1;
-    std::vector<TabuaBaseCpp> m_tabuas;
+    std::vector<double> m_nos;
+    std::vector<double> m_pesos;
+    void validar_x(const std::vector<int>& x) const;
+    void validar_j(const std::vector<int>& j) const;
+    void qx_todas_causas(const std::vector<int>& x, double t, double* auxiliar, double* qxj) const;
 public:
     TabuaMDTCpp();
-    TabuaMDTCpp(std::vector<TabuaCpp> tabuas, int causa_principal);
-    double qx_j(std::vector<int> x, double t, int j) const;
-    double qx(std::vector<int> x, double t) const;
-    double tpx(std::vector<int> x, double t) const;
-    double t_qx(std::vector<int> x, double t) const override;
-    std::vector<double> qx_j(std::vector<int> x, std::vector<double> t, int j) const;
-    std::vector<std::vector<double>> qx_j(std::vector<int> x, std::vector<double> t, std::vector<int> j) const;
-    std::vector<double> qx(std::vector<int> x, std::vector<double> t) const;
-    std::vector<double> tpx(std::vector<int> x, std::vector<double> t) const;
-    std::vector<double> t_qx_j(std::vector<int> x, std::vector<double> t, int j) const;
-    std::vector<double> t_qx(std::vector<int> x, std::vector<double> t) const;
-    std::vector<std::vector<double>> t_qx_j(std::vector<int> x, std::vector<double> t, std::vector<int> j) const;
-    double tempo_futuro_maximo(std::vector<int> x) const;
+    TabuaMDTCpp(const std::vector<TabuaCpp>& tabuas, int causa_principal);
+    double qx_j(const std::vector<int>& x, double t, int j) const;
+    double qx(const std::vector<int>& x, double t) const override;
+    double tpx(const std::vector<int>& x, double t) const override;
+    double t_qx(const std::vector<int>& x, double t) const override;
+    void qx_j(const std::vector<int>& x, const double* t, int n, const std::vector<int>& j, double* ret) const;
+    void t_qx_j(const std::vector<int>& x, const double* t, int n, const std::vector<int>& j, double* ret) const;
+    void probabilidades(const std::vector<int>& x, const double* t, int n, double* ret) const;
+    void qx(const std::vector<int>& x, const double* t, int n, double* ret) const override;
+    void tpx(const std::vector<int>& x, const double* t, int n, double* ret) const override;
+    void t_qx(const std::vector<int>& x, const double* t, int n, double* ret) const override;
+    double tempo_futuro_maximo(const std::vector<int>& x) const override;
+    int pega_causa_principal() const;
 };
\ No newline at end of file
@@ -5,14 +5,16 @@ from TabuaInterfaceCpp cimport TabuaInterfaceCpp
 cdef extern from "TabuaMDTCpp.cpp":
     pass
 
-cdef extern from "TabuaMDTCpp.h":
+cdef extern from "TabuaMDTCpp.h" nogil:
     cdef cppclass TabuaMDTCpp(TabuaInterfaceCpp):
         TabuaMDTCpp() except +
         TabuaMDTCpp(vector[TabuaCpp] tabuas, int causa_principal)
-        vector[vector[double]] qx_j(vector[int] x, vector[double] t, vector[int] j) except +
-        vector[double] qx(vector[int] x, vector[double] t) except +
-        vector[double] tpx(vector[int] x, vector[double] t) except +
-        vector[double] t_qx(vector[int] x, vector[double] t) except +
-        vector[vector[double]] t_qx_j(vector[int] x, vector[double] t, vector[int] j) except +
-        double tempo_futuro_maximo(vector[int] x) except +
+        void qx_j(const vector[int]& x, const double* t, int n, const vector[int]& j, double* ret) except +
+        void probabilidades(const vector[int]& x, const double* t, int n, double* ret) except +
+        void qx(const vector[int]& x, const double* t, int n, double* ret) except +
+        void tpx(const vector[int]& x, const double* t, int n, double* ret) except +
+        void t_qx(const vector[int]& x, const double* t, int n, double* ret) except +
+        void t_qx_j(const vector[int]& x, const double* t, int n, const vector[int]& j, double* ret) except +
+        double tempo_futuro_maximo(const vector[int]& x) except +
+        int pega_causa_principal()
 
@@ -8,16 +8,14 @@
 TabuaMultiplasVidasCpp::TabuaMultiplasVidasCpp() : TabuaInterfaceCpp() {
 }
 
-TabuaMultiplasVidasCpp::TabuaMultiplasVidasCpp(std::vector<TabuaCpp> tabuas, StatusVidasConjuntasCpp status_vidas_conjuntas) :
+TabuaMultiplasVidasCpp::TabuaMultiplasVidasCpp(const std::vector<TabuaCpp>& tabuas, StatusVidasConjuntasCpp status_vidas_conjuntas) :
 	TabuaInterfaceCpp(1, (int)tabuas.size(), extrairTabuasBase(tabuas))
 {
-	m_numero_vidas = (int)tabuas.size();
-	m_tabuas = extrairTabuasBase(tabuas);
 	m_status_vidas_conjuntas = status_vidas_conjuntas;
 }
 
 
-double TabuaMultiplasVidasCpp::qx(std::vector<int> x, double t) const {
+double TabuaMultiplasVidasCpp::qx(const std::vector<int>& x, double t) const {
 	if (x.size() != m_numero_vidas) {
 		throw std::invalid_argument("x deve ser um vetor com tamanho igual ao numero de vidas.");
 	}
@@ -25,19 +23,19 @@ double TabuaMultiplasVidasCpp::qx(std::vector<int> x, double t) const {
 	if (m_status_vidas_conjuntas == StatusVidasConjuntasCpp::JOINT) {
 		for (size_t i = 0; i < m_numero_vidas; i++)
 		{
-			ret = ret * (1 - m_tabuas[i].qx(x[i], t));
+			ret = ret * (1 - tabua(i).qx(x[i], t));
 		}
 		return 1 - ret;
 	}
 	for (size_t i = 0; i < m_numero_vidas; i++)
 	{
-		ret = ret * m_tabuas[i].qx(x[i], t);
+		ret = ret * tabua(i).qx(x[i], t);
 	}
 	return ret;
 
 }
 
-double TabuaMultiplasVidasCpp::tpx(std::vector<int> x, double t) const {
+double TabuaMultiplasVidasCpp::tpx(const std::vector<int>& x, double t) const {
 	if (x.size() != m_numero_vidas) {
 		throw std::invalid_argument("x deve ser um vetor com tamanho igual ao numero de vidas.");
 	}
@@ -46,7 +44,7 @@ double TabuaMultiplasVidasCpp::tpx(std::vector<int> x, double t) const {
 		double ret = 1.0;
 		for (size_t i = 0; i < m_numero_vidas; i++)
 		{
-			ret = ret * m_tabuas[i].tpx(x[i], t);
+			ret = ret * tabua(i).tpx(x[i], t);
 		}
 		return ret;
 	}
@@ -65,37 +63,89 @@ double TabuaMultiplasVidasCpp::tpx(std::vector<int> x, double t) const {
 	{
 		lx_t = lx_t * (1 - qx(x, (double)(i - 1)));
 	}
-	return lx_t;
+	return lx_t * sobrevivencia_fracionaria_last(x, t);
 }
 
-std::vector<double> TabuaMultiplasVidasCpp::qx(std::vector<int> x, std::vector<double> t) const {
-	std::vector<double> ret(t.size());
-	int n = (int)t.size();
+// No status LAST, a falha na fração do período após floor(t) é o produto das falhas de cada vida nessa fração,
+// calculadas com a hipótese fracionária de cada tábua.
+double TabuaMultiplasVidasCpp::sobrevivencia_fracionaria_last(const std::vector<int>& x, double t) const {
+	double inteiro = std::floor(t);
+	bool possui_hipotese = false;
+	for (size_t i = 0; i < m_numero_vidas; i++)
+	{
+		possui_hipotese = possui_hipotese || tabua(i).pega_hipotese_fracionaria() != HipoteseFracionariaCpp::NENHUMA;
+	}
+	if (t == inteiro || !possui_hipotese) {
+		return 1.0;
+	}
+	double falha = 1.0;
+	for (size_t i = 0; i < m_numero_vidas; i++)
+	{
+		double inicio = tabua(i).tpx(x[i], inteiro);
+		falha = falha * (inicio == 0 ? 1.0 : 1.0 - tabua(i).tpx(x[i], t) / inicio);
+	}
+	return 1.0 - falha;
+}
+
+void TabuaMultiplasVidasCpp::qx(const std::vector<int>& x, const double* t, int n, double* ret) const {
 	for (int i = 0; i < n; i++)
 	{
 		ret[i] = qx(x, t[i]);
 	}
-	return ret;
 }
 
-std::vector<double> TabuaMultiplasVidasCpp::tpx(std::vector<int> x, std::vector<double> t) const {
-	std::vector<double> ret(t.size());
-	int n = (int)t.size();
+void TabuaMultiplasVidasCpp::curva_sobrevivencia_last(const std::vector<int>& x, int t_max, std::vector<double>& curva) const {
+	curva.assign(t_max + 1, 0.0);
+	curva[0] = 1.0;
+	for (int i = 1; i <= t_max; i++)
+	{
+		curva[i] = curva[i - 1] * (1 - qx(x, (double)(i - 1)));
+	}
+}
+
+void TabuaMultiplasVidasCpp::tpx(const std::vector<int>& x, const double* t, int n, double* ret) const {
+	if (m_status_vidas_conjuntas == StatusVidasConjuntasCpp::JOINT || n == 0) {
+		for (int i = 0; i < n; i++)
+		{
+			ret[i] = tpx(x, t[i]);
+		}
+		return;
+	}
+	// No status LAST, a sobrevivência é o produto acumulado de (1 - qx). A curva é construída uma única vez até o
+	// maior tempo pedido, e cada tempo é apenas uma consulta, custando O(T * vidas) ao invés de O(T² * vidas).
+	double t_max = 0.0;
 	for (int i = 0; i < n; i++)
 	{
-		ret[i] = tpx(x, t[i]);
+		if (t[i] < 0) {
+			throw std::invalid_argument("t deve ser maior ou igual a 0");
+		}
+		t_max = std::max(t_max, t[i]);
+	}
+	if (x.size() != m_numero_vidas) {
+		throw std::invalid_argument("x deve ser um vetor com tamanho igual ao numero de vidas.");
+	}
+	for (size_t i = 0; i < m_numero_vidas; i++)
+	{
+		if (x[i] < 0) {
+			throw std::invalid_argument("x deve ser maior ou igual a 0");
+		}
+	}
+	std::vector<double> curva;
+	curva_sobrevivencia_last(x, (int)t_max, curva);
+	for (int i = 0; i < n; i++)
+	{
+		ret[i] = curva[(int)t[i]] * sobrevivencia_fracionaria_last(x, t[i]);
 	}
-	return ret;
 }
 
-double TabuaMultiplasVidasCpp::tempo_futuro_maximo(std::vector<int> x) const {
+double TabuaMultiplasVidasCpp::tempo_futuro_maximo(const std::vector<int>& x) const {
 	if (x.size() != m_numero_vidas) {
 		throw std::invalid_argument("x deve ser um vetor com tamanho igual ao numero de vidas.");
 	}
 	std::vector<double> ret(m_numero_vidas);
 	for (size_t i = 0; i < m_numero_vidas; i++)
 	{
-		ret[i] = m_tabuas[i].tempo_futuro_maximo(x[i]);
+		ret[i] = tabua(i).tempo_futuro_maximo(x[i]);
 	}
 	if (m_status_vidas_conjuntas == StatusVidasConjuntasCpp::JOINT) {
 		return *std::min_element(ret.begin(), ret.end());
@@ -103,17 +153,18 @@ double TabuaMultiplasVidasCpp::tempo_futuro_maximo(std::vector<int> x) const {
 	return *std::max_element(ret.begin(), ret.end());
 }
 
-std::vector<double> TabuaMultiplasVidasCpp::t_qx(std::vector<int> x, std::vector<double> t) const {
+void TabuaMultiplasVidasCpp::t_qx(const std::vector<int>& x, const double* t, int n, double* ret) const {
     if (x.size() != m_numero_decrementos * m_numero_vidas) {
         throw std::invalid_argument("x deve ter o mesmo tamanho que a quantidade de vidas ou decrementos");
     }
-    std::vector<double> ret(t.size());
-    int n = (int)t.size();
+    tpx(x, t, n, ret);
     for (int i = 0; i < n; i++)
     {
-        ret[i] = TabuaInterfaceCpp::t_qx(x, t[i]);
+        ret[i] = qx(x, t[i]) * ret[i];
     }
-    return ret;
 }
 
-
+StatusVidasConjuntasCpp TabuaMultiplasVidasCpp::pega_status() const
+{
+	return m_status_vidas_conjuntas;
+}
@@ -10,18 +10,18 @@ enum class StatusVidasConjuntasCpp { JOINT, LAST };
 class TabuaMultiplasVidasCpp final : public TabuaInterfaceCpp
 {
 private:
-    std::vector<TabuaBaseCpp> m_tabuas;
-    int m_numero_vidas = 1;
-    int m_numero_decrementos = 1;
     StatusVidasConjuntasCpp m_status_vidas_conjuntas;
+    void curva_sobrevivencia_last(const std::vector<int>& x, int t_max, std::vector<double>& curva) const;
+    double sobrevivencia_fracionaria_last(const std::vector<int>& x, double t) const;
 
 public:
     TabuaMultiplasVidasCpp();
-    TabuaMultiplasVidasCpp(std::vector<TabuaCpp> tabuas, StatusVidasConjuntasCpp status_vidas_conjuntas);
-    double qx(std::vector<int> x, double t) const;
-    double tpx(std::vector<int> x, double t) const;
-    std::vector<double> qx(std::vector<int> x, std::vector<double> t) const;
-    std::vector<double> tpx(std::vector<int> x, std::vector<double> t) const;
-    std::vector<double> t_qx(std::vector<int> x, std::vector<double> t) const;
-    double tempo_futuro_maximo(std::vector<int> x) const;
+    TabuaMultiplasVidasCpp(const std::vector<TabuaCpp>& tabuas, StatusVidasConjuntasCpp status_vidas_conjuntas);
+    double qx(const std::vector<int>& x, double t) const override;
+    double tpx(const std::vector<int>& x, double t) const override;
+    void qx(const std::vector<int>& x, const double* t, int n, double* ret) const override;
+    void tpx(const std::vector<int>& x, const double* t, int n, double* ret) const override;
+    void t_qx(const std::vector<int>& x, const double* t, int n, double* ret) const override;
+    double tempo_futuro_maximo(const std::vector<int>& x) const override;
+    StatusVidasConjuntasCpp pega_status() const;
 };
\ No newline at end of file
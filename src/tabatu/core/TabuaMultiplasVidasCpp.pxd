@@ -4,14 +4,15 @@ from TabuaInterfaceCpp cimport TabuaInterfaceCpp
 cdef extern from "TabuaMultiplasVidasCpp.cpp":
     pass
 
-cdef extern from "TabuaMultiplasVidasCpp.h":
+cdef extern from "TabuaMultiplasVidasCpp.h" nogil:
     cdef cppclass TabuaMultiplasVidasCpp(TabuaInterfaceCpp):
         TabuaMultiplasVidasCpp() except +
         TabuaMultiplasVidasCpp(vector[TabuaCpp] tabuas, StatusVidasConjuntasCpp status_vidas_conjuntas)
-        vector[double] qx(vector[int] x, vector[double] t) except +
-        vector[double] tpx(vector[int] x, vector[double] t) except +
-        vector[double] t_qx(vector[int] x, vector[double] t) except +
-        double tempo_futuro_maximo(vector[int] x) except +
+        void qx(const vector[int]& x, const double* t, int n, double* ret) except +
+        void tpx(const vector[int]& x, const double* t, int n, double* ret) except +
+        void t_qx(const vector[int]& x, const double* t, int n, double* ret) except +
+        double tempo_futuro_maximo(const vector[int]& x) except +
+        StatusVidasConjuntasCpp pega_status()
 
 
     cdef cppclass StatusVidasConjuntasCpp:
@@ -3,6 +3,9 @@ from tabatu.core.tabatu_cpp import Tabua
 from tabatu.core.tabatu_cpp import TabuaMultiplasVidas
 from tabatu.core.tabatu_cpp import StatusVidasConjuntas
 from tabatu.core.tabatu_cpp import TabuaBase
+from tabatu.core.tabatu_cpp import TabuaLote
 from tabatu.core.tabatu_cpp import alterar_periodicidade_qx
 from tabatu.core.tabatu_cpp import agravar_qx
-from tabatu.core.tabatu_cpp import JurosConstante
\ No newline at end of file
+from tabatu.core.tabatu_cpp import JurosConstante
+from tabatu.core.tabatu_cpp import comutacao
+from tabatu.core.tabatu_cpp import JurosCurva
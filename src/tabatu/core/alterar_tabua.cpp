@@ -1,4 +1,5 @@
 #include "alterar_tabua.h"
+#include <algorithm>
 #include <cmath>
 #include <stdexcept>
 
@@ -6,9 +7,8 @@ double reduzir_periodicidade(double qx, int razao_nova_atual) {
     return 1.0 - std::pow(1.0 - qx, 1.0 / razao_nova_atual);
 }
 
-std::vector<double> reduzir_periodicidade(std::vector<double> qx, int razao_nova_atual) {
-    std::vector<double> qx_reduzido(qx.size() * razao_nova_atual);
-    for (int i = 0; i < qx.size() * razao_nova_atual; i++) {
+void reduzir_periodicidade(const double* qx, int n, int razao_nova_atual, double* qx_reduzido) {
+    for (int i = 0; i < n * razao_nova_atual; i++) {
         if (i % razao_nova_atual == 0) {
             qx_reduzido[i] = reduzir_periodicidade(qx[(int) i / razao_nova_atual], razao_nova_atual);
         }
@@ -16,54 +16,63 @@ std::vector<double> reduzir_periodicidade(std::vector<double> qx, int razao_nova
             qx_reduzido[i] = qx_reduzido[i - 1];
         }
     }
-    return qx_reduzido;
 }
 
 double aumentar_periodicidade(double qx, int razao_atual_nova) {
     return 1 - std::pow(1 - qx, razao_atual_nova);
 }
 
-std::vector<double> aumentar_periodicidade(std::vector<double> qx, int razao_atual_nova) {
-    int tamanho = std::ceil((double) qx.size() / razao_atual_nova);
+void aumentar_periodicidade(const double* qx, int n, int razao_atual_nova, double* qx_aumentado) {
+    int tamanho = std::ceil((double) n / razao_atual_nova);
     int indice_atual;
-    std::vector<double> qx_aumentado(tamanho);
     for (int i = 0; i < tamanho; i++) {
-        indice_atual = std::min(i * razao_atual_nova, (int)qx.size() - 1);
+        indice_atual = std::min(i * razao_atual_nova, n - 1);
         for (int j = 1; j < razao_atual_nova; j++) {
-            if (indice_atual == (int)qx.size() - 1) break;
+            if (indice_atual == n - 1) break;
             if (qx[indice_atual + j] != qx[indice_atual]) {
                 throw std::invalid_argument("Alterar a periodicidade de uma tábua que não possui taxas constantes em cada subintervalo resultaria em perda de informação");
             }
         }
         qx_aumentado[i] = aumentar_periodicidade(qx[indice_atual], razao_atual_nova);
     }
-    return qx_aumentado;
 }
 
-std::vector<double> alterar_periodicidade_qx_cpp(std::vector<double> qx, int periodicidade, int nova_periodicidade) {
+int tamanho_periodicidade_qx_cpp(int n, int periodicidade, int nova_periodicidade) {
     if (periodicidade < nova_periodicidade) {
-        return reduzir_periodicidade(qx, (int) nova_periodicidade / periodicidade);
+        return n * ((int) nova_periodicidade / periodicidade);
     }
     else if (periodicidade > nova_periodicidade)
     {
-        return aumentar_periodicidade(qx, (int) periodicidade / nova_periodicidade);
+        return std::ceil((double) n / ((int) periodicidade / nova_periodicidade));
     }
-    return qx;
+    return n;
+}
 
+void alterar_periodicidade_qx_cpp(const double* qx, int n, int periodicidade, int nova_periodicidade, double* ret) {
+    if (periodicidade < nova_periodicidade) {
+        reduzir_periodicidade(qx, n, (int) nova_periodicidade / periodicidade, ret);
+    }
+    else if (periodicidade > nova_periodicidade)
+    {
+        aumentar_periodicidade(qx, n, (int) periodicidade / nova_periodicidade, ret);
+    }
+    else {
+        std::copy(qx, qx + n, ret);
+    }
 }
 
-std::vector<double> agravar_qx_cpp(std::vector<double> qx, double percentual) {
+void agravar_qx_cpp(const double* qx, int n, double percentual, double* ret) {
     if (percentual < 0.0) {
         throw std::invalid_argument("O percentual de agravo deve ser positivo.");
     }
     if (percentual == 0.0) {
-        return qx;
+        std::copy(qx, qx + n, ret);
+        return;
     }
-    std::vector<double> qx_agravado(qx.size(), 1.0);
-    for (int i = 0; i < qx.size(); i++) {
+    for (int i = 0; i < n; i++) {
+        ret[i] = 1.0;
         if (qx[i] < 1) {
-            qx_agravado[i] = std::min(qx[i] * (percentual / 100), 1.0);
+            ret[i] = std::min(qx[i] * (percentual / 100), 1.0);
         }
     }
-    return qx_agravado;
 };
@@ -1,5 +1,7 @@
 #pragma once
 #include <vector>
 
-std::vector<double> alterar_periodicidade_qx_cpp(std::vector<double>, int, int);
-std::vector<double> agravar_qx_cpp(std::vector<double>, double);
\ No newline at end of file
+double reduzir_periodicidade(double qx, int razao_nova_atual);
+int tamanho_periodicidade_qx_cpp(int, int, int);
+void alterar_periodicidade_qx_cpp(const double*, int, int, int, double*);
+void agravar_qx_cpp(const double*, int, double, double*);
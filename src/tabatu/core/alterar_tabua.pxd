@@ -3,6 +3,7 @@ from libcpp.vector cimport vector
 cdef extern from "alterar_tabua.cpp":
     pass
 
-cdef extern from "alterar_tabua.h":
-    vector[double] alterar_periodicidade_qx_cpp(vector[double] qx, int periodicidade, int nova_periodicidade) except +
-    vector[double] agravar_qx_cpp(vector[double] qx, double percentual) except +
+cdef extern from "alterar_tabua.h" nogil:
+    int tamanho_periodicidade_qx_cpp(int n, int periodicidade, int nova_periodicidade)
+    void alterar_periodicidade_qx_cpp(const double* qx, int n, int periodicidade, int nova_periodicidade, double* ret) except +
+    void agravar_qx_cpp(const double* qx, int n, double percentual, double* ret) except +
@@ -0,0 +1,23 @@
+#include "comutacao.h"
+
+enum ColunaComutacao { DX, NX, SX, CX, MX, RX, QUANTIDADE_COLUNAS };
+
+// Preenche ret, com formato (6, n + 1), com as colunas Dx, Nx, Sx, Cx, Mx e Rx para as idades 0 a n.
+// A última posição de cada coluna é zero, representando as idades após o fim da tábua.
+// lx e dx possuem n elementos e desconto possui n + 1 elementos, com o fator de desconto v^t para t = 0, ..., n.
+void comutacao_cpp(const double* lx, const double* dx, const double* desconto, int n, double* ret) {
+    const int tamanho = n + 1;
+    double* coluna[QUANTIDADE_COLUNAS];
+    for (int j = 0; j < QUANTIDADE_COLUNAS; j++) {
+        coluna[j] = ret + j * tamanho;
+        coluna[j][n] = 0.0;
+    }
+    for (int i = n - 1; i >= 0; i--) {
+        coluna[DX][i] = desconto[i] * lx[i];
+        coluna[CX][i] = desconto[i + 1] * dx[i];
+        coluna[NX][i] = coluna[NX][i + 1] + coluna[DX][i];
+        coluna[MX][i] = coluna[MX][i + 1] + coluna[CX][i];
+        coluna[SX][i] = coluna[SX][i + 1] + coluna[NX][i];
+        coluna[RX][i] = coluna[RX][i + 1] + coluna[MX][i];
+    }
+}
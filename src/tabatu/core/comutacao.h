@@ -0,0 +1,3 @@
+#pragma once
+
+void comutacao_cpp(const double*, const double*, const double*, int, double*);
@@ -0,0 +1,5 @@
+cdef extern from "comutacao.cpp":
+    pass
+
+cdef extern from "comutacao.h" nogil:
+    void comutacao_cpp(const double* lx, const double* dx, const double* desconto, int n, double* ret)
@@ -0,0 +1,14 @@
+#pragma once
+#include <Python.h>
+#include "TabuaBaseCpp.h"
+
+// Dono que mantém um objeto Python vivo enquanto existir alguma tábua que usa a sua memória. A referência é
+// liberada com o GIL, pois a última cópia da tábua pode ser destruída em um trecho que não o possui.
+inline DonoCpp dono_python(PyObject* objeto) {
+    Py_INCREF(objeto);
+    return DonoCpp(objeto, [](const void* ponteiro) {
+        PyGILState_STATE estado = PyGILState_Ensure();
+        Py_DECREF((PyObject*)ponteiro);
+        PyGILState_Release(estado);
+    });
+}
@@ -0,0 +1,5 @@
+from cpython.ref cimport PyObject
+from TabuaBaseCpp cimport DonoCpp
+
+cdef extern from "dono_python.h":
+    DonoCpp dono_python(PyObject* objeto)
@@ -1,70 +1,520 @@
 # distutils: language = c++
 
 from TabuaBaseCpp cimport TabuaBaseCpp
+from TabuaBaseCpp cimport HipoteseFracionariaCpp
+from dono_python cimport dono_python
+from TabuaInterfaceCpp cimport TabuaInterfaceCpp
 from TabuaCpp cimport TabuaCpp
 from TabuaMDTCpp cimport TabuaMDTCpp
 from TabuaMultiplasVidasCpp cimport TabuaMultiplasVidasCpp
 from TabuaMultiplasVidasCpp cimport StatusVidasConjuntasCpp
+from TabuaLoteCpp cimport TabuaLoteCpp
 from alterar_tabua cimport alterar_periodicidade_qx_cpp
+from alterar_tabua cimport tamanho_periodicidade_qx_cpp
 from alterar_tabua cimport agravar_qx_cpp
 from JurosConstanteCpp cimport JurosConstanteCpp
+from JurosCurvaCpp cimport JurosCurvaCpp
+from comutacao cimport comutacao_cpp
 
 from libcpp.vector cimport vector
 from libcpp.string cimport string
+from libcpp cimport bool
+from libc.stdint cimport int64_t
+from cpython.buffer cimport PyBUF_WRITABLE
+from cpython.ref cimport PyObject
 import numpy as np
 
 
-def alterar_periodicidade_qx(vector[double] qx, int periodicidade, int nova_periodicidade):
-    return np.array(alterar_periodicidade_qx_cpp(qx, periodicidade, nova_periodicidade))
-
-
-def agravar_qx(vector[double] qx, double percentual):
-    return np.array(agravar_qx_cpp(qx, percentual))
-
-
-cdef extrair_tabuas(vector[TabuaBaseCpp] tabuas_cpp):
-    """Transforma um vetor de TabuaBaseCpp em uma tupla de TabuaBase"""
+def alterar_periodicidade_qx(qx, int periodicidade, int nova_periodicidade, out = None):
+    cdef const double[::1] qx_view = preparar_t(qx, "qx")
+    cdef int n = qx_view.shape[0]
+    out = preparar_saida(out, (tamanho_periodicidade_qx_cpp(n, periodicidade, nova_periodicidade),))
+    cdef double[::1] ret = out
+    with nogil:
+        alterar_periodicidade_qx_cpp(ponteiro(qx_view), n, periodicidade, nova_periodicidade, ponteiro_saida(ret))
+    return out
+
+
+def agravar_qx(qx, double percentual, out = None):
+    cdef const double[::1] qx_view = preparar_t(qx, "qx")
+    out = preparar_saida(out, (qx_view.shape[0],))
+    cdef double[::1] ret = out
+    with nogil:
+        agravar_qx_cpp(ponteiro(qx_view), qx_view.shape[0], percentual, ponteiro_saida(ret))
+    return out
+
+
+def comutacao(lx, dx, desconto, out = None):
+    cdef const double[::1] lx_view = preparar_t(lx, "lx")
+    cdef const double[::1] dx_view = preparar_t(dx, "dx")
+    cdef const double[::1] desconto_view = preparar_t(desconto, "desconto")
+    cdef int n = lx_view.shape[0]
+    if dx_view.shape[0] != n or desconto_view.shape[0] != n + 1:
+        raise ValueError("lx e dx devem ter o mesmo tamanho e desconto deve ter um elemento a mais.")
+    out = preparar_saida(out, (6, n + 1))
+    cdef double[:, ::1] ret = out
+    with nogil:
+        comutacao_cpp(ponteiro(lx_view), ponteiro(dx_view), ponteiro(desconto_view), n, &ret[0, 0])
+    return out
+
+
+cdef inline const double* ponteiro(const double[::1] v) noexcept nogil:
+    """Ponteiro para o início do memoryview, aceitando memoryviews vazios."""
+    if v.shape[0] == 0:
+        return NULL
+    return &v[0]
+
+
+cdef inline double* ponteiro_saida(double[::1] v) noexcept nogil:
+    if v.shape[0] == 0:
+        return NULL
+    return &v[0]
+
+
+cdef preparar_t(t, str nome = "t"):
+    """Converte t em um array float64 unidimensional e contíguo, sem cópia quando t já está nesse formato.
+
+    Arrays com passo diferente do tamanho do elemento, ou com outro tipo, como int64, são copiados: os núcleos em
+    C++ percorrem apenas memória contígua, e a cópia tem o mesmo custo O(n) que o cálculo. As idades ``x`` dos métodos
+    por tábua são convertidas para ``vector[int]``, uma cópia de uma idade por decremento ou vida.
+    """
+    t = np.ascontiguousarray(t, dtype=np.float64)
+    if t.ndim != 1:
+        raise ValueError(f"{nome} deve ser um array unidimensional.")
+    return t
+
+
+cdef preparar_saida(out, tuple formato):
+    """Valida o array de saída fornecido pelo usuário ou cria um novo com o formato desejado.
+
+    O array retornado é sempre float64 e C-contíguo, permitindo que o núcleo em C++ escreva diretamente nele.
+    Quando ``out`` é fornecido, ele deve ter exatamente o formato ``formato`` e o retorno é o próprio ``out``.
+    """
+    if out is None:
+        out = np.empty(formato, dtype=np.float64)
+    elif (
+        not isinstance(out, np.ndarray)
+        or out.dtype != np.float64
+        or out.shape != formato
+        or not out.flags.c_contiguous
+        or not out.flags.writeable
+    ):
+        raise ValueError(f"out deve ser um array float64 C-contíguo e gravável com formato {formato}.")
+    return out
+
+
+cdef class _VisaoSomenteLeitura:
+    """Expõe um trecho de memória do núcleo em C++ como um buffer somente leitura.
+
+    Mantém uma referência ao objeto dono da memória, que continua vivo enquanto existir alguma visão.
+    """
+    cdef object dono
+    cdef const double* dados
+    cdef Py_ssize_t formato[1]
+    cdef Py_ssize_t passos[1]
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        if flags & PyBUF_WRITABLE:
+            raise BufferError("A visão das taxas é somente leitura.")
+        buffer.buf = <void*>self.dados
+        buffer.obj = self
+        buffer.len = self.formato[0] * sizeof(double)
+        buffer.readonly = 1
+        buffer.itemsize = sizeof(double)
+        buffer.format = "d"
+        buffer.ndim = 1
+        buffer.shape = self.formato
+        buffer.strides = self.passos
+        buffer.suboffsets = NULL
+        buffer.internal = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+
+cdef visao_somente_leitura(object dono, const double* dados, Py_ssize_t tamanho):
+    cdef _VisaoSomenteLeitura visao = _VisaoSomenteLeitura.__new__(_VisaoSomenteLeitura)
+    visao.dono = dono
+    visao.dados = dados
+    visao.formato[0] = tamanho
+    visao.passos[0] = sizeof(double)
+    return np.asarray(visao)
+
+
+cdef buffer_somente_leitura(valores, str nome):
+    """Array float64 contíguo e somente leitura que usa a memória do buffer, sem cópias."""
+    valores = np.asarray(valores)
+    if valores.ndim != 1 or valores.dtype != np.float64 or not valores.flags.c_contiguous:
+        raise ValueError(f"{nome} deve ser um buffer unidimensional e contíguo de float64.")
+    if valores.flags.writeable:
+        raise ValueError(f"{nome} deve ser um buffer somente leitura, para que as taxas não sejam alteradas.")
+    return valores
+
+
+cdef int validar_hipotese_fracionaria(int hipotese_fracionaria) except -1:
+    if hipotese_fracionaria < 0 or hipotese_fracionaria > 3:
+        raise ValueError("hipotese_fracionaria deve ser um valor de HipoteseFracionaria.")
+    return hipotese_fracionaria
+
+
+cdef definir_hipotese_fracionaria(TabuaBaseCpp* tabua, int hipotese_fracionaria):
+    """Define a hipótese fracionária da tábua a partir do valor de :class:`~tabatu.HipoteseFracionaria`."""
+    validar_hipotese_fracionaria(hipotese_fracionaria)
+    tabua.definir_hipotese_fracionaria(<HipoteseFracionariaCpp> hipotese_fracionaria)
+
+
+cdef extrair_tabuas(const TabuaInterfaceCpp* tabua_cpp):
+    """Transforma as TabuaBaseCpp da tábua em uma tupla de TabuaBase, que compartilham a memória das taxas."""
+    cdef const vector[TabuaBaseCpp]* tabuas_cpp = &tabua_cpp.pega_tabuas()
+    cdef TabuaBase tabua
     tabuas = []
     for i in range(tabuas_cpp.size()):
-        tabua = TabuaBase()
-        tabua.c_tabua = tabuas_cpp[i]
+        tabua = TabuaBase.__new__(TabuaBase)
+        tabua.c_tabua = tabuas_cpp.at(i)
         tabuas.append(tabua)
     return tuple(tabuas)
 
 
+cdef enum MetodoLote:
+    QX
+    TPX
+    T_QX
+
+
+cdef avaliar_lote(const TabuaInterfaceCpp* tabua, MetodoLote metodo, x, t, out):
+    """Avalia um método da tábua para N idades (N, k) e tempos (T,) ou (N, T), retornando (N, T)."""
+    cdef int k = tabua.pega_numero_decrementos() * tabua.pega_numero_vidas()
+    cdef const int64_t[:, ::1] x_view = preparar_x_lote(x, k)
+    cdef int n = x_view.shape[0]
+    cdef bool t_por_linha
+    t, t_por_linha = preparar_t_lote(t, n)
+    cdef int n_t = t.shape[t.ndim - 1]
+    cdef const double[::1] t_view = t.reshape(-1)
+    out = preparar_saida(out, (n, n_t))
+    cdef double[::1] ret = out.reshape(-1)
+    cdef const int64_t* x_ptr = NULL
+    if n > 0:
+        x_ptr = &x_view[0, 0]
+    with nogil:
+        if metodo == QX:
+            tabua.qx_lote(x_ptr, n, ponteiro(t_view), n_t, t_por_linha, ponteiro_saida(ret))
+        elif metodo == TPX:
+            tabua.tpx_lote(x_ptr, n, ponteiro(t_view), n_t, t_por_linha, ponteiro_saida(ret))
+        else:
+            tabua.t_qx_lote(x_ptr, n, ponteiro(t_view), n_t, t_por_linha, ponteiro_saida(ret))
+    return out
+
+
+cdef preparar_t_lote(t, int n):
+    """Converte os tempos do lote em um array float64 contíguo com formato (T,), comum a todas as apólices, ou (N, T),
+    com os tempos de cada apólice, indicando se os tempos são por apólice."""
+    t = np.ascontiguousarray(t, dtype=np.float64)
+    cdef bool t_por_linha = t.ndim == 2
+    if t.ndim not in (1, 2) or (t_por_linha and t.shape[0] != n):
+        raise ValueError("t deve ser um array com formato (T,) ou (N, T).")
+    return t, t_por_linha
+
+
+cdef preparar_apolices_lote(tabuas, x):
+    """Converte as tábuas e as idades das apólices em vetores int64 contíguos de mesmo tamanho."""
+    tabuas = np.ascontiguousarray(tabuas, dtype=np.int64)
+    x = np.ascontiguousarray(x, dtype=np.int64)
+    if tabuas.ndim != 1 or x.ndim != 1 or tabuas.shape[0] != x.shape[0]:
+        raise ValueError("tabuas e x devem ser vetores com uma tábua e uma idade para cada apólice.")
+    return tabuas, x
+
+
+cdef avaliar_tabua_lote(const TabuaLoteCpp* lote, MetodoLote metodo, tabuas, x, t, out):
+    """Avalia um método do lote para N apólices, cada uma com uma tábua e uma idade, e tempos (T,) ou (N, T),
+    retornando (N, T)."""
+    tabuas, x = preparar_apolices_lote(tabuas, x)
+    cdef const int64_t[::1] tabuas_view = tabuas
+    cdef const int64_t[::1] x_view = x
+    cdef int n = x_view.shape[0]
+    cdef bool t_por_linha
+    t, t_por_linha = preparar_t_lote(t, n)
+    cdef int n_t = t.shape[t.ndim - 1]
+    cdef const double[::1] t_view = t.reshape(-1)
+    out = preparar_saida(out, (n, n_t))
+    cdef double[::1] ret = out.reshape(-1)
+    cdef const int64_t* tabuas_ptr = NULL
+    cdef const int64_t* x_ptr = NULL
+    if n > 0:
+        tabuas_ptr = &tabuas_view[0]
+        x_ptr = &x_view[0]
+    with nogil:
+        if metodo == QX:
+            lote.qx(tabuas_ptr, x_ptr, n, ponteiro(t_view), n_t, t_por_linha, ponteiro_saida(ret))
+        elif metodo == TPX:
+            lote.tpx(tabuas_ptr, x_ptr, n, ponteiro(t_view), n_t, t_por_linha, ponteiro_saida(ret))
+        else:
+            lote.t_qx(tabuas_ptr, x_ptr, n, ponteiro(t_view), n_t, t_por_linha, ponteiro_saida(ret))
+    return out
+
+
+cdef preparar_x_lote(x, int k):
+    """Converte as idades do lote em uma matriz (N, k) int64 e contígua, com uma linha para cada apólice."""
+    x = np.ascontiguousarray(x, dtype=np.int64)
+    if x.ndim == 1 and k == 1:
+        x = x.reshape(-1, 1)
+    if x.ndim != 2 or x.shape[1] != k:
+        raise ValueError(f"x deve ser um array com formato (N, {k}).")
+    return x
+
+
+cdef preparar_qx_lote(qx, inicios):
+    """Converte as taxas de um lote de tábuas em um vetor float64 contíguo, com as tábuas em sequência, e os inícios
+    de cada tábua em um vetor int64 com um elemento a mais que a quantidade de tábuas."""
+    qx = np.ascontiguousarray(qx, dtype=np.float64)
+    if inicios is None:
+        if qx.ndim != 2:
+            raise ValueError("qx deve ser uma matriz (tábuas, idades), ou um vetor acompanhado dos inícios das tábuas.")
+        inicios = np.arange(qx.shape[0] + 1, dtype=np.int64) * qx.shape[1]
+        return qx.reshape(-1), inicios
+    inicios = np.ascontiguousarray(inicios, dtype=np.int64)
+    if qx.ndim != 1 or inicios.ndim != 1 or inicios.shape[0] == 0 or inicios[inicios.shape[0] - 1] != qx.shape[0]:
+        raise ValueError("inicios deve ser um vetor crescente, de zero até o tamanho de qx.")
+    return qx, inicios
+
+
+cdef tempo_futuro_maximo_lote(const TabuaInterfaceCpp* tabua, x, out):
+    cdef int k = tabua.pega_numero_decrementos() * tabua.pega_numero_vidas()
+    cdef const int64_t[:, ::1] x_view = preparar_x_lote(x, k)
+    cdef int n = x_view.shape[0]
+    out = preparar_saida(out, (n,))
+    cdef double[::1] ret = out
+    cdef const int64_t* x_ptr = NULL
+    if n > 0:
+        x_ptr = &x_view[0, 0]
+    with nogil:
+        tabua.tempo_futuro_maximo_lote(x_ptr, n, ponteiro_saida(ret))
+    return out
+
+
 cdef class JurosConstante:
     cdef JurosConstanteCpp c_juros
 
     def __init__(self, double juros):
         self.c_juros = JurosConstanteCpp(juros)
 
-    def taxa_juros(self, vector[double] t):
-        return np.array(self.c_juros.taxa_juros(t))
+    def __reduce__(self):
+        return JurosConstante, (self.taxa_juros([0.0])[0],)
+
+    def taxa_juros(self, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_juros.taxa_juros(ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+    def taxa_desconto(self, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_juros.taxa_desconto(ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+
+cdef class JurosCurva:
+    cdef JurosCurvaCpp c_juros
+
+    def __init__(self, taxas_juros):
+        cdef const double[::1] taxas_view = preparar_t(taxas_juros, "taxas_juros")
+        self.c_juros = JurosCurvaCpp(ponteiro(taxas_view), taxas_view.shape[0])
+
+    def taxa_juros(self, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_juros.taxa_juros(ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+    def taxa_desconto(self, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_juros.taxa_desconto(ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+    def pega_taxas_juros(self):
+        return visao_somente_leitura(self, self.c_juros.dados_taxas_juros(), self.c_juros.tamanho())
 
-    def taxa_desconto(self, vector[double] t):
-        return np.array(self.c_juros.taxa_desconto(t))
+    def __reduce__(self):
+        return JurosCurva, (np.array(self.pega_taxas_juros()),)
 
 
 cdef class TabuaBase:
     cdef TabuaBaseCpp c_tabua
 
-    def __init__(self, qx = None):
+    def __init__(self, qx = None, int hipotese_fracionaria = 0):
+        cdef const double[::1] qx_view
         if qx is None:
             self.c_tabua = TabuaBaseCpp()
         else:
-            self.c_tabua = TabuaBaseCpp(qx)
-
-    def qx(self, int x, vector[double] t):
-        return np.array(self.c_tabua.qx(x, t))
-
-    def tpx(self,  int x, vector[double] t):
-        return np.array(self.c_tabua.tpx(x, t))
-
-    def t_qx(self, int x, vector[double] t):
-        return np.array(self.c_tabua.t_qx(x, t))
+            qx_view = preparar_t(qx, "qx")
+            self.c_tabua = TabuaBaseCpp(ponteiro(qx_view), qx_view.shape[0])
+        definir_hipotese_fracionaria(&self.c_tabua, hipotese_fracionaria)
+
+    def qx(self, int x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_tabua.qx(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+    def tpx(self, int x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_tabua.tpx(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+    def t_qx(self, int x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_tabua.t_qx(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
 
     def pega_qx(self):
-        return self.c_tabua.pega_qx()
+        if self.c_tabua.razao_periodicidade() > 1:
+            return self._materializar()[0]
+        return visao_somente_leitura(self, self.c_tabua.dados_qx(), self.c_tabua.tamanho_qx())
+
+    def pega_log_lx(self):
+        if self.c_tabua.razao_periodicidade() > 1:
+            return self._materializar()[1]
+        return visao_somente_leitura(self, self.c_tabua.dados_log_lx(), self.c_tabua.tamanho_qx() + 1)
+
+    def pega_razao_periodicidade(self):
+        return self.c_tabua.razao_periodicidade()
+
+    def _materializar(self):
+        """Taxas e log da sobrevivência acumulada de cada período de uma visão de periodicidade."""
+        cdef int n = self.c_tabua.tamanho_qx()
+        qx = np.empty(n, dtype=np.float64)
+        log_lx = np.empty(n + 1, dtype=np.float64)
+        cdef double[::1] qx_view = qx
+        cdef double[::1] log_lx_view = log_lx
+        with nogil:
+            self.c_tabua.materializar(ponteiro_saida(qx_view), ponteiro_saida(log_lx_view))
+        qx.flags.writeable = False
+        log_lx.flags.writeable = False
+        return qx, log_lx
+
+    def _visao_periodicidade(self, int razao):
+        """Cria uma visão da tábua com razao períodos em cada período das taxas armazenadas, sem materializar as
+        taxas de cada subperíodo."""
+        cdef TabuaBase tabua = type(self).__new__(type(self))
+        tabua.c_tabua = self.c_tabua.visao_periodicidade(razao)
+        return tabua
+
+    @classmethod
+    def _de_tabua_base(cls, TabuaBase tabua):
+        """Cria uma cópia da tábua, reaproveitando a sobrevivência já calculada."""
+        cdef TabuaBase nova = cls.__new__(cls)
+        nova.c_tabua = tabua.c_tabua
+        return nova
+
+    def pega_periodo_selecao(self):
+        return self.c_tabua.periodo_selecao()
+
+    def pega_hipotese_fracionaria(self):
+        return <int>self.c_tabua.pega_hipotese_fracionaria()
+
+    def pega_qx_selecao(self):
+        """Matriz (idades, período de seleção + 1) de taxas seletivas e finais, ou None se a tábua não é seletiva."""
+        cdef int s = self.c_tabua.periodo_selecao()
+        if s == 0:
+            return None
+        cdef int idades = self.c_tabua.idades_selecao()
+        return visao_somente_leitura(self, self.c_tabua.dados_qx_selecao(), idades * (s + 1)).reshape(idades, s + 1)
+
+    def pega_log_lx_selecao(self):
+        """Log da sobrevivência acumulada de cada idade de entrada ao longo da seleção, ou None se a tábua não é
+        seletiva."""
+        cdef int s = self.c_tabua.periodo_selecao()
+        if s == 0:
+            return None
+        cdef int idades = self.c_tabua.idades_selecao()
+        return visao_somente_leitura(self, self.c_tabua.dados_log_lx_selecao(), idades * (s + 1)).reshape(idades, s + 1)
+
+    def _par_qx_log_lx(self):
+        """Par (qx, log_lx) que recria a tábua com :meth:`_de_qx_e_log_lx`. Em tábuas seletivas, são as matrizes
+        de taxas e de sobrevivência da seleção."""
+        if self.c_tabua.periodo_selecao() > 0:
+            return self.pega_qx_selecao(), self.pega_log_lx_selecao()
+        return self.pega_qx(), self.pega_log_lx()
+
+    @classmethod
+    def _de_qx_selecao(cls, qx_selecao, int hipotese_fracionaria = 0):
+        """Cria a tábua seletiva a partir da matriz (idades, período de seleção + 1) de taxas."""
+        qx_selecao = np.ascontiguousarray(qx_selecao, dtype=np.float64)
+        if qx_selecao.ndim != 2 or qx_selecao.shape[1] < 2:
+            raise ValueError("qx_selecao deve ser uma matriz com pelo menos duas colunas.")
+        cdef const double[::1] qx_view = qx_selecao.reshape(-1)
+        cdef TabuaBase tabua = cls.__new__(cls)
+        cdef int idades = qx_selecao.shape[0]
+        cdef int periodo_selecao = qx_selecao.shape[1] - 1
+        tabua.c_tabua = TabuaBaseCpp(ponteiro(qx_view), idades, periodo_selecao)
+        definir_hipotese_fracionaria(&tabua.c_tabua, hipotese_fracionaria)
+        return tabua
+
+    @classmethod
+    def _de_qx_e_log_lx(cls, qx, log_lx, int hipotese_fracionaria = 0):
+        """Cria a tábua a partir de um log(lx) já calculado, sem recalcular a sobrevivência acumulada."""
+        if np.ndim(qx) == 2:
+            return cls._de_qx_e_log_lx_selecao(qx, log_lx, hipotese_fracionaria)
+        cdef const double[::1] qx_view = preparar_t(qx, "qx")
+        cdef const double[::1] log_lx_view = preparar_t(log_lx, "log_lx")
+        if log_lx_view.shape[0] != qx_view.shape[0] + 1:
+            raise ValueError("log_lx deve ter um elemento a mais que qx.")
+        cdef TabuaBase tabua = cls.__new__(cls)
+        tabua.c_tabua = TabuaBaseCpp(ponteiro(qx_view), ponteiro(log_lx_view), qx_view.shape[0])
+        definir_hipotese_fracionaria(&tabua.c_tabua, hipotese_fracionaria)
+        return tabua
+
+    @classmethod
+    def _de_buffer(cls, qx, log_lx = None, int hipotese_fracionaria = 0):
+        """Cria a tábua usando diretamente a memória de buffers somente leitura, sem copiá-los. Os buffers são
+        mantidos vivos enquanto existir alguma tábua que os usa."""
+        qx = buffer_somente_leitura(qx, "qx")
+        cdef const double[::1] qx_view = qx
+        cdef const double[::1] log_lx_view
+        cdef const double* log_lx_ptr = NULL
+        if log_lx is not None:
+            log_lx = buffer_somente_leitura(log_lx, "log_lx")
+            if log_lx.shape[0] != qx.shape[0] + 1:
+                raise ValueError("log_lx deve ter um elemento a mais que qx.")
+            log_lx_view = log_lx
+            log_lx_ptr = ponteiro(log_lx_view)
+        dono = (qx, log_lx)
+        cdef TabuaBase tabua = cls.__new__(cls)
+        tabua.c_tabua = TabuaBaseCpp(ponteiro(qx_view), log_lx_ptr, qx_view.shape[0], dono_python(<PyObject*>dono))
+        definir_hipotese_fracionaria(&tabua.c_tabua, hipotese_fracionaria)
+        return tabua
+
+    @classmethod
+    def _de_qx_e_log_lx_selecao(cls, qx_selecao, log_lx_selecao, int hipotese_fracionaria = 0):
+        qx_selecao = np.ascontiguousarray(qx_selecao, dtype=np.float64)
+        log_lx_selecao = np.ascontiguousarray(log_lx_selecao, dtype=np.float64)
+        if qx_selecao.shape != log_lx_selecao.shape or qx_selecao.shape[1] < 2:
+            raise ValueError("qx e log_lx da seleção devem ser matrizes de mesmo formato, com pelo menos duas colunas.")
+        cdef const double[::1] qx_view = qx_selecao.reshape(-1)
+        cdef const double[::1] log_lx_view = log_lx_selecao.reshape(-1)
+        cdef int idades = qx_selecao.shape[0]
+        cdef int periodo_selecao = qx_selecao.shape[1] - 1
+        cdef TabuaBase tabua = cls.__new__(cls)
+        tabua.c_tabua = TabuaBaseCpp(ponteiro(qx_view), ponteiro(log_lx_view), idades, periodo_selecao)
+        definir_hipotese_fracionaria(&tabua.c_tabua, hipotese_fracionaria)
+        return tabua
 
     def tempo_futuro_maximo(self, x):
         return self.c_tabua.tempo_futuro_maximo(x)
@@ -72,24 +522,65 @@ cdef class TabuaBase:
     def possui_fechamento_plato(self):
         return self.c_tabua.possui_fechamento_plato()
 
+    def __reduce__(self):
+        qx, log_lx = self._par_qx_log_lx()
+        return _restaurar_tabua_base, (np.array(qx), np.array(log_lx), self.pega_hipotese_fracionaria())
+
 
 cdef class Tabua:
     cdef TabuaCpp c_tabua
 
-    def __init__(self, qx):
-        self.c_tabua = TabuaCpp(qx)
+    def __init__(self, qx, int hipotese_fracionaria = 0):
+        self._usar_tabua_base(TabuaBase(qx, hipotese_fracionaria))
+
+    @classmethod
+    def _de_tabua_base(cls, TabuaBase tabua):
+        """Cria a tábua a partir de uma TabuaBase, reaproveitando a sobrevivência já calculada."""
+        cdef Tabua nova = cls.__new__(cls)
+        nova._usar_tabua_base(tabua)
+        return nova
+
+    def _usar_tabua_base(self, TabuaBase tabua):
+        self.c_tabua = TabuaCpp(tabua.c_tabua)
+
+    def qx(self, vector[int] x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_tabua.qx(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+    def tpx(self, vector[int] x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_tabua.tpx(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+    def t_qx(self, vector[int] x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_tabua.t_qx(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
 
-    def qx(self, vector[int] x, vector[double] t):
-        return np.array(self.c_tabua.qx(x, t))
+    def tempo_futuro_maximo(self, vector[int] x):
+        return self.c_tabua.tempo_futuro_maximo(x)
 
-    def tpx(self,  vector[int] x, vector[double] t):
-        return np.array(self.c_tabua.tpx(x, t))
+    def qx_lote(self, x, t, out = None):
+        return avaliar_lote(&self.c_tabua, QX, x, t, out)
 
-    def t_qx(self, vector[int] x, vector[double] t):
-        return np.array(self.c_tabua.t_qx(x, t))
+    def tpx_lote(self, x, t, out = None):
+        return avaliar_lote(&self.c_tabua, TPX, x, t, out)
 
-    def tempo_futuro_maximo(self, vector[int] x):
-        return self.c_tabua.tempo_futuro_maximo(x)
+    def t_qx_lote(self, x, t, out = None):
+        return avaliar_lote(&self.c_tabua, T_QX, x, t, out)
+
+    def tempo_futuro_maximo_lote(self, x, out = None):
+        return tempo_futuro_maximo_lote(&self.c_tabua, x, out)
 
     def possui_fechamento_plato(self):
         return self.c_tabua.possui_fechamento_plato()
@@ -104,7 +595,15 @@ cdef class Tabua:
 
     @property
     def tabuas(self):
-        return extrair_tabuas(self.c_tabua.pega_tabuas())
+        return extrair_tabuas(&self.c_tabua)
+
+    def _tabuas_base(self):
+        return extrair_tabuas(&self.c_tabua)
+
+    def __reduce__(self):
+        tabua, = self._tabuas_base()
+        qx, log_lx = tabua._par_qx_log_lx()
+        return _restaurar_tabua, (np.array(qx), np.array(log_lx), tabua.pega_hipotese_fracionaria())
 
 
 cdef class TabuaMDT:
@@ -117,23 +616,69 @@ cdef class TabuaMDT:
             tabuas_vec.push_back(tabua.c_tabua)
         self.c_tabua = TabuaMDTCpp(tabuas_vec, causa_principal)
 
-    def qx_j(self, vector[int] x, vector[double] t, vector[int] j):
-        return np.atleast_2d(self.c_tabua.qx_j(x, t, j))
+    def qx_j(self, vector[int] x, t, vector[int] j, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (<Py_ssize_t>j.size(), t_view.shape[0]))
+        cdef double[::1] ret = out.reshape(-1)
+        with nogil:
+            self.c_tabua.qx_j(x, ponteiro(t_view), t_view.shape[0], j, ponteiro_saida(ret))
+        return out
+
+    def t_qx_j(self, vector[int] x, t, vector[int] j, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (<Py_ssize_t>j.size(), t_view.shape[0]))
+        cdef double[::1] ret = out.reshape(-1)
+        with nogil:
+            self.c_tabua.t_qx_j(x, ponteiro(t_view), t_view.shape[0], j, ponteiro_saida(ret))
+        return out
+
+    def probabilidades(self, vector[int] x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        cdef Py_ssize_t k = self.c_tabua.pega_numero_decrementos()
+        out = preparar_saida(out, (2 * k + 2, t_view.shape[0]))
+        cdef double[::1] ret = out.reshape(-1)
+        with nogil:
+            self.c_tabua.probabilidades(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+    def qx(self, vector[int] x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_tabua.qx(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+    def tpx(self, vector[int] x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_tabua.tpx(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+    def t_qx(self, vector[int] x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_tabua.t_qx(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
 
-    def t_qx_j(self, vector[int] x, vector[double] t, vector[int] j):
-        return np.atleast_2d(self.c_tabua.t_qx_j(x, t, j))
+    def tempo_futuro_maximo(self, vector[int] x):
+        return self.c_tabua.tempo_futuro_maximo(x)
 
-    def qx(self, vector[int] x, vector[double] t):
-        return np.atleast_1d(self.c_tabua.qx(x, t))
+    def qx_lote(self, x, t, out = None):
+        return avaliar_lote(&self.c_tabua, QX, x, t, out)
 
-    def tpx(self,  vector[int] x, vector[double] t):
-        return np.atleast_1d(self.c_tabua.tpx(x, t))
+    def tpx_lote(self, x, t, out = None):
+        return avaliar_lote(&self.c_tabua, TPX, x, t, out)
 
-    def t_qx(self, vector[int] x, vector[double] t):
-        return np.atleast_1d(self.c_tabua.t_qx(x, t))
+    def t_qx_lote(self, x, t, out = None):
+        return avaliar_lote(&self.c_tabua, T_QX, x, t, out)
 
-    def tempo_futuro_maximo(self, vector[int] x):
-        return self.c_tabua.tempo_futuro_maximo(x)
+    def tempo_futuro_maximo_lote(self, x, out = None):
+        return tempo_futuro_maximo_lote(&self.c_tabua, x, out)
 
     def possui_fechamento_plato(self):
         return self.c_tabua.possui_fechamento_plato()
@@ -148,7 +693,13 @@ cdef class TabuaMDT:
 
     @property
     def tabuas(self):
-        return extrair_tabuas(self.c_tabua.pega_tabuas())
+        return extrair_tabuas(&self.c_tabua)
+
+    def _tabuas_base(self):
+        return extrair_tabuas(&self.c_tabua)
+
+    def __reduce__(self):
+        return _restaurar_tabua_mdt, (self._tabuas_base(), self.c_tabua.pega_causa_principal())
 
 
 cdef extern from "TabuaMultiplasVidasCpp.h" namespace "StatusVidasConjuntasCpp":
@@ -166,6 +717,9 @@ cdef class StatusVidasConjuntas:
         cdef c = {<int>LAST : "LAST", <int>JOINT : "JOINT"}
         return c[<int>self.c_status]
 
+    def __reduce__(self):
+        return StatusVidasConjuntas, (self.get_status().encode(),)
+
 
 cdef class TabuaMultiplasVidas:
     cdef TabuaMultiplasVidasCpp c_tabua
@@ -177,18 +731,45 @@ cdef class TabuaMultiplasVidas:
             tabuas_vec.push_back(tabua.c_tabua)
         self.c_tabua = TabuaMultiplasVidasCpp(tabuas_vec, status.c_status)
 
-    def qx(self, vector[int] x, vector[double] t):
-        return np.atleast_1d(self.c_tabua.qx(x, t))
-
-    def tpx(self,  vector[int] x, vector[double] t):
-        return np.atleast_1d(self.c_tabua.tpx(x, t))
-
-    def t_qx(self, vector[int] x, vector[double] t):
-        return np.atleast_1d(self.c_tabua.t_qx(x, t))
+    def qx(self, vector[int] x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_tabua.qx(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+    def tpx(self, vector[int] x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_tabua.tpx(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
+
+    def t_qx(self, vector[int] x, t, out = None):
+        cdef const double[::1] t_view = preparar_t(t)
+        out = preparar_saida(out, (t_view.shape[0],))
+        cdef double[::1] ret = out
+        with nogil:
+            self.c_tabua.t_qx(x, ponteiro(t_view), t_view.shape[0], ponteiro_saida(ret))
+        return out
 
     def tempo_futuro_maximo(self, vector[int] x):
         return self.c_tabua.tempo_futuro_maximo(x)
 
+    def qx_lote(self, x, t, out = None):
+        return avaliar_lote(&self.c_tabua, QX, x, t, out)
+
+    def tpx_lote(self, x, t, out = None):
+        return avaliar_lote(&self.c_tabua, TPX, x, t, out)
+
+    def t_qx_lote(self, x, t, out = None):
+        return avaliar_lote(&self.c_tabua, T_QX, x, t, out)
+
+    def tempo_futuro_maximo_lote(self, x, out = None):
+        return tempo_futuro_maximo_lote(&self.c_tabua, x, out)
+
     def possui_fechamento_plato(self):
         return self.c_tabua.possui_fechamento_plato()
 
@@ -202,4 +783,89 @@ cdef class TabuaMultiplasVidas:
 
     @property
     def tabuas(self):
-        return extrair_tabuas(self.c_tabua.pega_tabuas())
+        return extrair_tabuas(&self.c_tabua)
+
+    def _tabuas_base(self):
+        return extrair_tabuas(&self.c_tabua)
+
+    def __reduce__(self):
+        cdef StatusVidasConjuntas status = StatusVidasConjuntas.__new__(StatusVidasConjuntas, b"LAST")
+        status.c_status = self.c_tabua.pega_status()
+        return _restaurar_tabua_multiplas_vidas, (self._tabuas_base(), status)
+
+
+cdef class TabuaLote:
+    cdef TabuaLoteCpp c_lote
+    cdef object _inicios
+
+    def __init__(self, qx, inicios = None, int hipotese_fracionaria = 0):
+        qx, inicios = preparar_qx_lote(qx, inicios)
+        cdef const double[::1] qx_view = qx
+        cdef const int64_t[::1] inicios_view = inicios
+        validar_hipotese_fracionaria(hipotese_fracionaria)
+        with nogil:
+            self.c_lote = TabuaLoteCpp(ponteiro(qx_view), &inicios_view[0], inicios_view.shape[0] - 1)
+        self.c_lote.definir_hipotese_fracionaria(<HipoteseFracionariaCpp> hipotese_fracionaria)
+        self._inicios = np.array(inicios)
+        self._inicios.flags.writeable = False
+
+    def __len__(self):
+        return self.c_lote.quantidade()
+
+    def pega_qx(self):
+        """Taxas de todas as tábuas, em sequência, como uma visão somente leitura da memória do lote."""
+        return visao_somente_leitura(self, self.c_lote.dados_qx(), self.c_lote.tamanho())
+
+    def pega_inicios(self):
+        return self._inicios
+
+    def qx(self, tabuas, x, t, out = None):
+        return avaliar_tabua_lote(&self.c_lote, QX, tabuas, x, t, out)
+
+    def tpx(self, tabuas, x, t, out = None):
+        return avaliar_tabua_lote(&self.c_lote, TPX, tabuas, x, t, out)
+
+    def t_qx(self, tabuas, x, t, out = None):
+        return avaliar_tabua_lote(&self.c_lote, T_QX, tabuas, x, t, out)
+
+    def tempo_futuro_maximo(self, tabuas, x, out = None):
+        tabuas, x = preparar_apolices_lote(tabuas, x)
+        cdef const int64_t[::1] tabuas_view = tabuas
+        cdef const int64_t[::1] x_view = x
+        cdef int n = x_view.shape[0]
+        out = preparar_saida(out, (n,))
+        cdef double[::1] ret = out
+        cdef const int64_t* tabuas_ptr = NULL
+        cdef const int64_t* x_ptr = NULL
+        if n > 0:
+            tabuas_ptr = &tabuas_view[0]
+            x_ptr = &x_view[0]
+        with nogil:
+            self.c_lote.tempo_futuro_maximo(tabuas_ptr, x_ptr, n, ponteiro_saida(ret))
+        return out
+
+    def _tabua_base(self, int i):
+        """TabuaBase da tábua i, que compartilha a memória do lote."""
+        cdef TabuaBase tabua = TabuaBase.__new__(TabuaBase)
+        tabua.c_tabua = self.c_lote.tabua(i)
+        return tabua
+
+
+def _restaurar_tabua_base(qx, log_lx, hipotese_fracionaria = 0):
+    return TabuaBase._de_qx_e_log_lx(qx, log_lx, hipotese_fracionaria)
+
+
+def _restaurar_tabua(qx, log_lx, hipotese_fracionaria = 0):
+    return Tabua._de_tabua_base(TabuaBase._de_qx_e_log_lx(qx, log_lx, hipotese_fracionaria))
+
+
+def _tabuas_de_bases(tabuas_base):
+    return [Tabua._de_tabua_base(tabua) for tabua in tabuas_base]
+
+
+def _restaurar_tabua_mdt(tabuas_base, causa_principal):
+    return TabuaMDT(*_tabuas_de_bases(tabuas_base), causa_principal=causa_principal)
+
+
+def _restaurar_tabua_multiplas_vidas(tabuas_base, status):
+    return TabuaMultiplasVidas(*_tabuas_de_bases(tabuas_base), status=status)
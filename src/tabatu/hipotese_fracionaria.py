@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class HipoteseFracionaria(Enum):
+    """Hipótese para a sobrevivência entre idades inteiras, usada em tempos fracionados.
+
+    Com ``NENHUMA``, o tempo é truncado para inteiro, e tpx(x, 2.5) é igual a tpx(x, 2). Nas demais, a sobrevivência
+    a uma fração s de um período, com probabilidade de falha q no período inteiro, é:
+
+    - ``UDD``: distribuição uniforme das falhas, 1 - s * q.
+    - ``FORCA_CONSTANTE``: força de mortalidade constante, (1 - q) ** s.
+    - ``BALDUCCI``: hipótese de Balducci, (1 - q) / (1 - (1 - s) * q).
+    """
+    NENHUMA = "NENHUMA"
+    UDD = "UDD"
+    FORCA_CONSTANTE = "FORCA_CONSTANTE"
+    BALDUCCI = "BALDUCCI"
+
+    @property
+    def codigo(self) -> int:
+        """Código da hipótese no núcleo em C++."""
+        return list(HipoteseFracionaria).index(self)
+
+    @classmethod
+    def from_codigo(cls, codigo: int) -> HipoteseFracionaria:
+        """Hipótese correspondente a um código do núcleo em C++."""
+        return list(cls)[codigo]
@@ -1,6 +1,8 @@
 from __future__ import annotations
-from typing import Iterable
+from functools import lru_cache
+from typing import Iterable, Optional
 
+from numpy import arange
 from numpy import float64
 from numpy.typing import NDArray
 
@@ -8,6 +10,16 @@ import tabatu.core as core
 from tabatu.periodicidade import Periodicidade
 from tabatu.alterar_juros import alterar_periodicidade_juros
 
+TAMANHO_CACHE_DESCONTO = 256
+"""Quantidade máxima de vetores de desconto mantidos em cache por :meth:`JurosConstante.vetor_desconto`."""
+
+
+@lru_cache(maxsize=TAMANHO_CACHE_DESCONTO)
+def _vetor_desconto(taxa_juros: float, horizonte: int) -> NDArray[float64]:
+    vetor = core.JurosConstante(taxa_juros).taxa_desconto(arange(horizonte, dtype=float64))
+    vetor.flags.writeable = False
+    return vetor
+
 
 class JurosConstante(core.JurosConstante):
     """Definição de juros constante no tempo.
@@ -32,6 +44,31 @@ class JurosConstante(core.JurosConstante):
         """Periodicidade do juros."""
         return self._periodicidade
 
+    def __reduce__(self):
+        return type(self), (self.taxa_juros([0]).item(), self._periodicidade)
+
+    def vetor_desconto(self, horizonte: int) -> NDArray[float64]:
+        """Taxas de desconto nos tempos 0, 1, ..., ``horizonte`` - 1.
+
+        Os vetores são mantidos em um cache limitado, compartilhado por todos os juros com a mesma taxa, de forma
+        que projeções que usam repetidamente o mesmo horizonte calculam o vetor uma única vez. O array retornado é
+        somente leitura.
+
+        Args:
+            horizonte (int): Quantidade de períodos.
+
+        Returns:
+            NDArray[float64]: Taxas de desconto.
+
+        Examples:
+
+            >>> JurosConstante(0.01).vetor_desconto(3)
+            array([1.        , 0.99009901, 0.98029605])
+        """
+        if horizonte < 0:
+            raise ValueError("horizonte deve ser maior ou igual a zero.")
+        return _vetor_desconto(self.taxa_juros([0]).item(), int(horizonte))
+
     def alterar_periodicidade(
         self, nova_periodicidade: Periodicidade
     ) -> JurosConstante:
@@ -48,11 +85,15 @@ class JurosConstante(core.JurosConstante):
         )
         return JurosConstante(taxa_juros_convertida, nova_periodicidade)
 
-    def taxa_juros(self, t: Iterable[int]) -> NDArray[float64]:
+    def taxa_juros(
+        self, t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         """Taxa de juros no tempo ``t``.
 
         Args:
             t (Iterable[int]): Tempo (ou tempos) para os quais se deseja obter a taxa de juros.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             NDArray[float64]: Taxa de juros nos tempos desejados.
@@ -71,14 +112,18 @@ class JurosConstante(core.JurosConstante):
             >>> juros.taxa_juros([0, 1, 2, 3, 4])
             array([0.00082954, 0.00082954, 0.00082954, 0.00082954, 0.00082954])
         """
-        return super().taxa_juros(t)
+        return super().taxa_juros(t, out=out)
 
-    def taxa_desconto(self, t: Iterable[int]) -> NDArray[float64]:
+    def taxa_desconto(
+        self, t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         """Taxa de desconto no tempo ``t``.
 
         Args:
             t (Iterable[int]): Tempos para os quais se deseja obter a taxa de desconto.
                 Deve estar na mesma periodicidade que o juros.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             NDArray[float64]: Taxa de desconto nos tempos desejados.
@@ -97,4 +142,4 @@ class JurosConstante(core.JurosConstante):
             >>> juros.taxa_desconto([0, 1, 2, 3, 4])
             array([1.        , 0.99917115, 0.99834299, 0.99751551, 0.99668872])
         """
-        return super().taxa_desconto(t)
+        return super().taxa_desconto(t, out=out)
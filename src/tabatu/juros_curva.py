@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from numpy import arange
+from numpy import asarray
+from numpy import ceil
+from numpy import exp
+from numpy import expm1
+from numpy import float64
+from numpy import power
+from numpy.typing import NDArray
+
+import tabatu.core as core
+from tabatu.periodicidade import Periodicidade
+
+
+def _taxas_a_termo(desconto: NDArray[float64]) -> NDArray[float64]:
+    """Taxas a termo de cada período a partir dos descontos acumulados, com desconto[0] igual a 1."""
+    return desconto[:-1] / desconto[1:] - 1
+
+
+class JurosCurva(core.JurosCurva):
+    """Definição de juros variável no tempo, a partir de uma estrutura a termo de taxas de juros.
+
+    Os fatores de desconto acumulados são calculados uma única vez, na criação da curva, de forma que o desconto em
+    tempos inteiros é obtido por consulta. Em tempos fracionados, o desconto é interpolado com a taxa a termo do
+    período. Após o fim da curva, a última taxa a termo é mantida constante.
+
+    Args:
+        taxas_juros (Iterable[float]): Taxas a termo, onde a posição k contém a taxa do período [k, k + 1).
+        periodicidade (Periodicidade, optional): Periodicidade das taxas de juros.
+
+    Examples:
+
+        >>> juros = JurosCurva([0.10, 0.05, 0.02])
+        >>> juros.taxa_juros([0, 1, 2, 3])
+        array([0.1 , 0.05, 0.02, 0.02])
+        >>> juros.taxa_desconto([0, 1, 2, 3])
+        array([1.        , 0.90909091, 0.86580087, 0.84882438])
+    """
+    __slots__ = "_periodicidade"
+
+    def __init__(
+        self,
+        taxas_juros: Iterable[float],
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+    ):
+        self._periodicidade = periodicidade
+        super().__init__(taxas_juros)
+
+    @classmethod
+    def from_taxas_spot(
+        cls,
+        taxas_spot: Iterable[float],
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+    ) -> JurosCurva:
+        """Cria a curva a partir de taxas spot, onde a posição k contém a taxa para o prazo de k + 1 períodos.
+
+        Args:
+            taxas_spot (Iterable[float]): Taxas spot, por período.
+            periodicidade (Periodicidade, optional): Periodicidade das taxas de juros.
+
+        Returns:
+            JurosCurva: Curva de juros.
+
+        Examples:
+
+            >>> juros = JurosCurva.from_taxas_spot([0.10, 0.075])
+            >>> juros.taxa_desconto([1, 2])
+            array([0.90909091, 0.86533261])
+        """
+        taxas_spot = asarray(taxas_spot, dtype=float64)
+        prazos = arange(len(taxas_spot) + 1, dtype=float64)
+        desconto = power(1 + asarray([0.0, *taxas_spot]), -prazos)
+        return cls(_taxas_a_termo(desconto), periodicidade)
+
+    @classmethod
+    def from_svensson(
+        cls,
+        beta1: float,
+        beta2: float,
+        beta3: float,
+        beta4: float,
+        lambda1: float,
+        lambda2: float,
+        prazo: int,
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+    ) -> JurosCurva:
+        """Cria a curva a partir dos parâmetros do modelo de Svensson, como os divulgados para a ETTJ.
+
+        A taxa spot em tempo contínuo para o prazo de ``tau`` anos é dada por
+        ``beta1 + beta2 * f1 + beta3 * (f1 - exp(-lambda1 * tau)) + beta4 * (f2 - exp(-lambda2 * tau))``,
+        onde ``fi = (1 - exp(-lambdai * tau)) / (lambdai * tau)``.
+
+        Args:
+            beta1 (float): Nível.
+            beta2 (float): Inclinação.
+            beta3 (float): Primeira curvatura.
+            beta4 (float): Segunda curvatura.
+            lambda1 (float): Decaimento da primeira curvatura, em anos.
+            lambda2 (float): Decaimento da segunda curvatura, em anos.
+            prazo (int): Quantidade de períodos da curva.
+            periodicidade (Periodicidade, optional): Periodicidade das taxas de juros.
+
+        Returns:
+            JurosCurva: Curva de juros.
+
+        Examples:
+
+            >>> juros = JurosCurva.from_svensson(0.05, 0.0, 0.0, 0.0, 1.0, 1.0, prazo=3)
+            >>> juros.taxa_juros([0, 1, 2])
+            array([0.0512711, 0.0512711, 0.0512711])
+        """
+        if prazo <= 0:
+            raise ValueError("prazo deve ser maior que zero.")
+        tau = arange(1, prazo + 1, dtype=float64) / periodicidade.quantidade_periodos_1_ano()
+        fator1 = -expm1(-lambda1 * tau) / (lambda1 * tau)
+        fator2 = -expm1(-lambda2 * tau) / (lambda2 * tau)
+        spot = (
+            beta1
+            + beta2 * fator1
+            + beta3 * (fator1 - exp(-lambda1 * tau))
+            + beta4 * (fator2 - exp(-lambda2 * tau))
+        )
+        desconto = exp(-asarray([0.0, *(spot * tau)]))
+        return cls(_taxas_a_termo(desconto), periodicidade)
+
+    @property
+    def periodicidade(self) -> Periodicidade:
+        """Periodicidade do juros."""
+        return self._periodicidade
+
+    def alterar_periodicidade(self, nova_periodicidade: Periodicidade) -> JurosCurva:
+        """Alteração da periodicidade dos juros, preservando os descontos acumulados.
+
+        Args:
+            nova_periodicidade (Periodicidade): Nova periodicidade dos juros.
+
+        Returns:
+            JurosCurva: Juros com a nova periodicidade.
+
+        Examples:
+
+            >>> juros = JurosCurva([0.10, 0.05])
+            >>> juros_mensal = juros.alterar_periodicidade(Periodicidade.MENSAL)
+            >>> juros_mensal.taxa_desconto([12, 24])
+            array([0.90909091, 0.86580087])
+        """
+        razao = nova_periodicidade.quantidade_periodos_1_periodicidade(self._periodicidade)
+        prazo = int(ceil(len(self.pega_taxas_juros()) * razao))
+        desconto = self.taxa_desconto(arange(prazo + 1, dtype=float64) / razao)
+        return JurosCurva(_taxas_a_termo(desconto), nova_periodicidade)
+
+    def __reduce__(self):
+        return type(self), (self.pega_taxas_juros(), self._periodicidade)
+
+    def taxa_juros(
+        self, t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Taxa de juros a termo no tempo ``t``.
+
+        Args:
+            t (Iterable[int]): Tempos para os quais se deseja obter a taxa de juros.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Taxa de juros nos tempos desejados.
+        """
+        return super().taxa_juros(t, out=out)
+
+    def taxa_desconto(
+        self, t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Fator de desconto acumulado entre o tempo 0 e o tempo ``t``.
+
+        Args:
+            t (Iterable[int]): Tempos para os quais se deseja obter a taxa de desconto.
+                Deve estar na mesma periodicidade que o juros.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Taxa de desconto nos tempos desejados.
+        """
+        return super().taxa_desconto(t, out=out)
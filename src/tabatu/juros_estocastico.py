@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import os
+from typing import Iterable, Optional, Union
+
+from numpy import arange
+from numpy import asarray
+from numpy import atleast_1d
+from numpy import ceil
+from numpy import cumprod
+from numpy import divide
+from numpy import empty
+from numpy import float64
+from numpy import floor
+from numpy import intp
+from numpy import load
+from numpy import minimum
+from numpy import power
+from numpy import take
+from numpy.typing import ArrayLike
+from numpy.typing import NDArray
+
+from tabatu.periodicidade import Periodicidade
+
+
+class JurosEstocastico:
+    """Definição de juros a partir de cenários econômicos, onde cada cenário é uma curva de taxas de juros por período.
+
+    As taxas são armazenadas em uma matriz (S, T), com S cenários e T períodos, e os descontos acumulados de todos os
+    cenários são calculados uma única vez, na criação do juros, com um produto acumulado vetorizado. Os métodos
+    ``taxa_juros`` e ``taxa_desconto`` retornam uma matriz (S, n), com uma linha para cada cenário.
+
+    Assim como em :class:`~tabatu.JurosCurva`, em tempos fracionados o desconto é interpolado com a taxa do período e,
+    após o último período, a última taxa de cada cenário é mantida constante.
+
+    Args:
+        taxas_juros (ArrayLike): Matriz (S, T), onde a posição [s, k] contém a taxa do período [k, k + 1) no
+            cenário s. Arrays float64, inclusive mapeados em memória, são usados sem cópia.
+        periodicidade (Periodicidade, optional): Periodicidade das taxas de juros.
+
+    Examples:
+
+        >>> juros = JurosEstocastico([[0.10, 0.05], [0.02, 0.04]])
+        >>> juros.taxa_desconto([0, 1, 2])
+        array([[1.        , 0.90909091, 0.86580087],
+               [1.        , 0.98039216, 0.94268477]])
+    """
+    __slots__ = "_taxas_juros", "_desconto_acumulado", "_periodicidade"
+
+    def __init__(
+        self,
+        taxas_juros: ArrayLike,
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+    ):
+        taxas_juros = asarray(taxas_juros, dtype=float64)
+        if taxas_juros.ndim != 2 or taxas_juros.shape[0] == 0 or taxas_juros.shape[1] == 0:
+            raise ValueError("taxas_juros deve ser uma matriz com pelo menos um cenário e um período.")
+        if not (taxas_juros > -1.0).all():
+            raise ValueError("As taxas de juros devem ser maiores que -1.")
+        self._taxas_juros = taxas_juros
+        self._periodicidade = periodicidade
+        self._desconto_acumulado = empty((taxas_juros.shape[0], taxas_juros.shape[1] + 1), dtype=float64)
+        self._desconto_acumulado[:, 0] = 1.0
+        divide(1.0, 1.0 + taxas_juros, out=self._desconto_acumulado[:, 1:])
+        cumprod(self._desconto_acumulado[:, 1:], axis=1, out=self._desconto_acumulado[:, 1:])
+        self._desconto_acumulado.flags.writeable = False
+
+    @classmethod
+    def from_npy(
+        cls,
+        caminho: Union[str, os.PathLike],
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+    ) -> JurosEstocastico:
+        """Cria o juros a partir de um arquivo ``.npy`` com a matriz (S, T) de taxas, mapeado em memória.
+
+        O arquivo não é copiado para a memória: as taxas são lidas diretamente do disco, uma única vez, no cálculo
+        dos descontos acumulados.
+
+        Args:
+            caminho (str | os.PathLike): Caminho do arquivo.
+            periodicidade (Periodicidade, optional): Periodicidade das taxas de juros.
+
+        Returns:
+            JurosEstocastico: Juros com um cenário para cada linha do arquivo.
+        """
+        return cls(load(caminho, mmap_mode="r"), periodicidade)
+
+    @property
+    def periodicidade(self) -> Periodicidade:
+        """Periodicidade do juros."""
+        return self._periodicidade
+
+    @property
+    def quantidade_cenarios(self) -> int:
+        """Quantidade de cenários, S."""
+        return self._taxas_juros.shape[0]
+
+    def pega_taxas_juros(self) -> NDArray[float64]:
+        """Matriz (S, T) de taxas de juros usada na criação do juros."""
+        return self._taxas_juros
+
+    def alterar_periodicidade(self, nova_periodicidade: Periodicidade) -> JurosEstocastico:
+        """Alteração da periodicidade dos juros, preservando os descontos acumulados de cada cenário.
+
+        Args:
+            nova_periodicidade (Periodicidade): Nova periodicidade dos juros.
+
+        Returns:
+            JurosEstocastico: Juros com a nova periodicidade.
+        """
+        razao = nova_periodicidade.quantidade_periodos_1_periodicidade(self._periodicidade)
+        prazo = int(ceil(self._taxas_juros.shape[1] * razao))
+        desconto = self.taxa_desconto(arange(prazo + 1, dtype=float64) / razao)
+        return JurosEstocastico(desconto[:, :-1] / desconto[:, 1:] - 1, nova_periodicidade)
+
+    def __reduce__(self):
+        return type(self), (asarray(self._taxas_juros), self._periodicidade)
+
+    def _indices(self, t: Iterable[float]):
+        t = atleast_1d(asarray(t, dtype=float64))
+        if (t < 0).any():
+            raise ValueError("t deve ser maior ou igual a zero.")
+        k = minimum(floor(t), self._taxas_juros.shape[1]).astype(intp)
+        return k, t - k
+
+    def taxa_juros(
+        self, t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Taxa de juros de cada cenário no tempo ``t``.
+
+        Args:
+            t (Iterable[int]): Tempos para os quais se deseja obter a taxa de juros.
+            out (NDArray[float64], optional): Array (S, n) onde o resultado será escrito.
+
+        Returns:
+            NDArray[float64]: Matriz (S, n) de taxas de juros.
+        """
+        k, _ = self._indices(t)
+        return take(self._taxas_juros, minimum(k, self._taxas_juros.shape[1] - 1), axis=1, out=out)
+
+    def taxa_desconto(
+        self, t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Fator de desconto acumulado de cada cenário entre o tempo 0 e o tempo ``t``.
+
+        Args:
+            t (Iterable[int]): Tempos para os quais se deseja obter a taxa de desconto.
+                Deve estar na mesma periodicidade que o juros.
+            out (NDArray[float64], optional): Array (S, n) onde o resultado será escrito.
+
+        Returns:
+            NDArray[float64]: Matriz (S, n) de taxas de desconto.
+        """
+        k, restante = self._indices(t)
+        ret = take(self._desconto_acumulado, k, axis=1, out=out)
+        fracionado = restante != 0
+        if fracionado.any():
+            taxas = self._taxas_juros[:, minimum(k[fracionado], self._taxas_juros.shape[1] - 1)]
+            ret[:, fracionado] *= power(1.0 + taxas, -restante[fracionado])
+        return ret
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from operator import index
+from typing import Iterator, Optional
+
+from numpy import array
+from numpy import float64
+from numpy.typing import ArrayLike
+from numpy.typing import NDArray
+
+import tabatu.core as core
+from tabatu.hipotese_fracionaria import HipoteseFracionaria
+from tabatu.periodicidade import Periodicidade
+from tabatu.unico_decremento import Tabua
+
+
+class TabuaLote(core.TabuaLote):
+    """Coleção de tábuas de único decremento, criadas em uma única chamada.
+
+    As taxas de todas as tábuas são copiadas para um único vetor, e a sobrevivência acumulada de todas as tábuas é
+    calculada em uma única passagem em C++, sem a criação de um objeto Python por tábua. Cada elemento da coleção é uma
+    :class:`~tabatu.Tabua`, criada no acesso, que compartilha a memória do lote e pode ser usada em qualquer método
+    que aceite uma tábua.
+
+    Os métodos :meth:`qx`, :meth:`tpx`, :meth:`t_qx` e :meth:`tempo_futuro_maximo` avaliam uma carteira em que cada
+    apólice usa uma tábua do lote, em uma única chamada, sem criar as tábuas individuais.
+
+    Args:
+        qx (ArrayLike): Matriz (tábuas, idades) com as taxas de tábuas de mesmo tamanho, uma tábua por linha. Se
+            ``inicios`` for informado, vetor com as taxas de todas as tábuas em sequência.
+        inicios (ArrayLike, optional): Posição do início de cada tábua em qx, com um elemento a mais, igual ao
+            tamanho de qx. A tábua i possui as taxas ``qx[inicios[i]:inicios[i + 1]]``.
+        periodicidade (Periodicidade): Periodicidade das probabilidades de falha de todas as tábuas.
+        hipotese_fracionaria (HipoteseFracionaria): Hipótese usada em tempos fracionados por todas as tábuas.
+
+    Raises:
+        ValueError: Se qx não for uma matriz e ``inicios`` não for informado, ou se ``inicios`` não for crescente,
+            começando em zero e terminando no tamanho de qx.
+
+    Examples:
+
+        >>> lote = TabuaLote([[0.1, 0.2, 1.0], [0.05, 0.1, 1.0]])
+        >>> len(lote)
+        2
+        >>> lote[1].tpx([0], [0, 1, 2])
+        array([1.   , 0.95 , 0.855])
+        >>> lote = TabuaLote([0.1, 0.2, 1.0, 0.5], inicios=[0, 3, 4])
+        >>> [tabua.possui_fechamento_plato() for tabua in lote]
+        [False, True]
+    """
+    __slots__ = "_periodicidade", "_hipotese_fracionaria"
+
+    def __init__(
+        self,
+        qx: ArrayLike,
+        inicios: Optional[ArrayLike] = None,
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+        hipotese_fracionaria: HipoteseFracionaria = HipoteseFracionaria.NENHUMA,
+    ):
+        self._periodicidade = Periodicidade(periodicidade)
+        self._hipotese_fracionaria = HipoteseFracionaria(hipotese_fracionaria)
+        super().__init__(qx, inicios, self._hipotese_fracionaria.codigo)
+
+    def __reduce__(self):
+        return type(self), (array(self.pega_qx()), self.pega_inicios(), self._periodicidade, self._hipotese_fracionaria)
+
+    @property
+    def periodicidade(self) -> Periodicidade:
+        """Periodicidade das tábuas."""
+        return self._periodicidade
+
+    @property
+    def hipotese_fracionaria(self) -> HipoteseFracionaria:
+        """Hipótese usada em tempos fracionados."""
+        return self._hipotese_fracionaria
+
+    def __getitem__(self, i: int) -> Tabua:
+        i = index(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"O lote possui {len(self)} tábuas.")
+        tabua = Tabua._de_tabua_base(self._tabua_base(i))
+        tabua._periodicidade = self._periodicidade
+        return tabua
+
+    def __iter__(self) -> Iterator[Tabua]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def qx(
+        self, tabuas: ArrayLike, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Probabilidade de falha de cada apólice, com a sua tábua e a sua idade. Veja :meth:`tabatu.Tabua.qx`.
+
+        Args:
+            tabuas (ArrayLike): Array com formato (N,), com o índice da tábua de cada apólice no lote.
+            x (ArrayLike): Array com formato (N,), com a idade inicial de cada apólice.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), onde a linha i contém o ``qx`` da apólice i.
+
+        Raises:
+            IndexError: Se algum índice de tábua não pertencer ao lote.
+
+        Examples:
+
+            >>> lote = TabuaLote([[0.1, 0.2, 1.0], [0.05, 0.1, 1.0]])
+            >>> lote.qx([0, 1, 1], [0, 0, 1], [0, 1])
+            array([[0.1 , 0.2 ],
+                   [0.05, 0.1 ],
+                   [0.1 , 1.  ]])
+        """
+        return super().qx(tabuas, x, t, out=out)
+
+    def tpx(
+        self, tabuas: ArrayLike, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Probabilidade de sobrevivência de cada apólice, com a sua tábua e a sua idade. Veja
+        :meth:`tabatu.Tabua.tpx`.
+
+        Args:
+            tabuas (ArrayLike): Array com formato (N,), com o índice da tábua de cada apólice no lote.
+            x (ArrayLike): Array com formato (N,), com a idade inicial de cada apólice.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), onde a linha i contém o ``tpx`` da apólice i.
+
+        Raises:
+            IndexError: Se algum índice de tábua não pertencer ao lote.
+
+        Examples:
+
+            >>> lote = TabuaLote([[0.1, 0.2, 1.0], [0.05, 0.1, 1.0]])
+            >>> lote.tpx([0, 1], [0, 0], [1, 2])
+            array([[0.9  , 0.72 ],
+                   [0.95 , 0.855]])
+        """
+        return super().tpx(tabuas, x, t, out=out)
+
+    def t_qx(
+        self, tabuas: ArrayLike, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Probabilidade de cada apólice sobreviver t períodos e falhar no período seguinte, com a sua tábua e a sua
+        idade. Veja :meth:`tabatu.Tabua.t_qx`.
+
+        Args:
+            tabuas (ArrayLike): Array com formato (N,), com o índice da tábua de cada apólice no lote.
+            x (ArrayLike): Array com formato (N,), com a idade inicial de cada apólice.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), onde a linha i contém o ``t_qx`` da apólice i.
+
+        Raises:
+            IndexError: Se algum índice de tábua não pertencer ao lote.
+
+        Examples:
+
+            >>> lote = TabuaLote([[0.1, 0.2, 1.0], [0.05, 0.1, 1.0]])
+            >>> lote.t_qx([0, 1], [0, 0], [[0, 1], [1, 2]])
+            array([[0.1  , 0.18 ],
+                   [0.095, 0.855]])
+        """
+        return super().t_qx(tabuas, x, t, out=out)
+
+    def tempo_futuro_maximo(
+        self, tabuas: ArrayLike, x: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Tempo de vida futuro máximo de cada apólice, com a sua tábua e a sua idade.
+
+        Args:
+            tabuas (ArrayLike): Array com formato (N,), com o índice da tábua de cada apólice no lote.
+            x (ArrayLike): Array com formato (N,), com a idade inicial de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N,), com o tempo de vida futuro máximo de cada apólice.
+
+        Examples:
+
+            >>> lote = TabuaLote([0.1, 0.2, 1.0, 0.5], inicios=[0, 3, 4])
+            >>> lote.tempo_futuro_maximo([0, 0, 1], [0, 2, 0])
+            array([ 3.,  1., inf])
+        """
+        return super().tempo_futuro_maximo(tabuas, x, out=out)
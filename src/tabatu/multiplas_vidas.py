@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Iterable
+from typing import Iterable, Optional
 
 from numpy import float64
+from numpy.typing import ArrayLike
 from numpy.typing import NDArray
 
 import tabatu.core as core
+from tabatu.hipotese_fracionaria import HipoteseFracionaria
 from tabatu.periodicidade import Periodicidade
 from tabatu.tabua_base import TabuaBase
+from tabatu.tabua_base import hipoteses_fracionarias
+from tabatu.tabua_base import pares_qx_log_lx
 from tabatu.tabua_base import valida_periodicidade
 from tabatu.unico_decremento import Tabua
 
@@ -39,7 +43,7 @@ class TabuaMultiplasVidas(core.TabuaMultiplasVidas):
         >>> qx1 = (np.arange(100) + 1)/100
         >>> tabua = TabuaMultiplasVidas(Tabua(qx1), Tabua(qx1), status = StatusVidasConjuntas.LAST)
     """
-    __slots__ = "_periodicidade", "_status"
+    __slots__ = "_periodicidade", "_status", "_tabuas"
 
     def __init__(
         self, *args: Tabua, status: StatusVidasConjuntas = StatusVidasConjuntas.LAST
@@ -48,6 +52,29 @@ class TabuaMultiplasVidas(core.TabuaMultiplasVidas):
         self._status = status
         super().__init__(*args, status=core.StatusVidasConjuntas(status.value))
 
+    @classmethod
+    def _restaurar(
+        cls,
+        bases: list[tuple[ArrayLike, ArrayLike]],
+        periodicidade: Periodicidade,
+        status: StatusVidasConjuntas,
+        hipoteses: Optional[list[str]] = None,
+        sem_copia: bool = False,
+    ) -> TabuaMultiplasVidas:
+        """Recria a tábua a partir dos pares (qx, log_lx) de cada vida, sem refazer o cálculo da
+        sobrevivência. Veja :meth:`Tabua._restaurar`."""
+        hipoteses = hipoteses or [HipoteseFracionaria.NENHUMA] * len(bases)
+        tabuas = [
+            Tabua._restaurar([base], periodicidade, [hipotese], sem_copia) for base, hipotese in zip(bases, hipoteses)
+        ]
+        return cls(*tabuas, status=StatusVidasConjuntas(status))
+
+    def __reduce__(self):
+        tabuas = self._tabuas_base()
+        return self._restaurar, (
+            pares_qx_log_lx(tabuas), self._periodicidade, self._status, hipoteses_fracionarias(tabuas)
+        )
+
     @property
     def periodicidade(self) -> Periodicidade:
         return self._periodicidade
@@ -57,7 +84,9 @@ class TabuaMultiplasVidas(core.TabuaMultiplasVidas):
         """Status de vida conjunta."""
         return self._status
 
-    def qx(self, x: Iterable[int], t: Iterable[int]) -> NDArray[float64]:
+    def qx(
+        self, x: Iterable[int], t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         """Probabilidade de falha entre as idades x + t e x + t + 1.
 
         A falha é definida pelo status da tabua. Se o status é "last", então
@@ -69,6 +98,8 @@ class TabuaMultiplasVidas(core.TabuaMultiplasVidas):
             x (Iterable[int]): Idade de inicial. Deve ser um array com 1 elemento
                 para cada vida.
             t (Iterable[int]): Tempo extra. Pode ser um array com diversos tempos.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             NDArray[float64]: Array com o mesmo tamanho que t, fornecendo as probabilidades
@@ -88,9 +119,11 @@ class TabuaMultiplasVidas(core.TabuaMultiplasVidas):
             >>> tabua.qx([50, 30], [0, 1, 2, 3])
             array([0.6619, 0.6736, 0.6851, 0.6964])
         """
-        return super().qx(x, t)
+        return super().qx(x, t, out=out)
 
-    def tpx(self, x: Iterable[int], t: Iterable[int]) -> NDArray[float64]:
+    def tpx(
+        self, x: Iterable[int], t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         """Probabilidade de um indivíduo com idade x sobreviver a idade
         x + t.
 
@@ -98,6 +131,8 @@ class TabuaMultiplasVidas(core.TabuaMultiplasVidas):
             x (Iterable[int]): Idade de inicial. Deve ser um array com 1 elemento
                 para cada vida.
             t (Iterable[int]): Tempo extra. Pode ser um array com diversos tempos.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             NDArray[float64]: Probabilidade de um indivíduo com idade x sobreviver a
@@ -113,9 +148,11 @@ class TabuaMultiplasVidas(core.TabuaMultiplasVidas):
             >>> np.round(tpx, 5)
             array([1.     , 0.8419 , 0.70181, 0.57906, 0.47275, 0.38174])
         """
-        return super().tpx(x, t)
+        return super().tpx(x, t, out=out)
 
-    def t_qx(self, x: Iterable[int], t: Iterable[int]) -> NDArray[float64]:
+    def t_qx(
+        self, x: Iterable[int], t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         """Probabilidade de um indivíduo com idade x falhar com
         idade exatamente igual a x + t.
 
@@ -123,12 +160,14 @@ class TabuaMultiplasVidas(core.TabuaMultiplasVidas):
             x (Iterable[int]): Idade de inicial. Deve ser um array com 1 elemento
                 ou um array com uma idade para cada decremento.
             t (Iterable[int]): Tempo extra. Pode ser um array com diversos tempos.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             NDArray[float64]: Probabilidade de um indivíduo com idade x falhar com
             idade exatamente igual a x + t.
         """
-        return super().t_qx(x, t)
+        return super().t_qx(x, t, out=out)
 
     def tempo_futuro_maximo(self, x: Iterable[int]) -> float:
         """Tempo de vida futuro máximo.
@@ -162,15 +201,125 @@ class TabuaMultiplasVidas(core.TabuaMultiplasVidas):
         """
         return super().tempo_futuro_maximo(x)
 
+    def qx_lote(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Versão de :meth:`qx` para um lote de idades, calculada em uma única chamada.
+
+        Args:
+            x (ArrayLike): Array com formato (N, k), onde k é o número de vidas, com as
+                idades iniciais de cada apólice.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), onde a linha i contém o ``qx`` da apólice i.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx1 = (np.arange(100) + 1)/100
+            >>> tabua = TabuaMultiplasVidas(Tabua(qx1), Tabua(qx1), status=StatusVidasConjuntas.LAST)
+            >>> tabua.qx_lote([[50, 30], [60, 60]], [0, 1, 2])
+            array([[0.1581, 0.1664, 0.1749],
+                   [0.3721, 0.3844, 0.3969]])
+        """
+        return super().qx_lote(x, t, out=out)
+
+    def tpx_lote(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Versão de :meth:`tpx` para um lote de idades, calculada em uma única chamada.
+
+        Args:
+            x (ArrayLike): Array com formato (N, k), onde k é o número de vidas, com as
+                idades iniciais de cada apólice.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), onde a linha i contém o ``tpx`` da apólice i.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx1 = (np.arange(100) + 1)/100
+            >>> tabua = TabuaMultiplasVidas(Tabua(qx1), Tabua(qx1), status=StatusVidasConjuntas.LAST)
+            >>> tabua.tpx_lote([[50, 30], [60, 60]], [0, 1, 2])
+            array([[1.        , 0.8419    , 0.70180784],
+                   [1.        , 0.6279    , 0.38653524]])
+        """
+        return super().tpx_lote(x, t, out=out)
+
+    def t_qx_lote(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Versão de :meth:`t_qx` para um lote de idades, calculada em uma única chamada.
+
+        Args:
+            x (ArrayLike): Array com formato (N, k), onde k é o número de vidas, com as
+                idades iniciais de cada apólice.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), onde a linha i contém o ``t_qx`` da apólice i.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx1 = (np.arange(100) + 1)/100
+            >>> tabua = TabuaMultiplasVidas(Tabua(qx1), Tabua(qx1), status=StatusVidasConjuntas.LAST)
+            >>> tabua.t_qx_lote([[50, 30], [60, 60]], [0, 1, 2])
+            array([[0.1581    , 0.14009216, 0.12274619],
+                   [0.3721    , 0.24136476, 0.15341584]])
+        """
+        return super().t_qx_lote(x, t, out=out)
+
+    def tempo_futuro_maximo_lote(
+        self, x: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Versão de :meth:`tempo_futuro_maximo` para um lote de idades.
+
+        Args:
+            x (ArrayLike): Array com formato (N, k), onde k é o número de vidas, com as
+                idades iniciais de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N,), com o tempo de vida futuro máximo de cada apólice.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx1 = (np.arange(100) + 1)/100
+            >>> tabua = TabuaMultiplasVidas(Tabua(qx1), Tabua(qx1), status=StatusVidasConjuntas.LAST)
+            >>> tabua.tempo_futuro_maximo_lote([[50, 30], [60, 60]])
+            array([70., 40.])
+        """
+        return super().tempo_futuro_maximo_lote(x, out=out)
+
     def possui_fechamento_plato(self) -> bool:
         """Verifica se a tábua possui fechamento de tipo platô."""
         return super().possui_fechamento_plato()
 
     @property
-    def tabuas(self) -> list[TabuaBase]:
-        return [
-            TabuaBase(tabua.pega_qx(), self._periodicidade) for tabua in super().tabuas
-        ]
+    def tabuas(self) -> tuple[TabuaBase, ...]:
+        """Tábuas base, criadas no primeiro acesso e compartilhadas entre os acessos seguintes. As tábuas base
+        usam a mesma memória das taxas desta tábua."""
+        tabuas = getattr(self, "_tabuas", None)
+        if tabuas is None:
+            tabuas = self._tabuas = tuple(
+                TabuaBase._de_tabua_base(tabua, self._periodicidade) for tabua in super().tabuas
+            )
+        return tabuas
 
     def alterar_periodicidade(
         self, nova_periodicidade: Periodicidade
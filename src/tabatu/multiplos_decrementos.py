@@ -7,8 +7,11 @@ from numpy.typing import ArrayLike
 from numpy.typing import NDArray
 
 import tabatu.core as core
+from tabatu.hipotese_fracionaria import HipoteseFracionaria
 from tabatu.periodicidade import Periodicidade
 from tabatu.tabua_base import TabuaBase
+from tabatu.tabua_base import hipoteses_fracionarias
+from tabatu.tabua_base import pares_qx_log_lx
 from tabatu.tabua_base import valida_periodicidade
 from tabatu.unico_decremento import Tabua
 
@@ -27,8 +30,6 @@ def captura_argumentos(*args: Any, **kwargs: Any) -> dict[str, int]:
 def valida_quantidade_tabuas(*args: Any) -> Any:
     if len(args) == 0:
         raise ValueError("Pelo menos 1 tábua deve ser fornecida.")
-    if len(args) > 3:
-        raise ValueError("São suportadas no máximo 3 tábuas.")
     return args
 
 
@@ -50,15 +51,19 @@ class TabuaMDT(core.TabuaMDT):
     """Representação de tábuas de múltiplos decrementos.
 
     Args:
-        *args (Tabua): Até 3 tábuas de únicos decrementos.
+        *args (Tabua): Tábuas de únicos decrementos.
         causa_principal (int, str, Optional): Causa principal de decremento. Pode ser um inteiro ou uma string.
-        **kwargs (Tabua): Até 3 tábuas de únicos decrementos.
+        **kwargs (Tabua): Tábuas de únicos decrementos.
 
     Notes:
         As tábuas podem ser fornecidas por posição ou por nome.
-        args e kwargs devem somar no máximo três tábuas. As tábuas fornecidas por posição irão utilizar a sua
+        args e kwargs devem somar pelo menos uma tábua. As tábuas fornecidas por posição irão utilizar a sua
         posição como identificador nos métodos qx_j e t_qx_j. As tábuas fornecidas por nome irão utilizar ou a posição,
         ou o nome.
+        As taxas de cada tábua são convertidas para o cenário de múltiplos decrementos supondo que as falhas de cada
+        causa são uniformes ao longo do período, para qualquer quantidade de causas. Até 3 causas, a conversão usa
+        a fórmula fechada. Acima disso, a integral da hipótese uniforme é calculada por quadratura, com custo
+        proporcional à quantidade de causas em cada tempo. O resultado é exato até 32 causas.
         O argumento causa_principal é um artífico para permitir que seja criada uma tábua de múltiplos decrementos
         onde o sinistro é definido por apenas um dos decrementos, enquanto os outros decrementos não configuram
         sinistro, mas encerram a 'vida' do indivíduo. Por exemplo, quando temos uma tábua de morte e uma tábua de
@@ -76,7 +81,7 @@ class TabuaMDT(core.TabuaMDT):
         >>> tabua_posicao_e_nome = TabuaMDT(Tabua(qx1), morte = Tabua(qx2))
         >>> tabua_nome = TabuaMDT(cancelamento = Tabua(qx1), morte = Tabua(qx2))
     """
-    __slots__ = "_periodicidade", "_causa_principal", "_causas"
+    __slots__ = "_periodicidade", "_causa_principal", "_causas", "_tabuas"
 
     def __init__(
         self,
@@ -95,6 +100,34 @@ class TabuaMDT(core.TabuaMDT):
             *tabuas, causa_principal=self._causas.get(self._causa_principal or "", -1)
         )
 
+    @classmethod
+    def _restaurar(
+        cls,
+        bases: list[tuple[ArrayLike, ArrayLike]],
+        periodicidade: Periodicidade,
+        causas: Iterable[str],
+        causa_principal: Optional[str],
+        hipoteses: Optional[list[str]] = None,
+        sem_copia: bool = False,
+    ) -> TabuaMDT:
+        """Recria a tábua a partir dos pares (qx, log_lx) de cada causa, sem refazer o cálculo da
+        sobrevivência. Veja :meth:`Tabua._restaurar`."""
+        hipoteses = hipoteses or [HipoteseFracionaria.NENHUMA] * len(bases)
+        tabuas = [
+            Tabua._restaurar([base], periodicidade, [hipotese], sem_copia) for base, hipotese in zip(bases, hipoteses)
+        ]
+        return cls(**dict(zip(causas, tabuas)), causa_principal=causa_principal)
+
+    def __reduce__(self):
+        tabuas = self._tabuas_base()
+        return self._restaurar, (
+            pares_qx_log_lx(tabuas),
+            self._periodicidade,
+            tuple(self._causas),
+            self._causa_principal,
+            hipoteses_fracionarias(tabuas),
+        )
+
     @property
     def periodicidade(self) -> Periodicidade:
         return self._periodicidade
@@ -112,7 +145,11 @@ class TabuaMDT(core.TabuaMDT):
         return self._causa_principal is not None
 
     def qx_j(
-        self, x: Iterable[int], t: Iterable[int], j: Iterable[int] | Iterable[str]
+        self,
+        x: Iterable[int],
+        t: Iterable[int],
+        j: Iterable[int] | Iterable[str],
+        out: Optional[NDArray[float64]] = None,
     ) -> NDArray[float64]:
         """Probabilidade de um indivíduo com idade x + t falhar pela causa j
         antes de completar a idade x + t + 1.
@@ -125,6 +162,8 @@ class TabuaMDT(core.TabuaMDT):
                 string com o nome da causa. Pode receber mais de um número. As causas de falha são ordenadas pela
                 forma como foram utilizadas na inicialização da classe, e possuirão um nome igual à ordem em que foram
                 passadas ou com o nome do argumento, caso tenha sido passada como argumento nomeado.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             NDArray[float64]: Array com o mesmo tamanho que t, fornecendo as probabilidades
@@ -152,10 +191,14 @@ class TabuaMDT(core.TabuaMDT):
                    [0.00745, 0.0074 , 0.00735, 0.0073 ]])
         """
         j = self._padronizar_j(j)
-        return super().qx_j(x, t, j)
+        return super().qx_j(x, t, j, out=out)
 
     def t_qx_j(
-        self, x: Iterable[int], t: Iterable[int], j: Iterable[int] | Iterable[str]
+        self,
+        x: Iterable[int],
+        t: Iterable[int],
+        j: Iterable[int] | Iterable[str],
+        out: Optional[NDArray[float64]] = None,
     ) -> NDArray[float64]:
         """Probabilidade de um indivíduo com idade x falhar com
         idade exatamente igual a x + t, pela causa j.
@@ -168,6 +211,8 @@ class TabuaMDT(core.TabuaMDT):
                 string com o nome da causa. Pode receber mais de um número. As causas de falha são ordenadas pela
                 forma como foram utilizadas na inicialização da classe, e possuirão um nome igual à ordem em que foram
                 passadas ou com o nome do argumento, caso tenha sido passada como argumento nomeado.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             NDArray[float64]: Probabilidade de um indivíduo com idade x falhar com
@@ -191,9 +236,47 @@ class TabuaMDT(core.TabuaMDT):
                    [0.00745   , 0.00358974, 0.00169432, 0.000783  ]])
         """
         j = self._padronizar_j(j)
-        return super().t_qx_j(x, t, j)
+        return super().t_qx_j(x, t, j, out=out)
+
+    def probabilidades(
+        self, x: Iterable[int], t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Calcula, em uma única passagem, o ``qx_j`` de todas as causas, o ``qx`` total, o ``tpx``
+        e o ``t_qx_j`` de todas as causas.
+
+        As taxas de cada tábua são consultadas e convertidas para o cenário de múltiplos decrementos
+        uma única vez para cada tempo, ao invés de uma vez para cada método e causa.
+
+        Args:
+            x (Iterable[int]): Idade de inicial. Deve ser um array com uma idade para cada decremento.
+            t (Iterable[int]): Tempo extra. Pode ser um array com diversos tempos.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (2k + 2, T), onde k é o número de decrementos. As linhas
+            0 até k - 1 contém o ``qx_j`` de cada causa, a linha k contém o ``qx``, a linha k + 1 contém
+            o ``tpx`` e as linhas k + 2 até 2k + 1 contém o ``t_qx_j`` de cada causa.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx1 = (np.arange(100) + 1)/100
+            >>> qx2 = np.repeat(0.01, 100)
+            >>> tabua = TabuaMDT(Tabua(qx1), causa2=Tabua(qx2))
+            >>> tabua.probabilidades([50, 0], [0, 1])
+            array([[0.50745   , 0.5174    ],
+                   [0.00745   , 0.0074    ],
+                   [0.5149    , 0.5248    ],
+                   [1.        , 0.4851    ],
+                   [0.50745   , 0.25099074],
+                   [0.00745   , 0.00358974]])
+        """
+        return super().probabilidades(x, t, out=out)
 
-    def qx(self, x: Iterable[int], t: Iterable[int]) -> NDArray[float64]:
+    def qx(
+        self, x: Iterable[int], t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         """Probabilidade de um indivíduo com idade x + t falhar por qualquer causa
         antes de completar a idade x + t + 1.
 
@@ -201,6 +284,8 @@ class TabuaMDT(core.TabuaMDT):
             x (Iterable[int]): Idade de inicial. Deve ser um array com 1 elemento
                 ou um array com uma idade para cada decremento.
             t (Iterable[int]): Tempo extra. Pode ser um array com diversos tempos.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             NDArray[float64]: Array com o mesmo tamanho que t, fornecendo as probabilidades
@@ -219,9 +304,11 @@ class TabuaMDT(core.TabuaMDT):
             >>> tabua.qx([50, 0], [0, 1, 2, 3])
             array([0.5149, 0.5248, 0.5347, 0.5446])
         """
-        return super().qx(x, t)
+        return super().qx(x, t, out=out)
 
-    def tpx(self, x: ArrayLike, t: ArrayLike) -> NDArray[float64]:
+    def tpx(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         """Probabilidade de um indivíduo com idade x sobreviver a idade
         x + t.
 
@@ -229,6 +316,8 @@ class TabuaMDT(core.TabuaMDT):
             x (ArrayLike): Idade de inicial. Deve ser um array com 1 elemento
                 para cada decremento.
             t (ArrayLike): Tempo extra. Pode ser um array com diversos tempos.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             ndarray: Probabilidade de um indivíduo com idade x sobreviver a
@@ -243,9 +332,11 @@ class TabuaMDT(core.TabuaMDT):
             >>> tabua.tpx([30, 30], [0, 1, 2, 3])
             array([1.        , 0.6831    , 0.45986292, 0.30502707])
         """
-        return super().tpx(x, t)
+        return super().tpx(x, t, out=out)
 
-    def t_qx(self, x: Iterable[int], t: Iterable[int]) -> NDArray[float64]:
+    def t_qx(
+        self, x: Iterable[int], t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         """Probabilidade de um indivíduo com idade x falhar com
         idade exatamente igual a x + t.
 
@@ -253,6 +344,8 @@ class TabuaMDT(core.TabuaMDT):
             x (Iterable[int]): Idade de inicial. Deve ser um array com 1 elemento
                 ou um array com uma idade para cada decremento.
             t (Iterable[int]): Tempo extra. Pode ser um array com diversos tempos.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             NDArray[float64]: Probabilidade de um indivíduo com idade x falhar com
@@ -269,7 +362,7 @@ class TabuaMDT(core.TabuaMDT):
             >>> tabua.t_qx([50, 0], [0, 1, 2, 3])
             array([0.5149    , 0.25458048, 0.12325879, 0.0584142 ])
         """
-        return super().t_qx(x, t)
+        return super().t_qx(x, t, out=out)
 
     def tempo_futuro_maximo(self, x: Iterable[int]) -> float:
         """Tempo de vida futuro máximo.
@@ -297,6 +390,115 @@ class TabuaMDT(core.TabuaMDT):
         """
         return super().tempo_futuro_maximo(x)
 
+    def qx_lote(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Versão de :meth:`qx` para um lote de idades, calculada em uma única chamada.
+
+        Args:
+            x (ArrayLike): Array com formato (N, k), onde k é o número de decrementos, com as
+                idades iniciais de cada apólice.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), onde a linha i contém o ``qx`` da apólice i.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx1 = (np.arange(100) + 1)/100
+            >>> qx2 = np.repeat(0.01, 100)
+            >>> tabua = TabuaMDT(Tabua(qx1), Tabua(qx2))
+            >>> tabua.qx_lote([[50, 0], [30, 30]], [0, 1, 2])
+            array([[0.5149, 0.5248, 0.5347],
+                   [0.3169, 0.3268, 0.3367]])
+        """
+        return super().qx_lote(x, t, out=out)
+
+    def tpx_lote(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Versão de :meth:`tpx` para um lote de idades, calculada em uma única chamada.
+
+        Args:
+            x (ArrayLike): Array com formato (N, k), onde k é o número de decrementos, com as
+                idades iniciais de cada apólice.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), onde a linha i contém o ``tpx`` da apólice i.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx1 = (np.arange(100) + 1)/100
+            >>> qx2 = np.repeat(0.01, 100)
+            >>> tabua = TabuaMDT(Tabua(qx1), Tabua(qx2))
+            >>> tabua.tpx_lote([[50, 0], [30, 30]], [0, 1, 2])
+            array([[1.        , 0.4851    , 0.23051952],
+                   [1.        , 0.6831    , 0.45986292]])
+        """
+        return super().tpx_lote(x, t, out=out)
+
+    def t_qx_lote(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Versão de :meth:`t_qx` para um lote de idades, calculada em uma única chamada.
+
+        Args:
+            x (ArrayLike): Array com formato (N, k), onde k é o número de decrementos, com as
+                idades iniciais de cada apólice.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), onde a linha i contém o ``t_qx`` da apólice i.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx1 = (np.arange(100) + 1)/100
+            >>> qx2 = np.repeat(0.01, 100)
+            >>> tabua = TabuaMDT(Tabua(qx1), Tabua(qx2))
+            >>> tabua.t_qx_lote([[50, 0], [30, 30]], [0, 1, 2])
+            array([[0.5149    , 0.25458048, 0.12325879],
+                   [0.3169    , 0.22323708, 0.15483585]])
+        """
+        return super().t_qx_lote(x, t, out=out)
+
+    def tempo_futuro_maximo_lote(
+        self, x: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Versão de :meth:`tempo_futuro_maximo` para um lote de idades.
+
+        Args:
+            x (ArrayLike): Array com formato (N, k), onde k é o número de decrementos, com as
+                idades iniciais de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N,), com o tempo de vida futuro máximo de cada apólice.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx1 = (np.arange(100) + 1)/100
+            >>> qx2 = np.repeat(0.01, 100)
+            >>> tabua = TabuaMDT(Tabua(qx1), Tabua(qx2))
+            >>> tabua.tempo_futuro_maximo_lote([[50, 0], [30, 30]])
+            array([50., 70.])
+        """
+        return super().tempo_futuro_maximo_lote(x, out=out)
+
     def possui_fechamento_plato(self) -> bool:
         """Verifica se a tábua possui fechamento de tipo platô."""
         return super().possui_fechamento_plato()
@@ -305,10 +507,15 @@ class TabuaMDT(core.TabuaMDT):
         return [self._causas[x] if isinstance(x, str) else x for x in j]
 
     @property
-    def tabuas(self) -> list[TabuaBase]:
-        return [
-            TabuaBase(tabua.pega_qx(), self._periodicidade) for tabua in super().tabuas
-        ]
+    def tabuas(self) -> tuple[TabuaBase, ...]:
+        """Tábuas base, criadas no primeiro acesso e compartilhadas entre os acessos seguintes. As tábuas base
+        usam a mesma memória das taxas desta tábua."""
+        tabuas = getattr(self, "_tabuas", None)
+        if tabuas is None:
+            tabuas = self._tabuas = tuple(
+                TabuaBase._de_tabua_base(tabua, self._periodicidade) for tabua in super().tabuas
+            )
+        return tabuas
 
     def alterar_periodicidade(self, nova_periodicidade: Periodicidade) -> TabuaMDT:
         """Altera a periodicidade da tábua.
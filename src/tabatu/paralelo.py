@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Optional
+
+from numpy import array
+from numpy import ascontiguousarray
+from numpy import asarray
+from numpy import dtype
+from numpy import empty
+from numpy import float64
+from numpy import int64
+from numpy import ndarray
+from numpy.typing import ArrayLike
+from numpy.typing import NDArray
+
+from tabatu.serializacao import _descrever_tabua
+from tabatu.serializacao import _desempacotar_bases
+from tabatu.serializacao import _empacotar_bases
+from tabatu.serializacao import _reconstruir_tabua
+from tabatu.typing import TabuaInterface
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+METODOS_LOTE = ("qx", "tpx", "t_qx")
+
+
+def avaliar_carteira(
+    tabua: TabuaInterface,
+    metodo: str,
+    x: ArrayLike,
+    t: ArrayLike,
+    max_threads: Optional[int] = None,
+    tamanho_bloco: Optional[int] = None,
+) -> NDArray[float64]:
+    """Avalia um método em lote da tábua para uma carteira, dividindo as apólices entre threads.
+
+    As tábuas são imutáveis após a criação e os cálculos em C++ liberam o GIL, portanto uma mesma
+    tábua pode ser compartilhada entre threads sem cópias. Cada thread calcula um bloco de linhas
+    e escreve diretamente na sua parte do array de resultado.
+
+    Args:
+        tabua (TabuaInterface): Tábua a ser usada no cálculo.
+        metodo (str): Nome do método a ser calculado, um entre "qx", "tpx" e "t_qx".
+        x (ArrayLike): Idades das apólices, no mesmo formato aceito por ``qx_lote``.
+        t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+            ou (N, T), com os tempos de cada apólice.
+        max_threads (int, optional): Quantidade máxima de threads. Por default, usa a
+            quantidade de processadores disponíveis.
+        tamanho_bloco (int, optional): Quantidade de apólices calculadas em cada tarefa. Por
+            default, divide as apólices igualmente entre as threads.
+
+    Returns:
+        NDArray[float64]: Array com formato (N, T), igual ao retornado pelo método em lote.
+
+    Examples:
+
+        >>> import numpy as np
+        >>> from tabatu import Tabua
+        >>> qx = (np.arange(100) + 1)/100
+        >>> avaliar_carteira(Tabua(qx), "tpx", [30, 50, 70], [0, 1, 2], max_threads=2)
+        array([[1.    , 0.69  , 0.4692],
+               [1.    , 0.49  , 0.2352],
+               [1.    , 0.29  , 0.0812]])
+    """
+    if metodo not in METODOS_LOTE:
+        raise ValueError(f"metodo deve ser um entre {METODOS_LOTE}.")
+    avaliar = getattr(tabua, f"{metodo}_lote")
+    x = asarray(x, dtype=int64)
+    t = asarray(t, dtype=float64)
+    n = x.shape[0] if x.ndim > 0 else 0
+    if max_threads is None:
+        max_threads = os.cpu_count() or 1
+    if tamanho_bloco is None:
+        tamanho_bloco = max(-(-n // max_threads), 1)
+    if max_threads <= 1 or n <= tamanho_bloco:
+        return avaliar(x, t)
+
+    resultado = empty((n, t.shape[-1]), dtype=float64)
+
+    def avaliar_bloco(inicio: int) -> None:
+        fim = min(inicio + tamanho_bloco, n)
+        t_bloco = t[inicio:fim] if t.ndim == 2 else t
+        avaliar(x[inicio:fim], t_bloco, out=resultado[inicio:fim])
+
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        for tarefa in [executor.submit(avaliar_bloco, i) for i in range(0, n, tamanho_bloco)]:
+            tarefa.result()
+    return resultado
+
+
+def _memoria_compartilhada(**kwargs: Any) -> SharedMemory:
+    """Cria ou abre um bloco de :mod:`multiprocessing.shared_memory`, disponível a partir do Python 3.8. O módulo é
+    importado apenas quando usado, para que :func:`avaliar_carteira` continue disponível em versões anteriores."""
+    from multiprocessing.shared_memory import SharedMemory
+
+    return SharedMemory(**kwargs)
+
+
+def _publicar(dados: ndarray) -> tuple[SharedMemory, tuple]:
+    """Copia o array para um novo bloco de memória compartilhada."""
+    memoria = _memoria_compartilhada(create=True, size=max(dados.nbytes, 1))
+    ndarray(dados.shape, dtype=dados.dtype, buffer=memoria.buf)[...] = dados
+    return memoria, (memoria.name, dados.shape, dados.dtype.str)
+
+
+def _anexar(descricao: tuple) -> tuple[SharedMemory, ndarray]:
+    nome, formato, tipo = descricao
+    memoria = _memoria_compartilhada(name=nome)
+    return memoria, ndarray(formato, dtype=dtype(tipo), buffer=memoria.buf)
+
+
+_TABUA_PROCESSO: Optional[TabuaInterface] = None
+# Memória compartilhada usada pelas tábuas do processo. Permanece aberta enquanto o processo existir.
+_MEMORIA_PROCESSO: Optional[SharedMemory] = None
+
+
+def _inicializar_processo(nome: str, descricao: dict[str, Any], tamanho: int) -> None:
+    global _TABUA_PROCESSO, _MEMORIA_PROCESSO
+    _MEMORIA_PROCESSO = _memoria_compartilhada(name=nome)
+    dados = ndarray((tamanho,), dtype=float64, buffer=_MEMORIA_PROCESSO.buf)
+    dados.flags.writeable = False
+    _TABUA_PROCESSO = _reconstruir_tabua(descricao, _desempacotar_bases(descricao, dados), sem_copia=True)
+
+
+def _avaliar_bloco(metodo: str, x: tuple, t: tuple, resultado: tuple, inicio: int, fim: int) -> None:
+    memorias = []
+    try:
+        memoria, x_compartilhado = _anexar(x)
+        memorias.append(memoria)
+        memoria, t_compartilhado = _anexar(t)
+        memorias.append(memoria)
+        memoria, resultado_compartilhado = _anexar(resultado)
+        memorias.append(memoria)
+        t_bloco = t_compartilhado[inicio:fim] if t_compartilhado.ndim == 2 else t_compartilhado
+        getattr(_TABUA_PROCESSO, f"{metodo}_lote")(
+            x_compartilhado[inicio:fim], t_bloco, out=resultado_compartilhado[inicio:fim]
+        )
+        del x_compartilhado, t_compartilhado, resultado_compartilhado, t_bloco
+    finally:
+        for memoria in memorias:
+            memoria.close()
+
+
+class AvaliadorProcessos:
+    """Avalia carteiras em um conjunto de processos que compartilham a mesma tábua.
+
+    As taxas e a sobrevivência acumulada (log de lx) de cada tábua base são publicadas uma única
+    vez em :mod:`multiprocessing.shared_memory`. Cada processo cria a sua tábua ao iniciar usando
+    diretamente essa memória, sem copiá-la e sem refazer o cálculo da sobrevivência, e a reutiliza em
+    todas as chamadas, de forma que as taxas ocupam a memória uma única vez, independente da quantidade
+    de processos. Tábuas seletivas são copiadas em cada processo.
+    Em cada avaliação, as idades, os tempos e o resultado também ficam em memória compartilhada, e
+    cada processo calcula um bloco de apólices escrevendo diretamente na sua parte do resultado.
+
+    Deve ser usado como gerenciador de contexto, ou encerrado com :meth:`fechar`. Requer Python 3.8 ou superior.
+
+    Args:
+        tabua (TabuaInterface): Tábua a ser usada nos cálculos.
+        max_processos (int, optional): Quantidade de processos. Por default, usa a quantidade
+            de processadores disponíveis.
+        tamanho_bloco (int, optional): Quantidade de apólices calculadas em cada tarefa. Por
+            default, divide as apólices igualmente entre os processos.
+
+    Examples:
+
+        >>> import numpy as np
+        >>> from tabatu import Tabua
+        >>> qx = (np.arange(100) + 1)/100
+        >>> with AvaliadorProcessos(Tabua(qx), max_processos=2) as avaliador:
+        ...     avaliador.avaliar("tpx", [30, 50, 70], [0, 1, 2])
+        array([[1.    , 0.69  , 0.4692],
+               [1.    , 0.49  , 0.2352],
+               [1.    , 0.29  , 0.0812]])
+    """
+
+    def __init__(
+        self,
+        tabua: TabuaInterface,
+        max_processos: Optional[int] = None,
+        tamanho_bloco: Optional[int] = None,
+    ):
+        descricao, bases = _descrever_tabua(tabua)
+        dados = _empacotar_bases(descricao, bases)
+        self._memoria = _memoria_compartilhada(create=True, size=max(dados.nbytes, 1))
+        ndarray(dados.shape, dtype=float64, buffer=self._memoria.buf)[...] = dados
+        self._max_processos = max_processos or os.cpu_count() or 1
+        self._tamanho_bloco = tamanho_bloco
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_processos,
+            initializer=_inicializar_processo,
+            initargs=(self._memoria.name, descricao, len(dados)),
+        )
+
+    def avaliar(self, metodo: str, x: ArrayLike, t: ArrayLike) -> NDArray[float64]:
+        """Avalia um método em lote da tábua para todas as apólices da carteira.
+
+        Args:
+            metodo (str): Nome do método a ser calculado, um entre "qx", "tpx" e "t_qx".
+            x (ArrayLike): Idades das apólices, no mesmo formato aceito por ``qx_lote``.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), igual ao retornado pelo método em lote.
+        """
+        if metodo not in METODOS_LOTE:
+            raise ValueError(f"metodo deve ser um entre {METODOS_LOTE}.")
+        x = ascontiguousarray(x, dtype=int64)
+        t = ascontiguousarray(t, dtype=float64)
+        if x.ndim not in (1, 2) or t.ndim not in (1, 2):
+            raise ValueError("x e t devem ser arrays com uma ou duas dimensões.")
+        n = x.shape[0]
+        tamanho_bloco = self._tamanho_bloco or max(-(-n // self._max_processos), 1)
+        memorias = []
+        try:
+            memoria_x, descricao_x = _publicar(x)
+            memorias.append(memoria_x)
+            memoria_t, descricao_t = _publicar(t)
+            memorias.append(memoria_t)
+            memoria_resultado, descricao_resultado = _publicar(empty((n, t.shape[-1]), dtype=float64))
+            memorias.append(memoria_resultado)
+            tarefas = [
+                self._executor.submit(
+                    _avaliar_bloco,
+                    metodo,
+                    descricao_x,
+                    descricao_t,
+                    descricao_resultado,
+                    inicio,
+                    inicio + tamanho_bloco,
+                )
+                for inicio in range(0, n, tamanho_bloco)
+            ]
+            for tarefa in tarefas:
+                tarefa.result()
+            return array(ndarray((n, t.shape[-1]), dtype=float64, buffer=memoria_resultado.buf))
+        finally:
+            for memoria in memorias:
+                memoria.close()
+                memoria.unlink()
+
+    def fechar(self) -> None:
+        """Encerra os processos e libera a memória compartilhada da tábua."""
+        self._executor.shutdown()
+        self._memoria.close()
+        self._memoria.unlink()
+
+    def __enter__(self) -> "AvaliadorProcessos":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.fechar()
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from dataclasses import field
 from dataclasses import replace
+from typing import Optional
 
+from tabatu.comutacao import Comutacao
 from tabatu.multiplos_decrementos import TabuaMDT
 from tabatu.periodicidade import Periodicidade
 from tabatu.typing import TabuaInterface
@@ -14,12 +17,22 @@ class Premissas:
     """Define a estrutura de premissas utilizadas em diversos cálculos atuariais.
     São realizadas validações para garantir que os componentes são compatíveis entre si.
 
+    As colunas de comutação são calculadas na primeira vez em que são usadas e reaproveitadas pela instância.
+
     Args:
         tabua (TabuaInterface): Tabua biométrica.
         juros (JurosInterface): Juros.
+
+    Examples:
+
+        >>> from tabatu import JurosConstante, Tabua
+        >>> premissas = Premissas(Tabua([0.1, 0.2, 0.4, 0.8, 1.0]), JurosConstante(0.05))
+        >>> premissas.comutacao.seguro([0, 2])
+        array([0.85931127, 0.91998704])
     """
     tabua: TabuaInterface
     juros: JurosInterface
+    _comutacao: Optional[Comutacao] = field(init=False, repr=False, compare=False, default=None)
 
     def __post_init__(self):
         if self.tabua.periodicidade != self.juros.periodicidade:
@@ -33,6 +46,13 @@ class Premissas:
         """Periodicidade das premissas."""
         return self.tabua.periodicidade
 
+    @property
+    def comutacao(self) -> Comutacao:
+        """Colunas de comutação da tábua e do juros, calculadas uma única vez por instância."""
+        if self._comutacao is None:
+            object.__setattr__(self, "_comutacao", Comutacao(self.tabua, self.juros))
+        return self._comutacao
+
     def alterar_periodicidade(self, periodicidade: Periodicidade):
         """Gera uma nova premissa com a periodicidade alterada."""
         nova_tabua = self.tabua.alterar_periodicidade(periodicidade)
@@ -0,0 +1,208 @@
+"""Formato binário compacto para armazenar tábuas.
+
+O arquivo é composto por um cabeçalho fixo, com um identificador do formato, a versão e o tamanho dos metadados,
+seguido pelos metadados em JSON (tipo da tábua, periodicidade, causas, causa principal, status e hipóteses fracionárias) e pelos dados em
+float64 little-endian: para cada tábua base, as taxas qx seguidas do log da sobrevivência acumulada (log de lx). Em
+tábuas seletivas, são armazenadas a matriz de taxas e a matriz de sobrevivência da seleção, e os metadados registram
+a quantidade de colunas das matrizes.
+
+A leitura é feita com uma única chamada a ``read`` e a sobrevivência acumulada armazenada é reaproveitada, sem que
+seja recalculada.
+"""
+from __future__ import annotations
+
+import json
+import os
+import struct
+from typing import Any, BinaryIO, Union
+
+from numpy import asarray
+from numpy import ascontiguousarray
+from numpy import concatenate
+from numpy import float64
+from numpy import frombuffer
+from numpy.typing import ArrayLike
+from numpy.typing import NDArray
+
+from tabatu.hipotese_fracionaria import HipoteseFracionaria
+from tabatu.multiplas_vidas import StatusVidasConjuntas
+from tabatu.multiplas_vidas import TabuaMultiplasVidas
+from tabatu.multiplos_decrementos import TabuaMDT
+from tabatu.periodicidade import Periodicidade
+from tabatu.tabua_base import hipoteses_fracionarias
+from tabatu.tabua_base import pares_qx_log_lx
+from tabatu.tabua_seletiva import TabuaSeletiva
+from tabatu.typing import TabuaInterface
+from tabatu.unico_decremento import Tabua
+
+MAGICA = b"TABATU\x00\x00"
+VERSAO = 1
+_CABECALHO = struct.Struct("<8sII")
+_TIPO_DADOS = "<f8"
+
+Arquivo = Union[str, os.PathLike, BinaryIO]
+
+
+def _descrever_tabua(tabua: TabuaInterface) -> tuple[dict[str, Any], list[tuple[ArrayLike, ArrayLike]]]:
+    """Separa a tábua em metadados serializáveis em JSON e nos pares (qx, log_lx) das suas tábuas base."""
+    descricao: dict[str, Any]
+    if isinstance(tabua, TabuaMDT):
+        descricao = {"tipo": "TabuaMDT", "causas": list(tabua.causas), "causa_principal": tabua.causa_principal}
+    elif isinstance(tabua, TabuaMultiplasVidas):
+        descricao = {"tipo": "TabuaMultiplasVidas", "status": tabua.status.name}
+    elif isinstance(tabua, TabuaSeletiva):
+        descricao = {"tipo": "TabuaSeletiva"}
+    elif isinstance(tabua, Tabua):
+        descricao = {"tipo": "Tabua"}
+    else:
+        raise TypeError(f"Tipo de tábua não suportado: {type(tabua).__name__}.")
+    descricao["periodicidade"] = tabua.periodicidade.value
+    tabuas = tabua._tabuas_base()
+    hipoteses = hipoteses_fracionarias(tabuas)
+    if any(hipotese != HipoteseFracionaria.NENHUMA.value for hipotese in hipoteses):
+        descricao["hipoteses"] = hipoteses
+    return descricao, pares_qx_log_lx(tabuas)
+
+
+def _reconstruir_tabua(
+    descricao: dict[str, Any], bases: list[tuple[ArrayLike, ArrayLike]], sem_copia: bool = False
+) -> TabuaInterface:
+    """Reconstrói uma tábua a partir de :func:`_descrever_tabua`, sem recalcular a sobrevivência acumulada. Com
+    ``sem_copia``, as tábuas base usam diretamente a memória dos pares (qx, log_lx), que devem ser somente leitura."""
+    periodicidade = Periodicidade(descricao["periodicidade"])
+    hipoteses = descricao.get("hipoteses")
+    tipo = descricao["tipo"]
+    if tipo == "Tabua":
+        return Tabua._restaurar(bases, periodicidade, hipoteses, sem_copia)
+    if tipo == "TabuaSeletiva":
+        return TabuaSeletiva._restaurar(bases, periodicidade, hipoteses, sem_copia)
+    if tipo == "TabuaMDT":
+        return TabuaMDT._restaurar(
+            bases, periodicidade, descricao["causas"], descricao["causa_principal"], hipoteses, sem_copia
+        )
+    if tipo == "TabuaMultiplasVidas":
+        return TabuaMultiplasVidas._restaurar(
+            bases, periodicidade, StatusVidasConjuntas[descricao["status"]], hipoteses, sem_copia
+        )
+    raise ValueError(f"Tipo de tábua desconhecido: {tipo}.")
+
+
+def _tamanhos_base(linhas: int, colunas: int) -> tuple[int, int]:
+    """Quantidade de valores de qx e de log_lx de uma tábua base. Tábuas seletivas possuem duas matrizes
+    (linhas, colunas), e as demais possuem um log_lx com um elemento a mais que qx."""
+    if colunas:
+        return linhas * colunas, linhas * colunas
+    return linhas, linhas + 1
+
+
+def _empacotar_bases(descricao: dict[str, Any], bases: list[tuple[ArrayLike, ArrayLike]]) -> NDArray[float64]:
+    """Registra o formato de cada tábua base na descrição e concatena os seus dados em um único array."""
+    descricao["tamanhos"] = [len(qx) for qx, _ in bases]
+    colunas = [qx.shape[1] if qx.ndim == 2 else 0 for qx, _ in bases]
+    if any(colunas):
+        descricao["colunas"] = colunas
+    return concatenate([asarray(valores).reshape(-1) for base in bases for valores in base])
+
+
+def _desempacotar_bases(descricao: dict[str, Any], dados: NDArray[float64]) -> list[tuple[ArrayLike, ArrayLike]]:
+    """Separa os dados concatenados por :func:`_empacotar_bases` nos pares (qx, log_lx) de cada tábua base."""
+    linhas = descricao["tamanhos"]
+    colunas = descricao.get("colunas", [0] * len(linhas))
+    tamanhos = [_tamanhos_base(n, c) for n, c in zip(linhas, colunas)]
+    if len(dados) != sum(tamanho_qx + tamanho_log_lx for tamanho_qx, tamanho_log_lx in tamanhos):
+        raise ValueError("Conteúdo truncado ou corrompido.")
+    bases = []
+    inicio = 0
+    for n, c, (tamanho_qx, tamanho_log_lx) in zip(linhas, colunas, tamanhos):
+        qx = dados[inicio:inicio + tamanho_qx]
+        log_lx = dados[inicio + tamanho_qx:inicio + tamanho_qx + tamanho_log_lx]
+        bases.append((qx.reshape(n, c), log_lx.reshape(n, c)) if c else (qx, log_lx))
+        inicio += tamanho_qx + tamanho_log_lx
+    return bases
+
+
+def para_bytes(tabua: TabuaInterface) -> bytes:
+    """Serializa a tábua no formato binário do tabatu.
+
+    Args:
+        tabua (TabuaInterface): Tábua a ser serializada.
+
+    Returns:
+        bytes: Conteúdo serializado.
+
+    Examples:
+
+        >>> import numpy as np
+        >>> from tabatu import Tabua
+        >>> qx = (np.arange(100) + 1)/100
+        >>> tabua = de_bytes(para_bytes(Tabua(qx)))
+        >>> tabua.tpx([30], [0, 1, 2])
+        array([1.    , 0.69  , 0.4692])
+    """
+    descricao, bases = _descrever_tabua(tabua)
+    dados = _empacotar_bases(descricao, bases).astype(_TIPO_DADOS, copy=False)
+    metadados = json.dumps(descricao, separators=(",", ":")).encode()
+    metadados += b" " * (-(_CABECALHO.size + len(metadados)) % 8)
+    return _CABECALHO.pack(MAGICA, VERSAO, len(metadados)) + metadados + dados.tobytes()
+
+
+def de_bytes(conteudo: Union[bytes, memoryview], sem_copia: bool = False) -> TabuaInterface:
+    """Recria uma tábua serializada com :func:`para_bytes`.
+
+    Args:
+        conteudo (bytes | memoryview): Conteúdo serializado, por exemplo, uma fatia de um arquivo mapeado em memória.
+        sem_copia (bool): Se verdadeiro, as tábuas base usam diretamente a memória do conteúdo, sem copiá-la, e o
+            conteúdo é mantido vivo enquanto existir alguma tábua que o usa. O conteúdo não deve ser alterado depois
+            da criação da tábua. Tábuas seletivas são sempre copiadas.
+
+    Returns:
+        TabuaInterface: Tábua recriada.
+
+    Raises:
+        ValueError: Se o conteúdo não estiver no formato do tabatu, ou se a versão não for suportada.
+    """
+    if len(conteudo) < _CABECALHO.size:
+        raise ValueError("Conteúdo não está no formato de tábuas do tabatu.")
+    magica, versao, tamanho_metadados = _CABECALHO.unpack_from(conteudo)
+    if magica != MAGICA:
+        raise ValueError("Conteúdo não está no formato de tábuas do tabatu.")
+    if versao != VERSAO:
+        raise ValueError(f"Versão {versao} do formato não é suportada. A versão suportada é {VERSAO}.")
+    inicio = _CABECALHO.size + tamanho_metadados
+    descricao = json.loads(bytes(conteudo[_CABECALHO.size:inicio]))
+    dados = ascontiguousarray(frombuffer(conteudo, dtype=_TIPO_DADOS, offset=inicio), dtype=float)
+    if sem_copia:
+        dados.flags.writeable = False
+    return _reconstruir_tabua(descricao, _desempacotar_bases(descricao, dados), sem_copia)
+
+
+def salvar(tabua: TabuaInterface, arquivo: Arquivo) -> None:
+    """Salva a tábua em um arquivo, no formato binário do tabatu.
+
+    Args:
+        tabua (TabuaInterface): Tábua a ser salva.
+        arquivo (str | os.PathLike | BinaryIO): Caminho ou arquivo aberto em modo binário.
+    """
+    conteudo = para_bytes(tabua)
+    if hasattr(arquivo, "write"):
+        arquivo.write(conteudo)
+        return
+    with open(arquivo, "wb") as f:
+        f.write(conteudo)
+
+
+def carregar(arquivo: Arquivo) -> TabuaInterface:
+    """Carrega uma tábua salva com :func:`salvar`.
+
+    O arquivo é lido com uma única leitura e a sobrevivência acumulada armazenada é reaproveitada.
+
+    Args:
+        arquivo (str | os.PathLike | BinaryIO): Caminho ou arquivo aberto em modo binário.
+
+    Returns:
+        TabuaInterface: Tábua carregada.
+    """
+    if hasattr(arquivo, "read"):
+        return de_bytes(arquivo.read())
+    with open(arquivo, "rb") as f:
+        return de_bytes(f.read())
@@ -0,0 +1,234 @@
+"""Simulação de Monte Carlo do tempo de vida futuro e da causa de falha.
+
+O tempo de vida futuro curtate K de uma vida com idade x é sorteado pelo método da transformada inversa: para cada
+idade distinta da carteira, a função de distribuição acumulada de K, a soma acumulada de ``t_qx``, é calculada uma
+única vez, e cada vida recebe o primeiro tempo em que a distribuição acumulada supera um número aleatório uniforme,
+encontrado por busca binária. Em tábuas de múltiplos decrementos, a distribuição acumulada é construída sobre os pares
+(tempo, causa), de forma que a mesma busca sorteia o tempo e a causa da falha.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from numpy import arange
+from numpy import argsort
+from numpy import asarray
+from numpy import bincount
+from numpy import column_stack
+from numpy import cumsum
+from numpy import empty
+from numpy import flatnonzero
+from numpy import float64
+from numpy import int64
+from numpy import prod
+from numpy import ravel_multi_index
+from numpy import searchsorted
+from numpy import uint16
+from numpy import unique
+from numpy import unravel_index
+from numpy.random import Generator
+from numpy.random import SeedSequence
+from numpy.random import default_rng
+from numpy.typing import ArrayLike
+from numpy.typing import NDArray
+
+from tabatu.multiplos_decrementos import TabuaMDT
+from tabatu.typing import TabuaInterface
+
+LIMITE_CHAVES = 2**24
+"""Quantidade máxima de combinações de idades para que as vidas sejam agrupadas por contagem, ao invés de ordenação."""
+
+TAMANHO_BLOCO = 1_000_000
+"""Quantidade default de vidas simuladas em cada bloco de :meth:`Simulador.simular_em_blocos`."""
+
+
+@dataclass(frozen=True)
+class ResultadoSimulacao:
+    """Resultado de uma simulação.
+
+    Args:
+        tempo (NDArray[int64]): Tempo de vida futuro curtate de cada vida, isto é, o tempo t em que ocorre a falha
+            entre x + t e x + t + 1. Vidas sem falha até o tempo máximo da simulação recebem o tempo máximo.
+        causa (NDArray[int64]): Índice da causa da falha de cada vida, na ordem de ``TabuaMDT.causas``. Para tábuas de
+            um único decremento ou de múltiplas vidas, é sempre 0. Vidas sem falha até o tempo máximo recebem -1.
+    """
+    tempo: NDArray[int64]
+    causa: NDArray[int64]
+
+
+class Simulador:
+    """Simulador do tempo de vida futuro e da causa de falha de vidas de uma tábua.
+
+    As distribuições acumuladas de cada idade distinta são calculadas uma vez por chamada, com os métodos em lote da
+    tábua, e o custo por vida é apenas o de um número aleatório e de uma busca binária.
+
+    Args:
+        tabua (TabuaInterface): Tábua de um único decremento, de múltiplos decrementos ou de múltiplas vidas.
+        tempo_maximo (int, optional): Tempo máximo da simulação. Obrigatório para tábuas com fechamento platô. Por
+            default, é o maior tempo futuro das idades simuladas, e todas as vidas falham.
+
+    Examples:
+
+        >>> import numpy as np
+        >>> from tabatu import Tabua
+        >>> simulador = Simulador(Tabua([0.1, 0.2, 0.4, 0.8, 1.0]))
+        >>> resultado = simulador.simular(np.zeros(100_000, dtype=np.int64), np.random.default_rng(0))
+        >>> np.bincount(resultado.tempo) / 100_000
+        array([0.10176, 0.17759, 0.28918, 0.34618, 0.08529])
+    """
+    __slots__ = "_tabua", "_tempo_maximo"
+
+    def __init__(self, tabua: TabuaInterface, tempo_maximo: Optional[int] = None) -> None:
+        if tempo_maximo is None and tabua.possui_fechamento_plato():
+            raise ValueError("tempo_maximo deve ser informado para tábuas com fechamento platô.")
+        if tempo_maximo is not None and tempo_maximo < 0:
+            raise ValueError("tempo_maximo deve ser maior ou igual a zero.")
+        self._tabua = tabua
+        self._tempo_maximo = tempo_maximo
+
+    @property
+    def tabua(self) -> TabuaInterface:
+        """Tábua usada na simulação."""
+        return self._tabua
+
+    def _agrupar(self, x: ArrayLike) -> tuple[NDArray[int64], NDArray[int64]]:
+        """Retorna as idades distintas, com formato (G, k), e a posição da idade de cada vida entre elas."""
+        x = asarray(x, dtype=int64)
+        x = x.reshape(-1, 1) if x.ndim == 1 else x
+        if len(x) == 0:
+            return x, empty(0, dtype=int64)
+        minimo = x.min(axis=0)
+        dimensoes = tuple(x.max(axis=0) - minimo + 1)
+        if prod(dimensoes, dtype=float64) > LIMITE_CHAVES:
+            idades, grupo = unique(x, axis=0, return_inverse=True)
+            return idades, grupo.reshape(-1)
+        # Cada combinação de idades é codificada em um inteiro, o que permite agrupar as vidas
+        # com bincount, em tempo linear, ao invés de ordenar as linhas de x.
+        chave = ravel_multi_index(tuple((x - minimo).T), dimensoes)
+        presentes = flatnonzero(bincount(chave))
+        posicao = empty(presentes[-1] + 1, dtype=int64)
+        posicao[presentes] = arange(len(presentes))
+        idades = column_stack(unravel_index(presentes, dimensoes)) + minimo
+        return idades, posicao[chave]
+
+    def _distribuicoes(self, idades: NDArray[int64]) -> NDArray[float64]:
+        """Distribuição acumulada dos pares (tempo, causa) de cada idade distinta, com formato (G, H * k)."""
+        if self._tempo_maximo is None:
+            horizonte = int(self._tabua.tempo_futuro_maximo_lote(idades).max(initial=0))
+        else:
+            horizonte = self._tempo_maximo
+        t = arange(horizonte, dtype=float64)
+        if isinstance(self._tabua, TabuaMDT):
+            k = self._tabua.numero_decrementos
+            densidade = empty((len(idades), horizonte, k), dtype=float64)
+            for g, idade in enumerate(idades):
+                densidade[g] = self._tabua.probabilidades(idade, t)[k + 2:].T
+            densidade = densidade.reshape(len(idades), horizonte * k)
+        else:
+            densidade = self._tabua.t_qx_lote(idades, t)
+        return cumsum(densidade, axis=1)
+
+    def _amostrar(
+        self, distribuicoes: NDArray[float64], grupo: NDArray[int64], gerador: Generator
+    ) -> ResultadoSimulacao:
+        k = self._tabua.numero_decrementos if isinstance(self._tabua, TabuaMDT) else 1
+        posicoes = distribuicoes.shape[1]
+        u = gerador.random(len(grupo))
+        indices = empty(len(grupo), dtype=int64)
+        # Com poucas idades distintas, a ordenação estável de inteiros de 16 bits usa radix sort.
+        ordem = argsort(grupo.astype(uint16) if len(distribuicoes) <= 2**16 else grupo, kind="stable")
+        limites = searchsorted(grupo[ordem], arange(len(distribuicoes) + 1))
+        for g, distribuicao in enumerate(distribuicoes):
+            vidas = ordem[limites[g]:limites[g + 1]]
+            if len(vidas) == 0:
+                continue
+            if posicoes == 0:
+                indices[vidas] = 0
+                continue
+            if self._tempo_maximo is None:
+                # Sem truncamento, todas as vidas falham. A escala evita que erros de arredondamento
+                # na soma acumulada deixem uma vida sem falha.
+                indices[vidas] = searchsorted(distribuicao, u[vidas] * distribuicao[-1], side="right")
+            else:
+                indices[vidas] = searchsorted(distribuicao, u[vidas], side="right")
+        sobrevive = indices >= posicoes
+        tempo = indices // k
+        causa = indices % k
+        tempo[sobrevive] = posicoes // k
+        causa[sobrevive] = -1
+        return ResultadoSimulacao(tempo, causa)
+
+    def simular(self, x: ArrayLike, gerador: Generator) -> ResultadoSimulacao:
+        """Sorteia o tempo de vida futuro e a causa da falha de cada vida.
+
+        Args:
+            x (ArrayLike): Idades das vidas, no formato aceito por ``t_qx_lote``.
+            gerador (Generator): Gerador de números aleatórios do NumPy.
+
+        Returns:
+            ResultadoSimulacao: Tempo e causa de cada vida.
+        """
+        idades, grupo = self._agrupar(x)
+        return self._amostrar(self._distribuicoes(idades), grupo, gerador)
+
+    def simular_em_blocos(
+        self,
+        x: ArrayLike,
+        semente: Optional[int | SeedSequence] = None,
+        tamanho_bloco: int = TAMANHO_BLOCO,
+        blocos: Optional[Iterable[int]] = None,
+    ) -> Iterator[ResultadoSimulacao]:
+        """Sorteia o tempo de vida futuro e a causa da falha em blocos de vidas, retornando um bloco por vez.
+
+        Cada bloco usa um gerador próprio, derivado da semente com ``SeedSequence.spawn``, de forma que o resultado
+        de um bloco depende apenas da semente e da sua posição. Assim, diferentes processos podem simular blocos
+        diferentes da mesma carteira, através do argumento ``blocos``, e obter o mesmo resultado de uma única
+        execução sequencial.
+
+        Args:
+            x (ArrayLike): Idades das vidas, no formato aceito por ``t_qx_lote``.
+            semente (int | SeedSequence, optional): Semente da simulação.
+            tamanho_bloco (int): Quantidade de vidas em cada bloco.
+            blocos (Iterable[int], optional): Posições dos blocos a simular. Por default, simula todos os blocos.
+
+        Yields:
+            ResultadoSimulacao: Tempo e causa das vidas de cada bloco, na ordem de ``blocos``.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> from tabatu import Tabua
+            >>> simulador = Simulador(Tabua([0.1, 0.2, 0.4, 0.8, 1.0]))
+            >>> x = np.zeros(10, dtype=np.int64)
+            >>> [bloco.tempo for bloco in simulador.simular_em_blocos(x, semente=42, tamanho_bloco=4)]
+            [array([4, 3, 3, 2]), array([2, 0, 3, 1]), array([0, 3])]
+        """
+        if tamanho_bloco <= 0:
+            raise ValueError("tamanho_bloco deve ser maior que zero.")
+        idades, grupo = self._agrupar(x)
+        distribuicoes = self._distribuicoes(idades)
+        quantidade_blocos = -(-len(grupo) // tamanho_bloco)
+        if not isinstance(semente, SeedSequence):
+            semente = SeedSequence(semente)
+        sementes = semente.spawn(quantidade_blocos)
+        for i in range(quantidade_blocos) if blocos is None else blocos:
+            bloco = grupo[i * tamanho_bloco:(i + 1) * tamanho_bloco]
+            yield self._amostrar(distribuicoes, bloco, default_rng(sementes[i]))
+
+
+def simular(
+    tabua: TabuaInterface, x: ArrayLike, gerador: Generator, tempo_maximo: Optional[int] = None
+) -> ResultadoSimulacao:
+    """Sorteia o tempo de vida futuro e a causa da falha de cada vida. Atalho para :meth:`Simulador.simular`.
+
+    Args:
+        tabua (TabuaInterface): Tábua de um único decremento, de múltiplos decrementos ou de múltiplas vidas.
+        x (ArrayLike): Idades das vidas, no formato aceito por ``t_qx_lote``.
+        gerador (Generator): Gerador de números aleatórios do NumPy.
+        tempo_maximo (int, optional): Tempo máximo da simulação. Obrigatório para tábuas com fechamento platô.
+
+    Returns:
+        ResultadoSimulacao: Tempo e causa de cada vida.
+    """
+    return Simulador(tabua, tempo_maximo).simular(x, gerador)
@@ -1,7 +1,13 @@
-from typing import Iterable
+from __future__ import annotations
+
+from typing import Iterable, Optional
 from numpy import array
+from numpy import float64
+from numpy.typing import ArrayLike
+from numpy.typing import NDArray
 
 import tabatu.core as core
+from tabatu.hipotese_fracionaria import HipoteseFracionaria
 from tabatu.periodicidade import Periodicidade
 from tabatu.alterar_tabua import alterar_periodicidade_qx
 
@@ -10,20 +16,114 @@ class TabuaBase(core.TabuaBase):
     __slots__ = "_tabua", "_periodicidade"
 
     def __init__(
-        self, qx: Iterable[float], periodicidade: Periodicidade = Periodicidade.ANUAL
+        self,
+        qx: Iterable[float],
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+        hipotese_fracionaria: HipoteseFracionaria = HipoteseFracionaria.NENHUMA,
     ):
         self._periodicidade: Periodicidade = Periodicidade(periodicidade)
-        super().__init__(qx)
+        super().__init__(qx, HipoteseFracionaria(hipotese_fracionaria).codigo)
+
+    @classmethod
+    def from_log_lx(
+        cls,
+        qx: Iterable[float],
+        log_lx: Iterable[float],
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+        hipotese_fracionaria: HipoteseFracionaria = HipoteseFracionaria.NENHUMA,
+    ) -> "TabuaBase":
+        """Cria uma TabuaBase a partir das taxas e do log da sobrevivência acumulada já calculado,
+        por exemplo, com :meth:`pega_log_lx` de outra tábua, sem refazer o cálculo.
+
+        Args:
+            qx (Iterable[float]): Probabilidades de falha.
+            log_lx (Iterable[float]): Log da sobrevivência acumulada, com um elemento a mais que qx.
+            periodicidade (Periodicidade): Periodicidade das probabilidades de falha.
+            hipotese_fracionaria (HipoteseFracionaria): Hipótese usada em tempos fracionados.
+
+        Returns:
+            TabuaBase: Tábua criada.
+        """
+        tabua = cls._de_qx_e_log_lx(qx, log_lx, HipoteseFracionaria(hipotese_fracionaria).codigo)
+        tabua._periodicidade = Periodicidade(periodicidade)
+        return tabua
+
+    @classmethod
+    def from_buffer(
+        cls,
+        qx: ArrayLike,
+        log_lx: Optional[ArrayLike] = None,
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+        hipotese_fracionaria: HipoteseFracionaria = HipoteseFracionaria.NENHUMA,
+    ) -> "TabuaBase":
+        """Cria uma TabuaBase usando diretamente a memória de buffers somente leitura, sem copiá-los. Veja
+        :meth:`tabatu.Tabua.from_buffer`.
+
+        Args:
+            qx (ArrayLike): Buffer unidimensional, contíguo e somente leitura de float64 com as probabilidades de
+                falha.
+            log_lx (ArrayLike, optional): Buffer com o log da sobrevivência acumulada, com um elemento a mais que
+                qx. Por default, é calculado na criação.
+            periodicidade (Periodicidade): Periodicidade das probabilidades de falha.
+            hipotese_fracionaria (HipoteseFracionaria): Hipótese usada em tempos fracionados.
+
+        Returns:
+            TabuaBase: Tábua criada.
+        """
+        tabua = cls._de_buffer(qx, log_lx, HipoteseFracionaria(hipotese_fracionaria).codigo)
+        tabua._periodicidade = Periodicidade(periodicidade)
+        return tabua
 
     @property
     def periodicidade(self) -> Periodicidade:
         return self._periodicidade
 
+    @property
+    def hipotese_fracionaria(self) -> HipoteseFracionaria:
+        return HipoteseFracionaria.from_codigo(self.pega_hipotese_fracionaria())
+
+    def __reduce__(self):
+        return self.from_log_lx, (*self._par_qx_log_lx(), self._periodicidade, self.hipotese_fracionaria)
+
+    @classmethod
+    def _de_tabua_base(
+        cls, tabua: core.TabuaBase, periodicidade: Periodicidade = Periodicidade.ANUAL
+    ) -> "TabuaBase":
+        """Cria uma TabuaBase a partir de uma tábua base do core, preservando a seleção, a hipótese fracionária e
+        as visões de periodicidade, sem recalcular a sobrevivência."""
+        nova = super()._de_tabua_base(tabua)
+        nova._periodicidade = Periodicidade(periodicidade)
+        return nova
+
     def alterar_periodicidade(self, nova_periodicidade: Periodicidade) -> "TabuaBase":
+        """Altera a periodicidade da tábua.
+
+        Quando a nova periodicidade divide um período das taxas armazenadas em uma quantidade inteira de
+        períodos, como de anual para mensal, é retornada uma visão: as taxas armazenadas são mantidas, e cada
+        período é mapeado para a sua idade na consulta. A taxa convertida e a sobrevivência em um período são
+        calculadas uma única vez por idade, ao invés de uma vez por subperíodo. Nos demais casos, as taxas são
+        convertidas com :func:`~tabatu.alterar_periodicidade_qx`.
+
+        Args:
+            nova_periodicidade (Periodicidade): Nova periodicidade.
+
+        Returns:
+            TabuaBase: Tábua com a nova periodicidade.
+        """
+        if self.pega_periodo_selecao() > 0:
+            raise ValueError("A periodicidade de tábuas seletivas não pode ser alterada.")
+        nova_periodicidade = Periodicidade(nova_periodicidade)
+        # Períodos da nova periodicidade em um período das taxas armazenadas.
+        periodos = nova_periodicidade.quantidade_periodos_1_ano() * self.pega_razao_periodicidade()
+        periodos_atuais = self._periodicidade.quantidade_periodos_1_ano()
+        if periodos >= periodos_atuais and periodos % periodos_atuais == 0:
+            tabua = self._visao_periodicidade(periodos // periodos_atuais)
+            tabua._periodicidade = nova_periodicidade
+            return tabua
         qx = alterar_periodicidade_qx(
             self.pega_qx(), self._periodicidade, nova_periodicidade
         )
-        return TabuaBase(qx, nova_periodicidade)
+        return TabuaBase(qx, nova_periodicidade, self.hipotese_fracionaria)
 
 
 def valida_periodicidade(*args: TabuaBase) -> Periodicidade:
@@ -31,3 +131,17 @@ def valida_periodicidade(*args: TabuaBase) -> Periodicidade:
     if not (periodicidade == periodicidade[0]).all():
         raise ValueError("Todas as tabuas precisam possuir a mesma periodicidade.")
     return periodicidade[0]
+
+
+def pares_qx_log_lx(
+    tabuas: Iterable[core.TabuaBase],
+) -> list[tuple[NDArray[float64], NDArray[float64]]]:
+    """Taxas e log da sobrevivência acumulada de cada tábua base, usados para recriar as tábuas
+    sem refazer o cálculo de lx. Em tábuas seletivas, os dois elementos são matrizes
+    (idades, período de seleção + 1)."""
+    return [tabua._par_qx_log_lx() for tabua in tabuas]
+
+
+def hipoteses_fracionarias(tabuas: Iterable[core.TabuaBase]) -> list[str]:
+    """Nome da hipótese fracionária de cada tábua base."""
+    return [HipoteseFracionaria.from_codigo(tabua.pega_hipotese_fracionaria()).value for tabua in tabuas]
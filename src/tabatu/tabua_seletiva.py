@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from numpy import float64
+from numpy.typing import ArrayLike
+from numpy.typing import NDArray
+
+import tabatu.core as core
+from tabatu.hipotese_fracionaria import HipoteseFracionaria
+from tabatu.periodicidade import Periodicidade
+from tabatu.unico_decremento import Tabua
+
+
+class TabuaSeletiva(Tabua):
+    """Representação de tábuas seletivas e finais (select and ultimate).
+
+    Nas tábuas seletivas, a probabilidade de falha depende da idade de entrada e da duração desde a entrada, até o fim
+    do período de seleção. Após esse período, é usada a tábua final, que depende apenas da idade atingida.
+
+    Todas as taxas são armazenadas em uma única matriz contígua, com uma linha por idade de entrada, e a sobrevivência
+    acumulada de cada idade de entrada ao longo da seleção é calculada uma única vez, na criação da tábua. A tábua
+    possui a mesma interface de :class:`~tabatu.Tabua`, e pode ser usada na construção de tábuas de múltiplos
+    decrementos e de múltiplas vidas.
+
+    Args:
+        qx_selecao (ArrayLike): Matriz com formato (idades, periodo_selecao + 1). A linha x contém as taxas de uma vida
+            que entrou com idade x: as colunas 0 até periodo_selecao - 1 são as taxas de cada duração da seleção, e a
+            última coluna é a taxa final da idade atingida x + periodo_selecao.
+        periodicidade (Periodicidade): Periodicidade das probabilidades de falha fornecidas. Por default, é
+            considerado que as taxas são anuais.
+        hipotese_fracionaria (HipoteseFracionaria): Hipótese usada para avaliar os métodos em tempos fracionados. Por
+            default, o tempo é truncado para inteiro.
+
+    Note:
+        Nos métodos da tábua, x é a idade de entrada e t é o tempo desde a entrada. Idades de entrada acima da última
+        linha usam as taxas seletivas da última linha. A periodicidade de tábuas seletivas não pode ser alterada.
+
+    Examples:
+
+        >>> tabua = TabuaSeletiva([[0.1, 0.2, 0.3], [0.15, 0.25, 0.4], [0.2, 0.3, 0.5]])
+        >>> tabua.qx([1], [0, 1, 2, 3])
+        array([0.15, 0.25, 0.4 , 0.5 ])
+        >>> tabua.tpx([1], [0, 1, 2, 3])
+        array([1.    , 0.85  , 0.6375, 0.3825])
+    """
+    __slots__ = ()
+
+    def __init__(
+        self,
+        qx_selecao: ArrayLike,
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+        hipotese_fracionaria: HipoteseFracionaria = HipoteseFracionaria.NENHUMA,
+    ):
+        codigo = HipoteseFracionaria(hipotese_fracionaria).codigo
+        self._usar_tabua_base(core.TabuaBase._de_qx_selecao(qx_selecao, codigo))
+        self._periodicidade = periodicidade
+
+    @property
+    def periodo_selecao(self) -> int:
+        """Quantidade de períodos da seleção."""
+        return self._tabuas_base()[0].pega_periodo_selecao()
+
+    @property
+    def qx_selecao(self) -> NDArray[float64]:
+        """Matriz somente leitura (idades, periodo_selecao + 1) de taxas seletivas e finais."""
+        return self._tabuas_base()[0].pega_qx_selecao()
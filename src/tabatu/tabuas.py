@@ -0,0 +1,186 @@
+"""Registro de tábuas padrão, carregadas por nome a partir de pacotes binários.
+
+Um pacote reúne várias tábuas no formato de :mod:`tabatu.serializacao`, com a sobrevivência acumulada já calculada,
+em um único arquivo. O arquivo começa com um cabeçalho fixo, com um identificador do formato, a versão e o tamanho do
+índice, seguido pelo índice em JSON, que associa o nome de cada tábua à posição e ao tamanho do seu conteúdo, e pelo
+conteúdo das tábuas, alinhado em 8 bytes.
+
+Os pacotes são mapeados em memória com ``mmap``, e as tábuas carregadas usam diretamente a memória do mapa, sem
+copiar as taxas e a sobrevivência acumulada. Assim, apenas as tábuas usadas são lidas do disco, e as suas páginas
+ficam no cache do sistema operacional, compartilhadas entre os processos que usam o mesmo pacote. Tábuas seletivas
+são a exceção: as suas matrizes são copiadas na criação. Cada tábua é criada uma única vez por processo, e tábuas com
+o mesmo conteúdo, mesmo que registradas com nomes diferentes, são a mesma instância.
+
+O pacote tabatu não distribui as tábuas de mercado: os pacotes são criados com :func:`salvar_pacote` a partir das
+tábuas oficiais, e registrados com :func:`registrar_pacote` ou pela variável de ambiente ``TABATU_TABUAS``, com os
+caminhos dos pacotes separados por ``os.pathsep``.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from hashlib import blake2b
+from threading import Lock
+from typing import Mapping, Union
+
+from tabatu.serializacao import de_bytes
+from tabatu.serializacao import para_bytes
+from tabatu.typing import TabuaInterface
+
+MAGICA = b"TABATUPK"
+VERSAO = 1
+_CABECALHO = struct.Struct("<8sII")
+
+VARIAVEL_AMBIENTE = "TABATU_TABUAS"
+"""Variável de ambiente com os caminhos dos pacotes registrados no :data:`REGISTRO` default."""
+
+Caminho = Union[str, os.PathLike]
+
+
+def salvar_pacote(tabuas: Mapping[str, TabuaInterface], caminho: Caminho) -> None:
+    """Salva um conjunto de tábuas em um pacote, que pode ser registrado com :func:`registrar_pacote`.
+
+    Args:
+        tabuas (Mapping[str, TabuaInterface]): Tábuas do pacote, indexadas pelo nome.
+        caminho (str | os.PathLike): Caminho do pacote.
+    """
+    conteudos = {nome: para_bytes(tabua) for nome, tabua in tabuas.items()}
+    # O índice depende do tamanho do cabeçalho e do próprio índice: as posições são calculadas
+    # relativas ao início dos dados e deslocadas depois que o tamanho do índice é conhecido.
+    relativas = {}
+    inicio = 0
+    for nome, conteudo in conteudos.items():
+        relativas[nome] = (inicio, len(conteudo))
+        inicio += len(conteudo) + (-len(conteudo) % 8)
+    deslocamento = 0
+    while True:
+        indice = json.dumps(
+            {nome: [deslocamento + i, n] for nome, (i, n) in relativas.items()}, separators=(",", ":")
+        ).encode()
+        indice += b" " * (-(_CABECALHO.size + len(indice)) % 8)
+        if _CABECALHO.size + len(indice) == deslocamento:
+            break
+        deslocamento = _CABECALHO.size + len(indice)
+    with open(caminho, "wb") as f:
+        f.write(_CABECALHO.pack(MAGICA, VERSAO, len(indice)))
+        f.write(indice)
+        for conteudo in conteudos.values():
+            f.write(conteudo)
+            f.write(b"\x00" * (-len(conteudo) % 8))
+
+
+class _Pacote:
+    """Pacote mapeado em memória."""
+    __slots__ = "caminho", "mapa", "indice"
+
+    def __init__(self, caminho: Caminho) -> None:
+        self.caminho = os.fspath(caminho)
+        with open(self.caminho, "rb") as f:
+            self.mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mapa) < _CABECALHO.size:
+            raise ValueError(f"{self.caminho} não é um pacote de tábuas do tabatu.")
+        magica, versao, tamanho_indice = _CABECALHO.unpack_from(self.mapa)
+        if magica != MAGICA:
+            raise ValueError(f"{self.caminho} não é um pacote de tábuas do tabatu.")
+        if versao != VERSAO:
+            raise ValueError(f"Versão {versao} do pacote não é suportada. A versão suportada é {VERSAO}.")
+        self.indice: dict[str, list[int]] = json.loads(self.mapa[_CABECALHO.size:_CABECALHO.size + tamanho_indice])
+
+    def conteudo(self, nome: str) -> memoryview:
+        inicio, tamanho = self.indice[nome]
+        return memoryview(self.mapa)[inicio:inicio + tamanho]
+
+
+class RegistroTabuas:
+    """Registro de tábuas carregadas por nome a partir de pacotes.
+
+    Quando o mesmo nome existe em mais de um pacote, vale o pacote registrado por último. O registro pode ser
+    compartilhado entre threads.
+
+    Examples:
+
+        >>> import os, tempfile
+        >>> from tabatu import Tabua
+        >>> caminho = os.path.join(tempfile.mkdtemp(), "tabuas.tabatupk")
+        >>> salvar_pacote({"EXEMPLO": Tabua([0.1, 0.2, 0.4, 0.8, 1.0])}, caminho)
+        >>> registro = RegistroTabuas()
+        >>> registro.registrar_pacote(caminho)
+        >>> registro.nomes()
+        ['EXEMPLO']
+        >>> registro.carregar("EXEMPLO").tpx([0], [0, 1, 2])
+        array([1.  , 0.9 , 0.72])
+        >>> registro.carregar("EXEMPLO") is registro.carregar("EXEMPLO")
+        True
+    """
+    __slots__ = "_pacotes", "_nomes", "_internadas", "_trava"
+
+    def __init__(self) -> None:
+        self._pacotes: list[_Pacote] = []
+        self._nomes: dict[str, _Pacote] = {}
+        self._internadas: dict[bytes, TabuaInterface] = {}
+        self._trava = Lock()
+
+    def registrar_pacote(self, caminho: Caminho) -> None:
+        """Registra as tábuas de um pacote criado com :func:`salvar_pacote`.
+
+        Args:
+            caminho (str | os.PathLike): Caminho do pacote.
+        """
+        pacote = _Pacote(caminho)
+        with self._trava:
+            self._pacotes.append(pacote)
+            for nome in pacote.indice:
+                self._nomes[nome] = pacote
+
+    def nomes(self) -> list[str]:
+        """Nomes das tábuas registradas, em ordem alfabética."""
+        with self._trava:
+            return sorted(self._nomes)
+
+    def carregar(self, nome: str) -> TabuaInterface:
+        """Carrega uma tábua registrada.
+
+        Args:
+            nome (str): Nome da tábua.
+
+        Returns:
+            TabuaInterface: Tábua carregada. Consultas ao mesmo conteúdo retornam a mesma instância.
+
+        Raises:
+            KeyError: Se não houver tábua registrada com o nome.
+        """
+        with self._trava:
+            pacote = self._nomes.get(nome)
+            if pacote is None:
+                raise KeyError(f"Tábua {nome!r} não registrada. Tábuas disponíveis: {sorted(self._nomes)}.")
+            conteudo = pacote.conteudo(nome)
+            chave = blake2b(conteudo, digest_size=16).digest()
+            tabua = self._internadas.get(chave)
+            if tabua is None:
+                tabua = self._internadas[chave] = de_bytes(conteudo, sem_copia=True)
+            return tabua
+
+
+REGISTRO = RegistroTabuas()
+"""Registro usado pelas funções do módulo. Os pacotes da variável de ambiente ``TABATU_TABUAS`` são registrados na
+importação do módulo."""
+
+for _caminho in filter(None, os.environ.get(VARIAVEL_AMBIENTE, "").split(os.pathsep)):
+    REGISTRO.registrar_pacote(_caminho)
+
+
+def registrar_pacote(caminho: Caminho) -> None:
+    """Registra as tábuas de um pacote no registro default. Veja :meth:`RegistroTabuas.registrar_pacote`."""
+    REGISTRO.registrar_pacote(caminho)
+
+
+def nomes() -> list[str]:
+    """Nomes das tábuas do registro default. Veja :meth:`RegistroTabuas.nomes`."""
+    return REGISTRO.nomes()
+
+
+def carregar(nome: str) -> TabuaInterface:
+    """Carrega uma tábua do registro default. Veja :meth:`RegistroTabuas.carregar`."""
+    return REGISTRO.carregar(nome)
@@ -1,6 +1,7 @@
-from typing import Iterable, Protocol
+from typing import Iterable, Optional, Protocol
 
 from numpy import float64
+from numpy.typing import ArrayLike
 from numpy.typing import NDArray
 
 from tabatu.periodicidade import Periodicidade
@@ -11,18 +12,44 @@ class TabuaInterface(Protocol):
     def periodicidade(self) -> Periodicidade:
         ...
 
-    def qx(self, x: Iterable[int], t: Iterable[int]) -> NDArray[float64]:
+    def qx(
+        self, x: Iterable[int], t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         ...
 
-    def tpx(self, x: Iterable[int], t: Iterable[int]) -> NDArray[float64]:
+    def tpx(
+        self, x: Iterable[int], t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         ...
 
-    def t_qx(self, x: Iterable[int], t: Iterable[int]) -> NDArray[float64]:
+    def t_qx(
+        self, x: Iterable[int], t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         ...
 
     def tempo_futuro_maximo(self, x: Iterable[int]) -> float:
         ...
 
+    def qx_lote(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        ...
+
+    def tpx_lote(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        ...
+
+    def t_qx_lote(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        ...
+
+    def tempo_futuro_maximo_lote(
+        self, x: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        ...
+
     def possui_fechamento_plato(self) -> bool:
         ...
 
@@ -42,8 +69,12 @@ class JurosInterface(Protocol):
     ) -> "JurosInterface":
         ...
 
-    def taxa_juros(self, t: Iterable[int]) -> NDArray[float64]:
+    def taxa_juros(
+        self, t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         ...
 
-    def taxa_desconto(self, t: Iterable[int]) -> NDArray[float64]:
+    def taxa_desconto(
+        self, t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         ...
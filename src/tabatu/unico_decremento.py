@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-from typing import Iterable
+import os
+from typing import Iterable, Optional, Union
 
+from numpy import concatenate
 from numpy import float64
+from numpy import full
+from numpy import load
+from numpy import save
+from numpy.typing import ArrayLike
 from numpy.typing import NDArray
 
 import tabatu.core as core
+from tabatu.hipotese_fracionaria import HipoteseFracionaria
 from tabatu.periodicidade import Periodicidade
 from tabatu.tabua_base import TabuaBase
+from tabatu.tabua_base import hipoteses_fracionarias
+from tabatu.tabua_base import pares_qx_log_lx
 
 
 class Tabua(core.Tabua):
@@ -24,6 +33,9 @@ class Tabua(core.Tabua):
             crie a tábua e use o setter de periodicidade.
         periodicidade (Periodicidade): Periodicidade das probabilidades
             de falha fornecidas. Por default, é considerado que as taxas são anuais.
+        hipotese_fracionaria (HipoteseFracionaria): Hipótese usada para avaliar os métodos
+            em tempos fracionados, a partir das taxas na periodicidade original. Por default,
+            o tempo é truncado para inteiro.
 
     Note:
         A periodicidade controla como os métodos devem ser usados.
@@ -37,12 +49,15 @@ class Tabua(core.Tabua):
         >>> qx1 = (np.arange(100) + 1)/100
         >>> tabua = Tabua(qx1, periodicidade=Periodicidade["ANUAL"])
     """
-    __slots__ = "_periodicidade"
+    __slots__ = "_periodicidade", "_tabuas"
 
     def __init__(
-        self, qx: Iterable[float], periodicidade: Periodicidade = Periodicidade.ANUAL
+        self,
+        qx: Iterable[float],
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+        hipotese_fracionaria: HipoteseFracionaria = HipoteseFracionaria.NENHUMA,
     ):
-        super().__init__(qx)
+        super().__init__(qx, HipoteseFracionaria(hipotese_fracionaria).codigo)
         self._periodicidade = periodicidade
 
     @classmethod
@@ -55,20 +70,140 @@ class Tabua(core.Tabua):
         Returns:
             Tabua: Tabua criada.
         """
-        return cls(tabua.pega_qx(), tabua.periodicidade)
+        nova = cls._de_tabua_base(tabua)
+        nova._periodicidade = tabua.periodicidade
+        return nova
+
+    @classmethod
+    def from_buffer(
+        cls,
+        qx: ArrayLike,
+        log_lx: Optional[ArrayLike] = None,
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+        hipotese_fracionaria: HipoteseFracionaria = HipoteseFracionaria.NENHUMA,
+    ) -> Tabua:
+        """Cria a tábua usando diretamente a memória de buffers somente leitura, como um ``np.memmap``, sem copiá-los.
+
+        Os buffers são mantidos vivos enquanto a tábua, ou alguma tábua construída a partir dela, existir. Quando o
+        log da sobrevivência acumulada é informado, a criação não percorre as taxas para calculá-lo.
+
+        Args:
+            qx (ArrayLike): Buffer unidimensional, contíguo e somente leitura de float64 com as probabilidades de
+                falha.
+            log_lx (ArrayLike, optional): Buffer com o log da sobrevivência acumulada, com um elemento a mais que
+                qx, por exemplo, obtido com :meth:`TabuaBase.pega_log_lx`. Por default, é calculado na criação.
+            periodicidade (Periodicidade): Periodicidade das probabilidades de falha.
+            hipotese_fracionaria (HipoteseFracionaria): Hipótese usada em tempos fracionados.
+
+        Returns:
+            Tabua: Tábua criada.
+
+        Raises:
+            ValueError: Se algum buffer não for unidimensional, contíguo, de float64 e somente leitura.
+        """
+        codigo = HipoteseFracionaria(hipotese_fracionaria).codigo
+        tabua = cls._de_tabua_base(core.TabuaBase._de_buffer(qx, log_lx, codigo))
+        tabua._periodicidade = Periodicidade(periodicidade)
+        return tabua
+
+    @classmethod
+    def from_npy(
+        cls,
+        caminho: Union[str, os.PathLike],
+        periodicidade: Periodicidade = Periodicidade.ANUAL,
+        hipotese_fracionaria: HipoteseFracionaria = HipoteseFracionaria.NENHUMA,
+    ) -> Tabua:
+        """Cria a tábua a partir de um arquivo ``.npy`` mapeado em memória, sem copiá-lo.
+
+        O arquivo pode conter apenas o vetor de taxas, ou a matriz (2, n + 1) salva com :meth:`salvar_npy`, com as
+        taxas na primeira linha e o log da sobrevivência acumulada na segunda. Nesse caso, a tábua é criada em tempo
+        constante, e as páginas do arquivo são compartilhadas entre os processos pelo sistema operacional.
+
+        Args:
+            caminho (str | os.PathLike): Caminho do arquivo.
+            periodicidade (Periodicidade): Periodicidade das probabilidades de falha.
+            hipotese_fracionaria (HipoteseFracionaria): Hipótese usada em tempos fracionados.
+
+        Returns:
+            Tabua: Tábua criada.
+
+        Examples:
+
+            >>> import os, tempfile
+            >>> caminho = os.path.join(tempfile.mkdtemp(), "tabua.npy")
+            >>> Tabua([0.1, 0.2, 0.4, 0.8, 1.0]).salvar_npy(caminho)
+            >>> Tabua.from_npy(caminho).tpx([0], [0, 1, 2])
+            array([1.  , 0.9 , 0.72])
+        """
+        dados = load(caminho, mmap_mode="r")
+        if dados.ndim == 2:
+            if dados.shape[0] != 2:
+                raise ValueError("O arquivo deve conter o vetor de taxas ou a matriz (2, n + 1) de taxas e log_lx.")
+            return cls.from_buffer(dados[0, :-1], dados[1], periodicidade, hipotese_fracionaria)
+        return cls.from_buffer(dados, None, periodicidade, hipotese_fracionaria)
+
+    def salvar_npy(self, caminho: Union[str, os.PathLike]) -> None:
+        """Salva as taxas e o log da sobrevivência acumulada em um arquivo ``.npy``, para :meth:`from_npy`.
+
+        O arquivo contém uma matriz (2, n + 1): a primeira linha possui as n taxas, completadas com NaN, e a
+        segunda o log da sobrevivência acumulada. A periodicidade e a hipótese fracionária não são salvas.
+
+        Args:
+            caminho (str | os.PathLike): Caminho do arquivo.
+        """
+        tabua, = self._tabuas_base()
+        if tabua.pega_periodo_selecao() > 0:
+            raise ValueError("Tábuas seletivas não podem ser salvas em .npy.")
+        qx, log_lx = tabua._par_qx_log_lx()
+        save(caminho, concatenate([qx, full(1, float("nan")), log_lx]).reshape(2, -1))
+
+    @classmethod
+    def _restaurar(
+        cls,
+        bases: list[tuple[ArrayLike, ArrayLike]],
+        periodicidade: Periodicidade,
+        hipoteses: Optional[list[str]] = None,
+        sem_copia: bool = False,
+    ) -> Tabua:
+        """Recria a tábua a partir do par (qx, log_lx), sem refazer o cálculo da sobrevivência. Com ``sem_copia``,
+        a tábua usa diretamente a memória de qx e log_lx, que devem ser somente leitura; tábuas seletivas são
+        sempre copiadas."""
+        ((qx, log_lx),) = bases
+        (hipotese,) = hipoteses or [HipoteseFracionaria.NENHUMA]
+        codigo = HipoteseFracionaria(hipotese).codigo
+        if sem_copia and qx.ndim == 1:
+            tabua_base = core.TabuaBase._de_buffer(qx, log_lx, codigo)
+        else:
+            tabua_base = core.TabuaBase._de_qx_e_log_lx(qx, log_lx, codigo)
+        tabua = cls._de_tabua_base(tabua_base)
+        tabua._periodicidade = Periodicidade(periodicidade)
+        return tabua
+
+    def __reduce__(self):
+        tabuas = self._tabuas_base()
+        return self._restaurar, (pares_qx_log_lx(tabuas), self._periodicidade, hipoteses_fracionarias(tabuas))
 
     @property
     def periodicidade(self) -> Periodicidade:
         """Periodicidade da tábua."""
         return self._periodicidade
 
-    def qx(self, x: Iterable[int], t: Iterable[int]) -> NDArray[float64]:
+    @property
+    def hipotese_fracionaria(self) -> HipoteseFracionaria:
+        """Hipótese usada em tempos fracionados."""
+        return HipoteseFracionaria.from_codigo(self._tabuas_base()[0].pega_hipotese_fracionaria())
+
+    def qx(
+        self, x: Iterable[int], t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         """Probabilidade de um indivíduo com idade x + t falhar
         antes de completar a idade x + t + 1.
 
         Args:
             x (Iterable[int]): Idade de inicial, deve ser um inteiro ou um array com um único inteiro.
             t (Iterable[int]): Tempo extra. Pode ser um array com diversos tempos.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             NDArray[float64]: Array com o mesmo tamanho que t, fornecendo as probabilidades
@@ -81,15 +216,19 @@ class Tabua(core.Tabua):
             >>> Tabua(qx).qx([30], [0,1,2,3,4,5])
             array([0.31, 0.32, 0.33, 0.34, 0.35, 0.36])
         """
-        return super().qx(x, t)
+        return super().qx(x, t, out=out)
 
-    def tpx(self, x: Iterable[int], t: Iterable[int]) -> NDArray[float64]:
+    def tpx(
+        self, x: Iterable[int], t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         """Probabilidade de um indivíduo com idade x sobreviver a idade
         x + t.
 
         Args:
             x (Iterable[int]): Idade de inicial, deve ser um inteiro ou um array com um único inteiro.
             t (Iterable[int]): Tempo extra. Pode ser um array com diversos tempos.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             NDArray[float64]: Probabilidade de um indivíduo com idade x sobreviver a
@@ -103,15 +242,19 @@ class Tabua(core.Tabua):
             array([1.        , 0.69      , 0.4692    , 0.314364  , 0.20748024,
                    0.13486216])
         """
-        return super().tpx(x, t)
+        return super().tpx(x, t, out=out)
 
-    def t_qx(self, x: Iterable[int], t: Iterable[int]) -> NDArray[float64]:
+    def t_qx(
+        self, x: Iterable[int], t: Iterable[int], out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
         """Probabilidade de um indivíduo com idade x falhar com
         idade exatamente igual a x + t.
 
         Args:
             x (Iterable[int]): Idade de inicial, deve ser um inteiro ou um array com um único inteiro.
             t (Iterable[int]): Tempo extra. Pode ser um array com diversos tempos.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
 
         Returns:
             NDArray[float64]: Probabilidade de um indivíduo com idade x falhar com
@@ -125,7 +268,7 @@ class Tabua(core.Tabua):
             array([0.31      , 0.2208    , 0.154836  , 0.10688376, 0.07261808,
                    0.04855038])
         """
-        return super().t_qx(x, t)
+        return super().t_qx(x, t, out=out)
 
     def tempo_futuro_maximo(self, x: Iterable[int]) -> float:
         """Tempo de vida futuro máximo.
@@ -147,15 +290,117 @@ class Tabua(core.Tabua):
         """
         return super().tempo_futuro_maximo(x)
 
+    def qx_lote(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Versão de :meth:`qx` para um lote de idades, calculada em uma única chamada.
+
+        Args:
+            x (ArrayLike): Array com formato (N,) ou (N, 1), com a idade inicial de cada apólice.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), onde a linha i contém o ``qx`` da apólice i.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx = (np.arange(100) + 1)/100
+            >>> Tabua(qx).qx_lote([30, 50], [0, 1, 2])
+            array([[0.31, 0.32, 0.33],
+                   [0.51, 0.52, 0.53]])
+        """
+        return super().qx_lote(x, t, out=out)
+
+    def tpx_lote(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Versão de :meth:`tpx` para um lote de idades, calculada em uma única chamada.
+
+        Args:
+            x (ArrayLike): Array com formato (N,) ou (N, 1), com a idade inicial de cada apólice.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), onde a linha i contém o ``tpx`` da apólice i.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx = (np.arange(100) + 1)/100
+            >>> Tabua(qx).tpx_lote([30, 50], [[0, 1, 2], [1, 2, 3]])
+            array([[1.      , 0.69    , 0.4692  ],
+                   [0.49    , 0.2352  , 0.110544]])
+        """
+        return super().tpx_lote(x, t, out=out)
+
+    def t_qx_lote(
+        self, x: ArrayLike, t: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Versão de :meth:`t_qx` para um lote de idades, calculada em uma única chamada.
+
+        Args:
+            x (ArrayLike): Array com formato (N,) ou (N, 1), com a idade inicial de cada apólice.
+            t (ArrayLike): Array com formato (T,), com os tempos comuns a todas as apólices,
+                ou (N, T), com os tempos de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N, T), onde a linha i contém o ``t_qx`` da apólice i.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx = (np.arange(100) + 1)/100
+            >>> Tabua(qx).t_qx_lote([30, 50], [0, 1, 2])
+            array([[0.31    , 0.2208  , 0.154836],
+                   [0.51    , 0.2548  , 0.124656]])
+        """
+        return super().t_qx_lote(x, t, out=out)
+
+    def tempo_futuro_maximo_lote(
+        self, x: ArrayLike, out: Optional[NDArray[float64]] = None
+    ) -> NDArray[float64]:
+        """Versão de :meth:`tempo_futuro_maximo` para um lote de idades.
+
+        Args:
+            x (ArrayLike): Array com formato (N,) ou (N, 1), com a idade inicial de cada apólice.
+            out (NDArray[float64], optional): Array onde o resultado será escrito, permitindo reaproveitar
+                a memória entre chamadas. Deve ser float64, C-contíguo e ter o formato do resultado.
+
+        Returns:
+            NDArray[float64]: Array com formato (N,), com o tempo de vida futuro máximo de cada apólice.
+
+        Examples:
+
+            >>> import numpy as np
+            >>> qx = (np.arange(100) + 1)/100
+            >>> Tabua(qx).tempo_futuro_maximo_lote([0, 30, 120])
+            array([100.,  70.,   0.])
+        """
+        return super().tempo_futuro_maximo_lote(x, out=out)
+
     def possui_fechamento_plato(self) -> bool:
         """Verifica se a tábua possui fechamento de tipo platô."""
         return super().possui_fechamento_plato()
 
     @property
-    def tabuas(self) -> list[TabuaBase]:
-        return [
-            TabuaBase(tabua.pega_qx(), self._periodicidade) for tabua in super().tabuas
-        ]
+    def tabuas(self) -> tuple[TabuaBase, ...]:
+        """Tábuas base, criadas no primeiro acesso e compartilhadas entre os acessos seguintes. As tábuas base
+        usam a mesma memória das taxas desta tábua."""
+        tabuas = getattr(self, "_tabuas", None)
+        if tabuas is None:
+            tabuas = self._tabuas = tuple(
+                TabuaBase._de_tabua_base(tabua, self._periodicidade) for tabua in super().tabuas
+            )
+        return tabuas
 
     def alterar_periodicidade(self, nova_periodicidade: Periodicidade) -> Tabua:
         """Altera a periodicidade da tábua.
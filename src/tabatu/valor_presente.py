@@ -0,0 +1,204 @@
+"""Valores presentes atuariais de rendas e seguros para carteiras de apólices.
+
+Cada função recebe as idades de N apólices, no mesmo formato aceito pelos métodos em lote das tábuas, e prazos e
+diferimentos escalares ou com uma posição para cada apólice. Os fluxos de todas as apólices são calculados em uma única
+chamada aos métodos ``tpx_lote`` ou ``t_qx_lote`` da tábua, descontados com ``taxa_desconto`` do juros e acumulados ao
+longo do tempo, de forma que o valor presente de cada apólice é a diferença entre duas posições da soma acumulada.
+
+Quando o juros das premissas é um :class:`~tabatu.juros_estocastico.JurosEstocastico`, com S cenários, o resultado é
+uma matriz (N, S), com o valor presente de cada apólice em cada cenário. Nesse caso, os fluxos de cada bloco de
+apólices são multiplicados pela matriz de descontos de todos os cenários em um único produto de matrizes.
+
+As apólices são processadas em blocos, limitando a memória usada em carteiras grandes. Idades, prazos e diferimentos
+devem estar na periodicidade das premissas.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+from numpy import arange
+from numpy import asarray
+from numpy import broadcast_to
+from numpy import cumsum
+from numpy import empty
+from numpy import float64
+from numpy import int64
+from numpy import matmul
+from numpy import maximum
+from numpy.typing import ArrayLike
+from numpy.typing import NDArray
+
+from tabatu.premissas import Premissas
+
+ELEMENTOS_POR_BLOCO = 2**22
+"""Quantidade aproximada de fluxos (apólices x tempos) calculados por bloco."""
+
+
+def _validar_prazo(valor: ArrayLike, n: int, nome: str) -> NDArray[int64]:
+    valor = broadcast_to(asarray(valor, dtype=int64), (n,))
+    if (valor < 0).any():
+        raise ValueError(f"{nome} deve ser maior ou igual a zero.")
+    return valor
+
+
+def _preparar(premissas: Premissas, x: ArrayLike, n: Optional[ArrayLike], m: ArrayLike):
+    """Converte as idades para int64 e retorna o início e o fim (exclusivo) do período de cobertura de cada apólice.
+    Quando n não é informado, a cobertura vai até o tempo futuro máximo de cada apólice."""
+    x = asarray(x, dtype=int64)
+    quantidade = x.shape[0] if x.ndim > 0 else 0
+    inicio = _validar_prazo(m, quantidade, "m")
+    if n is None:
+        fim = maximum(premissas.tabua.tempo_futuro_maximo_lote(x).astype(int64), inicio)
+    else:
+        fim = inicio + _validar_prazo(n, quantidade, "n")
+    return x, inicio, fim
+
+
+def _soma_descontada(
+    premissas: Premissas,
+    metodo: str,
+    x: NDArray[int64],
+    inicio: NDArray[int64],
+    fim: NDArray[int64],
+    deslocamento: int,
+    tamanho_bloco: Optional[int],
+) -> NDArray[float64]:
+    """Para cada apólice i, soma v^(t + deslocamento) * metodo(x_i, t) para t em [inicio_i, fim_i).
+    Com juros estocástico, a soma é feita para cada cenário e o resultado tem uma coluna por cenário."""
+    quantidade = x.shape[0]
+    tempo_maximo = int(fim.max(initial=0))
+    desconto = premissas.juros.taxa_desconto(arange(tempo_maximo, dtype=float64) + deslocamento)
+    estocastico = desconto.ndim == 2
+    resultado = empty((quantidade, desconto.shape[0]) if estocastico else quantidade, dtype=float64)
+    if quantidade == 0:
+        return resultado
+    avaliar = getattr(premissas.tabua, f"{metodo}_lote")
+    tamanho_bloco = tamanho_bloco or max(ELEMENTOS_POR_BLOCO // max(tempo_maximo, 1), 1)
+    for i in range(0, quantidade, tamanho_bloco):
+        bloco = slice(i, min(i + tamanho_bloco, quantidade))
+        tempos = int(fim[bloco].max())
+        fluxos = avaliar(x[bloco], arange(tempos, dtype=float64))
+        if estocastico:
+            t = arange(tempos)
+            fluxos *= (t >= inicio[bloco, None]) & (t < fim[bloco, None])
+            matmul(fluxos, desconto[:, :tempos].T, out=resultado[bloco])
+            continue
+        acumulado = empty((bloco.stop - bloco.start, tempos + 1), dtype=float64)
+        acumulado[:, 0] = 0.0
+        fluxos *= desconto[:tempos]
+        cumsum(fluxos, axis=1, out=acumulado[:, 1:])
+        linhas = arange(bloco.stop - bloco.start)
+        resultado[bloco] = acumulado[linhas, fim[bloco]] - acumulado[linhas, inicio[bloco]]
+    return resultado
+
+
+def anuidade(
+    premissas: Premissas,
+    x: ArrayLike,
+    n: Optional[ArrayLike] = None,
+    m: ArrayLike = 0,
+    antecipada: bool = True,
+    tamanho_bloco: Optional[int] = None,
+) -> NDArray[float64]:
+    """Valor presente de uma renda unitária paga enquanto a apólice estiver ativa, diferida por m períodos e
+    limitada a n pagamentos.
+
+    Args:
+        premissas (Premissas): Tábua e juros.
+        x (ArrayLike): Idades das apólices, no formato aceito por ``tpx_lote``.
+        n (ArrayLike, optional): Quantidade máxima de pagamentos. Se não for informado, a renda é vitalícia.
+        m (ArrayLike): Diferimento.
+        antecipada (bool): Se True, os pagamentos ocorrem no início de cada período, caso contrário, no fim.
+        tamanho_bloco (int, optional): Quantidade de apólices calculadas de uma vez.
+
+    Returns:
+        NDArray[float64]: Valor presente de cada apólice, ou de cada apólice em cada cenário.
+
+    Examples:
+
+        >>> from tabatu import JurosConstante, Tabua
+        >>> premissas = Premissas(Tabua([0.1, 0.2, 0.4, 0.8, 1.0]), JurosConstante(0.05))
+        >>> anuidade(premissas, [0, 2], n=2)
+        array([1.85714286, 1.57142857])
+        >>> anuidade(premissas, [0, 2], n=2, m=1, antecipada=False)
+        array([1.02623907, 0.10884354])
+    """
+    x, inicio, fim = _preparar(premissas, x, n, m)
+    if not antecipada:
+        inicio, fim = inicio + 1, fim + 1
+    return _soma_descontada(premissas, "tpx", x, inicio, fim, 0, tamanho_bloco)
+
+
+def seguro(
+    premissas: Premissas,
+    x: ArrayLike,
+    n: Optional[ArrayLike] = None,
+    m: ArrayLike = 0,
+    tamanho_bloco: Optional[int] = None,
+) -> NDArray[float64]:
+    """Valor presente de um pagamento unitário no fim do período da falha, caso ela ocorra após m períodos e
+    antes de m + n períodos.
+
+    Args:
+        premissas (Premissas): Tábua e juros.
+        x (ArrayLike): Idades das apólices, no formato aceito por ``t_qx_lote``.
+        n (ArrayLike, optional): Prazo de cobertura. Se não for informado, o seguro é vitalício.
+        m (ArrayLike): Diferimento.
+        tamanho_bloco (int, optional): Quantidade de apólices calculadas de uma vez.
+
+    Returns:
+        NDArray[float64]: Valor presente de cada apólice, ou de cada apólice em cada cenário.
+
+    Examples:
+
+        >>> from tabatu import JurosConstante, Tabua
+        >>> premissas = Premissas(Tabua([0.1, 0.2, 0.4, 0.8, 1.0]), JurosConstante(0.05))
+        >>> seguro(premissas, [0, 2])
+        array([0.85931127, 0.91998704])
+    """
+    x, inicio, fim = _preparar(premissas, x, n, m)
+    return _soma_descontada(premissas, "t_qx", x, inicio, fim, 1, tamanho_bloco)
+
+
+def dotal_puro(premissas: Premissas, x: ArrayLike, n: ArrayLike) -> NDArray[float64]:
+    """Valor presente de um pagamento unitário em n períodos, caso a apólice ainda esteja ativa.
+
+    Args:
+        premissas (Premissas): Tábua e juros.
+        x (ArrayLike): Idades das apólices, no formato aceito por ``tpx_lote``.
+        n (ArrayLike): Prazos.
+
+    Returns:
+        NDArray[float64]: Valor presente de cada apólice, ou de cada apólice em cada cenário.
+
+    Examples:
+
+        >>> from tabatu import JurosConstante, Tabua
+        >>> premissas = Premissas(Tabua([0.1, 0.2, 0.4, 0.8, 1.0]), JurosConstante(0.05))
+        >>> dotal_puro(premissas, [0, 2], 2)
+        array([0.65306122, 0.10884354])
+    """
+    x = asarray(x, dtype=int64)
+    n = _validar_prazo(n, x.shape[0] if x.ndim > 0 else 0, "n").astype(float64)
+    tpx = premissas.tabua.tpx_lote(x, n.reshape(-1, 1))[:, 0]
+    desconto = premissas.juros.taxa_desconto(n)
+    if desconto.ndim == 2:
+        return tpx[:, None] * desconto.T
+    return tpx * desconto
+
+
+def dotal(
+    premissas: Premissas, x: ArrayLike, n: ArrayLike, tamanho_bloco: Optional[int] = None
+) -> NDArray[float64]:
+    """Valor presente de um seguro temporário por n períodos somado ao dotal puro de n períodos.
+
+    Args:
+        premissas (Premissas): Tábua e juros.
+        x (ArrayLike): Idades das apólices, no formato aceito por ``tpx_lote``.
+        n (ArrayLike): Prazos.
+        tamanho_bloco (int, optional): Quantidade de apólices calculadas de uma vez.
+
+    Returns:
+        NDArray[float64]: Valor presente de cada apólice, ou de cada apólice em cada cenário.
+    """
+    return seguro(premissas, x, n, tamanho_bloco=tamanho_bloco) + dotal_puro(premissas, x, n)
@@ -7,6 +7,9 @@ from tabatu.unico_decremento import Tabua
 
 qx_plato = array([0.1, 0.3, 0.5, 0.7, 0.9])
 qx_completo = array([0.1, 0.2, 0.4, 0.8, 1.0])
+qx_seletivo = array(
+    [[0.05, 0.1, 0.2], [0.1, 0.15, 0.3], [0.15, 0.2, 0.5], [0.2, 0.3, 0.8], [0.3, 0.4, 1.0]]
+)
 
 
 @pytest.fixture
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from tabatu import StatusVidasConjuntas
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu import TabuaMultiplasVidas
+from tabatu import TabuaSeletiva
+from tabatu.periodicidade import Periodicidade
+from tests.conftest import qx_completo
+from tests.conftest import qx_plato
+from tests.conftest import qx_seletivo
+
+t = np.arange(20)
+
+
+@pytest.mark.parametrize(
+    "tabua",
+    [
+        Tabua(qx_completo),
+        TabuaMDT(Tabua(qx_completo), Tabua(qx_plato)),
+        TabuaMultiplasVidas(Tabua(qx_completo), Tabua(qx_plato), status=StatusVidasConjuntas.LAST),
+    ],
+)
+def test_tabuas_sao_criadas_uma_unica_vez(tabua):
+    assert isinstance(tabua.tabuas, tuple)
+    assert tabua.tabuas is tabua.tabuas
+
+
+@pytest.mark.parametrize("composta", [TabuaMDT, TabuaMultiplasVidas])
+def test_tabuas_compostas_compartilham_as_taxas(composta):
+    morte, cancelamento = Tabua(qx_completo), Tabua(qx_plato)
+    tabua = composta(morte, cancelamento)
+    for base, original in zip(tabua.tabuas, [morte, cancelamento]):
+        assert np.shares_memory(base.pega_qx(), original.tabuas[0].pega_qx())
+        assert np.shares_memory(base.pega_log_lx(), original.tabuas[0].pega_log_lx())
+
+
+def test_tabuas_seletivas_compartilham_a_selecao():
+    seletiva = TabuaSeletiva(qx_seletivo)
+    base, _ = TabuaMDT(seletiva, Tabua(qx_plato)).tabuas
+    assert np.shares_memory(base.pega_qx_selecao(), seletiva.tabuas[0].pega_qx_selecao())
+    assert np.shares_memory(base.pega_log_lx_selecao(), seletiva.tabuas[0].pega_log_lx_selecao())
+
+
+def test_tabuas_preservam_a_periodicidade():
+    tabua = TabuaMDT(*[Tabua(qx).alterar_periodicidade(Periodicidade.MENSAL) for qx in [qx_completo, qx_plato]])
+    assert [base.periodicidade for base in tabua.tabuas] == [Periodicidade.MENSAL] * 2
+
+
+def test_tabuas_compostas_sobrevivem_as_tabuas_originais():
+    tabuas = [Tabua(qx).alterar_periodicidade(Periodicidade.MENSAL) for qx in [qx_completo, qx_plato]]
+    esperado = TabuaMDT(*tabuas).tpx([30, 2], t)
+    tabua = TabuaMDT(*tabuas)
+    del tabuas
+    assert_array_equal(tabua.tpx([30, 2], t), esperado)
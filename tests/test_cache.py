@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import tabatu.cache as cache_modulo
+from tabatu import HipoteseFracionaria
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu import TabuaSeletiva
+from tabatu import agravar_qx
+from tabatu.cache import CacheTabuas
+from tabatu.cache import EstatisticasCache
+from tabatu.cache import derivar_tabua
+from tabatu.periodicidade import Periodicidade
+from tests.conftest import qx_completo
+from tests.conftest import qx_plato
+from tests.conftest import qx_seletivo
+
+t = np.arange(60)
+
+
+@pytest.fixture
+def cache():
+    return CacheTabuas()
+
+
+def test_tabua_derivada_eh_igual_a_tabua_agravada_com_periodicidade_alterada(cache):
+    derivada = derivar_tabua(Tabua(qx_plato), 150, Periodicidade.MENSAL, cache=cache)
+    esperado = Tabua(agravar_qx(qx_plato, 150)).alterar_periodicidade(Periodicidade.MENSAL)
+    assert derivada.periodicidade == Periodicidade.MENSAL
+    assert_array_equal(derivada.tpx([5], t), esperado.tpx([5], t))
+
+
+def test_tabua_derivada_preserva_a_hipotese_fracionaria(cache):
+    tabua = Tabua(qx_plato, hipotese_fracionaria=HipoteseFracionaria.UDD)
+    assert derivar_tabua(tabua, 120, cache=cache).hipotese_fracionaria == HipoteseFracionaria.UDD
+
+
+def test_tabuas_com_o_mesmo_conteudo_compartilham_a_tabua_derivada(cache):
+    primeira = derivar_tabua(Tabua(qx_plato), 150, Periodicidade.MENSAL, cache=cache)
+    segunda = derivar_tabua(Tabua(qx_plato.copy()), 150, Periodicidade.MENSAL, cache=cache)
+    assert primeira is segunda
+    assert cache.estatisticas() == EstatisticasCache(acertos=1, falhas=1, descartes=0, entradas=1, memoria=168)
+
+
+@pytest.mark.parametrize(
+    "argumentos",
+    [
+        (Tabua(qx_completo), 150, Periodicidade.MENSAL),
+        (Tabua(qx_plato), 120, Periodicidade.MENSAL),
+        (Tabua(qx_plato), 150, Periodicidade.ANUAL),
+        (Tabua(qx_plato, Periodicidade.MENSAL), 150, Periodicidade.MENSAL),
+        (Tabua(qx_plato, hipotese_fracionaria=HipoteseFracionaria.UDD), 150, Periodicidade.MENSAL),
+    ],
+)
+def test_chaves_diferentes_geram_tabuas_diferentes(cache, argumentos):
+    primeira = derivar_tabua(Tabua(qx_plato), 150, Periodicidade.MENSAL, cache=cache)
+    assert derivar_tabua(*argumentos, cache=cache) is not primeira
+    assert cache.estatisticas().falhas == 2
+
+
+def test_tabua_usada_ha_mais_tempo_eh_descartada():
+    cache = CacheTabuas(tamanho_maximo=2)
+    tabua = Tabua(qx_plato)
+    anual = derivar_tabua(tabua, 100, cache=cache)
+    derivar_tabua(tabua, 110, cache=cache)
+    assert derivar_tabua(tabua, 100, cache=cache) is anual
+    derivar_tabua(tabua, 120, cache=cache)
+    assert derivar_tabua(tabua, 100, cache=cache) is anual
+    assert cache.estatisticas() == EstatisticasCache(acertos=2, falhas=3, descartes=1, entradas=2, memoria=176)
+
+
+def test_limite_de_memoria():
+    cache = CacheTabuas(memoria_maxima=100)
+    tabua = Tabua(qx_plato)
+    derivar_tabua(tabua, 100, Periodicidade.MENSAL, cache=cache)
+    assert cache.estatisticas().entradas == 0
+    derivar_tabua(tabua, 100, cache=cache)
+    derivar_tabua(tabua, 110, cache=cache)
+    assert cache.estatisticas() == EstatisticasCache(acertos=0, falhas=3, descartes=1, entradas=1, memoria=88)
+
+
+def test_configurar_descarta_tabuas_e_limpar_zera_as_estatisticas(cache):
+    for agravo in [100, 110, 120]:
+        derivar_tabua(Tabua(qx_plato), agravo, cache=cache)
+    cache.configurar(tamanho_maximo=1)
+    assert cache.tamanho_maximo == 1
+    assert cache.estatisticas().entradas == 1
+    cache.limpar()
+    assert cache.estatisticas() == EstatisticasCache(acertos=0, falhas=0, descartes=0, entradas=0, memoria=0)
+
+
+@pytest.mark.parametrize("limites", [{"tamanho_maximo": -1}, {"memoria_maxima": -1}])
+def test_limites_negativos_retornam_erro(limites):
+    with pytest.raises(ValueError):
+        CacheTabuas(**limites)
+
+
+def test_cache_default(monkeypatch):
+    monkeypatch.setattr(cache_modulo, "CACHE_TABUAS", CacheTabuas())
+    derivar_tabua(Tabua(qx_plato), 150)
+    derivar_tabua(Tabua(qx_plato), 150)
+    assert cache_modulo.CACHE_TABUAS.estatisticas().acertos == 1
+
+
+@pytest.mark.parametrize("tabua", [TabuaMDT(Tabua(qx_plato), Tabua(qx_completo)), TabuaSeletiva(qx_seletivo)])
+def test_apenas_tabuas_de_unico_decremento_podem_ser_derivadas(cache, tabua):
+    with pytest.raises(ValueError):
+        derivar_tabua(tabua, 150, cache=cache)
@@ -0,0 +1,106 @@
+import pytest
+from numpy import arange
+from numpy import array
+from numpy.testing import assert_allclose
+from numpy.testing import assert_array_equal
+
+from tabatu import JurosConstante
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu.comutacao import Comutacao
+from tests.conftest import qx_completo
+from tests.conftest import qx_plato
+
+TAXA = 0.05
+V = 1 / (1 + TAXA)
+
+
+@pytest.fixture
+def comutacao():
+    return Comutacao(Tabua(qx_completo), JurosConstante(TAXA))
+
+
+def _lx(qx):
+    lx = [1.0]
+    for q in qx:
+        lx.append(lx[-1] * (1 - q))
+    return array(lx)
+
+
+def _fatores_por_definicao(x, n):
+    """Fatores calculados diretamente pela soma dos fluxos descontados."""
+    lx = _lx(qx_completo)
+    l = lambda idade: lx[min(idade, len(qx_completo))]
+    anuidade = sum(V**k * l(x + k) for k in range(n)) / l(x)
+    seguro = sum(V ** (k + 1) * (l(x + k) - l(x + k + 1)) for k in range(n)) / l(x)
+    anuidade_crescente = sum((k + 1) * V**k * l(x + k) for k in range(n)) / l(x)
+    seguro_crescente = sum((k + 1) * V ** (k + 1) * (l(x + k) - l(x + k + 1)) for k in range(n)) / l(x)
+    dotal_puro = V**n * l(x + n) / l(x)
+    return anuidade, seguro, anuidade_crescente, seguro_crescente, dotal_puro
+
+
+@pytest.mark.parametrize("x", range(5))
+@pytest.mark.parametrize("n", range(8))
+def test_fatores_sao_iguais_a_soma_dos_fluxos_descontados(comutacao, x, n):
+    obtido = [
+        comutacao.anuidade(x, n),
+        comutacao.seguro(x, n),
+        comutacao.anuidade_crescente(x, n),
+        comutacao.seguro_crescente(x, n),
+        comutacao.dotal_puro(x, n),
+    ]
+    assert_allclose(array(obtido).ravel(), _fatores_por_definicao(x, n))
+
+
+def test_dotal_eh_a_soma_do_seguro_temporario_e_do_dotal_puro(comutacao):
+    x, n = arange(5), arange(5)
+    assert_array_equal(comutacao.dotal(x, n), comutacao.seguro(x, n) + comutacao.dotal_puro(x, n))
+
+
+def test_seguro_vitalicio_e_anuidade_vitalicia_satisfazem_a_relacao_usual(comutacao):
+    d = TAXA / (1 + TAXA)
+    x = arange(5)
+    assert_allclose(comutacao.seguro(x) + d * comutacao.anuidade(x), 1)
+
+
+def test_anuidade_postecipada_eh_a_antecipada_menos_o_primeiro_pagamento(comutacao):
+    x = arange(5)
+    assert_allclose(
+        comutacao.anuidade(x, 3, antecipada=False),
+        comutacao.anuidade(x, 4) - 1,
+    )
+
+
+def test_fatores_sao_zero_quando_a_idade_eh_superior_ao_fim_da_tabua(comutacao):
+    assert_array_equal(comutacao.anuidade([5, 10]), [0, 0])
+    assert_array_equal(comutacao.seguro([5, 10], 3), [0, 0])
+
+
+def test_colunas_sao_somente_leitura(comutacao):
+    with pytest.raises(ValueError):
+        comutacao.Dx[0] = 0
+
+
+def test_colunas_terminam_com_zero(comutacao):
+    for coluna in [comutacao.Dx, comutacao.Nx, comutacao.Sx, comutacao.Cx, comutacao.Mx, comutacao.Rx]:
+        assert len(coluna) == len(qx_completo) + 1
+        assert coluna[-1] == 0
+
+
+def test_cx_considera_apenas_a_causa_principal_da_tabua_mdt():
+    tabua = TabuaMDT(morte=Tabua(qx_completo), cancelamento=Tabua(qx_completo), causa_principal="morte")
+    comutacao = Comutacao(tabua, JurosConstante(TAXA))
+    idades = arange(len(qx_completo), dtype=float)
+    esperado = V ** (idades + 1) * tabua.t_qx_j([0, 0], idades, ["morte"])[0]
+    assert_allclose(comutacao.Cx[:-1], esperado)
+
+
+def test_comutacao_retorna_erro_quando_a_tabua_eh_plato():
+    with pytest.raises(ValueError):
+        Comutacao(Tabua(qx_plato), JurosConstante(TAXA))
+
+
+@pytest.mark.parametrize("x, n", [(-1, 1), (1, -1)])
+def test_fatores_retornam_erro_quando_idade_ou_prazo_sao_negativos(comutacao, x, n):
+    with pytest.raises(ValueError):
+        comutacao.anuidade(x, n)
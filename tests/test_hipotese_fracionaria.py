@@ -0,0 +1,131 @@
+import pickle
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from numpy.testing import assert_array_equal
+
+from tabatu import HipoteseFracionaria
+from tabatu import StatusVidasConjuntas
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu import TabuaMultiplasVidas
+from tabatu import TabuaSeletiva
+from tabatu.periodicidade import Periodicidade
+from tabatu.serializacao import de_bytes
+from tabatu.serializacao import para_bytes
+from tests.conftest import qx_completo
+from tests.conftest import qx_plato
+from tests.conftest import qx_seletivo
+
+qx = (np.arange(100) + 1) / 100
+hipoteses = list(HipoteseFracionaria)
+
+
+def test_sem_hipotese_o_tempo_eh_truncado():
+    tabua = Tabua(qx)
+    assert_array_equal(tabua.tpx([30], [2.5, 2.75]), tabua.tpx([30], [2, 2]))
+    assert_array_equal(tabua.qx([30], [2.5]), tabua.qx([30], [2]))
+
+
+@pytest.mark.parametrize("hipotese", hipoteses)
+def test_tempos_inteiros_nao_dependem_da_hipotese(hipotese):
+    t = np.arange(10)
+    assert_array_equal(Tabua(qx, hipotese_fracionaria=hipotese).tpx([30], t), Tabua(qx).tpx([30], t))
+    assert_array_equal(Tabua(qx, hipotese_fracionaria=hipotese).qx([30], t), Tabua(qx).qx([30], t))
+
+
+@pytest.mark.parametrize(
+    "hipotese, sobrevivencia",
+    [
+        (HipoteseFracionaria.UDD, lambda s, q: 1 - s * q),
+        (HipoteseFracionaria.FORCA_CONSTANTE, lambda s, q: (1 - q) ** s),
+        (HipoteseFracionaria.BALDUCCI, lambda s, q: (1 - q) / (1 - (1 - s) * q)),
+    ],
+)
+def test_tpx_fracionado_segue_a_hipotese(hipotese, sobrevivencia):
+    tabua = Tabua(qx, hipotese_fracionaria=hipotese)
+    s = np.array([0.25, 0.5, 0.75])
+    esperado = Tabua(qx).tpx([30], [2])[0] * sobrevivencia(s, qx[32])
+    assert_allclose(tabua.tpx([30], 2 + s), esperado, rtol=1e-14)
+
+
+def test_forca_constante_eh_igual_a_tabua_mensal():
+    t = np.arange(60)
+    tabua_mensal = Tabua(qx).alterar_periodicidade(Periodicidade.MENSAL)
+    tabua = Tabua(qx, hipotese_fracionaria=HipoteseFracionaria.FORCA_CONSTANTE)
+    assert_allclose(tabua.tpx([30], t / 12), tabua_mensal.tpx([360], t), rtol=1e-13)
+
+
+@pytest.mark.parametrize("hipotese", hipoteses[1:])
+def test_qx_e_t_qx_fracionados_sao_consistentes_com_tpx(hipotese):
+    tabua = Tabua(qx, hipotese_fracionaria=hipotese)
+    t = np.array([0.5, 1.25, 3.75])
+    tpx = tabua.tpx([30], t)
+    assert_allclose(tabua.qx([30], t), 1 - tabua.tpx([30], t + 1) / tpx, rtol=1e-14)
+    assert_allclose(tabua.t_qx([30], t), tpx - tabua.tpx([30], t + 1), rtol=1e-12, atol=1e-16)
+
+
+@pytest.mark.parametrize("hipotese", hipoteses[1:])
+def test_metodos_em_lote_aceitam_tempos_fracionados(hipotese):
+    tabua = Tabua(qx, hipotese_fracionaria=hipotese)
+    t = np.arange(24) / 12
+    assert_array_equal(tabua.tpx_lote([30, 50], t), [tabua.tpx([30], t), tabua.tpx([50], t)])
+
+
+@pytest.mark.parametrize("hipotese", hipoteses[1:])
+def test_tpx_fracionado_apos_o_fim_da_tabua(hipotese):
+    tabua = Tabua(qx_plato, hipotese_fracionaria=hipotese)
+    assert 0 < tabua.tpx([4], [10.5])[0] < tabua.tpx([4], [10])[0]
+    assert_array_equal(Tabua(qx_completo, hipotese_fracionaria=hipotese).tpx([0], [5.5]), [0.0])
+
+
+def test_tabua_seletiva_com_hipotese():
+    tabua = TabuaSeletiva(qx_seletivo, hipotese_fracionaria=HipoteseFracionaria.UDD)
+    assert_allclose(tabua.tpx([1], [0.5, 2.5]), [1 - 0.5 * 0.1, 0.9 * 0.85 * (1 - 0.5 * 0.3)], rtol=1e-14)
+
+
+def test_tabua_mdt_usa_a_hipotese_de_cada_decremento():
+    udd = Tabua(qx_completo, hipotese_fracionaria=HipoteseFracionaria.UDD)
+    tabua = TabuaMDT(udd, Tabua(qx_plato))
+    assert_allclose(tabua.tpx([1, 1], [1.5]), udd.tpx([1], [1.5]) * Tabua(qx_plato).tpx([1], [1]), rtol=1e-14)
+
+
+def test_tabua_multiplas_vidas_last_com_hipotese():
+    udd = Tabua(qx, hipotese_fracionaria=HipoteseFracionaria.UDD)
+    tabua = TabuaMultiplasVidas(udd, udd, status=StatusVidasConjuntas.LAST)
+    falha = (1 - udd.tpx([30], [1.5]) / udd.tpx([30], [1])) * (1 - udd.tpx([40], [1.5]) / udd.tpx([40], [1]))
+    assert_allclose(tabua.tpx([30, 40], [1.5]), tabua.tpx([30, 40], [1]) * (1 - falha), rtol=1e-14)
+    assert_array_equal(tabua.tpx_lote([[30, 40]], [1.5]), [tabua.tpx([30, 40], [1.5])])
+
+
+def test_tabua_multiplas_vidas_last_sem_hipotese_trunca_o_tempo():
+    tabua = TabuaMultiplasVidas(Tabua(qx), Tabua(qx), status=StatusVidasConjuntas.LAST)
+    assert_array_equal(tabua.tpx([30, 40], [1.5, 2.5]), tabua.tpx([30, 40], [1, 2]))
+
+
+def test_hipotese_invalida_retorna_erro():
+    with pytest.raises(ValueError):
+        Tabua(qx, hipotese_fracionaria="LINEAR")
+
+
+@pytest.mark.parametrize("hipotese", hipoteses)
+def test_hipotese_eh_preservada(hipotese):
+    tabua = Tabua(qx, hipotese_fracionaria=hipotese)
+    assert tabua.hipotese_fracionaria == hipotese
+    assert pickle.loads(pickle.dumps(tabua)).hipotese_fracionaria == hipotese
+    assert de_bytes(para_bytes(tabua)).hipotese_fracionaria == hipotese
+    assert tabua.tabuas[0].hipotese_fracionaria == hipotese
+    assert tabua.alterar_periodicidade(Periodicidade.MENSAL).hipotese_fracionaria == hipotese
+
+
+def test_hipoteses_sao_preservadas_em_tabuas_com_mais_de_um_componente():
+    udd = Tabua(qx_completo, hipotese_fracionaria=HipoteseFracionaria.UDD)
+    balducci = Tabua(qx_plato, hipotese_fracionaria=HipoteseFracionaria.BALDUCCI)
+    for tabua in [TabuaMDT(udd, balducci), TabuaMultiplasVidas(udd, balducci)]:
+        for nova in [pickle.loads(pickle.dumps(tabua)), de_bytes(para_bytes(tabua))]:
+            assert [base.hipotese_fracionaria for base in nova.tabuas] == [
+                HipoteseFracionaria.UDD,
+                HipoteseFracionaria.BALDUCCI,
+            ]
+            assert_array_equal(nova.tpx([1, 2], [0.5, 1.5]), tabua.tpx([1, 2], [0.5, 1.5]))
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from numpy.testing import assert_array_equal
 
 from tabatu import JurosConstante
@@ -41,4 +42,45 @@ class TestJurosConstante:
     def test_alteracao_periodicidade(self):
         juros_mensal = self.juros.alterar_periodicidade(Periodicidade["MENSAL"])
         assert juros_mensal.periodicidade == Periodicidade.MENSAL
-        assert juros_mensal.taxa_juros([0]) == self.juros2.taxa_juros([0])
\ No newline at end of file
+        assert juros_mensal.taxa_juros([0]) == self.juros2.taxa_juros([0])
+
+    def test_taxa_desconto_escreve_no_array_out_quando_fornecido(self):
+        out = np.empty(10)
+        resultado = self.juros.taxa_desconto(np.arange(10), out=out)
+        assert resultado is out
+        assert_array_equal(out, self.juros.taxa_desconto(np.arange(10)))
+
+
+class TestDescontoSemPow:
+    taxa_diaria = alterar_periodicidade_juros(0.06, Periodicidade.ANUAL, Periodicidade.DIARIA)
+
+    def test_desconto_em_grade_diaria_longa_eh_igual_ao_calculado_com_pow(self):
+        t = np.arange(365 * 40, dtype=float)
+        juros = JurosConstante(self.taxa_diaria, Periodicidade.DIARIA)
+        np.testing.assert_allclose(juros.taxa_desconto(t), (1 + self.taxa_diaria) ** -t, rtol=1e-13)
+
+    @pytest.mark.parametrize(
+        "t",
+        [
+            np.arange(0, 50, 0.5),
+            np.array([3.0, 4.0, 5.0, 10.0, 11.0, 2.5, 3.5, 0.0]),
+            np.arange(1000, 0, -1, dtype=float),
+        ],
+    )
+    def test_desconto_em_tempos_quaisquer_eh_igual_ao_calculado_com_pow(self, t):
+        np.testing.assert_allclose(JurosConstante(0.05).taxa_desconto(t), 1.05**-t, rtol=1e-13)
+
+    def test_vetor_desconto_eh_igual_a_taxa_desconto(self):
+        juros = JurosConstante(0.05)
+        assert_array_equal(juros.vetor_desconto(30), juros.taxa_desconto(np.arange(30)))
+
+    def test_vetor_desconto_reaproveita_o_vetor_calculado(self):
+        assert JurosConstante(0.05).vetor_desconto(30) is JurosConstante(0.05).vetor_desconto(30)
+
+    def test_vetor_desconto_eh_somente_leitura(self):
+        with pytest.raises(ValueError):
+            JurosConstante(0.05).vetor_desconto(3)[0] = 0
+
+    def test_vetor_desconto_retorna_erro_quando_horizonte_eh_negativo(self):
+        with pytest.raises(ValueError):
+            JurosConstante(0.05).vetor_desconto(-1)
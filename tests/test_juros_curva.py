@@ -0,0 +1,105 @@
+import pickle
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from numpy.testing import assert_array_equal
+
+from tabatu import JurosConstante
+from tabatu import JurosCurva
+from tabatu import Tabua
+from tabatu.comutacao import Comutacao
+from tabatu.periodicidade import Periodicidade
+from tabatu.premissas import Premissas
+from tabatu.valor_presente import anuidade
+
+
+class TestJurosCurva:
+    juros = JurosCurva([0.10, 0.05, 0.02])
+
+    def test_taxa_juros_repete_a_ultima_taxa_apos_o_fim_da_curva(self):
+        assert_array_equal(self.juros.taxa_juros([0, 1, 2, 3, 10]), [0.10, 0.05, 0.02, 0.02, 0.02])
+
+    def test_taxa_desconto_eh_o_produto_dos_descontos_de_cada_periodo(self):
+        esperado = np.cumprod([1, 1 / 1.10, 1 / 1.05, 1 / 1.02, 1 / 1.02])
+        assert_allclose(self.juros.taxa_desconto([0, 1, 2, 3, 4]), esperado, rtol=1e-15)
+
+    def test_taxa_desconto_em_tempos_fracionados_usa_a_taxa_do_periodo(self):
+        assert_allclose(self.juros.taxa_desconto([1.5]), [1.05**-0.5 / 1.10], rtol=1e-15)
+
+    def test_curva_com_taxas_iguais_eh_igual_ao_juros_constante(self):
+        t = np.arange(50.0)
+        assert_allclose(
+            JurosCurva(np.repeat(0.04, 20)).taxa_desconto(t),
+            JurosConstante(0.04).taxa_desconto(t),
+            rtol=1e-13,
+        )
+
+    def test_from_taxas_spot_reproduz_os_descontos_das_taxas_spot(self):
+        spot = np.array([0.10, 0.08, 0.07, 0.065])
+        juros = JurosCurva.from_taxas_spot(spot)
+        prazos = np.arange(1, 5)
+        assert_allclose(juros.taxa_desconto(prazos), (1 + spot) ** -prazos.astype(float), rtol=1e-14)
+
+    def test_from_svensson_com_apenas_o_nivel_gera_taxa_constante(self):
+        juros = JurosCurva.from_svensson(0.05, 0.0, 0.0, 0.0, 1.5, 0.5, prazo=30)
+        assert_allclose(juros.taxa_juros(np.arange(30)), np.expm1(0.05), rtol=1e-12)
+
+    def test_from_svensson_usa_tempo_em_anos_para_periodicidade_mensal(self):
+        parametros = 0.05, -0.02, 0.01, 0.005, 1.2, 0.3
+        anual = JurosCurva.from_svensson(*parametros, prazo=10)
+        mensal = JurosCurva.from_svensson(*parametros, prazo=120, periodicidade=Periodicidade.MENSAL)
+        assert_allclose(mensal.taxa_desconto(np.arange(0, 121, 12)), anual.taxa_desconto(np.arange(11)), rtol=1e-13)
+
+    def test_alterar_periodicidade_preserva_os_descontos(self):
+        mensal = self.juros.alterar_periodicidade(Periodicidade.MENSAL)
+        assert mensal.periodicidade == Periodicidade.MENSAL
+        assert_allclose(mensal.taxa_desconto(np.arange(0, 61, 12)), self.juros.taxa_desconto(np.arange(6)), rtol=1e-14)
+        anual = mensal.alterar_periodicidade(Periodicidade.ANUAL)
+        assert_allclose(anual.taxa_juros(np.arange(4)), self.juros.taxa_juros(np.arange(4)), rtol=1e-12)
+
+    def test_pickle_preserva_a_curva(self):
+        juros = pickle.loads(pickle.dumps(JurosCurva([0.1, 0.2], Periodicidade.MENSAL)))
+        assert juros.periodicidade == Periodicidade.MENSAL
+        assert_array_equal(juros.taxa_juros([0, 1]), [0.1, 0.2])
+
+    def test_pega_taxas_juros_retorna_visao_somente_leitura(self):
+        taxas = self.juros.pega_taxas_juros()
+        assert_array_equal(taxas, [0.10, 0.05, 0.02])
+        with pytest.raises(ValueError):
+            taxas[0] = 0
+
+    @pytest.mark.parametrize("taxas", [[], [0.1, -1.0]])
+    def test_curva_retorna_erro_quando_as_taxas_sao_invalidas(self, taxas):
+        with pytest.raises(ValueError):
+            JurosCurva(taxas)
+
+    def test_taxa_desconto_retorna_erro_quando_t_eh_negativo(self):
+        with pytest.raises(ValueError):
+            self.juros.taxa_desconto([-1])
+
+    def test_taxa_desconto_escreve_no_array_out_quando_fornecido(self):
+        out = np.empty(3)
+        assert self.juros.taxa_desconto([0, 1, 2], out=out) is out
+
+
+def test_premissas_com_juros_curva_precisam_ter_a_mesma_periodicidade():
+    with pytest.raises(ValueError):
+        Premissas(Tabua([0.1, 0.5, 1.0]), JurosCurva([0.1], Periodicidade.MENSAL))
+
+
+def test_premissas_com_juros_curva_alteram_a_periodicidade_em_conjunto():
+    premissas = Premissas(Tabua([0.1, 0.5, 1.0]), JurosCurva([0.1, 0.05]))
+    nova = premissas.alterar_periodicidade(Periodicidade.MENSAL)
+    assert nova.juros.periodicidade == Periodicidade.MENSAL
+    assert_allclose(nova.juros.taxa_desconto([24]), premissas.juros.taxa_desconto([2]), rtol=1e-14)
+
+
+def test_valor_presente_desconta_pelo_tempo_decorrido_com_juros_curva():
+    premissas = Premissas(Tabua([0.1, 0.5, 1.0]), JurosCurva([0.10, 0.05]))
+    assert_allclose(anuidade(premissas, [1], 2), [1 + 0.5 / 1.10])
+
+
+def test_comutacao_retorna_erro_com_juros_curva():
+    with pytest.raises(ValueError):
+        Comutacao(Tabua([0.1, 0.5, 1.0]), JurosCurva([0.1]))
@@ -0,0 +1,104 @@
+import pickle
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from numpy.testing import assert_array_equal
+
+from tabatu import JurosConstante
+from tabatu import JurosCurva
+from tabatu import JurosEstocastico
+from tabatu import Tabua
+from tabatu.comutacao import Comutacao
+from tabatu.periodicidade import Periodicidade
+from tabatu.premissas import Premissas
+from tabatu.valor_presente import anuidade
+from tabatu.valor_presente import dotal
+from tabatu.valor_presente import dotal_puro
+from tabatu.valor_presente import seguro
+
+taxas = np.array([[0.10, 0.05, 0.02], [0.03, 0.03, 0.03], [0.01, 0.06, 0.04]])
+qx = (np.arange(100) + 1) / 100
+
+
+class TestJurosEstocastico:
+    juros = JurosEstocastico(taxas)
+
+    def test_cada_cenario_eh_igual_a_curva_de_juros_com_as_mesmas_taxas(self):
+        t = np.array([0, 0.5, 1, 2.25, 3, 7.5])
+        for s, cenario in enumerate(taxas):
+            curva = JurosCurva(cenario)
+            assert_allclose(self.juros.taxa_desconto(t)[s], curva.taxa_desconto(t), rtol=1e-14)
+            assert_array_equal(self.juros.taxa_juros(t)[s], curva.taxa_juros(t))
+
+    def test_retorna_uma_linha_por_cenario(self):
+        assert self.juros.quantidade_cenarios == 3
+        assert self.juros.taxa_desconto(np.arange(10)).shape == (3, 10)
+        assert self.juros.taxa_juros(np.arange(10)).shape == (3, 10)
+
+    def test_taxa_desconto_escreve_no_array_out_quando_fornecido(self):
+        out = np.empty((3, 4))
+        assert self.juros.taxa_desconto(np.arange(4), out=out) is out
+        assert_array_equal(out, self.juros.taxa_desconto(np.arange(4)))
+
+    def test_retorna_erro_quando_t_eh_negativo(self):
+        with pytest.raises(ValueError):
+            self.juros.taxa_desconto([-1])
+
+    @pytest.mark.parametrize("taxas_invalidas", [[0.1, 0.2], np.empty((0, 3)), [[0.1, -1.0]]])
+    def test_retorna_erro_quando_as_taxas_sao_invalidas(self, taxas_invalidas):
+        with pytest.raises(ValueError):
+            JurosEstocastico(taxas_invalidas)
+
+    def test_from_npy_mapeia_o_arquivo_em_memoria(self, tmp_path):
+        caminho = tmp_path / "cenarios.npy"
+        np.save(caminho, taxas)
+        juros = JurosEstocastico.from_npy(caminho, Periodicidade.MENSAL)
+        assert not juros.pega_taxas_juros().flags.owndata
+        assert juros.periodicidade == Periodicidade.MENSAL
+        assert_array_equal(juros.taxa_desconto(np.arange(5)), self.juros.taxa_desconto(np.arange(5)))
+
+    def test_alterar_periodicidade_preserva_os_descontos(self):
+        mensal = self.juros.alterar_periodicidade(Periodicidade.MENSAL)
+        assert mensal.periodicidade == Periodicidade.MENSAL
+        assert_allclose(mensal.taxa_desconto(np.arange(0, 49, 12)), self.juros.taxa_desconto(np.arange(5)), rtol=1e-14)
+
+    def test_pickle_preserva_o_juros(self):
+        novo = pickle.loads(pickle.dumps(self.juros))
+        assert_array_equal(novo.taxa_desconto(np.arange(5)), self.juros.taxa_desconto(np.arange(5)))
+
+    def test_comutacao_retorna_erro_com_juros_estocastico(self):
+        with pytest.raises(ValueError):
+            Comutacao(Tabua(qx), self.juros)
+
+
+@pytest.mark.parametrize(
+    "calcular",
+    [
+        lambda p, x: anuidade(p, x),
+        lambda p, x: anuidade(p, x, n=5, m=2, antecipada=False),
+        lambda p, x: seguro(p, x, n=10, tamanho_bloco=3),
+        lambda p, x: dotal_puro(p, x, 7),
+        lambda p, x: dotal(p, x, 7),
+    ],
+)
+def test_valor_presente_de_cada_cenario_eh_igual_ao_calculado_com_a_curva_do_cenario(calcular):
+    rng = np.random.default_rng(0)
+    cenarios = rng.uniform(0.0, 0.1, (20, 30))
+    x = np.arange(0, 100, 9)
+    resultado = calcular(Premissas(Tabua(qx), JurosEstocastico(cenarios)), x)
+    assert resultado.shape == (len(x), 20)
+    for s, cenario in enumerate(cenarios):
+        assert_allclose(resultado[:, s], calcular(Premissas(Tabua(qx), JurosCurva(cenario)), x), rtol=1e-12)
+
+
+def test_valor_presente_com_cenarios_iguais_ao_juros_constante():
+    x = np.arange(0, 100, 11)
+    estocastico = Premissas(Tabua(qx), JurosEstocastico(np.full((2, 150), 0.04)))
+    constante = Premissas(Tabua(qx), JurosConstante(0.04))
+    assert_allclose(seguro(estocastico, x), np.column_stack([seguro(constante, x)] * 2), rtol=1e-12)
+
+
+def test_valor_presente_de_carteira_vazia_com_juros_estocastico():
+    premissas = Premissas(Tabua(qx), JurosEstocastico(taxas))
+    assert anuidade(premissas, np.empty(0, dtype=np.int64)).shape == (0, 3)
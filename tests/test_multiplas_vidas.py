@@ -1,13 +1,14 @@
 from unittest.mock import Mock, call
 
 import pytest
-from numpy import cumprod
+from numpy import arange, cumprod, repeat
 from numpy.testing import assert_array_equal
 
 import tabatu.multiplas_vidas as tabuas_mvd_modulo
 import tabatu.tabua_base as tabua_base_modulo
 from tabatu.multiplas_vidas import StatusVidasConjuntas, TabuaMultiplasVidas
 from tabatu.periodicidade import Periodicidade
+from tabatu.unico_decremento import Tabua
 
 
 def test_tpx_retorna_produto_acumulado_de_um_menos_qx(tabua_1dt_1, tabua_1dt_2):
@@ -20,6 +21,19 @@ def test_tpx_retorna_produto_acumulado_de_um_menos_qx(tabua_1dt_1, tabua_1dt_2):
     )
 
 
+def test_tpx_e_t_qx_vetoriais_sao_iguais_as_chamadas_escalares_quando_status_eh_last():
+    qx = 1 - (1 - (arange(120) + 1) / 121) ** (1 / 12)
+    tabua = TabuaMultiplasVidas(
+        Tabua(repeat(qx, 12)), Tabua(repeat(qx, 12)), status=StatusVidasConjuntas.LAST
+    )
+    t = arange(1200)[::-1]
+    tpx = tabua.tpx([360, 300], t)
+    t_qx = tabua.t_qx([360, 300], t)
+    for i in [0, 1, 600, 1199]:
+        assert tpx[i] == tabua.tpx([360, 300], [t[i]])[0]
+        assert t_qx[i] == tabua.t_qx([360, 300], [t[i]])[0]
+
+
 def test_qx_retorna_o_produto_de_qx_de_cada_tabua_quando_status_eh_last(
     tabua_1dt_1, tabua_1dt_2
 ):
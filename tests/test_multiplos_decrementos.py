@@ -1,11 +1,13 @@
 from unittest.mock import Mock, call
 
+import numpy as np
 import pytest
 from numpy import array
-from numpy.testing import assert_array_almost_equal, assert_array_equal
+from numpy.testing import assert_allclose, assert_array_almost_equal, assert_array_equal
 
 import tabatu.multiplos_decrementos as tabuas_mdt_modulo
 import tabatu.tabua_base as tabua_base_modulo
+from tabatu import Tabua
 from tabatu import TabuaMDT
 from tabatu.multiplos_decrementos import captura_argumentos, valida_quantidade_tabuas
 from tabatu.periodicidade import Periodicidade
@@ -26,9 +28,9 @@ class TestCapturaArgumentos:
 
 
 class TestValidaQuantidadeDeTabuas:
-    def test_quando_existem_mais_que_3_tabuas_deve_falhar(self):
-        with pytest.raises(ValueError):
-            valida_quantidade_tabuas(Mock(), Mock(), Mock(), Mock())
+    def test_quando_existem_mais_que_3_tabuas_deve_retornar_tupla_com_elas(self):
+        args = (Mock(), Mock(), Mock(), Mock(), Mock())
+        assert valida_quantidade_tabuas(*args) == args
 
     def test_quando_nao_existem_tabuas_deve_falhar(self):
         with pytest.raises(ValueError):
@@ -52,6 +54,19 @@ class TestTabuaMDT:
         with pytest.raises(ValueError):
             TabuaMDT(tabua_1dt_1, morte=tabua_1dt_2, causa_principal="invalidez")
 
+    def test_probabilidades_eh_igual_aos_metodos_calculados_separadamente(self, tabua_mdt):
+        x, t = [1, 0], [0, 1, 2, 3, 10]
+        resultado = tabua_mdt.probabilidades(x, t)
+        assert resultado.shape == (6, 5)
+        assert_array_equal(resultado[0:2], tabua_mdt.qx_j(x, t, [0, 1]))
+        assert_array_equal(resultado[2], tabua_mdt.qx(x, t))
+        assert_array_equal(resultado[3], tabua_mdt.tpx(x, t))
+        assert_array_equal(resultado[4:6], tabua_mdt.t_qx_j(x, t, [0, 1]))
+
+    def test_qx_j_falha_quando_a_causa_nao_existe(self, tabua_mdt):
+        with pytest.raises(IndexError):
+            tabua_mdt.qx_j([1, 0], [0, 1], [2])
+
     def test_tpx_eh_o_produto_dos_tpxs_de_cada_tabua(self, tabua_mdt):
         assert tabua_mdt.numero_decrementos == 2
 
@@ -159,3 +174,66 @@ def test_alterar_periodicidade_chama_alterar_periodicidade_da_tabua_base_e_gera_
     assert isinstance(nova_tabua, TabuaMDT)
     assert nova_tabua.causas == tabua.causas
     assert nova_tabua.causa_principal == tabua.causa_principal
+
+
+class TestTabuaMDTComMaisDeTresDecrementos:
+    qx = [
+        (np.arange(100) + 1) / 100,
+        np.repeat(0.01, 100),
+        np.linspace(0.001, 0.3, 100),
+        np.linspace(0.2, 0.05, 100),
+        np.repeat(0.07, 100),
+    ]
+    t = np.arange(0, 40, 0.5)
+
+    def test_causa_adicional_sem_falhas_nao_altera_as_tres_causas(self):
+        tres = TabuaMDT(*[Tabua(qx) for qx in self.qx[:3]])
+        quatro = TabuaMDT(*[Tabua(qx) for qx in self.qx[:3]], Tabua(np.zeros(100)))
+        assert_allclose(
+            quatro.qx_j([30, 31, 32, 0], self.t, [0, 1, 2]), tres.qx_j([30, 31, 32], self.t, [0, 1, 2]), rtol=1e-14
+        )
+        assert_array_equal(quatro.qx_j([30, 31, 32, 0], self.t, [3]), 0.0)
+
+    def test_qx_j_eh_igual_a_expansao_da_integral_do_produto_das_outras_causas(self):
+        tabua = TabuaMDT(*[Tabua(qx) for qx in self.qx])
+        x = [30, 31, 32, 33, 34]
+        qx = np.array([self.qx[i][x[i] + 5] for i in range(5)])
+        esperado = []
+        for j in range(5):
+            outras = np.delete(qx, j)
+            # Coeficientes de prod(1 - s * qx_i), em ordem crescente de grau.
+            coeficientes = np.polynomial.polynomial.polyfromroots(1 / outras) * np.prod(-outras)
+            esperado.append(qx[j] * np.sum(coeficientes / np.arange(1, len(coeficientes) + 1)))
+        assert_allclose(tabua.qx_j(x, [5], range(5))[:, 0], esperado, rtol=1e-13)
+
+    @pytest.mark.parametrize("k", [32, 40])
+    def test_qx_j_com_muitas_causas_eh_igual_a_expansao_da_integral(self, k):
+        qx = np.linspace(0.001, 1.0, k)
+        tabua = TabuaMDT(*[Tabua(np.repeat(q, 10)) for q in qx])
+        esperado = []
+        for j in range(k):
+            coeficientes = np.array([1.0])
+            for q in np.delete(qx, j):
+                coeficientes = np.convolve(coeficientes, [1.0, -q])
+            esperado.append(qx[j] * np.sum(coeficientes / np.arange(1, k + 1)))
+        assert_allclose(tabua.qx_j([0] * k, [0], range(k))[:, 0], esperado, rtol=0, atol=1e-9 if k > 32 else 1e-11)
+
+    def test_qx_eh_o_complementar_do_produto_das_sobrevivencias(self):
+        tabua = TabuaMDT(*[Tabua(qx) for qx in self.qx])
+        x = [20, 25, 30, 35, 40]
+        esperado = 1 - np.prod([1 - tabua.tabuas[i].qx(x[i], self.t) for i in range(5)], axis=0)
+        assert_allclose(tabua.qx(x, self.t), esperado, rtol=1e-13)
+
+    def test_causas_nomeadas_e_causa_principal(self):
+        tabua = TabuaMDT(
+            morte=Tabua(self.qx[0]),
+            invalidez=Tabua(self.qx[1]),
+            aposentadoria=Tabua(self.qx[2]),
+            cancelamento=Tabua(self.qx[3]),
+            transferencia=Tabua(self.qx[4]),
+            causa_principal="invalidez",
+        )
+        x = [40] * 5
+        assert tabua.numero_decrementos == 5
+        assert_array_equal(tabua.t_qx(x, self.t), tabua.t_qx_j(x, self.t, ["invalidez"])[0])
+        assert tabua.probabilidades(x, self.t).shape == (12, len(self.t))
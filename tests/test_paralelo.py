@@ -0,0 +1,118 @@
+import importlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from numpy import arange
+from numpy import array
+from numpy import repeat
+from numpy import shares_memory
+from numpy.testing import assert_array_equal
+
+from tabatu import StatusVidasConjuntas
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu import TabuaMultiplasVidas
+from tabatu import TabuaSeletiva
+from tabatu import paralelo
+from tabatu.paralelo import AvaliadorProcessos
+from tabatu.paralelo import avaliar_carteira
+from tests.conftest import qx_completo
+from tests.conftest import qx_plato
+from tests.conftest import qx_seletivo
+
+
+@pytest.fixture(
+    params=[
+        Tabua(qx_plato),
+        TabuaMDT(Tabua(qx_plato), Tabua(qx_completo)),
+        TabuaMultiplasVidas(Tabua(qx_plato), Tabua(qx_completo), status=StatusVidasConjuntas.LAST),
+        TabuaMultiplasVidas(TabuaSeletiva(qx_seletivo), Tabua(qx_completo), status=StatusVidasConjuntas.JOINT),
+    ]
+)
+def todas_tabuas(request):
+    return request.param
+
+
+def _idades(tabua, n):
+    k = tabua.numero_decrementos * tabua.numero_vidas
+    return array([repeat(idade % 5, k) for idade in range(n)])
+
+
+@pytest.mark.parametrize("metodo", ["qx", "tpx", "t_qx"])
+def test_avaliar_carteira_eh_igual_ao_metodo_em_lote(todas_tabuas, metodo):
+    x = _idades(todas_tabuas, 37)
+    t = arange(8)
+    resultado = avaliar_carteira(todas_tabuas, metodo, x, t, max_threads=4, tamanho_bloco=5)
+    assert_array_equal(resultado, getattr(todas_tabuas, f"{metodo}_lote")(x, t))
+
+
+def test_avaliar_carteira_aceita_tempos_diferentes_para_cada_apolice(todas_tabuas):
+    x = _idades(todas_tabuas, 10)
+    t = arange(30).reshape(10, 3) % 7
+    resultado = avaliar_carteira(todas_tabuas, "tpx", x, t, max_threads=3)
+    assert_array_equal(resultado, todas_tabuas.tpx_lote(x, t))
+
+
+def test_avaliar_carteira_falha_quando_o_metodo_nao_existe(todas_tabuas):
+    with pytest.raises(ValueError):
+        avaliar_carteira(todas_tabuas, "lx", _idades(todas_tabuas, 2), [0, 1])
+
+
+def test_uma_mesma_tabua_pode_ser_usada_por_diversas_threads(todas_tabuas):
+    """As tábuas são somente leitura após a criação, então chamadas concorrentes devem gerar
+    exatamente o mesmo resultado que chamadas sequenciais."""
+    k = todas_tabuas.numero_decrementos * todas_tabuas.numero_vidas
+    t = arange(200) % 7
+    esperado = [todas_tabuas.t_qx(repeat(x, k), t) for x in range(5)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        resultados = list(executor.map(lambda i: todas_tabuas.t_qx(repeat(i % 5, k), t), range(200)))
+    for i, resultado in enumerate(resultados):
+        assert_array_equal(resultado, esperado[i % 5])
+
+
+@pytest.mark.parametrize("metodo", ["qx", "tpx", "t_qx"])
+def test_avaliador_processos_eh_igual_ao_metodo_em_lote(todas_tabuas, metodo):
+    x = _idades(todas_tabuas, 23)
+    t = arange(6)
+    with AvaliadorProcessos(todas_tabuas, max_processos=2, tamanho_bloco=4) as avaliador:
+        resultado = avaliador.avaliar(metodo, x, t)
+    assert_array_equal(resultado, getattr(todas_tabuas, f"{metodo}_lote")(x, t))
+
+
+def test_avaliador_processos_aceita_tempos_diferentes_para_cada_apolice(todas_tabuas):
+    x = _idades(todas_tabuas, 10)
+    t = arange(30).reshape(10, 3) % 7
+    with AvaliadorProcessos(todas_tabuas, max_processos=2) as avaliador:
+        assert_array_equal(avaliador.avaliar("tpx", x, t), todas_tabuas.tpx_lote(x, t))
+        assert_array_equal(avaliador.avaliar("qx", x, t), todas_tabuas.qx_lote(x, t))
+
+
+def test_avaliador_processos_falha_quando_o_metodo_nao_existe(todas_tabuas):
+    with AvaliadorProcessos(todas_tabuas, max_processos=1) as avaliador:
+        with pytest.raises(ValueError):
+            avaliador.avaliar("lx", _idades(todas_tabuas, 2), [0, 1])
+
+
+def _taxas_usam_memoria_compartilhada():
+    memoria = paralelo._MEMORIA_PROCESSO.buf
+    return [shares_memory(base.pega_qx(), memoria) for base in paralelo._TABUA_PROCESSO.tabuas]
+
+
+def test_processos_usam_a_memoria_compartilhada_sem_copiar_as_taxas():
+    tabua = TabuaMDT(Tabua(qx_plato), Tabua(qx_completo))
+    with AvaliadorProcessos(tabua, max_processos=1) as avaliador:
+        assert avaliador._executor.submit(_taxas_usam_memoria_compartilhada).result() == [True, True]
+
+
+def test_avaliar_carteira_nao_depende_de_shared_memory(monkeypatch):
+    monkeypatch.setitem(sys.modules, "multiprocessing.shared_memory", None)
+    try:
+        modulo = importlib.reload(paralelo)
+        tabua, x, t = Tabua(qx_plato), [[1], [2]], [0, 1]
+        assert_array_equal(modulo.avaliar_carteira(tabua, "tpx", x, t, max_threads=2), tabua.tpx_lote(x, t))
+        with pytest.raises(ImportError):
+            modulo.AvaliadorProcessos(tabua, max_processos=1)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(paralelo)
@@ -6,6 +6,7 @@ import pytest
 from numpy import array
 from numpy import atleast_1d
 from numpy import repeat
+from numpy.testing import assert_allclose
 import pytest
 from tabatu.juros_constante import JurosConstante
 
@@ -223,3 +224,17 @@ def test_tabua_acumulacao_deve_ter_causa_principal_na_renda_invalidez(
             tabua_concessao=mock_tabua_concessao_anual,
             juros=mock_juros_anual,
         )
+
+
+def test_comutacao_eh_calculada_uma_unica_vez_por_instancia():
+    premissas = Premissas(Tabua(array([0.1, 0.2, 0.4, 0.8, 1.0])), JurosConstante(0.05))
+    assert premissas.comutacao is premissas.comutacao
+
+
+def test_alterar_periodicidade_gera_premissa_com_nova_comutacao():
+    premissas = Premissas(Tabua(array([0.1, 0.2, 0.4, 0.8, 1.0])), JurosConstante(0.05))
+    comutacao_anual = premissas.comutacao
+    nova_premissa = premissas.alterar_periodicidade(Periodicidade.MENSAL)
+    assert nova_premissa.comutacao is not comutacao_anual
+    assert_allclose(nova_premissa.comutacao.Dx[0:60:12], comutacao_anual.Dx[:-1])
+    assert premissas.comutacao is comutacao_anual
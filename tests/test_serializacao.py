@@ -0,0 +1,155 @@
+import io
+import pickle
+import struct
+
+import pytest
+from numpy import arange
+from numpy import array
+from numpy import repeat
+from numpy.testing import assert_array_equal
+
+import tabatu.core as core
+from tabatu import JurosConstante
+from tabatu import StatusVidasConjuntas
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu import TabuaMultiplasVidas
+from tabatu import TabuaSeletiva
+from tabatu.periodicidade import Periodicidade
+from tabatu.serializacao import _descrever_tabua
+from tabatu.serializacao import _reconstruir_tabua
+from tabatu.serializacao import carregar
+from tabatu.serializacao import de_bytes
+from tabatu.serializacao import para_bytes
+from tabatu.serializacao import salvar
+from tabatu.tabua_base import TabuaBase
+from tests.conftest import qx_completo
+from tests.conftest import qx_plato
+from tests.conftest import qx_seletivo
+
+
+@pytest.fixture(
+    params=[
+        Tabua(qx_plato, Periodicidade.MENSAL),
+        TabuaMDT(Tabua(qx_plato), morte=Tabua(qx_completo), causa_principal="morte"),
+        TabuaMultiplasVidas(Tabua(qx_plato), Tabua(qx_completo), status=StatusVidasConjuntas.JOINT),
+        TabuaSeletiva(qx_seletivo, Periodicidade.MENSAL),
+        TabuaMDT(TabuaSeletiva(qx_seletivo), Tabua(qx_completo)),
+    ]
+)
+def todas_tabuas(request):
+    return request.param
+
+
+def _idades(tabua, n):
+    k = tabua.numero_decrementos * tabua.numero_vidas
+    return array([repeat(idade % 5, k) for idade in range(n)])
+
+
+def assert_tabuas_iguais(nova, tabua):
+    assert type(nova) is type(tabua)
+    assert nova.periodicidade == tabua.periodicidade
+    for base_nova, base in zip(nova._tabuas_base(), tabua._tabuas_base()):
+        assert_array_equal(base_nova.pega_qx(), base.pega_qx())
+        assert_array_equal(base_nova.pega_log_lx(), base.pega_log_lx())
+    x = _idades(tabua, 7)
+    t = arange(12)
+    assert_array_equal(nova.t_qx_lote(x, t), tabua.t_qx_lote(x, t))
+    assert_array_equal(nova.tpx_lote(x, t), tabua.tpx_lote(x, t))
+
+
+def test_pickle_preserva_a_tabua(todas_tabuas):
+    assert_tabuas_iguais(pickle.loads(pickle.dumps(todas_tabuas)), todas_tabuas)
+
+
+def test_pickle_preserva_causas_e_causa_principal_da_tabua_mdt():
+    tabua = TabuaMDT(Tabua(qx_plato), morte=Tabua(qx_completo), causa_principal="morte")
+    nova = pickle.loads(pickle.dumps(tabua))
+    assert nova.causas == tabua.causas
+    assert nova.causa_principal == "morte"
+
+
+def test_pickle_preserva_status_da_tabua_multiplas_vidas():
+    tabua = TabuaMultiplasVidas(Tabua(qx_plato), Tabua(qx_completo), status=StatusVidasConjuntas.JOINT)
+    assert pickle.loads(pickle.dumps(tabua)).status == StatusVidasConjuntas.JOINT
+
+
+def test_pickle_preserva_tabua_base():
+    tabua = TabuaBase(qx_completo, Periodicidade.TRIMESTRAL)
+    nova = pickle.loads(pickle.dumps(tabua))
+    assert nova.periodicidade == Periodicidade.TRIMESTRAL
+    assert_array_equal(nova.pega_log_lx(), tabua.pega_log_lx())
+
+
+@pytest.mark.parametrize(
+    "tabua",
+    [
+        core.Tabua(qx_plato),
+        core.TabuaMDT(core.Tabua(qx_plato), core.Tabua(qx_completo), causa_principal=1),
+        core.TabuaMultiplasVidas(
+            core.Tabua(qx_plato), core.Tabua(qx_completo), status=core.StatusVidasConjuntas(b"JOINT")
+        ),
+    ],
+)
+def test_pickle_preserva_as_classes_do_core(tabua):
+    nova = pickle.loads(pickle.dumps(tabua))
+    assert type(nova) is type(tabua)
+    x = _idades(tabua, 5)
+    t = arange(8)
+    assert_array_equal(nova.t_qx_lote(x, t), tabua.t_qx_lote(x, t))
+
+
+def test_pickle_preserva_juros_constante():
+    juros = JurosConstante(0.01, Periodicidade.MENSAL)
+    novo = pickle.loads(pickle.dumps(juros))
+    assert novo.periodicidade == Periodicidade.MENSAL
+    assert_array_equal(novo.taxa_desconto(arange(5)), juros.taxa_desconto(arange(5)))
+    assert_array_equal(pickle.loads(pickle.dumps(core.JurosConstante(0.02))).taxa_juros([0]), [0.02])
+
+
+def test_formato_binario_preserva_a_tabua(todas_tabuas):
+    assert_tabuas_iguais(de_bytes(para_bytes(todas_tabuas)), todas_tabuas)
+
+
+def test_formato_binario_eh_mais_compacto_que_o_pickle(todas_tabuas):
+    assert len(para_bytes(todas_tabuas)) < len(pickle.dumps(todas_tabuas))
+
+
+def test_salvar_e_carregar_usando_caminho(todas_tabuas, tmp_path):
+    caminho = tmp_path / "tabua.tabatu"
+    salvar(todas_tabuas, caminho)
+    assert_tabuas_iguais(carregar(caminho), todas_tabuas)
+
+
+def test_salvar_e_carregar_usando_arquivo_aberto(todas_tabuas):
+    arquivo = io.BytesIO()
+    salvar(todas_tabuas, arquivo)
+    arquivo.seek(0)
+    assert_tabuas_iguais(carregar(arquivo), todas_tabuas)
+
+
+def test_de_bytes_retorna_erro_quando_o_conteudo_nao_eh_do_formato():
+    with pytest.raises(ValueError):
+        de_bytes(b"nao eh uma tabua do tabatu")
+
+
+def test_de_bytes_retorna_erro_quando_a_versao_nao_eh_suportada():
+    conteudo = bytearray(para_bytes(Tabua(qx_plato)))
+    struct.pack_into("<I", conteudo, 8, 99)
+    with pytest.raises(ValueError, match="Versão 99"):
+        de_bytes(bytes(conteudo))
+
+
+def test_de_bytes_retorna_erro_quando_o_conteudo_esta_truncado():
+    with pytest.raises(ValueError):
+        de_bytes(para_bytes(Tabua(qx_plato))[:-8])
+
+
+def test_tabua_reconstruida_a_partir_da_descricao_eh_igual_a_original(todas_tabuas):
+    descricao, bases = _descrever_tabua(todas_tabuas)
+    assert_tabuas_iguais(_reconstruir_tabua(descricao, bases), todas_tabuas)
+
+
+def test_descrever_tabua_falha_quando_o_tipo_nao_eh_suportado():
+    with pytest.raises(TypeError):
+        _descrever_tabua(object())
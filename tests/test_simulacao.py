@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from numpy.testing import assert_array_equal
+
+import tabatu.simulacao as simulacao
+from tabatu import StatusVidasConjuntas
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu import TabuaMultiplasVidas
+from tabatu.simulacao import Simulador
+from tabatu.simulacao import simular
+from tests.conftest import qx_plato
+
+N = 200_000
+qx = (np.arange(100) + 1) / 100
+
+
+def _frequencias(resultado, horizonte, k=1):
+    """Frequência de cada par (tempo, causa), com formato (k, horizonte)."""
+    falhas = resultado.causa >= 0
+    pares = resultado.tempo[falhas] * k + resultado.causa[falhas]
+    return np.bincount(pares, minlength=horizonte * k).reshape(horizonte, k).T / len(resultado.tempo)
+
+
+def test_distribuicao_do_tempo_de_vida_eh_igual_ao_t_qx():
+    tabua = Tabua(qx)
+    horizonte = int(tabua.tempo_futuro_maximo([40]))
+    resultado = simular(tabua, np.full(N, 40), np.random.default_rng(0))
+    assert (resultado.causa == 0).all()
+    assert_allclose(_frequencias(resultado, horizonte)[0], tabua.t_qx([40], np.arange(horizonte)), atol=5e-3)
+
+
+def test_distribuicao_do_tempo_e_da_causa_eh_igual_ao_t_qx_j():
+    tabua = TabuaMDT(Tabua(qx), cancelamento=Tabua(np.repeat(0.05, len(qx))))
+    x = np.tile([30, 30], (N, 1))
+    horizonte = int(tabua.tempo_futuro_maximo([30, 30]))
+    resultado = Simulador(tabua).simular(x, np.random.default_rng(1))
+    esperado = tabua.t_qx_j([30, 30], np.arange(horizonte), [0, 1])
+    assert_allclose(_frequencias(resultado, horizonte, 2), esperado, atol=5e-3)
+
+
+@pytest.mark.parametrize("status", [StatusVidasConjuntas.JOINT, StatusVidasConjuntas.LAST])
+def test_distribuicao_do_tempo_de_vida_de_multiplas_vidas_eh_igual_ao_t_qx(status):
+    tabua = TabuaMultiplasVidas(Tabua(qx), Tabua(qx), status=status)
+    horizonte = int(tabua.tempo_futuro_maximo([60, 50]))
+    resultado = simular(tabua, np.tile([60, 50], (N, 1)), np.random.default_rng(2))
+    assert_allclose(_frequencias(resultado, horizonte)[0], tabua.t_qx([60, 50], np.arange(horizonte)), atol=5e-3)
+
+
+def test_vidas_sem_falha_ate_o_tempo_maximo_recebem_causa_negativa():
+    tabua = Tabua(qx_plato)
+    resultado = simular(tabua, np.full(N, 0), np.random.default_rng(3), tempo_maximo=10)
+    sobreviventes = resultado.causa == -1
+    assert (resultado.tempo[sobreviventes] == 10).all()
+    assert (resultado.tempo[~sobreviventes] < 10).all()
+    assert sobreviventes.mean() == pytest.approx(tabua.tpx([0], [10])[0], abs=5e-3)
+
+
+def test_tabua_plato_exige_tempo_maximo():
+    with pytest.raises(ValueError):
+        Simulador(Tabua(qx_plato))
+
+
+def test_mesmo_gerador_gera_o_mesmo_resultado():
+    x = np.arange(0, 50).repeat(100)
+    primeiro = simular(Tabua(qx), x, np.random.default_rng(4))
+    segundo = simular(Tabua(qx), x, np.random.default_rng(4))
+    assert_array_equal(primeiro.tempo, segundo.tempo)
+
+
+def test_agrupamento_por_ordenacao_gera_o_mesmo_resultado(monkeypatch):
+    tabua = TabuaMDT(Tabua(qx), Tabua(qx))
+    x = np.random.default_rng(5).integers(0, 50, (1000, 2))
+    esperado = Simulador(tabua).simular(x, np.random.default_rng(6))
+    monkeypatch.setattr(simulacao, "LIMITE_CHAVES", 0)
+    resultado = Simulador(tabua).simular(x, np.random.default_rng(6))
+    assert_array_equal(resultado.tempo, esperado.tempo)
+    assert_array_equal(resultado.causa, esperado.causa)
+
+
+def test_blocos_dependem_apenas_da_semente_e_da_posicao():
+    simulador = Simulador(Tabua(qx))
+    x = np.random.default_rng(7).integers(0, 80, 1000)
+    todos = list(simulador.simular_em_blocos(x, semente=8, tamanho_bloco=300))
+    assert [len(bloco.tempo) for bloco in todos] == [300, 300, 300, 100]
+    alguns = list(simulador.simular_em_blocos(x, semente=8, tamanho_bloco=300, blocos=[3, 1]))
+    assert_array_equal(alguns[0].tempo, todos[3].tempo)
+    assert_array_equal(alguns[1].tempo, todos[1].tempo)
+
+
+def test_simular_em_blocos_retorna_erro_quando_tamanho_bloco_nao_eh_positivo():
+    with pytest.raises(ValueError):
+        next(Simulador(Tabua(qx)).simular_em_blocos([0], tamanho_bloco=0))
+
+
+def test_carteira_vazia_retorna_arrays_vazios():
+    resultado = simular(Tabua(qx), np.empty(0, dtype=np.int64), np.random.default_rng(9))
+    assert len(resultado.tempo) == 0
+    assert len(resultado.causa) == 0
@@ -1,10 +1,11 @@
 from unittest.mock import Mock
 
 import pytest
-from numpy import arange, array, isinf
+from numpy import arange, array, isinf, repeat
 from numpy.testing import assert_array_equal
 
 import tabatu.tabua_base as tabua_base_modulo
+from tabatu.hipotese_fracionaria import HipoteseFracionaria
 from tabatu.periodicidade import Periodicidade
 from tabatu.tabua_base import TabuaBase
 from tests.conftest import qx_completo, qx_plato
@@ -109,6 +110,22 @@ class TestIntegrationTestsTabuaBaseTpx:
         t = min(tabua.tempo_futuro_maximo(x), 100)
         assert tabua.tpx(x, [t]) == pytest.approx(0)
 
+    def test_tpx_apos_o_fim_da_tabua_plato_repete_o_ultimo_qx(self):
+        tabua = TabuaBase(qx_plato)
+        n = len(qx_plato)
+        t = array([n, n + 10, n + 1000])
+        esperado = tabua.tpx(0, [n]) * (1 - qx_plato[-1]) ** (t - n)
+        assert tabua.tpx(0, t) == pytest.approx(esperado, rel=1e-12)
+
+    def test_tpx_nao_sofre_underflow_em_tabuas_diarias_longas(self):
+        """A sobrevivência acumulada de uma tábua diária de 120 anos fica abaixo do menor double,
+        mas as probabilidades condicionais continuam bem definidas."""
+        qx = repeat(0.05, 365 * 120)
+        tabua = TabuaBase(qx)
+        assert tabua.possui_fechamento_plato()
+        assert isinf(tabua.tempo_futuro_maximo(0))
+        assert tabua.tpx(365 * 100, [1, 2]) == pytest.approx([0.95, 0.95**2])
+
     def test_tpx_retorna_erro_se_t_for_negativo(self):
         tabua = TabuaBase(qx_plato)
         with pytest.raises(ValueError):
@@ -160,17 +177,59 @@ class TestIntegrationTestsTabuaBaseTqx:
         with pytest.raises(ValueError):
             tabua.t_qx(-1, [0])
 
+class TestIntegrationTestsTabuaBasePegaQx:
+    def test_pega_qx_retorna_as_taxas_da_tabua(self):
+        tabua = TabuaBase(qx_completo)
+        assert_array_equal(tabua.pega_qx(), qx_completo)
+
+    def test_pega_qx_retorna_visao_somente_leitura(self):
+        tabua = TabuaBase(qx_completo)
+        qx = tabua.pega_qx()
+        assert not qx.flags.writeable
+        with pytest.raises(ValueError):
+            qx[0] = 0.5
+
+    def test_pega_qx_continua_valido_apos_a_tabua_sair_de_escopo(self):
+        qx = TabuaBase(qx_completo).pega_qx()
+        assert_array_equal(qx, qx_completo)
+
+
+class TestIntegrationTestsTabuaBaseFromLogLx:
+    @pytest.mark.parametrize("qx", [qx_completo, qx_plato])
+    def test_from_log_lx_gera_tabua_igual_a_original(self, qx):
+        tabua = TabuaBase(qx)
+        nova_tabua = TabuaBase.from_log_lx(tabua.pega_qx(), tabua.pega_log_lx())
+        t = arange(150)
+        assert_array_equal(nova_tabua.tpx(1, t), tabua.tpx(1, t))
+        assert nova_tabua.tempo_futuro_maximo(0) == tabua.tempo_futuro_maximo(0)
+
+    def test_pega_log_lx_tem_um_elemento_a_mais_que_qx_e_comeca_em_zero(self):
+        log_lx = TabuaBase(qx_completo).pega_log_lx()
+        assert len(log_lx) == len(qx_completo) + 1
+        assert log_lx[0] == 0
+        assert isinf(log_lx[-1])
+
+    def test_from_log_lx_retorna_erro_quando_os_tamanhos_nao_sao_compativeis(self):
+        with pytest.raises(ValueError):
+            TabuaBase.from_log_lx(qx_completo, [0.0])
+
+
 def test_alterar_periodicidade_chama_funcao_alterar_periodicidade_e_gera_nova_tabua_base(monkeypatch):
-    tabua = TabuaBase(qx_completo, Periodicidade.ANUAL)
+    tabua = TabuaBase(qx_completo, Periodicidade.MENSAL)
 
     mock_init = Mock(return_value=None)
     mock_alterar_periodicidade = Mock()
     monkeypatch.setattr(TabuaBase, "__init__", mock_init)
     monkeypatch.setattr(tabua_base_modulo, "alterar_periodicidade_qx", mock_alterar_periodicidade)
 
-    nova_tabua = tabua.alterar_periodicidade(Periodicidade.MENSAL)
+    nova_tabua = tabua.alterar_periodicidade(Periodicidade.ANUAL)
 
-    mock_alterar_periodicidade.assert_called_once_with(qx_completo.tolist(), Periodicidade.ANUAL, Periodicidade.MENSAL)
-    mock_init.assert_called_once_with(mock_alterar_periodicidade.return_value, Periodicidade.MENSAL)
+    mock_alterar_periodicidade.assert_called_once()
+    qx, periodicidade, nova_periodicidade = mock_alterar_periodicidade.call_args[0]
+    assert_array_equal(qx, qx_completo)
+    assert (periodicidade, nova_periodicidade) == (Periodicidade.MENSAL, Periodicidade.ANUAL)
+    mock_init.assert_called_once_with(
+        mock_alterar_periodicidade.return_value, Periodicidade.ANUAL, HipoteseFracionaria.NENHUMA
+    )
 
     assert isinstance(nova_tabua, TabuaBase)
\ No newline at end of file
@@ -0,0 +1,101 @@
+import gc
+import pickle
+import weakref
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from tabatu import HipoteseFracionaria
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu.periodicidade import Periodicidade
+from tabatu.tabua_base import TabuaBase
+from tests.conftest import qx_completo
+from tests.conftest import qx_plato
+
+t = np.arange(10)
+
+
+def somente_leitura(valores):
+    valores = np.array(valores, dtype=np.float64)
+    valores.flags.writeable = False
+    return valores
+
+
+@pytest.mark.parametrize("qx", [qx_completo, qx_plato])
+def test_tabua_do_buffer_eh_igual_a_tabua_original(qx):
+    tabua = Tabua.from_buffer(somente_leitura(qx))
+    for x in range(len(qx) + 1):
+        assert_array_equal(tabua.tpx([x], t), Tabua(qx).tpx([x], t))
+        assert_array_equal(tabua.t_qx([x], t), Tabua(qx).t_qx([x], t))
+    assert tabua.possui_fechamento_plato() == Tabua(qx).possui_fechamento_plato()
+
+
+def test_buffers_nao_sao_copiados():
+    qx = somente_leitura(qx_plato)
+    log_lx = somente_leitura(TabuaBase(qx_plato).pega_log_lx())
+    tabua_base, = Tabua.from_buffer(qx, log_lx).tabuas
+    assert np.shares_memory(tabua_base.pega_qx(), qx)
+    assert np.shares_memory(tabua_base.pega_log_lx(), log_lx)
+
+
+def test_log_lx_eh_calculado_quando_nao_informado():
+    tabua_base = TabuaBase.from_buffer(somente_leitura(qx_completo), periodicidade=Periodicidade.MENSAL)
+    assert tabua_base.periodicidade == Periodicidade.MENSAL
+    assert_array_equal(tabua_base.pega_log_lx(), TabuaBase(qx_completo).pega_log_lx())
+
+
+def test_buffer_eh_mantido_enquanto_alguma_tabua_o_usa():
+    qx = somente_leitura(qx_plato)
+    referencia = weakref.ref(qx)
+    tabua = TabuaMDT(Tabua.from_buffer(qx, hipotese_fracionaria=HipoteseFracionaria.UDD), Tabua(qx_completo))
+    del qx
+    gc.collect()
+    assert referencia() is not None
+    assert_array_equal(tabua.tpx([1, 1], t), TabuaMDT(Tabua(qx_plato), Tabua(qx_completo)).tpx([1, 1], t))
+    del tabua
+    gc.collect()
+    assert referencia() is None
+
+
+@pytest.mark.parametrize(
+    "qx, log_lx",
+    [
+        (np.array(qx_plato), None),
+        (somente_leitura(qx_plato).astype(np.float32), None),
+        (somente_leitura([qx_plato, qx_plato]), None),
+        (somente_leitura(np.repeat(qx_plato, 2))[::2], None),
+        (somente_leitura(qx_plato), somente_leitura(np.zeros(5))),
+    ],
+)
+def test_buffer_invalido_retorna_erro(qx, log_lx):
+    with pytest.raises(ValueError):
+        Tabua.from_buffer(qx, log_lx)
+
+
+def test_pickle_copia_as_taxas():
+    tabua = pickle.loads(pickle.dumps(Tabua.from_buffer(somente_leitura(qx_plato), periodicidade=Periodicidade.MENSAL)))
+    assert tabua.periodicidade == Periodicidade.MENSAL
+    assert_array_equal(tabua.tpx([1], t), Tabua(qx_plato).tpx([1], t))
+
+
+class TestNpy:
+    def test_salvar_e_carregar_preserva_a_tabua(self, tmp_path):
+        caminho = tmp_path / "tabua.npy"
+        Tabua(qx_completo).salvar_npy(caminho)
+        tabua = Tabua.from_npy(caminho, Periodicidade.MENSAL, HipoteseFracionaria.UDD)
+        assert (tabua.periodicidade, tabua.hipotese_fracionaria) == (Periodicidade.MENSAL, HipoteseFracionaria.UDD)
+        assert_array_equal(tabua.tabuas[0].pega_log_lx(), TabuaBase(qx_completo).pega_log_lx())
+        assert_array_equal(tabua.t_qx([1], t), Tabua(qx_completo).t_qx([1], t))
+
+    def test_arquivo_com_apenas_as_taxas(self, tmp_path):
+        caminho = tmp_path / "qx.npy"
+        np.save(caminho, qx_plato)
+        assert_array_equal(Tabua.from_npy(caminho).tpx([2], t), Tabua(qx_plato).tpx([2], t))
+
+    def test_arquivo_com_formato_invalido_retorna_erro(self, tmp_path):
+        caminho = tmp_path / "invalido.npy"
+        np.save(caminho, np.zeros((3, 6)))
+        with pytest.raises(ValueError):
+            Tabua.from_npy(caminho)
@@ -0,0 +1,146 @@
+import pickle
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from tabatu import HipoteseFracionaria
+from tabatu import Tabua
+from tabatu import TabuaLote
+from tabatu import TabuaMDT
+from tabatu import agravar_qx
+from tabatu.periodicidade import Periodicidade
+from tests.conftest import qx_completo
+from tests.conftest import qx_plato
+
+t = np.arange(10, dtype=float)
+agravos = [80, 100, 150, 300]
+
+
+@pytest.fixture
+def matriz():
+    return np.array([agravar_qx(qx_completo, agravo) for agravo in agravos])
+
+
+def test_tabuas_do_lote_sao_iguais_as_tabuas_individuais(matriz):
+    lote = TabuaLote(matriz)
+    assert len(lote) == len(agravos)
+    for tabua, qx in zip(lote, matriz):
+        for x in range(len(qx) + 1):
+            assert_array_equal(tabua.tpx([x], t), Tabua(qx).tpx([x], t))
+            assert_array_equal(tabua.t_qx([x], t), Tabua(qx).t_qx([x], t))
+        assert tabua.tempo_futuro_maximo([0]) == Tabua(qx).tempo_futuro_maximo([0])
+
+
+def test_lote_com_tabuas_de_tamanhos_diferentes():
+    tabuas = [qx_completo, qx_plato, np.array([]), qx_plato[:2]]
+    inicios = np.cumsum([0] + [len(qx) for qx in tabuas])
+    lote = TabuaLote(np.concatenate(tabuas), inicios)
+    assert len(lote) == len(tabuas)
+    for tabua, qx in zip(lote, tabuas):
+        assert_array_equal(tabua.tabuas[0].pega_qx(), qx)
+        assert_array_equal(tabua.tabuas[0].pega_log_lx(), Tabua(qx).tabuas[0].pega_log_lx())
+    assert_array_equal(lote.pega_inicios(), inicios)
+
+
+def test_tabuas_compartilham_a_memoria_do_lote(matriz):
+    lote = TabuaLote(matriz)
+    assert np.shares_memory(lote[1].tabuas[0].pega_qx(), lote.pega_qx())
+    assert_array_equal(lote.pega_qx(), matriz.reshape(-1))
+
+
+def test_periodicidade_e_hipotese_fracionaria_sao_aplicadas_a_todas_as_tabuas(matriz):
+    lote = TabuaLote(matriz, periodicidade=Periodicidade.MENSAL, hipotese_fracionaria=HipoteseFracionaria.UDD)
+    for tabua in lote:
+        assert tabua.periodicidade == Periodicidade.MENSAL
+        assert tabua.hipotese_fracionaria == HipoteseFracionaria.UDD
+    esperado = Tabua(matriz[2], hipotese_fracionaria=HipoteseFracionaria.UDD).tpx([1], t + 0.5)
+    assert_array_equal(lote[2].tpx([1], t + 0.5), esperado)
+
+
+def test_tabuas_do_lote_podem_ser_combinadas(matriz):
+    lote = TabuaLote(matriz)
+    esperado = TabuaMDT(Tabua(matriz[0]), Tabua(matriz[3])).t_qx([1, 2], t)
+    assert_array_equal(TabuaMDT(lote[0], lote[-1]).t_qx([1, 2], t), esperado)
+
+
+def test_indice_fora_do_lote_retorna_erro(matriz):
+    lote = TabuaLote(matriz)
+    with pytest.raises(IndexError):
+        lote[len(agravos)]
+    with pytest.raises(IndexError):
+        lote[-len(agravos) - 1]
+
+
+def test_pickle(matriz):
+    lote = TabuaLote(matriz, periodicidade=Periodicidade.MENSAL, hipotese_fracionaria=HipoteseFracionaria.UDD)
+    copia = pickle.loads(pickle.dumps(lote))
+    assert (copia.periodicidade, copia.hipotese_fracionaria) == (Periodicidade.MENSAL, HipoteseFracionaria.UDD)
+    assert_array_equal(copia.pega_qx(), lote.pega_qx())
+    assert_array_equal(copia[3].tpx([2], t + 0.5), lote[3].tpx([2], t + 0.5))
+
+
+@pytest.mark.parametrize(
+    "qx, inicios",
+    [
+        (qx_completo, None),
+        (np.zeros((2, 3)), [0, 3, 6]),
+        (qx_completo, [1, len(qx_completo)]),
+        (qx_completo, [0, 3, 2, len(qx_completo)]),
+        (qx_completo, [0, 3]),
+        (qx_completo, []),
+    ],
+)
+def test_qx_ou_inicios_invalidos_retornam_erro(qx, inicios):
+    with pytest.raises(ValueError):
+        TabuaLote(qx, inicios)
+
+
+class TestAvaliacao:
+    tabuas = np.array([3, 0, 2, 1, 3, 0])
+    x = np.array([0, 1, 2, 3, 4, 10])
+
+    @pytest.mark.parametrize("metodo", ["qx", "tpx", "t_qx"])
+    @pytest.mark.parametrize("hipotese", [HipoteseFracionaria.NENHUMA, HipoteseFracionaria.UDD])
+    def test_resultado_eh_igual_ao_de_cada_tabua(self, matriz, metodo, hipotese):
+        lote = TabuaLote(matriz, hipotese_fracionaria=hipotese)
+        tempos = t / 2
+        resultado = getattr(lote, metodo)(self.tabuas, self.x, tempos)
+        for i, (k, x) in enumerate(zip(self.tabuas, self.x)):
+            esperado = getattr(Tabua(matriz[k], hipotese_fracionaria=hipotese), metodo)([x], tempos)
+            assert_array_equal(resultado[i], esperado)
+
+    def test_tempos_por_apolice(self, matriz):
+        lote = TabuaLote(matriz)
+        tempos = np.arange(len(self.x) * 3, dtype=float).reshape(-1, 3)
+        resultado = lote.t_qx(self.tabuas, self.x, tempos)
+        for i, (k, x) in enumerate(zip(self.tabuas, self.x)):
+            assert_array_equal(resultado[i], Tabua(matriz[k]).t_qx([x], tempos[i]))
+
+    def test_tempo_futuro_maximo(self):
+        tabuas = [qx_completo, qx_plato]
+        lote = TabuaLote(np.concatenate(tabuas), [0, len(qx_completo), len(qx_completo) + len(qx_plato)])
+        esperado = [Tabua(tabuas[k]).tempo_futuro_maximo([x]) for k, x in zip([0, 1, 0], [0, 1, 2])]
+        assert_array_equal(lote.tempo_futuro_maximo([0, 1, 0], [0, 1, 2]), esperado)
+
+    def test_out(self, matriz):
+        lote = TabuaLote(matriz)
+        saida = np.empty((len(self.x), len(t)))
+        assert lote.tpx(self.tabuas, self.x, t, out=saida) is saida
+        assert_array_equal(saida, lote.tpx(self.tabuas, self.x, t))
+
+    def test_carteira_vazia(self, matriz):
+        assert TabuaLote(matriz).tpx([], [], t).shape == (0, len(t))
+
+    @pytest.mark.parametrize("tabuas", [[0, 4], [-1, 0]])
+    def test_tabua_fora_do_lote_retorna_erro(self, matriz, tabuas):
+        with pytest.raises(IndexError):
+            TabuaLote(matriz).tpx(tabuas, [0, 0], t)
+
+    @pytest.mark.parametrize(
+        "tabuas, x, tempos",
+        [([0, 1], [0], t), ([[0, 1]], [[0, 1]], t), ([0, 1], [0, 1], np.zeros((3, 2))), ([0], [-1], t)],
+    )
+    def test_argumentos_invalidos_retornam_erro(self, matriz, tabuas, x, tempos):
+        with pytest.raises(ValueError):
+            TabuaLote(matriz).qx(tabuas, x, tempos)
@@ -0,0 +1,110 @@
+import pickle
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from numpy.testing import assert_array_equal
+
+from tabatu import StatusVidasConjuntas
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu import TabuaMultiplasVidas
+from tabatu import TabuaSeletiva
+from tabatu.periodicidade import Periodicidade
+from tests.conftest import qx_completo
+from tests.conftest import qx_seletivo
+
+t = np.arange(10)
+
+
+def tabua_da_idade_de_entrada(x):
+    """Tábua de único decremento com as taxas seguidas por uma vida que entrou com idade x."""
+    s = qx_seletivo.shape[1] - 1
+    linha = min(x, len(qx_seletivo) - 1)
+    finais = qx_seletivo[x:, s] if x < len(qx_seletivo) else qx_seletivo[-1:, s]
+    return Tabua(np.concatenate([qx_seletivo[linha, :s], finais]))
+
+
+@pytest.fixture
+def tabua_seletiva():
+    return TabuaSeletiva(qx_seletivo)
+
+
+@pytest.mark.parametrize("x", [0, 1, 2, 3, 4])
+class TestTabuaSeletivaEhIgualATabuaDaIdadeDeEntrada:
+    def test_qx(self, tabua_seletiva, x):
+        assert_array_equal(tabua_seletiva.qx([x], t), tabua_da_idade_de_entrada(x).qx([0], t))
+
+    def test_tpx(self, tabua_seletiva, x):
+        assert_allclose(tabua_seletiva.tpx([x], t), tabua_da_idade_de_entrada(x).tpx([0], t), rtol=1e-14)
+
+    def test_t_qx(self, tabua_seletiva, x):
+        assert_allclose(tabua_seletiva.t_qx([x], t), tabua_da_idade_de_entrada(x).t_qx([0], t), rtol=1e-14)
+
+    def test_tempo_futuro_maximo(self, tabua_seletiva, x):
+        assert tabua_seletiva.tempo_futuro_maximo([x]) == tabua_da_idade_de_entrada(x).tempo_futuro_maximo([0])
+
+
+def test_qx_usa_a_duracao_durante_a_selecao_e_a_idade_atingida_depois():
+    tabua = TabuaSeletiva([[0.1, 0.2, 0.3], [0.15, 0.25, 0.4], [0.2, 0.3, 0.5]])
+    assert_array_equal(tabua.qx([0], [0, 1, 2, 3]), [0.1, 0.2, 0.3, 0.4])
+    assert_array_equal(tabua.qx([2], [0, 1, 2, 3]), [0.2, 0.3, 0.5, 0.5])
+
+
+def test_tpx_com_selecao_que_encerra_a_sobrevivencia():
+    tabua = TabuaSeletiva([[0.5, 1.0, 0.3], [0.1, 0.2, 0.4]])
+    assert_array_equal(tabua.tpx([0], [0, 1, 2, 3]), [1.0, 0.5, 0.0, 0.0])
+    assert tabua.tempo_futuro_maximo([0]) == 2
+
+
+def test_metodos_em_lote_sao_iguais_aos_metodos_por_idade(tabua_seletiva):
+    x = np.array([0, 3, 1, 4, 2])
+    esperado = np.array([tabua_seletiva.tpx([idade], t) for idade in x])
+    assert_array_equal(tabua_seletiva.tpx_lote(x, t), esperado)
+
+
+def test_qx_selecao_eh_somente_leitura(tabua_seletiva):
+    assert_array_equal(tabua_seletiva.qx_selecao, qx_seletivo)
+    assert tabua_seletiva.periodo_selecao == 2
+    with pytest.raises(ValueError):
+        tabua_seletiva.qx_selecao[0, 0] = 0.5
+
+
+@pytest.mark.parametrize("qx_selecao", [[0.1, 0.2], [[0.1], [0.2]], np.zeros((0, 3))])
+def test_qx_selecao_invalido_retorna_erro(qx_selecao):
+    with pytest.raises(ValueError):
+        TabuaSeletiva(qx_selecao)
+
+
+def test_alterar_periodicidade_retorna_erro(tabua_seletiva):
+    with pytest.raises(ValueError, match="seletivas"):
+        tabua_seletiva.alterar_periodicidade(Periodicidade.MENSAL)
+
+
+def test_tabuas_preserva_a_selecao(tabua_seletiva):
+    tabua_base, = tabua_seletiva.tabuas
+    assert tabua_base.pega_periodo_selecao() == 2
+    assert_array_equal(tabua_base.tpx(1, t), tabua_seletiva.tpx([1], t))
+
+
+def test_pickle_preserva_a_selecao(tabua_seletiva):
+    nova = pickle.loads(pickle.dumps(tabua_seletiva))
+    assert type(nova) is TabuaSeletiva
+    assert_array_equal(nova.qx_selecao, qx_seletivo)
+    assert_array_equal(nova.t_qx([1], t), tabua_seletiva.t_qx([1], t))
+
+
+@pytest.mark.parametrize("x", [0, 2, 4])
+def test_tabua_mdt_com_tabua_seletiva(tabua_seletiva, x):
+    tabua = TabuaMDT(tabua_seletiva, Tabua(qx_completo))
+    esperado = TabuaMDT(tabua_da_idade_de_entrada(x), Tabua(qx_completo[1:]))
+    assert_allclose(tabua.t_qx([x, 1], t), esperado.t_qx([0, 0], t), rtol=1e-14)
+    assert_allclose(tabua.tpx([x, 1], t), esperado.tpx([0, 0], t), rtol=1e-14)
+
+
+@pytest.mark.parametrize("status", [StatusVidasConjuntas.JOINT, StatusVidasConjuntas.LAST])
+def test_tabua_multiplas_vidas_com_tabua_seletiva(tabua_seletiva, status):
+    tabua = TabuaMultiplasVidas(tabua_seletiva, tabua_seletiva, status=status)
+    esperado = TabuaMultiplasVidas(tabua_da_idade_de_entrada(1), tabua_da_idade_de_entrada(3), status=status)
+    assert_allclose(tabua.tpx([1, 3], t), esperado.tpx([0, 0], t), rtol=1e-14)
+    assert_allclose(tabua.t_qx([1, 3], t), esperado.t_qx([0, 0], t), rtol=1e-14)
@@ -0,0 +1,118 @@
+import importlib
+import json
+import os
+import struct
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import tabatu.tabuas as tabuas_modulo
+from tabatu import HipoteseFracionaria
+from tabatu import StatusVidasConjuntas
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu import TabuaMultiplasVidas
+from tabatu import TabuaSeletiva
+from tabatu.periodicidade import Periodicidade
+from tabatu.tabuas import RegistroTabuas
+from tabatu.tabuas import salvar_pacote
+from tests.conftest import qx_completo
+from tests.conftest import qx_plato
+from tests.conftest import qx_seletivo
+
+t = np.arange(8)
+
+tabuas = {
+    "COMPLETA": Tabua(qx_completo),
+    "PLATO_MENSAL": Tabua(qx_plato, Periodicidade.MENSAL, HipoteseFracionaria.UDD),
+    "SELETIVA": TabuaSeletiva(qx_seletivo),
+    "MDT": TabuaMDT(morte=Tabua(qx_completo), invalidez=Tabua(qx_plato), causa_principal="morte"),
+    "MV": TabuaMultiplasVidas(Tabua(qx_completo), Tabua(qx_plato), status=StatusVidasConjuntas.LAST),
+}
+
+
+@pytest.fixture
+def pacote(tmp_path):
+    caminho = tmp_path / "tabuas.tabatupk"
+    salvar_pacote(tabuas, caminho)
+    return caminho
+
+
+@pytest.fixture
+def registro(pacote):
+    registro = RegistroTabuas()
+    registro.registrar_pacote(pacote)
+    return registro
+
+
+@pytest.mark.parametrize("nome", list(tabuas))
+def test_tabua_carregada_eh_igual_a_original(registro, nome):
+    tabua = registro.carregar(nome)
+    original = tabuas[nome]
+    assert type(tabua) is type(original)
+    assert tabua.periodicidade == original.periodicidade
+    x = [1] * original.numero_decrementos * original.numero_vidas
+    assert_array_equal(tabua.tpx(x, t), original.tpx(x, t))
+    assert_array_equal(tabua.t_qx(x, t), original.t_qx(x, t))
+
+
+@pytest.mark.parametrize("nome", ["COMPLETA", "PLATO_MENSAL", "MDT", "MV"])
+def test_tabuas_usam_a_memoria_do_pacote(registro, nome):
+    mapa = np.frombuffer(registro._nomes[nome].mapa, dtype=np.uint8)
+    for base in registro.carregar(nome).tabuas:
+        assert np.shares_memory(base.pega_qx(), mapa)
+        assert np.shares_memory(base.pega_log_lx(), mapa)
+
+
+def test_nomes_sao_ordenados(registro):
+    assert registro.nomes() == sorted(tabuas)
+
+
+def test_tabuas_sao_internadas(tmp_path, registro):
+    assert registro.carregar("COMPLETA") is registro.carregar("COMPLETA")
+    caminho = tmp_path / "copia.tabatupk"
+    salvar_pacote({"COPIA": Tabua(qx_completo.copy())}, caminho)
+    registro.registrar_pacote(caminho)
+    assert registro.carregar("COPIA") is registro.carregar("COMPLETA")
+
+
+def test_pacote_registrado_por_ultimo_prevalece(tmp_path, registro):
+    caminho = tmp_path / "novo.tabatupk"
+    salvar_pacote({"COMPLETA": Tabua(qx_plato)}, caminho)
+    registro.registrar_pacote(caminho)
+    assert_array_equal(registro.carregar("COMPLETA").qx([0], t), Tabua(qx_plato).qx([0], t))
+
+
+def test_conteudo_das_tabuas_eh_alinhado(pacote):
+    conteudo = pacote.read_bytes()
+    _, _, tamanho_indice = struct.unpack_from("<8sII", conteudo)
+    indice = json.loads(conteudo[16:16 + tamanho_indice])
+    assert all(inicio % 8 == 0 for inicio, _ in indice.values())
+    assert min(inicio for inicio, _ in indice.values()) == 16 + tamanho_indice
+
+
+def test_tabua_nao_registrada_retorna_erro(registro):
+    with pytest.raises(KeyError, match="AT-2000"):
+        registro.carregar("AT-2000")
+
+
+@pytest.mark.parametrize(
+    "conteudo", [b"", b"TABATU\x00\x00" + bytes(8), struct.pack("<8sII", b"TABATUPK", 99, 0)]
+)
+def test_arquivo_invalido_retorna_erro(tmp_path, conteudo):
+    caminho = tmp_path / "invalido.tabatupk"
+    caminho.write_bytes(conteudo + bytes(8))
+    with pytest.raises(ValueError):
+        RegistroTabuas().registrar_pacote(caminho)
+
+
+def test_variavel_de_ambiente_registra_pacotes(monkeypatch, pacote):
+    monkeypatch.setenv(tabuas_modulo.VARIAVEL_AMBIENTE, os.pathsep.join(["", str(pacote)]))
+    try:
+        modulo = importlib.reload(tabuas_modulo)
+        assert modulo.nomes() == sorted(tabuas)
+        assert_array_equal(modulo.carregar("COMPLETA").tpx([0], t), tabuas["COMPLETA"].tpx([0], t))
+    finally:
+        monkeypatch.delenv(tabuas_modulo.VARIAVEL_AMBIENTE)
+        importlib.reload(tabuas_modulo)
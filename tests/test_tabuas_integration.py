@@ -3,6 +3,7 @@ Os testes na tabua base + nas tabaus específicas garantem alguns desses resulta
 mantê-los aqui para deixar explicito o comportamento esperado."""
 import pytest
 from numpy import arange
+from numpy import empty
 from numpy import array
 from numpy import fromiter
 from numpy import isinf
@@ -359,3 +360,82 @@ class TestEfeitoAgravoNaTabua:
         tabua_original = Tabua(qx_original)
         tabua_agravada = Tabua(qx_agravado)
         assert tabua_original.tempo_futuro_maximo([0]) == tabua_agravada.tempo_futuro_maximo([0])
+
+
+class TestAvaliacaoEmLote:
+    @pytest.mark.parametrize("metodo", ["qx", "tpx", "t_qx"])
+    def test_metodos_lote_sao_iguais_a_chamar_o_metodo_para_cada_linha(self, todas_tabuas, metodo):
+        k = todas_tabuas.numero_decrementos * todas_tabuas.numero_vidas
+        x = array([repeat(idade, k) for idade in [0, 2, 3, 10]])
+        t = arange(6)
+        resultado = getattr(todas_tabuas, f"{metodo}_lote")(x, t)
+        esperado = array([getattr(todas_tabuas, metodo)(linha, t) for linha in x])
+        assert resultado.shape == (4, 6)
+        assert_array_almost_equal(resultado, esperado)
+
+    @pytest.mark.parametrize("metodo", ["qx", "tpx", "t_qx"])
+    def test_metodos_lote_aceitam_tempos_diferentes_para_cada_linha(self, todas_tabuas, metodo):
+        k = todas_tabuas.numero_decrementos * todas_tabuas.numero_vidas
+        x = array([repeat(idade, k) for idade in [0, 2, 3]])
+        t = array([[0, 1], [2, 3], [1, 5]])
+        resultado = getattr(todas_tabuas, f"{metodo}_lote")(x, t)
+        esperado = array([getattr(todas_tabuas, metodo)(x[i], t[i]) for i in range(3)])
+        assert_array_almost_equal(resultado, esperado)
+
+    def test_tempo_futuro_maximo_lote_eh_igual_a_chamar_o_metodo_para_cada_linha(self, todas_tabuas):
+        k = todas_tabuas.numero_decrementos * todas_tabuas.numero_vidas
+        x = array([repeat(idade, k) for idade in [0, 2, 3, 10]])
+        resultado = todas_tabuas.tempo_futuro_maximo_lote(x)
+        esperado = array([todas_tabuas.tempo_futuro_maximo(linha) for linha in x])
+        assert_array_almost_equal(resultado, esperado)
+
+    def test_metodos_lote_falham_quando_x_nao_possui_uma_idade_por_vida_ou_decremento(self, todas_tabuas):
+        k = todas_tabuas.numero_decrementos * todas_tabuas.numero_vidas
+        x = repeat(0, 2 * (k + 1)).reshape(2, k + 1)
+        with pytest.raises(ValueError):
+            todas_tabuas.tpx_lote(x, [0, 1])
+        with pytest.raises(ValueError):
+            todas_tabuas.tempo_futuro_maximo_lote(x)
+
+    def test_metodos_lote_falham_quando_t_possui_quantidade_de_linhas_diferente_de_x(self, todas_tabuas):
+        k = todas_tabuas.numero_decrementos * todas_tabuas.numero_vidas
+        x = repeat(0, 2 * k).reshape(2, k)
+        with pytest.raises(ValueError):
+            todas_tabuas.tpx_lote(x, [[0, 1], [0, 1], [0, 1]])
+
+    def test_metodos_lote_falham_quando_t_eh_negativo(self, todas_tabuas):
+        k = todas_tabuas.numero_decrementos * todas_tabuas.numero_vidas
+        x = repeat(0, 2 * k).reshape(2, k)
+        with pytest.raises(ValueError):
+            todas_tabuas.t_qx_lote(x, [0, -1])
+
+
+class TestBufferDeSaida:
+    @pytest.mark.parametrize("metodo", ["qx", "tpx", "t_qx"])
+    def test_metodos_escrevem_no_array_out_quando_fornecido(self, todas_tabuas, metodo):
+        k = todas_tabuas.numero_decrementos * todas_tabuas.numero_vidas
+        t = arange(6)
+        out = empty(6)
+        resultado = getattr(todas_tabuas, metodo)(repeat(2, k), t, out=out)
+        assert resultado is out
+        assert_array_almost_equal(out, getattr(todas_tabuas, metodo)(repeat(2, k), t))
+
+    @pytest.mark.parametrize("metodo", ["qx", "tpx", "t_qx"])
+    def test_metodos_lote_escrevem_no_array_out_quando_fornecido(self, todas_tabuas, metodo):
+        k = todas_tabuas.numero_decrementos * todas_tabuas.numero_vidas
+        x = array([repeat(idade, k) for idade in [0, 2, 3]])
+        out = empty((3, 4))
+        resultado = getattr(todas_tabuas, f"{metodo}_lote")(x, arange(4), out=out)
+        assert resultado is out
+        assert_array_almost_equal(out, getattr(todas_tabuas, f"{metodo}_lote")(x, arange(4)))
+
+    def test_metodos_aceitam_t_nao_contiguo(self, todas_tabuas):
+        k = todas_tabuas.numero_decrementos * todas_tabuas.numero_vidas
+        t = arange(12, dtype=float)[::2]
+        assert_array_almost_equal(todas_tabuas.tpx(repeat(2, k), t), todas_tabuas.tpx(repeat(2, k), t.copy()))
+
+    @pytest.mark.parametrize("out", [empty(5), empty(6, dtype=int), empty(12)[::2], empty((2, 3))])
+    def test_metodos_falham_quando_out_nao_eh_compativel_com_o_resultado(self, todas_tabuas, out):
+        k = todas_tabuas.numero_decrementos * todas_tabuas.numero_vidas
+        with pytest.raises(ValueError):
+            todas_tabuas.tpx(repeat(2, k), arange(6), out=out)
@@ -4,24 +4,11 @@ import pytest
 from numpy import array
 from numpy.testing import assert_array_equal
 
-import tabatu.unico_decremento as unico_decremento
+import tabatu.tabua_base as tabua_base_modulo
 from tabatu import Tabua
 from tabatu.periodicidade import Periodicidade
 
 
-@pytest.fixture
-def mock_tabua_base(monkeypatch):
-    mock_tabua_base = Mock()
-    mock_tabua_base.tpx = Mock(return_value=2)
-    mock_tabua_base.qx = Mock(return_value=3)
-    mock_tabua_base.tempo_futuro_maximo = Mock()
-    mock_tabua_base.alterar_periodicidade = Mock()
-    monkeypatch.setattr(
-        unico_decremento, "TabuaBase", Mock(return_value=mock_tabua_base)
-    ) 
-    return mock_tabua_base
-
-
 @pytest.mark.parametrize("x", [array([0]), [0], (0,)])
 class TestArgumentosSaoPassadosComoInteirosNosMetodosDeTabua:
     def test_tpx_passa_argumentos_para_tabua_base_quando_x_eh_inteiro_ou_array_like(
@@ -73,17 +60,16 @@ class TestMetodosFalhamQuandoXPossuiMaisQueUmElemento:
 
 
 def test_alterar_periodicidade_chama_alterar_periodicidade_da_tabua_base_e_gera_nova_tabua(
-    monkeypatch, mock_tabua_base, tabua_1dt_1
+    monkeypatch, tabua_1dt_1
 ):
-    mock_init = Mock(return_value=None)
-    monkeypatch.setattr(Tabua, "__init__", mock_init)
+    mock_alterar_periodicidade = Mock()
+    mock_from_tabua_base = Mock(return_value=tabua_1dt_1)
+    monkeypatch.setattr(tabua_base_modulo.TabuaBase, "alterar_periodicidade", mock_alterar_periodicidade)
+    monkeypatch.setattr(Tabua, "from_tabua_base", mock_from_tabua_base)
 
     nova_tabua = tabua_1dt_1.alterar_periodicidade(Periodicidade.MENSAL)
 
-    mock_tabua_base.alterar_periodicidade.assert_called_once_with(Periodicidade.MENSAL)
-    mock_init.assert_called_once_with(
-        mock_tabua_base.alterar_periodicidade.return_value.pega_qx(),
-        mock_tabua_base.alterar_periodicidade.return_value.periodicidade,
-    )
+    mock_alterar_periodicidade.assert_called_once_with(Periodicidade.MENSAL)
+    mock_from_tabua_base.assert_called_once_with(mock_alterar_periodicidade.return_value)
 
     assert isinstance(nova_tabua, Tabua)
@@ -0,0 +1,104 @@
+import pytest
+from numpy import arange
+from numpy import array
+from numpy import column_stack
+from numpy import repeat
+from numpy.testing import assert_allclose
+
+from tabatu import JurosConstante
+from tabatu import StatusVidasConjuntas
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu import TabuaMultiplasVidas
+from tabatu.premissas import Premissas
+from tabatu.valor_presente import anuidade
+from tabatu.valor_presente import dotal
+from tabatu.valor_presente import dotal_puro
+from tabatu.valor_presente import seguro
+
+TAXA = 0.04
+qx = (arange(100) + 1) / 100
+
+
+@pytest.fixture
+def premissas():
+    return Premissas(Tabua(qx), JurosConstante(TAXA))
+
+
+def _por_definicao(tabua, x, inicio, fim, metodo, deslocamento):
+    """Valor presente calculado apólice a apólice, com os métodos não vetorizados da tábua."""
+    juros = JurosConstante(TAXA)
+    resultado = []
+    for xi, a, b in zip(x, inicio, fim):
+        t = arange(a, b, dtype=float)
+        fluxos = getattr(tabua, metodo)(list(xi), t) * juros.taxa_desconto(t + deslocamento)
+        resultado.append(fluxos.sum())
+    return array(resultado)
+
+
+def test_anuidade_e_seguro_sao_iguais_aos_fatores_de_comutacao(premissas):
+    x = arange(0, 100, 7)
+    n = arange(len(x)) % 13
+    comutacao = premissas.comutacao
+    assert_allclose(anuidade(premissas, x, n), comutacao.anuidade(x, n), rtol=1e-12)
+    assert_allclose(anuidade(premissas, x, n, antecipada=False), comutacao.anuidade(x, n, antecipada=False), rtol=1e-12)
+    assert_allclose(seguro(premissas, x, n), comutacao.seguro(x, n), rtol=1e-12, atol=1e-16)
+    assert_allclose(anuidade(premissas, x), comutacao.anuidade(x), rtol=1e-12)
+    assert_allclose(seguro(premissas, x), comutacao.seguro(x), rtol=1e-12)
+    assert_allclose(dotal_puro(premissas, x, n), comutacao.dotal_puro(x, n), rtol=1e-12)
+    assert_allclose(dotal(premissas, x, n), comutacao.dotal(x, n), rtol=1e-12)
+
+
+def test_renda_diferida_eh_a_diferenca_entre_rendas_temporarias(premissas):
+    x, m, n = arange(20, 60), 5, 10
+    assert_allclose(
+        anuidade(premissas, x, n, m=m),
+        anuidade(premissas, x, m + n) - anuidade(premissas, x, m),
+        rtol=1e-12,
+    )
+
+
+def test_resultado_nao_depende_do_tamanho_do_bloco(premissas):
+    x = arange(100)
+    n = 100 - x
+    m = x % 4
+    assert_allclose(
+        anuidade(premissas, x, n, m, tamanho_bloco=7),
+        anuidade(premissas, x, n, m),
+        rtol=0,
+        atol=1e-14,
+    )
+
+
+@pytest.mark.parametrize(
+    "tabua",
+    [
+        TabuaMDT(Tabua(qx), morte=Tabua(repeat(0.02, 100)), causa_principal="morte"),
+        TabuaMultiplasVidas(Tabua(qx), Tabua(qx[::-1].copy()), status=StatusVidasConjuntas.LAST),
+    ],
+)
+def test_valor_presente_eh_igual_a_soma_dos_fluxos_descontados(tabua):
+    premissas = Premissas(tabua, JurosConstante(TAXA))
+    x = column_stack([arange(10, 60, 5), arange(50, 0, -5)])
+    m = arange(10) % 3
+    n = arange(10) + 1
+    assert_allclose(
+        anuidade(premissas, x, n, m),
+        _por_definicao(tabua, x, m, m + n, "tpx", 0),
+        rtol=1e-12,
+    )
+    assert_allclose(
+        seguro(premissas, x, n, m),
+        _por_definicao(tabua, x, m, m + n, "t_qx", 1),
+        rtol=1e-12,
+    )
+
+
+def test_carteira_vazia_retorna_array_vazio(premissas):
+    assert anuidade(premissas, array([], dtype=int), 5).shape == (0,)
+
+
+@pytest.mark.parametrize("n, m", [(-1, 0), (1, -1)])
+def test_valor_presente_retorna_erro_quando_prazo_ou_diferimento_sao_negativos(premissas, n, m):
+    with pytest.raises(ValueError):
+        anuidade(premissas, [30], n, m)
@@ -0,0 +1,133 @@
+import pickle
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from numpy.testing import assert_array_equal
+
+from tabatu import HipoteseFracionaria
+from tabatu import JurosConstante
+from tabatu import StatusVidasConjuntas
+from tabatu import Tabua
+from tabatu import TabuaMDT
+from tabatu import TabuaMultiplasVidas
+from tabatu import TabuaSeletiva
+from tabatu.alterar_tabua import alterar_periodicidade_qx
+from tabatu.periodicidade import Periodicidade
+from tabatu.premissas import Premissas
+from tabatu.serializacao import de_bytes
+from tabatu.serializacao import para_bytes
+from tests.conftest import qx_completo
+from tests.conftest import qx_plato
+from tests.conftest import qx_seletivo
+
+t = np.arange(70)
+
+
+def tabua_materializada(qx, periodicidade):
+    return Tabua(alterar_periodicidade_qx(qx, Periodicidade.ANUAL, periodicidade), periodicidade)
+
+
+@pytest.mark.parametrize("qx", [qx_completo, qx_plato])
+@pytest.mark.parametrize("periodicidade", [Periodicidade.MENSAL, Periodicidade.TRIMESTRAL, Periodicidade.DIARIA])
+class TestVisaoEhIgualATabuaMaterializada:
+    def test_qx(self, qx, periodicidade):
+        visao = Tabua(qx).alterar_periodicidade(periodicidade)
+        esperado = tabua_materializada(qx, periodicidade)
+        for x in [0, 5, 13, 40]:
+            assert_array_equal(visao.qx([x], t), esperado.qx([x], t))
+
+    def test_tpx_e_t_qx(self, qx, periodicidade):
+        visao = Tabua(qx).alterar_periodicidade(periodicidade)
+        esperado = tabua_materializada(qx, periodicidade)
+        for x in [0, 5, 13, 40]:
+            assert_allclose(visao.tpx([x], t), esperado.tpx([x], t), rtol=1e-12)
+            assert_allclose(visao.t_qx([x], t), esperado.t_qx([x], t), rtol=1e-12)
+
+    def test_tempo_futuro_maximo(self, qx, periodicidade):
+        visao = Tabua(qx).alterar_periodicidade(periodicidade)
+        esperado = tabua_materializada(qx, periodicidade)
+        x = np.arange(0, 80, 7)
+        assert_array_equal(visao.tempo_futuro_maximo_lote(x), esperado.tempo_futuro_maximo_lote(x))
+        assert visao.possui_fechamento_plato() == esperado.possui_fechamento_plato()
+
+    def test_pega_qx_materializa_as_taxas_de_cada_periodo(self, qx, periodicidade):
+        tabua_base, = Tabua(qx).alterar_periodicidade(periodicidade).tabuas
+        assert_array_equal(tabua_base.pega_qx(), alterar_periodicidade_qx(qx, Periodicidade.ANUAL, periodicidade))
+        assert len(tabua_base.pega_log_lx()) == len(tabua_base.pega_qx()) + 1
+
+
+def test_visao_mantem_as_taxas_armazenadas():
+    tabua = Tabua(qx_completo).alterar_periodicidade(Periodicidade.MENSAL)
+    tabua_base, = tabua.tabuas
+    assert tabua.periodicidade == Periodicidade.MENSAL
+    assert tabua_base.periodicidade == Periodicidade.MENSAL
+    assert tabua_base.pega_razao_periodicidade() == 12
+
+
+def test_visoes_encadeadas_usam_as_taxas_armazenadas():
+    trimestral = Tabua(qx_plato).alterar_periodicidade(Periodicidade.MENSAL).alterar_periodicidade(
+        Periodicidade.TRIMESTRAL
+    )
+    assert trimestral.tabuas[0].pega_razao_periodicidade() == 4
+    esperado = Tabua(qx_plato).alterar_periodicidade(Periodicidade.TRIMESTRAL)
+    assert_array_equal(trimestral.tpx([2], t), esperado.tpx([2], t))
+
+    anual = trimestral.alterar_periodicidade(Periodicidade.ANUAL)
+    assert anual.tabuas[0].pega_razao_periodicidade() == 1
+    assert_array_equal(anual.tabuas[0].pega_qx(), qx_plato)
+
+
+def test_periodicidade_maior_que_a_armazenada_converte_as_taxas():
+    tabua = Tabua(qx_completo, Periodicidade.MENSAL).alterar_periodicidade(Periodicidade.MENSAL)
+    assert tabua.tabuas[0].pega_razao_periodicidade() == 1
+    with pytest.raises(ValueError, match="perda de informação"):
+        Tabua(qx_completo, Periodicidade.MENSAL).alterar_periodicidade(Periodicidade.ANUAL)
+
+
+def test_visao_preserva_a_hipotese_fracionaria():
+    tabua = Tabua(qx_plato, hipotese_fracionaria=HipoteseFracionaria.UDD).alterar_periodicidade(Periodicidade.MENSAL)
+    esperado = Tabua(
+        alterar_periodicidade_qx(qx_plato, Periodicidade.ANUAL, Periodicidade.MENSAL),
+        Periodicidade.MENSAL,
+        HipoteseFracionaria.UDD,
+    )
+    assert tabua.hipotese_fracionaria == HipoteseFracionaria.UDD
+    assert_allclose(tabua.tpx([3], t + 0.5), esperado.tpx([3], t + 0.5), rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "construir",
+    [
+        lambda *tabuas: TabuaMDT(*tabuas),
+        lambda *tabuas: TabuaMultiplasVidas(*tabuas, status=StatusVidasConjuntas.LAST),
+    ],
+)
+def test_tabuas_com_mais_de_um_componente_usam_visoes(construir):
+    visao = construir(Tabua(qx_completo), Tabua(qx_plato)).alterar_periodicidade(Periodicidade.MENSAL)
+    esperado = construir(
+        tabua_materializada(qx_completo, Periodicidade.MENSAL), tabua_materializada(qx_plato, Periodicidade.MENSAL)
+    )
+    assert [base.pega_razao_periodicidade() for base in visao.tabuas] == [12, 12]
+    assert_allclose(visao.tpx([13, 2], t), esperado.tpx([13, 2], t), rtol=1e-12)
+    assert_allclose(visao.t_qx([13, 2], t), esperado.t_qx([13, 2], t), rtol=1e-12, atol=1e-16)
+
+
+def test_premissas_usam_visoes():
+    premissas = Premissas(Tabua(qx_completo), JurosConstante(0.05)).alterar_periodicidade(Periodicidade.MENSAL)
+    assert premissas.tabua.tabuas[0].pega_razao_periodicidade() == 12
+    esperado = Premissas(tabua_materializada(qx_completo, Periodicidade.MENSAL), premissas.juros)
+    assert_allclose(premissas.comutacao.seguro([0, 13]), esperado.comutacao.seguro([0, 13]), rtol=1e-12)
+
+
+def test_pickle_e_serializacao_preservam_a_visao():
+    tabua = Tabua(qx_plato).alterar_periodicidade(Periodicidade.MENSAL)
+    for nova in [pickle.loads(pickle.dumps(tabua)), de_bytes(para_bytes(tabua))]:
+        assert nova.periodicidade == Periodicidade.MENSAL
+        assert_array_equal(nova.tpx([7], t), tabua.tpx([7], t))
+        assert_array_equal(nova.qx([7], t), tabua.qx([7], t))
+
+
+def test_tabua_seletiva_nao_possui_visao():
+    with pytest.raises(ValueError, match="seletivas"):
+        TabuaSeletiva(qx_seletivo).tabuas[0]._visao_periodicidade(12)